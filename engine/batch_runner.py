@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Multi-draft batch runner: generate_draft pipelines in a process pool
+ABOUTME: Workers share one Gemini RPM/TPM limiter and the on-disk caches; reports aggregate throughput
+
+Each line of the jobs file is a JSON object with a "topic" and any
+generate_draft keyword (language, academic_level, citation_style, blurb,
+output_type, author_name, ...). The CLI names level/lang/style/author are
+accepted as aliases. Every job gets its own output folder and checkpoint, so
+re-running a batch resumes unfinished drafts.
+
+Usage:
+    opendraft batch jobs.jsonl -o ./batch_output --workers 3
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Add engine to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+logger = logging.getLogger(__name__)
+
+REPORT_FILENAME = "batch_report.json"
+
+# generate_draft keywords a job may set (topic and output_dir are handled separately)
+JOB_OPTIONS = {
+    "language", "academic_level", "blurb", "output_type", "citation_style",
+    "author_name", "institution", "department", "faculty", "advisor",
+    "second_examiner", "location", "student_id", "skip_validation",
+}
+JOB_ALIASES = {
+    "lang": "language",
+    "level": "academic_level",
+    "style": "citation_style",
+    "author": "author_name",
+}
+
+# Cache locations pinned to absolute paths so every worker opens the same files
+SHARED_CACHE_ENV = {
+    "CITATION_CACHE_DB": ".citation_cache_orchestrator.db",
+    "VERDICT_CACHE_DB": ".citation_verdicts.db",
+    "LLM_CACHE_DIR": ".llm_cache",
+}
+
+
+@dataclass
+class BatchJob:
+    """One draft to generate."""
+
+    index: int
+    topic: str
+    output_dir: Path
+    options: Dict[str, Any] = field(default_factory=dict)
+    # threading.Event that stops generate_draft early (set in-process only, never pickled)
+    cancel_event: Any = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], index: int, batch_dir: Path) -> "BatchJob":
+        """
+        Build a job from one jobs-file entry.
+
+        Raises:
+            ValueError: If the topic is missing or an option is unknown
+        """
+        data = dict(data)
+        topic = str(data.pop("topic", "") or "").strip()
+        if not topic:
+            raise ValueError(f"Job {index}: missing 'topic'")
+
+        output_dir = data.pop("output_dir", None)
+        options: Dict[str, Any] = {}
+        for key, value in data.items():
+            name = JOB_ALIASES.get(key, key)
+            if name not in JOB_OPTIONS:
+                raise ValueError(f"Job {index}: unknown option '{key}'")
+            options[name] = value
+
+        if output_dir:
+            output_dir = Path(output_dir)
+            if not output_dir.is_absolute():
+                output_dir = batch_dir / output_dir
+        else:
+            output_dir = batch_dir / f"{index:03d}_{_slug(topic)}"
+        return cls(index=index, topic=topic, output_dir=output_dir, options=options)
+
+
+@dataclass
+class JobResult:
+    """Outcome of one job."""
+
+    index: int
+    topic: str
+    output_dir: str
+    status: str  # "completed" or "failed"
+    seconds: float
+    tokens: int = 0
+    pdf_path: Optional[str] = None
+    docx_path: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchReport:
+    """Results of a batch plus aggregate throughput."""
+
+    results: List[JobResult]
+    wall_seconds: float
+    workers: int
+
+    @property
+    def completed(self) -> int:
+        return sum(1 for r in self.results if r.status == "completed")
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.completed
+
+    @property
+    def total_tokens(self) -> int:
+        return sum(r.tokens for r in self.results)
+
+    @property
+    def drafts_per_hour(self) -> float:
+        if self.wall_seconds <= 0:
+            return 0.0
+        return self.completed * 3600.0 / self.wall_seconds
+
+    @property
+    def tokens_per_minute(self) -> float:
+        if self.wall_seconds <= 0:
+            return 0.0
+        return self.total_tokens * 60.0 / self.wall_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "jobs": len(self.results),
+            "completed": self.completed,
+            "failed": self.failed,
+            "wall_seconds": round(self.wall_seconds, 1),
+            "total_tokens": self.total_tokens,
+            "drafts_per_hour": round(self.drafts_per_hour, 2),
+            "tokens_per_minute": round(self.tokens_per_minute, 1),
+            "results": [asdict(r) for r in sorted(self.results, key=lambda r: r.index)],
+        }
+
+    def summary(self) -> str:
+        """One-line throughput summary."""
+        return (
+            f"{self.completed}/{len(self.results)} drafts in {self.wall_seconds / 60:.1f} min "
+            f"with {self.workers} workers: {self.drafts_per_hour:.2f} drafts/hour, "
+            f"{self.tokens_per_minute:,.0f} tokens/min"
+        )
+
+
+def _slug(text: str, max_length: int = 30) -> str:
+    """Folder-safe slug (same rules as draft_generator.slugify)."""
+    slug = re.sub(r'[^\w\s-]', '', text.lower())
+    slug = re.sub(r'[\s_]+', '_', slug).strip('_')
+    return slug[:max_length]
+
+
+def load_jobs(jobs_path: Path, batch_dir: Path) -> List[BatchJob]:
+    """
+    Parse a JSONL jobs file. Blank lines and lines starting with # are skipped.
+
+    Raises:
+        ValueError: On invalid JSON or an invalid job
+    """
+    jobs = []
+    for line_number, line in enumerate(Path(jobs_path).read_text(encoding="utf-8").splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{jobs_path}:{line_number}: invalid JSON: {e}") from e
+        if not isinstance(data, dict):
+            raise ValueError(f"{jobs_path}:{line_number}: expected a JSON object")
+        jobs.append(BatchJob.from_dict(data, index=len(jobs) + 1, batch_dir=Path(batch_dir)))
+    return jobs
+
+
+def run_job(job: BatchJob) -> JobResult:
+    """Generate one draft in this process, resuming from its checkpoint if present."""
+    from draft_generator import generate_draft
+    from utils.checkpoint import CHECKPOINT_FILENAME, has_checkpoint
+
+    start = time.time()
+    checkpoint = job.output_dir / CHECKPOINT_FILENAME
+    options = {"skip_validation": True, **job.options}
+    try:
+        pdf_path, docx_path = generate_draft(
+            topic=job.topic,
+            output_dir=job.output_dir,
+            verbose=False,
+            resume_from=checkpoint if has_checkpoint(job.output_dir) else None,
+            cancel_event=job.cancel_event,
+            **options,
+        )
+    except Exception as e:
+        logger.error(f"Batch job {job.index} failed: {type(e).__name__}: {e}")
+        return JobResult(
+            index=job.index, topic=job.topic, output_dir=str(job.output_dir), status="failed",
+            seconds=time.time() - start, tokens=_read_tokens(job.output_dir),
+            error=f"{type(e).__name__}: {str(e)[:300]}",
+        )
+    return JobResult(
+        index=job.index, topic=job.topic, output_dir=str(job.output_dir), status="completed",
+        seconds=time.time() - start, tokens=_read_tokens(job.output_dir),
+        pdf_path=str(pdf_path), docx_path=str(docx_path),
+    )
+
+
+def _read_tokens(output_dir: Path) -> int:
+    """Total tokens from the draft's token_usage.json (0 if unavailable)."""
+    try:
+        data = json.loads((output_dir / "token_usage.json").read_text(encoding="utf-8"))
+        return int(data.get("total_tokens", 0))
+    except (OSError, ValueError):
+        return 0
+
+
+def _init_worker(limiter, cache_env: Dict[str, str]) -> None:
+    """Process pool initializer: share the limiter and the cache files."""
+    os.environ.update(cache_env)
+    if limiter is not None:
+        from concurrency.rate_limiter import install_gemini_limiter
+        install_gemini_limiter(limiter)
+
+
+def _shared_cache_env() -> Dict[str, str]:
+    return {
+        name: str(Path(os.getenv(name, default)).resolve())
+        for name, default in SHARED_CACHE_ENV.items()
+    }
+
+
+def run_batch(
+    jobs: List[BatchJob],
+    batch_dir: Path,
+    max_workers: Optional[int] = None,
+    runner: Callable[[BatchJob], JobResult] = run_job,
+    on_result: Optional[Callable[[JobResult], None]] = None,
+) -> BatchReport:
+    """
+    Run jobs in a process pool sharing one Gemini limiter.
+
+    Args:
+        jobs: Jobs to run
+        batch_dir: Folder for batch_report.json
+        max_workers: Worker processes (default: MAX_PARALLEL_THESES)
+        runner: Picklable function running one job in a worker
+        on_result: Called in this process as each job finishes
+
+    Returns:
+        BatchReport (also written to batch_dir/batch_report.json)
+    """
+    from concurrency.concurrency_config import get_concurrency_config
+    from concurrency.rate_limiter import start_shared_gemini_limiter
+
+    if max_workers is None:
+        max_workers = get_concurrency_config(verbose=False).max_parallel_theses
+    workers = max(1, min(max_workers, len(jobs) or 1))
+
+    batch_dir = Path(batch_dir)
+    batch_dir.mkdir(parents=True, exist_ok=True)
+
+    shared = start_shared_gemini_limiter()
+    manager, limiter = shared if shared else (None, None)
+    results: List[JobResult] = []
+    start = time.time()
+    try:
+        # spawn: workers must not inherit this process's threads or singletons
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(limiter, _shared_cache_env()),
+        ) as executor:
+            futures = {executor.submit(runner, job): job for job in jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # The runner raised or its worker process died (e.g. out of memory)
+                    result = JobResult(
+                        index=job.index, topic=job.topic, output_dir=str(job.output_dir),
+                        status="failed", seconds=time.time() - start,
+                        error=f"{type(e).__name__}: {str(e)[:300]}",
+                    )
+                results.append(result)
+                if on_result:
+                    on_result(result)
+    finally:
+        if manager is not None:
+            manager.shutdown()
+
+    report = BatchReport(results=results, wall_seconds=time.time() - start, workers=workers)
+    (batch_dir / REPORT_FILENAME).write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+    logger.info(f"Batch complete: {report.summary()}")
+    return report
@@ -1,4 +1,9 @@
 """Concurrency configuration module for OpenDraft."""
 from .concurrency_config import get_concurrency_config, ConcurrencyConfig
+from .dag_scheduler import DagScheduler, DagTask
+from .rate_limiter import TokenBucketLimiter, get_gemini_limiter, acquire_gemini
+from .host_rate_limiter import HostRateLimiter, get_host_limiter
 
-__all__ = ['get_concurrency_config', 'ConcurrencyConfig']
+__all__ = ['get_concurrency_config', 'ConcurrencyConfig', 'DagScheduler', 'DagTask',
+           'TokenBucketLimiter', 'get_gemini_limiter', 'acquire_gemini',
+           'HostRateLimiter', 'get_host_limiter']
@@ -19,6 +19,16 @@ def _tier_to_rpm(tier: str) -> int:
     return tier_map.get(tier, 10)
 
 
+def _tier_to_tpm(tier: str) -> int:
+    """Map tier name to default input tokens per minute."""
+    tier_map = {
+        "free": 250_000,
+        "paid": 4_000_000,
+        "custom": 1_000_000,  # Conservative default for unknown tiers
+    }
+    return tier_map.get(tier, 250_000)
+
+
 @dataclass
 class ConcurrencyConfig:
     """
@@ -30,12 +40,26 @@ class ConcurrencyConfig:
     Attributes:
         tier: API tier ("free", "paid", "custom")
         rpm_limit: Requests per minute limit
-        rate_limit_delay: Seconds to wait between API calls
-        crafter_parallel: Whether to run 6 Crafter agents in parallel
+        tpm_limit: Input tokens per minute limit
+        rate_limit_delay: Seconds to wait between API calls (when token bucket is off)
+        token_bucket_enabled: Pace Gemini calls with the shared token-bucket limiter
+                              instead of fixed rate_limit_delay sleeps
+        crafter_parallel: Whether to run independent Crafter agents in parallel
+        crafter_max_workers: Max Crafter agents in flight when crafter_parallel is set
         scout_batch_delay: Seconds between Scout citation research batches
         scout_batch_size: Citations per batch
         scout_parallel_workers: Number of parallel workers for citation research
-        max_parallel_theses: Max thesis generations to run concurrently
+        scout_async: Run parallel citation research on one asyncio event loop
+        scout_async_concurrency: Topics in flight at once when scout_async is set
+        doi_batch_enrich: Resolve collected DOIs in bulk after citation research
+        citation_streaming: Stream Scout citations to citation management while research runs
+        overlap_structure_citations: Run citation management beside the structure phase
+        citation_stream_queue: Scout result batches buffered before research waits on the stream
+        scrape_max_workers: Concurrent page downloads when scraping citation URLs
+        scrape_per_domain: Concurrent page downloads per domain when scraping
+        validation_max_workers: Concurrent DOI/URL checks when validating citations
+        validation_per_host: Concurrent DOI/URL checks per host when validating
+        max_parallel_theses: Max drafts generated concurrently by `opendraft batch`
     """
 
     # Tier detection (auto-detected if not specified)
@@ -43,10 +67,17 @@ class ConcurrencyConfig:
 
     # Rate limiting (auto-configured based on tier)
     rpm_limit: int = field(default=None)
+    tpm_limit: int = field(default=None)
     rate_limit_delay: float = field(default=None)
+    token_bucket_enabled: bool = field(
+        default_factory=lambda: os.getenv("GEMINI_TOKEN_BUCKET", "true").lower() != "false"
+    )
 
     # Parallel execution flags
     crafter_parallel: bool = field(default=None)
+    crafter_max_workers: int = field(
+        default_factory=lambda: int(os.getenv("CRAFTER_MAX_WORKERS", "3"))
+    )
 
     # Scout (citation research) settings
     scout_batch_size: int = field(
@@ -58,6 +89,36 @@ class ConcurrencyConfig:
     scout_parallel_workers: int = field(
         default_factory=lambda: int(os.getenv("SCOUT_PARALLEL_WORKERS", "4"))
     )
+    scout_async: bool = field(
+        default_factory=lambda: os.getenv("SCOUT_ASYNC", "true").lower() != "false"
+    )
+    scout_async_concurrency: int = field(
+        default_factory=lambda: int(os.getenv("SCOUT_ASYNC_CONCURRENCY", "32"))
+    )
+    doi_batch_enrich: bool = field(
+        default_factory=lambda: os.getenv("DOI_BATCH_ENRICH", "true").lower() != "false"
+    )
+    citation_streaming: bool = field(
+        default_factory=lambda: os.getenv("CITATION_STREAMING", "true").lower() != "false"
+    )
+    citation_stream_queue: int = field(
+        default_factory=lambda: int(os.getenv("CITATION_STREAM_QUEUE", "64"))
+    )
+    overlap_structure_citations: bool = field(
+        default_factory=lambda: os.getenv("OVERLAP_STRUCTURE_CITATIONS", "true").lower() != "false"
+    )
+    scrape_max_workers: int = field(
+        default_factory=lambda: int(os.getenv("SCRAPE_MAX_WORKERS", "8"))
+    )
+    scrape_per_domain: int = field(
+        default_factory=lambda: int(os.getenv("SCRAPE_PER_DOMAIN", "2"))
+    )
+    validation_max_workers: int = field(
+        default_factory=lambda: int(os.getenv("VALIDATION_MAX_WORKERS", "16"))
+    )
+    validation_per_host: int = field(
+        default_factory=lambda: int(os.getenv("VALIDATION_PER_HOST", "4"))
+    )
 
     # Thesis generation limits
     max_parallel_theses: int = field(
@@ -85,7 +146,12 @@ class ConcurrencyConfig:
 
         # Get tier-specific rate limit
         if self.rpm_limit is None:
-            self.rpm_limit = _tier_to_rpm(self.tier)
+            env_rpm = os.getenv("RPM_LIMIT")
+            self.rpm_limit = int(env_rpm) if env_rpm else _tier_to_rpm(self.tier)
+
+        if self.tpm_limit is None:
+            env_tpm = os.getenv("TPM_LIMIT")
+            self.tpm_limit = int(env_tpm) if env_tpm else _tier_to_tpm(self.tier)
 
         # Calculate delay between calls based on RPM
         if self.rate_limit_delay is None:
@@ -140,7 +206,16 @@ if __name__ == "__main__":
     config = get_concurrency_config(verbose=True)
     print(f"Tier: {config.tier}")
     print(f"RPM Limit: {config.rpm_limit}")
+    print(f"TPM Limit: {config.tpm_limit:,}")
+    print(f"Token Bucket: {config.token_bucket_enabled}")
     print(f"Rate Limit Delay: {config.rate_limit_delay}s")
-    print(f"Crafter Parallel: {config.crafter_parallel}")
+    print(f"Crafter Parallel: {config.crafter_parallel} ({config.crafter_max_workers} workers)")
     print(f"Scout Batch Size: {config.scout_batch_size}")
     print(f"Scout Workers: {config.scout_parallel_workers}")
+    print(f"Scout Async: {config.scout_async} ({config.scout_async_concurrency} in flight)")
+    print(f"DOI Batch Enrich: {config.doi_batch_enrich}")
+    print(f"Citation Streaming: {config.citation_streaming} (queue {config.citation_stream_queue})")
+    print(f"Overlap Structure/Citations: {config.overlap_structure_citations}")
+    print(f"Scrape Workers: {config.scrape_max_workers} ({config.scrape_per_domain} per domain)")
+    print(f"Validation Workers: {config.validation_max_workers} ({config.validation_per_host} per host)")
+    print(f"Parallel Drafts: {config.max_parallel_theses}")
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Dependency-graph scheduler for pipeline steps that can overlap
+ABOUTME: Starts each task as soon as its dependencies finish, bounded by a worker pool
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DagTask:
+    """
+    A single node in the scheduler graph.
+
+    Attributes:
+        name: Unique task name (used by other tasks in depends_on)
+        func: Zero-argument callable that performs the work
+        depends_on: Names of tasks that must finish before this one starts
+        throttled: Whether starting this task counts against submit_delay
+                   (set False for cheap local steps such as file merges)
+    """
+
+    name: str
+    func: Callable[[], Any]
+    depends_on: List[str] = field(default_factory=list)
+    throttled: bool = True
+
+
+class DagScheduler:
+    """
+    Run a small graph of tasks with as much overlap as the dependencies allow.
+
+    Tasks are started in insertion order whenever they are ready, so with
+    max_workers=1 the scheduler degrades to the familiar sequential order.
+    Consecutive throttled task starts are spaced at least submit_delay seconds
+    apart, which keeps bursts within the tier's requests-per-minute budget.
+
+    The first task failure stops new tasks from being started; tasks that are
+    already running are allowed to finish and the original exception is re-raised.
+
+    Usage:
+        scheduler = DagScheduler(max_workers=3, submit_delay=0.5)
+        scheduler.add("intro", write_intro)
+        scheduler.add("results", write_results, depends_on=["methodology"])
+        durations = scheduler.run()
+    """
+
+    def __init__(self, max_workers: int = 1, submit_delay: float = 0.0, name: str = "dag"):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_workers: Maximum number of tasks running at once
+            submit_delay: Minimum seconds between two throttled task starts
+            name: Label used in log messages
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.submit_delay = max(0.0, float(submit_delay))
+        self.name = name
+        self._tasks: Dict[str, DagTask] = {}
+        self._last_throttled_start: Optional[float] = None
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        depends_on: Optional[List[str]] = None,
+        throttled: bool = True,
+    ) -> None:
+        """Register a task. Dependencies must be registered before run()."""
+        if name in self._tasks:
+            raise ValueError(f"Duplicate task name: {name}")
+        self._tasks[name] = DagTask(
+            name=name,
+            func=func,
+            depends_on=list(depends_on or []),
+            throttled=throttled,
+        )
+
+    @property
+    def task_names(self) -> List[str]:
+        """Task names in insertion order."""
+        return list(self._tasks)
+
+    def topological_order(self) -> List[str]:
+        """
+        Return the order tasks would run in with a single worker.
+
+        Raises:
+            ValueError: If a dependency is unknown or the graph has a cycle
+        """
+        for task in self._tasks.values():
+            for dep in task.depends_on:
+                if dep not in self._tasks:
+                    raise ValueError(f"Task '{task.name}' depends on unknown task '{dep}'")
+
+        order: List[str] = []
+        done: set = set()
+        remaining = list(self._tasks)
+        while remaining:
+            ready = [n for n in remaining if all(d in done for d in self._tasks[n].depends_on)]
+            if not ready:
+                raise ValueError(f"Dependency cycle among tasks: {', '.join(remaining)}")
+            # Take only the first ready task so insertion order wins ties
+            order.append(ready[0])
+            done.add(ready[0])
+            remaining.remove(ready[0])
+        return order
+
+    def run(self) -> Dict[str, float]:
+        """
+        Execute all tasks.
+
+        Returns:
+            Dict mapping task name to its wall-clock duration in seconds
+        """
+        order = self.topological_order()
+        if self.max_workers == 1:
+            return self._run_sequential(order)
+        return self._run_parallel(order)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _throttle(self, task: DagTask) -> None:
+        """Sleep so throttled starts are at least submit_delay apart."""
+        if not task.throttled:
+            return
+        if self._last_throttled_start is not None and self.submit_delay > 0:
+            elapsed = time.monotonic() - self._last_throttled_start
+            if elapsed < self.submit_delay:
+                time.sleep(self.submit_delay - elapsed)
+        self._last_throttled_start = time.monotonic()
+
+    def _timed(self, task: DagTask) -> float:
+        start = time.monotonic()
+        task.func()
+        return time.monotonic() - start
+
+    def _run_sequential(self, order: List[str]) -> Dict[str, float]:
+        durations: Dict[str, float] = {}
+        for name in order:
+            task = self._tasks[name]
+            self._throttle(task)
+            durations[name] = self._timed(task)
+        return durations
+
+    def _run_parallel(self, order: List[str]) -> Dict[str, float]:
+        durations: Dict[str, float] = {}
+        completed: set = set()
+        waiting = list(order)
+        running: Dict[Future, str] = {}
+        first_error: Optional[BaseException] = None
+
+        logger.info(f"[{self.name}] Running {len(order)} tasks with up to {self.max_workers} workers")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name) as pool:
+            while waiting or running:
+                if first_error is None:
+                    for name in list(waiting):
+                        if len(running) >= self.max_workers:
+                            break
+                        task = self._tasks[name]
+                        if all(dep in completed for dep in task.depends_on):
+                            self._throttle(task)
+                            waiting.remove(name)
+                            running[pool.submit(self._timed, task)] = name
+                            logger.debug(f"[{self.name}] Started {name}")
+
+                if not running:
+                    # Nothing in flight and nothing startable: either a failure
+                    # stopped scheduling or the remaining tasks can never run.
+                    break
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        durations[name] = future.result()
+                        completed.add(name)
+                        logger.debug(f"[{self.name}] Finished {name} in {durations[name]:.1f}s")
+                    except BaseException as e:
+                        logger.error(f"[{self.name}] Task {name} failed: {e}")
+                        if first_error is None:
+                            first_error = e
+
+        if first_error is not None:
+            raise first_error
+
+        return durations
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Process-wide adaptive rate limiters for academic API hosts (Crossref, OpenAlex, S2, Serper, NCBI)
+ABOUTME: Every client instance for a host draws on one limiter; honours Retry-After and adapts the rate
+
+A rate limit belongs to the API host, not to a client object: four scout
+threads sharing a CrossrefClient, and the fresh CitationResearcher a
+CitationCompiler creates, all hit the same Crossref quota. get_host_limiter()
+returns one HostRateLimiter per host, created on first use.
+
+Each limiter hands out request slots 1/rate apart under a lock, so
+concurrent callers are spaced instead of passing a "time since last
+request" check together. The rate adapts between a floor and a ceiling:
+
+- 429: the rate halves (not below the floor) and the whole host pauses,
+  for the Retry-After time if the server sent one (capped at
+  MAX_RETRY_AFTER_SECONDS), otherwise for a short
+  cooldown that doubles with each further 429 in a row.
+- Success: after SUCCESS_STREAK successes in a row the rate steps back up
+  by a tenth of the floor-to-ceiling range.
+
+Configured from environment:
+    API_HOST_RATE_LIMITS: Per-host floor:ceiling overrides in requests per second,
+        e.g. "api.crossref.org=2:20,eutils.ncbi.nlm.nih.gov=3:10"
+"""
+
+import email.utils
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from utils.perf_trace import traced_async_sleep, traced_sleep
+
+logger = logging.getLogger(__name__)
+
+# Requests per second (floor, ceiling) for known hosts. A client asking for a
+# lower rate lowers the ceiling; hosts not listed use the client's rate as the
+# ceiling and a quarter of it as the floor.
+HOST_RATE_LIMITS: Dict[str, Tuple[float, float]] = {
+    "api.crossref.org": (2.0, 20.0),           # Public pool allows ~50/s; stay polite
+    "api.openalex.org": (1.0, 50.0),           # 10/s without key
+    "api.semanticscholar.org": (0.2, 10.0),    # 1/s shared pool without key
+    "google.serper.dev": (1.0, 10.0),
+    "eutils.ncbi.nlm.nih.gov": (1.0, 3.0),     # 3/s without NCBI API key
+}
+
+# Successes in a row before the rate steps up
+SUCCESS_STREAK = 10
+
+# Cooldown after a 429 without Retry-After: BASE_COOLDOWN_SLOTS request
+# intervals at the reduced rate, doubling per consecutive 429, capped
+BASE_COOLDOWN_SLOTS = 2
+MAX_COOLDOWN_SECONDS = 30.0
+
+# Longest Retry-After honoured; a larger value (misconfigured server, far-off
+# HTTP date) would otherwise stall every caller for the host
+MAX_RETRY_AFTER_SECONDS = 120.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Seconds to wait from a Retry-After header (delta-seconds or HTTP date).
+
+    Returns None for a missing or unparseable header.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class HostRateLimiter:
+    """
+    Thread-safe, adaptive request spacing for one API host.
+
+    Usage:
+        limiter = get_host_limiter("api.crossref.org", rate=10.0)
+        limiter.acquire()
+        response = session.get(url)
+        if response.status_code == 429:
+            limiter.record_rate_limited(parse_retry_after(response.headers.get("Retry-After")))
+        else:
+            limiter.record_success()
+    """
+
+    def __init__(self, host: str, floor: float, ceiling: float):
+        """
+        Initialize limiter at its ceiling rate.
+
+        Args:
+            host: API host name (for logging and stats)
+            floor: Lowest rate the limiter adapts down to (requests/second)
+            ceiling: Highest rate, and the starting rate (requests/second)
+        """
+        if floor <= 0 or ceiling <= 0:
+            raise ValueError("floor and ceiling must be positive")
+
+        self.host = host
+        self.ceiling = ceiling
+        self.floor = min(floor, ceiling)
+        self._rate = ceiling
+        self._next_slot = 0.0
+        self._blocked_until = 0.0
+        self._successes = 0
+        self._strikes = 0
+        self._lock = threading.Lock()
+
+        # Stats for reporting
+        self.total_requests = 0
+        self.total_wait_seconds = 0.0
+        self.rate_limited = 0
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def lower_ceiling(self, rate: float) -> None:
+        """Cap the ceiling at a client's configured rate (the most conservative client wins)."""
+        with self._lock:
+            if rate < self.ceiling:
+                self.ceiling = rate
+                self.floor = min(self.floor, rate)
+                self._rate = min(self._rate, rate)
+
+    def _reserve(self) -> float:
+        """Reserve the next request slot; returns seconds until it starts."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_slot, self._blocked_until)
+            self._next_slot = start + 1.0 / self._rate
+            self.total_requests += 1
+            self.total_wait_seconds += start - now
+            return start - now
+
+    def _blocked_for(self) -> float:
+        with self._lock:
+            return self._blocked_until - time.monotonic()
+
+    def acquire(self) -> float:
+        """
+        Block until this caller's request slot.
+
+        A 429 reported while waiting pauses the host, so the caller reserves
+        a new slot after the pause instead of firing into it.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            delay = self._reserve()
+            if delay > 0:
+                traced_sleep(delay, "api_rate_limit", host=self.host)
+                waited += delay
+            if self._blocked_for() <= 0:
+                return waited
+
+    async def acquire_async(self) -> float:
+        """Async counterpart of acquire()."""
+        waited = 0.0
+        while True:
+            delay = self._reserve()
+            if delay > 0:
+                await traced_async_sleep(delay, "api_rate_limit", host=self.host)
+                waited += delay
+            if self._blocked_for() <= 0:
+                return waited
+
+    def record_success(self) -> None:
+        """A request went through: after a streak of these, raise the rate a step."""
+        with self._lock:
+            self._strikes = 0
+            self._successes += 1
+            if self._successes < SUCCESS_STREAK or self._rate >= self.ceiling:
+                return
+            self._successes = 0
+            step = max((self.ceiling - self.floor) / 10.0, self.floor * 0.1)
+            self._rate = min(self.ceiling, self._rate + step)
+
+    def record_rate_limited(self, retry_after: Optional[float] = None) -> float:
+        """
+        A request got 429: halve the rate and pause the host.
+
+        Args:
+            retry_after: Seconds from the response's Retry-After header, if any
+
+        Returns:
+            Seconds the host is paused
+        """
+        with self._lock:
+            self._successes = 0
+            self._strikes += 1
+            self._rate = max(self.floor, self._rate / 2.0)
+            clamped = retry_after is not None and retry_after > MAX_RETRY_AFTER_SECONDS
+            if retry_after is not None:
+                cooldown = min(retry_after, MAX_RETRY_AFTER_SECONDS)
+            else:
+                cooldown = min(
+                    MAX_COOLDOWN_SECONDS,
+                    BASE_COOLDOWN_SLOTS * (2 ** (self._strikes - 1)) / self._rate,
+                )
+            now = time.monotonic()
+            self._blocked_until = max(self._blocked_until, now + cooldown)
+            self._next_slot = max(self._next_slot, self._blocked_until)
+            self.rate_limited += 1
+            rate = self._rate
+        if clamped:
+            logger.warning(f"[{self.host}] Retry-After of {retry_after:.0f}s capped at {MAX_RETRY_AFTER_SECONDS:.0f}s")
+        logger.debug(f"[{self.host}] Rate limited: {rate:.2f} req/s, paused {cooldown:.1f}s")
+        return cooldown
+
+    def get_stats(self) -> dict:
+        """Snapshot of limiter state for monitoring."""
+        with self._lock:
+            return {
+                "host": self.host,
+                "rate": round(self._rate, 3),
+                "floor": self.floor,
+                "ceiling": self.ceiling,
+                "total_requests": self.total_requests,
+                "total_wait_seconds": round(self.total_wait_seconds, 2),
+                "rate_limited": self.rate_limited,
+            }
+
+
+def _env_limits() -> Dict[str, Tuple[float, float]]:
+    """Parse API_HOST_RATE_LIMITS ("host=floor:ceiling,...")."""
+    limits = {}
+    for entry in os.getenv("API_HOST_RATE_LIMITS", "").split(","):
+        if "=" not in entry:
+            continue
+        host, _, bounds = entry.partition("=")
+        try:
+            floor, ceiling = (float(x) for x in bounds.split(":"))
+        except ValueError:
+            logger.warning(f"Ignoring malformed API_HOST_RATE_LIMITS entry: {entry!r}")
+            continue
+        limits[host.strip().lower()] = (floor, ceiling)
+    return limits
+
+
+# Shared instances, one per host
+_host_limiters: Dict[str, HostRateLimiter] = {}
+_host_limiters_lock = threading.Lock()
+
+
+def get_host_limiter(host: str, rate: Optional[float] = None) -> HostRateLimiter:
+    """
+    Get or create the process-wide limiter for an API host.
+
+    Args:
+        host: Host name (e.g. "api.crossref.org")
+        rate: Requests per second the calling client is configured for; caps
+              the host's ceiling
+
+    Returns:
+        HostRateLimiter shared by every caller for this host
+    """
+    host = (host or "").lower()
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None:
+            floor, ceiling = {**HOST_RATE_LIMITS, **_env_limits()}.get(host, (None, None))
+            if ceiling is None:
+                ceiling = rate or 10.0
+                floor = ceiling / 4.0
+            elif rate:
+                ceiling = min(ceiling, rate)
+            limiter = HostRateLimiter(host, floor, ceiling)
+            _host_limiters[host] = limiter
+            logger.debug(f"Rate limiter for {host}: {limiter.floor:g}-{limiter.ceiling:g} req/s")
+            return limiter
+    if rate:
+        limiter.lower_ceiling(rate)
+    return limiter
+
+
+def get_host_limiter_stats() -> Dict[str, dict]:
+    """Stats of every host limiter created so far."""
+    with _host_limiters_lock:
+        limiters = list(_host_limiters.values())
+    return {limiter.host: limiter.get_stats() for limiter in limiters}
+
+
+def reset_host_limiters() -> None:
+    """Reset the shared instances (for testing)."""
+    with _host_limiters_lock:
+        _host_limiters.clear()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Process-wide token-bucket limiter for Gemini requests and tokens per minute
+ABOUTME: Shared by run_agent, Gemini Grounded, deep research planning and factcheck
+"""
+
+import logging
+import threading
+import time
+from multiprocessing.managers import BaseManager
+from typing import Optional, Tuple
+
+from utils.perf_trace import CAT_SLEEP, get_tracer
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucketLimiter:
+    """
+    Thread-safe dual token bucket: requests per minute and tokens per minute.
+
+    Each acquire() takes one request and an estimated number of input tokens.
+    Both buckets refill continuously, so callers run right up to quota and
+    only sleep for as long as the buckets are actually empty.
+
+    Callers that learn the real token count afterwards (from usage_metadata)
+    report it with record_usage() so the estimate does not drift. A 429 from
+    the API is reported with penalize(), which drains the buckets so every
+    thread backs off together instead of retrying into the same quota wall.
+
+    Usage:
+        limiter = TokenBucketLimiter(rpm_limit=2000, tpm_limit=4_000_000)
+        limiter.acquire(tokens=1200)
+        response = model.generate_content(prompt)
+        limiter.record_usage(actual_tokens=1350, estimated_tokens=1200)
+    """
+
+    def __init__(self, rpm_limit: int, tpm_limit: int, name: str = "gemini"):
+        """
+        Initialize limiter.
+
+        Args:
+            rpm_limit: Requests per minute (bucket capacity and refill rate)
+            tpm_limit: Input tokens per minute (bucket capacity and refill rate)
+            name: Label used in log messages
+        """
+        if rpm_limit <= 0 or tpm_limit <= 0:
+            raise ValueError("rpm_limit and tpm_limit must be positive")
+
+        self.name = name
+        self.rpm_limit = rpm_limit
+        self.tpm_limit = tpm_limit
+
+        self._request_tokens = float(rpm_limit)
+        self._token_tokens = float(tpm_limit)
+        self._blocked_until = 0.0
+        self._last_refill = time.monotonic()
+        self._cond = threading.Condition()
+
+        # Stats for reporting
+        self.total_requests = 0
+        self.total_wait_seconds = 0.0
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the time elapsed since the last refill (lock held)."""
+        elapsed = now - self._last_refill
+        if elapsed <= 0:
+            return
+        self._request_tokens = min(
+            float(self.rpm_limit), self._request_tokens + elapsed * self.rpm_limit / 60.0
+        )
+        self._token_tokens = min(
+            float(self.tpm_limit), self._token_tokens + elapsed * self.tpm_limit / 60.0
+        )
+        self._last_refill = now
+
+    def _seconds_until_available(self, tokens: float, now: float) -> float:
+        """Seconds until one request and `tokens` tokens are available (lock held)."""
+        wait = max(0.0, self._blocked_until - now)
+        if self._request_tokens < 1.0:
+            wait = max(wait, (1.0 - self._request_tokens) * 60.0 / self.rpm_limit)
+        if self._token_tokens < tokens:
+            wait = max(wait, (tokens - self._token_tokens) * 60.0 / self.tpm_limit)
+        return wait
+
+    def acquire(self, tokens: int = 0, timeout: Optional[float] = None) -> float:
+        """
+        Block until a request slot and `tokens` input tokens are available.
+
+        Requests larger than the whole TPM budget are clamped to it, so an
+        oversized prompt waits for a full bucket instead of forever.
+
+        Args:
+            tokens: Estimated input tokens for the call
+            timeout: Give up after this many seconds (None = wait indefinitely)
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            TimeoutError: If timeout elapses before capacity is available
+        """
+        needed = float(min(max(tokens, 0), self.tpm_limit))
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._seconds_until_available(needed, now)
+                if wait <= 0:
+                    self._request_tokens -= 1.0
+                    self._token_tokens -= needed
+                    break
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"{self.name} rate limiter: no capacity within {timeout:.1f}s"
+                        )
+                    wait = min(wait, remaining)
+                self._cond.wait(wait)
+
+            waited = time.monotonic() - start
+            self.total_requests += 1
+            self.total_wait_seconds += waited
+
+        if waited > 0.05:
+            logger.debug(f"[{self.name}] Waited {waited:.2f}s for rate limit ({tokens} tokens)")
+            get_tracer().add_span_seconds(f"{self.name}_rate_limit", CAT_SLEEP, waited, tokens=tokens)
+        return waited
+
+    def record_usage(self, actual_tokens: int, estimated_tokens: int) -> None:
+        """
+        Correct the token bucket once the real usage of a call is known.
+
+        Charges the difference if the estimate was low, refunds it if high.
+        The bucket may go negative, which delays later callers accordingly.
+        """
+        delta = float(actual_tokens) - float(estimated_tokens)
+        if delta == 0:
+            return
+        with self._cond:
+            self._token_tokens = min(float(self.tpm_limit), self._token_tokens - delta)
+            if delta < 0:
+                self._cond.notify_all()
+
+    def penalize(self, cooldown_seconds: float = 0.0) -> None:
+        """
+        React to a 429: drain both buckets and optionally block all callers.
+
+        Args:
+            cooldown_seconds: Minimum time before the next request may start
+                              (e.g. from a Retry-After header)
+        """
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            self._request_tokens = min(self._request_tokens, 0.0)
+            self._token_tokens = min(self._token_tokens, 0.0)
+            if cooldown_seconds > 0:
+                self._blocked_until = max(self._blocked_until, now + cooldown_seconds)
+        logger.warning(f"[{self.name}] Rate limited - draining buckets (cooldown {cooldown_seconds:.1f}s)")
+
+    def get_stats(self) -> dict:
+        """Snapshot of limiter state for monitoring."""
+        with self._cond:
+            self._refill(time.monotonic())
+            return {
+                "rpm_limit": self.rpm_limit,
+                "tpm_limit": self.tpm_limit,
+                "available_requests": round(self._request_tokens, 2),
+                "available_tokens": round(self._token_tokens),
+                "total_requests": self.total_requests,
+                "total_wait_seconds": round(self.total_wait_seconds, 2),
+            }
+
+
+# Singleton instance shared by every Gemini call site in the process
+_gemini_limiter: Optional[TokenBucketLimiter] = None
+_gemini_limiter_lock = threading.Lock()
+
+
+def get_gemini_limiter() -> Optional[TokenBucketLimiter]:
+    """
+    Get or create the process-wide Gemini limiter.
+
+    Seeded from ConcurrencyConfig.rpm_limit / tpm_limit. Returns None when the
+    token bucket is disabled (GEMINI_TOKEN_BUCKET=false), in which case callers
+    fall back to the fixed rate_limit_delay sleeps.
+    """
+    global _gemini_limiter
+    if _gemini_limiter is None:
+        with _gemini_limiter_lock:
+            if _gemini_limiter is None:
+                from .concurrency_config import get_concurrency_config
+
+                config = get_concurrency_config(verbose=False)
+                if not config.token_bucket_enabled:
+                    return None
+                _gemini_limiter = TokenBucketLimiter(
+                    rpm_limit=config.rpm_limit,
+                    tpm_limit=config.tpm_limit,
+                )
+                logger.info(
+                    f"Gemini rate limiter: {config.rpm_limit} RPM, {config.tpm_limit:,} TPM"
+                )
+    return _gemini_limiter
+
+
+def acquire_gemini(tokens: int = 0) -> float:
+    """Acquire from the shared Gemini limiter if enabled. Returns seconds waited."""
+    limiter = get_gemini_limiter()
+    if limiter is None:
+        return 0.0
+    return limiter.acquire(tokens=tokens)
+
+
+class SharedLimiterManager(BaseManager):
+    """Manager process that hosts one TokenBucketLimiter for a pool of worker processes."""
+
+
+SharedLimiterManager.register(
+    "TokenBucketLimiter",
+    TokenBucketLimiter,
+    exposed=("acquire", "record_usage", "penalize", "get_stats"),
+)
+
+
+def start_shared_gemini_limiter() -> Optional[Tuple[SharedLimiterManager, "TokenBucketLimiter"]]:
+    """
+    Start a manager process holding the Gemini limiter for multi-process runs.
+
+    The returned proxy has the limiter's acquire/record_usage/penalize API and
+    can be passed to worker processes, which install it with
+    install_gemini_limiter() so every process draws on one RPM/TPM budget.
+    The caller shuts the manager down when the workers are done.
+
+    Returns:
+        (manager, limiter proxy), or None when the token bucket is disabled
+    """
+    from .concurrency_config import get_concurrency_config
+
+    config = get_concurrency_config(verbose=False)
+    if not config.token_bucket_enabled:
+        return None
+    manager = SharedLimiterManager()
+    manager.start()
+    limiter = manager.TokenBucketLimiter(rpm_limit=config.rpm_limit, tpm_limit=config.tpm_limit)
+    logger.info(f"Shared Gemini rate limiter: {config.rpm_limit} RPM, {config.tpm_limit:,} TPM")
+    return manager, limiter
+
+
+def install_gemini_limiter(limiter) -> None:
+    """Use `limiter` (e.g. a shared proxy) as this process's Gemini limiter."""
+    global _gemini_limiter
+    with _gemini_limiter_lock:
+        _gemini_limiter = limiter
+
+
+def reset_gemini_limiter() -> None:
+    """Reset the singleton (for testing)."""
+    global _gemini_limiter
+    _gemini_limiter = None
@@ -34,6 +34,8 @@ import logging
 import traceback
 import psutil
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, Optional, List, Dict
 from datetime import datetime
 
@@ -44,6 +46,7 @@ os.environ['WEASYPRINT_QUIET'] = '1'
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import get_config
+from concurrency.concurrency_config import get_concurrency_config
 from utils.structured_logger import StructuredLogger
 from utils.agent_runner import setup_model
 
@@ -60,11 +63,16 @@ from phases import (
 )
 
 # Checkpoint system
-from utils.checkpoint import save_checkpoint, load_checkpoint, restore_context, get_next_phase
+from utils.checkpoint import (
+    DraftCancelled, save_checkpoint, load_checkpoint, load_units, raise_if_cancelled, restore_context, get_next_phase,
+)
 
 # Quality gate
 from utils.quality_gate import run_quality_gate
 
+# Performance trace (trace.json next to checkpoint.json)
+from utils.perf_trace import CAT_PHASE, get_tracer, reset_tracer, span, traced_sleep
+
 # Configure comprehensive logging
 logging.basicConfig(
     level=logging.INFO,
@@ -84,6 +92,7 @@ def log_memory_usage(context=""):
     mem_info = process.memory_info()
     mem_mb = mem_info.rss / 1024 / 1024
     logger.info(f"[MEMORY] {context}: {mem_mb:.1f} MB RSS")
+    get_tracer().counter("memory", rss_mb=round(mem_mb, 1))
     return mem_mb
 
 
@@ -115,6 +124,12 @@ def slugify(text: str, max_length: int = 30) -> str:
     return slug[:max_length]
 
 
+def checkpoint_phase(ctx: 'DraftContext', phase: str, output_dir: Path) -> None:
+    """Save the phase checkpoint and flush the performance trace beside it."""
+    save_checkpoint(ctx, phase, output_dir)
+    get_tracer().write(output_dir)
+
+
 def run_phase_with_retry(
     phase_func,
     ctx: 'DraftContext',
@@ -139,25 +154,27 @@ def run_phase_with_retry(
 
     last_error = None
     for attempt in range(max_retries + 1):
+        raise_if_cancelled(ctx.cancel_event, f"{phase_name} phase")
         try:
             if attempt > 0:
                 logger.warning(f"[RETRY] {phase_name} attempt {attempt + 1}/{max_retries + 1}")
                 if ctx.verbose:
                     print(f"   Retrying {phase_name} (attempt {attempt + 1})...")
 
-            phase_func(ctx)
+            with span(phase_name, CAT_PHASE, attempt=attempt + 1):
+                phase_func(ctx)
             return  # Success
 
         except Exception as e:
             last_error = e
 
             # Check if error is transient and worth retrying
-            if attempt < max_retries and _is_transient_error(e):
+            if attempt < max_retries and not isinstance(e, DraftCancelled) and _is_transient_error(e):
                 logger.warning(f"[RETRY] {phase_name} failed with transient error: {e}")
                 # Exponential backoff
                 backoff = (2 ** attempt) * 5  # 5s, 10s
                 logger.info(f"[RETRY] Waiting {backoff}s before retry...")
-                time.sleep(backoff)
+                traced_sleep(backoff, "phase_backoff", phase=phase_name)
                 continue
             else:
                 # Non-transient error or max retries reached
@@ -168,6 +185,37 @@ def run_phase_with_retry(
         raise last_error
 
 
+def run_structure_and_citations(ctx: 'DraftContext', output_dir: Path) -> None:
+    """
+    Run the structure and citations phases concurrently.
+
+    The Architect and Formatter only need the research outputs, so citation
+    management (page fetching, scraping, filtering) runs beside them instead
+    of after them. Checkpoints keep the sequential order: structure is
+    recorded once it passes validation, citations only after both phases
+    finished. Citations that finish first are kept as a unit checkpoint, so
+    a run interrupted before structure completes does not repeat them.
+
+    Args:
+        ctx: DraftContext with research outputs
+        output_dir: Directory for checkpoints
+    """
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="citations") as executor:
+        citations = executor.submit(run_phase_with_retry, run_citation_management, ctx, "citations")
+        try:
+            run_phase_with_retry(run_structure_phase, ctx, "structure")
+            validate_structure_phase(ctx)
+            checkpoint_phase(ctx, "structure", output_dir)
+        finally:
+            # Join before compose (or before a structure failure propagates)
+            citations_error = citations.exception()
+
+    if citations_error is not None:
+        raise citations_error
+    validate_citation_phase(ctx)
+    checkpoint_phase(ctx, "citations", output_dir)
+
+
 # =============================================================================
 # LOCALIZATION: Chapter and section names in different languages
 # =============================================================================
@@ -504,6 +552,7 @@ def generate_draft(
     student_id: Optional[str] = None,
     citation_style: str = "apa",
     resume_from: Optional[Path] = None,
+    cancel_event: Optional[threading.Event] = None,
 ) -> Tuple[Path, Path]:
     """
     Generate a complete academic draft using specialized AI agents.
@@ -529,18 +578,22 @@ def generate_draft(
         student_id: Student matriculation number
         citation_style: Citation format - 'apa' or 'ieee' (default: 'apa')
         resume_from: Path to checkpoint.json to resume from (skips completed phases)
+        cancel_event: Once set, the run stops at its next phase or checkpoint
+            write with DraftCancelled (used when a queue worker loses its lease)
 
     Returns:
         Tuple[Path, Path]: (pdf_path, docx_path) - Paths to generated draft files
 
     Raises:
         ValueError: If insufficient citations found or generation fails
+        DraftCancelled: If cancel_event was set
         Exception: If any critical step fails
     """
     # ====================================================================
     # STARTUP AND INITIALIZATION
     # ====================================================================
     draft_start_time = time.time()
+    reset_tracer()
     logger.info("=" * 80)
     logger.info("DRAFT GENERATION STARTED")
     logger.info("=" * 80)
@@ -638,6 +691,7 @@ def generate_draft(
             language_instruction=language_instruction,
             tracker=tracker,
             streamer=streamer,
+            cancel_event=cancel_event,
         )
 
         # Optional token tracker
@@ -678,6 +732,13 @@ def generate_draft(
             if verbose:
                 print(f"   Resumed from checkpoint (completed: {completed_phase})")
 
+        # Units finished inside the interrupted phase (chapters, queries, QA agents)
+        if resume_from:
+            ctx.completed_units = load_units(resume_from.parent)
+            if verbose and ctx.completed_units:
+                saved = sum(len(units) for units in ctx.completed_units.values())
+                print(f"   Restored {saved} sub-phase checkpoints")
+
         # ====================================================================
         # Execute pipeline phases with inter-phase validation and checkpoints
         # ====================================================================
@@ -688,26 +749,33 @@ def generate_draft(
                 logger.info("Starting fresh (no phases completed yet)")
             run_phase_with_retry(run_research_phase, ctx, "research")
             validate_research_phase(ctx)
-            save_checkpoint(ctx, "research", output_dir)
+            checkpoint_phase(ctx, "research", output_dir)
             completed_phase = "research"
 
+        # STRUCTURE + CITATIONS PHASES side by side (OVERLAP_STRUCTURE_CITATIONS);
+        # a run resumed after structure continues with citations below
+        if get_next_phase(completed_phase) == "structure" and get_concurrency_config(verbose=False).overlap_structure_citations:
+            run_structure_and_citations(ctx, output_dir)
+            completed_phase = "citations"
+
         # STRUCTURE PHASE (with pipeline-level retry)
         if get_next_phase(completed_phase) == "structure" or completed_phase == "research":
             run_phase_with_retry(run_structure_phase, ctx, "structure")
             validate_structure_phase(ctx)
-            save_checkpoint(ctx, "structure", output_dir)
+            checkpoint_phase(ctx, "structure", output_dir)
             completed_phase = "structure"
 
         # CITATIONS PHASE (with pipeline-level retry)
         if get_next_phase(completed_phase) == "citations" or completed_phase == "structure":
             run_phase_with_retry(run_citation_management, ctx, "citations")
             validate_citation_phase(ctx)
-            save_checkpoint(ctx, "citations", output_dir)
+            checkpoint_phase(ctx, "citations", output_dir)
             completed_phase = "citations"
 
         # EXPOSE MODE: Early exit after citations
         if ctx.output_type == 'expose':
-            pdf_path, docx_path = run_expose_export(ctx)
+            with span("expose_export", CAT_PHASE):
+                pdf_path, docx_path = run_expose_export(ctx)
             _finalize(ctx, pdf_path, docx_path, draft_start_time)
             return pdf_path, docx_path
 
@@ -715,11 +783,12 @@ def generate_draft(
         if get_next_phase(completed_phase) == "compose" or completed_phase == "citations":
             run_phase_with_retry(run_compose_phase, ctx, "compose")
             validate_compose_phase(ctx)
-            save_checkpoint(ctx, "compose", output_dir)
+            checkpoint_phase(ctx, "compose", output_dir)
             completed_phase = "compose"
 
         # QUALITY GATE (after compose, before validate)
-        quality_result = run_quality_gate(ctx, strict=not skip_validation)
+        with span("quality_gate", CAT_PHASE):
+            quality_result = run_quality_gate(ctx, strict=not skip_validation)
         if verbose:
             print(f"   Quality Score: {quality_result.total_score}/100")
             if quality_result.issues:
@@ -734,14 +803,16 @@ def generate_draft(
             completed_phase = "validate"  # Mark as complete
         elif get_next_phase(completed_phase) == "validate" or completed_phase == "compose":
             run_phase_with_retry(run_validate_phase, ctx, "validate")
-            save_checkpoint(ctx, "validate", output_dir)
+            checkpoint_phase(ctx, "validate", output_dir)
             completed_phase = "validate"
 
         # Copy tools and README
+        raise_if_cancelled(ctx.cancel_event, "compile")
         copy_tools_to_output(folders['tools'], topic, academic_level, verbose)
         create_output_readme(output_dir, topic, verbose)
 
-        pdf_path, docx_path = run_compile_and_export(ctx)
+        with span("compile", CAT_PHASE):
+            pdf_path, docx_path = run_compile_and_export(ctx)
 
         _finalize(ctx, pdf_path, docx_path, draft_start_time)
         return pdf_path, docx_path
@@ -759,6 +830,8 @@ def generate_draft(
         logger.error(traceback.format_exc())
         logger.error("=" * 80)
         log_memory_usage("At failure")
+        if output_dir is not None:
+            get_tracer().write(output_dir)
 
         if tracker:
             try:
@@ -781,6 +854,11 @@ def _finalize(ctx: DraftContext, pdf_path: Path, docx_path: Path, draft_start_ti
         except Exception as e:
             logger.warning(f"Failed to save token usage: {e}")
 
+    trace_path = get_tracer().write(ctx.folders['root'])
+    if trace_path:
+        logger.info(f"Performance trace saved to {trace_path}")
+        logger.info(f"Time by category (s): {get_tracer().summary()}")
+
     if ctx.tracker:
         ctx.tracker.mark_completed()
 
@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Durable SQLite job queue and worker fleet for draft generation
+ABOUTME: Enqueue, lease, heartbeat, retry with backoff and dead-letter; crashed jobs resume from their checkpoint
+
+Jobs are batch_runner jobs (topic, options, output folder). A worker leases
+one job at a time and heartbeats while generate_draft runs. If the worker
+dies, its lease expires and another worker takes the job over; because the
+output folder already holds checkpoint.json, run_job resumes after the last
+completed phase instead of starting from research again. Failed attempts are
+retried with exponential backoff and moved to the dead-letter state once
+max_attempts is used up.
+
+Usage:
+    opendraft queue add jobs.jsonl
+    opendraft queue work --workers 3
+    opendraft queue status
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Add engine to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from batch_runner import BatchJob, JobResult, run_job
+from utils.sqlite_store import SQLiteConnections
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_DB = Path("opendraft_queue.db")
+
+# Job states
+QUEUED = "queued"
+LEASED = "leased"
+DONE = "done"
+DEAD = "dead"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    payload       TEXT NOT NULL,     -- JSON: topic, output_dir, options
+    status        TEXT NOT NULL,
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    max_attempts  INTEGER NOT NULL,
+    available_at  REAL NOT NULL,
+    lease_owner   TEXT,
+    lease_expires REAL,
+    last_error    TEXT,
+    result        TEXT,              -- JSON JobResult of the final attempt
+    created_at    REAL NOT NULL,
+    updated_at    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_available ON jobs (status, available_at);
+"""
+
+
+@dataclass
+class LeasedJob:
+    """A job currently leased by a worker."""
+
+    id: int
+    payload: Dict[str, Any]
+    attempts: int
+    max_attempts: int
+    owner: str
+    lease_expires: float = 0.0  # As of the last successful lease or heartbeat
+
+    def to_batch_job(self) -> BatchJob:
+        return BatchJob(
+            index=self.id,
+            topic=self.payload["topic"],
+            output_dir=Path(self.payload["output_dir"]),
+            options=dict(self.payload.get("options", {})),
+        )
+
+
+class JobQueue:
+    """
+    SQLite-backed job queue shared by worker processes.
+
+    Leasing runs in a BEGIN IMMEDIATE transaction, so two workers never take
+    the same job. A lease lasts lease_seconds and is extended by heartbeat();
+    an expired lease makes the job available again (or dead-letters it when
+    its attempts are used up). Connections are per thread.
+    """
+
+    def __init__(
+        self,
+        db_path: Path = DEFAULT_QUEUE_DB,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3,
+        backoff_base: float = 30.0,
+        backoff_max: float = 1800.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize queue, creating the schema if needed.
+
+        Args:
+            db_path: SQLite database file
+            lease_seconds: How long a lease lasts without a heartbeat
+            max_attempts: Default attempts per job before dead-lettering
+            backoff_base: Delay before the first retry (doubles per attempt)
+            backoff_max: Upper bound on the retry delay
+            clock: Time source (wall clock, shared across processes)
+        """
+        self.db_path = Path(db_path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.clock = clock
+        self._connections = SQLiteConnections(self.db_path, isolation_level=None)
+
+        conn = self._conn()
+        conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        """Per-thread connection in autocommit mode (transactions are explicit)."""
+        return self._connections.get()
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        self._connections.close()
+
+    def backoff(self, attempts: int) -> float:
+        """Delay before retrying a job that has failed `attempts` times."""
+        return min(self.backoff_base * (2 ** max(attempts - 1, 0)), self.backoff_max)
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def enqueue(self, job: BatchJob, max_attempts: Optional[int] = None) -> int:
+        """
+        Add a job. Its output folder is stored as an absolute path so any
+        worker can resume it.
+
+        Returns:
+            Job id
+        """
+        payload = {
+            "topic": job.topic,
+            "output_dir": str(Path(job.output_dir).resolve()),
+            "options": job.options,
+        }
+        now = self.clock()
+        cursor = self._conn().execute(
+            "INSERT INTO jobs (payload, status, max_attempts, available_at, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (json.dumps(payload), QUEUED, max_attempts or self.max_attempts, now, now, now),
+        )
+        return cursor.lastrowid
+
+    # ------------------------------------------------------------------
+    # Worker side
+    # ------------------------------------------------------------------
+
+    def lease(self, owner: str) -> Optional[LeasedJob]:
+        """
+        Take the next available job: a queued job whose backoff has passed,
+        or a leased job whose lease expired (its worker died).
+
+        Returns:
+            LeasedJob, or None if nothing is available
+        """
+        conn = self._conn()
+        now = self.clock()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            while True:
+                row = conn.execute(
+                    "SELECT id, payload, status, attempts, max_attempts FROM jobs "
+                    "WHERE (status = ? AND available_at <= ?) OR (status = ? AND lease_expires <= ?) "
+                    "ORDER BY available_at, id LIMIT 1",
+                    (QUEUED, now, LEASED, now),
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+
+                job_id, payload, status, attempts, max_attempts = row
+                if status == LEASED and attempts >= max_attempts:
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, lease_owner = NULL, lease_expires = NULL, "
+                        "last_error = ?, updated_at = ? WHERE id = ?",
+                        (DEAD, "Lease expired on final attempt (worker died)", now, job_id),
+                    )
+                    logger.warning(f"Job {job_id} dead-lettered: worker died on attempt {attempts}")
+                    continue
+                if status == LEASED:
+                    logger.warning(f"Job {job_id}: lease expired, taking over (attempt {attempts + 1})")
+
+                conn.execute(
+                    "UPDATE jobs SET status = ?, attempts = attempts + 1, lease_owner = ?, "
+                    "lease_expires = ?, updated_at = ? WHERE id = ?",
+                    (LEASED, owner, now + self.lease_seconds, now, job_id),
+                )
+                conn.execute("COMMIT")
+                return LeasedJob(
+                    id=job_id,
+                    payload=json.loads(payload),
+                    attempts=attempts + 1,
+                    max_attempts=max_attempts,
+                    owner=owner,
+                    lease_expires=now + self.lease_seconds,
+                )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def heartbeat(self, job: LeasedJob) -> bool:
+        """
+        Extend the lease.
+
+        Returns:
+            False if the lease was lost (expired and taken by another worker)
+        """
+        now = self.clock()
+        cursor = self._conn().execute(
+            "UPDATE jobs SET lease_expires = ?, updated_at = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+            (now + self.lease_seconds, now, job.id, LEASED, job.owner),
+        )
+        if cursor.rowcount != 1:
+            return False
+        job.lease_expires = now + self.lease_seconds
+        return True
+
+    def complete(self, job: LeasedJob, result: Optional[JobResult] = None) -> bool:
+        """Mark a leased job done. Returns False if the lease was lost."""
+        now = self.clock()
+        cursor = self._conn().execute(
+            "UPDATE jobs SET status = ?, lease_owner = NULL, lease_expires = NULL, result = ?, "
+            "last_error = NULL, updated_at = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+            (DONE, _result_json(result), now, job.id, LEASED, job.owner),
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, job: LeasedJob, error: str, result: Optional[JobResult] = None) -> Optional[str]:
+        """
+        Record a failed attempt: retry after backoff, or dead-letter the job.
+
+        Returns:
+            New status (QUEUED or DEAD), or None if the lease was lost
+        """
+        now = self.clock()
+        if job.attempts >= job.max_attempts:
+            status, available_at = DEAD, now
+        else:
+            status, available_at = QUEUED, now + self.backoff(job.attempts)
+        cursor = self._conn().execute(
+            "UPDATE jobs SET status = ?, available_at = ?, lease_owner = NULL, lease_expires = NULL, "
+            "last_error = ?, result = ?, updated_at = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+            (status, available_at, error[:2000], _result_json(result), now, job.id, LEASED, job.owner),
+        )
+        if cursor.rowcount != 1:
+            return None
+        if status == DEAD:
+            logger.error(f"Job {job.id} dead-lettered after {job.attempts} attempts: {error[:200]}")
+        else:
+            logger.warning(f"Job {job.id} failed (attempt {job.attempts}), retrying in {available_at - now:.0f}s")
+        return status
+
+    # ------------------------------------------------------------------
+    # Inspection and maintenance
+    # ------------------------------------------------------------------
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per state."""
+        counts = {QUEUED: 0, LEASED: 0, DONE: 0, DEAD: 0}
+        for status, count in self._conn().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status"):
+            counts[status] = count
+        return counts
+
+    def jobs(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Job rows (optionally only one state), oldest first."""
+        query = "SELECT id, payload, status, attempts, max_attempts, last_error, updated_at FROM jobs"
+        params: tuple = ()
+        if status:
+            query += " WHERE status = ?"
+            params = (status,)
+        rows = self._conn().execute(query + " ORDER BY id", params).fetchall()
+        return [
+            {
+                "id": job_id,
+                "topic": json.loads(payload)["topic"],
+                "status": job_status,
+                "attempts": attempts,
+                "max_attempts": max_attempts,
+                "last_error": last_error,
+                "updated_at": updated_at,
+            }
+            for job_id, payload, job_status, attempts, max_attempts, last_error, updated_at in rows
+        ]
+
+    def requeue(self, job_id: int) -> bool:
+        """Give a dead-lettered job a fresh set of attempts."""
+        now = self.clock()
+        cursor = self._conn().execute(
+            "UPDATE jobs SET status = ?, attempts = 0, available_at = ?, updated_at = ? WHERE id = ? AND status = ?",
+            (QUEUED, now, now, job_id, DEAD),
+        )
+        return cursor.rowcount == 1
+
+    def is_drained(self) -> bool:
+        """True when no job is queued or leased."""
+        counts = self.counts()
+        return counts[QUEUED] == 0 and counts[LEASED] == 0
+
+
+def _result_json(result: Optional[JobResult]) -> Optional[str]:
+    if result is None:
+        return None
+    return json.dumps(asdict(result))
+
+
+# =========================================================================
+# Workers
+# =========================================================================
+
+class QueueWorker:
+    """
+    Leases jobs one at a time and runs them in this process.
+
+    A background thread heartbeats every heartbeat_interval seconds while a
+    job runs. A heartbeat that hits a database error is retried on the next
+    tick. If a heartbeat finds the lease taken over, or the lease expires
+    before a heartbeat gets through, it sets the job's cancel_event so
+    generate_draft stops before writing more checkpoint state into the
+    folder the new owner is resuming. Jobs run through run_job, which
+    resumes from the job folder's checkpoint.json when an earlier attempt
+    got that far.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        runner: Callable[[BatchJob], JobResult] = run_job,
+        worker_id: Optional[str] = None,
+        heartbeat_interval: Optional[float] = None,
+        poll_interval: float = 5.0,
+    ):
+        self.queue = queue
+        self.runner = runner
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.heartbeat_interval = heartbeat_interval or max(queue.lease_seconds / 3, 0.05)
+        self.poll_interval = poll_interval
+        self.processed = 0
+
+    def run_one(self) -> Optional[str]:
+        """
+        Lease and run one job.
+
+        Returns:
+            Final status of the job (DONE, QUEUED, DEAD), None if nothing was
+            available, or LEASED if this worker lost the lease meanwhile
+        """
+        leased = self.queue.lease(self.worker_id)
+        if leased is None:
+            return None
+
+        job = leased.to_batch_job()
+        job.cancel_event = threading.Event()
+        logger.info(f"[{self.worker_id}] Job {leased.id} attempt {leased.attempts}/{leased.max_attempts}: {job.topic[:60]}")
+
+        stop = threading.Event()
+        beat = threading.Thread(target=self._heartbeat, args=(leased, stop, job.cancel_event), daemon=True)
+        beat.start()
+        try:
+            try:
+                result = self.runner(job)
+            except Exception as e:
+                result = JobResult(
+                    index=job.index, topic=job.topic, output_dir=str(job.output_dir), status="failed",
+                    seconds=0.0, error=f"{type(e).__name__}: {str(e)[:300]}",
+                )
+        finally:
+            stop.set()
+            beat.join()
+
+        self.processed += 1
+        if result.status == "completed":
+            status = DONE if self.queue.complete(leased, result) else None
+        else:
+            status = self.queue.fail(leased, result.error or "failed", result)
+        if status is None:
+            logger.warning(f"[{self.worker_id}] Lost the lease on job {leased.id}; result discarded")
+            return LEASED
+        return status
+
+    def _heartbeat(self, leased: LeasedJob, stop: threading.Event, lost: threading.Event) -> None:
+        try:
+            while not stop.wait(self.heartbeat_interval):
+                try:
+                    if self.queue.heartbeat(leased):
+                        continue
+                    logger.warning(f"[{self.worker_id}] Lease on job {leased.id} lost; stopping the run")
+                except sqlite3.Error as e:
+                    # e.g. database locked: the lease still holds until it expires
+                    if self.queue.clock() < leased.lease_expires:
+                        logger.warning(f"[{self.worker_id}] Heartbeat for job {leased.id} failed, retrying: {e}")
+                        continue
+                    logger.warning(f"[{self.worker_id}] Lease on job {leased.id} expired unconfirmed ({e}); stopping the run")
+                lost.set()
+                return
+        finally:
+            self.queue.close()
+
+    def run(self, exit_when_idle: bool = False, stop: Optional[threading.Event] = None) -> int:
+        """
+        Process jobs until stopped (or until the queue drains if exit_when_idle).
+
+        Returns:
+            Number of jobs processed
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            if self.run_one() is not None:
+                continue
+            if exit_when_idle and self.queue.is_drained():
+                break
+            # Nothing leasable yet (backoff, or another worker holds the rest)
+            stop.wait(self.poll_interval)
+        return self.processed
+
+
+def _worker_main(
+    db_path: str,
+    queue_options: Dict[str, Any],
+    runner: Callable[[BatchJob], JobResult],
+    limiter,
+    cache_env: Dict[str, str],
+    exit_when_idle: bool,
+    poll_interval: float,
+) -> None:
+    """Entry point of one worker process."""
+    from batch_runner import _init_worker
+
+    _init_worker(limiter, cache_env)
+    queue = JobQueue(Path(db_path), **queue_options)
+    QueueWorker(queue, runner=runner, poll_interval=poll_interval).run(exit_when_idle=exit_when_idle)
+
+
+def run_workers(
+    db_path: Path = DEFAULT_QUEUE_DB,
+    workers: Optional[int] = None,
+    runner: Callable[[BatchJob], JobResult] = run_job,
+    exit_when_idle: bool = False,
+    poll_interval: float = 5.0,
+    **queue_options: Any,
+) -> None:
+    """
+    Run a fleet of worker processes against the queue.
+
+    Workers share one Gemini limiter and the on-disk caches, exactly like
+    `opendraft batch`. Blocks until every worker exits (with exit_when_idle)
+    or until interrupted.
+
+    Args:
+        db_path: Queue database
+        workers: Worker processes (default: MAX_PARALLEL_THESES)
+        runner: Picklable function running one job
+        exit_when_idle: Stop once no job is queued or leased
+        poll_interval: Seconds between polls when nothing is leasable
+        **queue_options: JobQueue settings (lease_seconds, max_attempts, ...)
+    """
+    from batch_runner import _shared_cache_env
+    from concurrency.concurrency_config import get_concurrency_config
+    from concurrency.rate_limiter import start_shared_gemini_limiter
+
+    if workers is None:
+        workers = get_concurrency_config(verbose=False).max_parallel_theses
+    db_path = Path(db_path).resolve()
+    JobQueue(db_path, **queue_options).close()  # Create the schema once
+
+    shared = start_shared_gemini_limiter()
+    manager, limiter = shared if shared else (None, None)
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(
+            target=_worker_main,
+            args=(str(db_path), queue_options, runner, limiter, _shared_cache_env(), exit_when_idle, poll_interval),
+            name=f"opendraft-worker-{i}",
+        )
+        for i in range(max(1, workers))
+    ]
+    try:
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        if manager is not None:
+            manager.shutdown()
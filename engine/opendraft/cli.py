@@ -1044,6 +1044,160 @@ def run_data_command(argv):
         return 1
 
 
+def run_batch_command(argv):
+    """Run batch subcommand: generate many drafts in parallel."""
+    import argparse
+    c = Colors
+
+    parser = argparse.ArgumentParser(
+        prog="opendraft batch",
+        description="Generate many drafts in parallel from a JSONL jobs file"
+    )
+    parser.add_argument("jobs", help="JSONL file, one job per line (e.g. {\"topic\": \"...\", \"level\": \"master\"})")
+    parser.add_argument("--output", "-o", type=Path, default=Path.cwd() / "opendraft_batch",
+                        help="Batch output directory (default: ./opendraft_batch)")
+    parser.add_argument("--workers", "-w", type=int,
+                        help="Drafts generated at once (default: MAX_PARALLEL_THESES or 3)")
+
+    args = parser.parse_args(argv)
+    jobs_path = Path(args.jobs)
+
+    if not jobs_path.exists():
+        print(f"\n  {c.RED}✗{c.RESET} File not found: {jobs_path}\n")
+        return 1
+
+    if not has_api_key():
+        print(f"  {c.YELLOW}!{c.RESET} Run {c.BOLD}opendraft setup{c.RESET} first.\n")
+        return 1
+    if not os.getenv('GOOGLE_API_KEY'):
+        os.environ['GOOGLE_API_KEY'] = get_api_key()
+
+    try:
+        sys.path.insert(0, str(Path(__file__).parent.parent))
+        from batch_runner import load_jobs, run_batch, REPORT_FILENAME
+
+        jobs = load_jobs(jobs_path, args.output)
+        if not jobs:
+            print(f"\n  {c.YELLOW}!{c.RESET} No jobs in {jobs_path}\n")
+            return 1
+
+        print()
+        print(f"  {c.BOLD}Batch{c.RESET}")
+        print(f"  {c.GRAY}{'─' * 40}{c.RESET}")
+        print(f"  {c.GRAY}Jobs:{c.RESET}     {len(jobs)}")
+        print(f"  {c.GRAY}Output:{c.RESET}   {args.output}")
+        print()
+        print(f"  {c.PURPLE}⣾{c.RESET} Generating drafts...")
+
+        def on_result(result):
+            mark = f"{c.GREEN}✓{c.RESET}" if result.status == "completed" else f"{c.RED}✗{c.RESET}"
+            detail = result.pdf_path if result.status == "completed" else result.error
+            print(f"  {mark} [{result.index}] {result.topic[:50]} ({result.seconds / 60:.1f} min)")
+            print(f"    {c.GRAY}{detail}{c.RESET}")
+
+        report = run_batch(jobs, args.output, max_workers=args.workers, on_result=on_result)
+
+        print()
+        print(f"  {c.GREEN}{'─' * 40}{c.RESET}")
+        print(f"  {report.summary()}")
+        print(f"  {c.GRAY}Report:{c.RESET} {args.output / REPORT_FILENAME}")
+        print()
+        return 0 if report.failed == 0 else 1
+
+    except KeyboardInterrupt:
+        print(f"\n\n  {c.YELLOW}!{c.RESET} Interrupted.\n")
+        return 1
+    except Exception as e:
+        print_friendly_error(e)
+        return 1
+
+
+def run_queue_command(argv):
+    """Run queue subcommand: durable job queue and worker fleet."""
+    import argparse
+    c = Colors
+
+    parser = argparse.ArgumentParser(
+        prog="opendraft queue",
+        description="Durable draft job queue with crash-safe workers"
+    )
+    parser.add_argument("--db", type=Path, default=Path(os.getenv("OPENDRAFT_QUEUE_DB", "opendraft_queue.db")),
+                        help="Queue database (default: $OPENDRAFT_QUEUE_DB or ./opendraft_queue.db)")
+    sub = parser.add_subparsers(dest="action", required=True)
+
+    add = sub.add_parser("add", help="Enqueue jobs from a JSONL file (same format as opendraft batch)")
+    add.add_argument("jobs", help="JSONL jobs file")
+    add.add_argument("--output", "-o", type=Path, default=Path.cwd() / "opendraft_queue",
+                     help="Folder for job outputs (default: ./opendraft_queue)")
+    add.add_argument("--max-attempts", type=int, default=3, help="Attempts before dead-lettering (default: 3)")
+
+    work = sub.add_parser("work", help="Run worker processes")
+    work.add_argument("--workers", "-w", type=int,
+                      help="Worker processes (default: MAX_PARALLEL_THESES or 3)")
+    work.add_argument("--lease", type=float, default=300.0, help="Lease seconds without heartbeat (default: 300)")
+    work.add_argument("--exit-when-idle", action="store_true", help="Stop once the queue is drained")
+
+    sub.add_parser("status", help="Show job counts and dead letters")
+
+    requeue = sub.add_parser("requeue", help="Retry a dead-lettered job")
+    requeue.add_argument("job_id", type=int)
+
+    args = parser.parse_args(argv)
+
+    try:
+        sys.path.insert(0, str(Path(__file__).parent.parent))
+        from job_queue import DEAD, JobQueue, run_workers
+        from batch_runner import load_jobs
+
+        if args.action == "add":
+            import time
+            queue = JobQueue(args.db)
+            # One subfolder per add, so enqueueing the same file twice never shares job folders
+            jobs = load_jobs(Path(args.jobs), args.output / time.strftime("%Y%m%d_%H%M%S"))
+            ids = [queue.enqueue(job, max_attempts=args.max_attempts) for job in jobs]
+            print(f"\n  {c.GREEN}✓{c.RESET} Enqueued {len(ids)} jobs in {args.db}\n")
+            return 0
+
+        if args.action == "status":
+            queue = JobQueue(args.db)
+            counts = queue.counts()
+            print()
+            print(f"  {c.BOLD}Queue{c.RESET} {c.GRAY}{args.db}{c.RESET}")
+            print(f"  {c.GRAY}{'─' * 40}{c.RESET}")
+            for status, count in counts.items():
+                print(f"  {c.GRAY}{status:8}{c.RESET} {count}")
+            for job in queue.jobs(DEAD):
+                print(f"  {c.RED}✗{c.RESET} [{job['id']}] {job['topic'][:50]}")
+                print(f"    {c.GRAY}{job['last_error']}{c.RESET}")
+            print()
+            return 0
+
+        if args.action == "requeue":
+            if JobQueue(args.db).requeue(args.job_id):
+                print(f"\n  {c.GREEN}✓{c.RESET} Job {args.job_id} requeued\n")
+                return 0
+            print(f"\n  {c.YELLOW}!{c.RESET} Job {args.job_id} is not dead-lettered\n")
+            return 1
+
+        # work
+        if not has_api_key():
+            print(f"  {c.YELLOW}!{c.RESET} Run {c.BOLD}opendraft setup{c.RESET} first.\n")
+            return 1
+        if not os.getenv('GOOGLE_API_KEY'):
+            os.environ['GOOGLE_API_KEY'] = get_api_key()
+
+        print(f"\n  {c.PURPLE}⣾{c.RESET} Workers running on {args.db} (Ctrl+C to stop)...\n")
+        run_workers(args.db, workers=args.workers, exit_when_idle=args.exit_when_idle, lease_seconds=args.lease)
+        return 0
+
+    except KeyboardInterrupt:
+        print(f"\n\n  {c.YELLOW}!{c.RESET} Interrupted.\n")
+        return 1
+    except Exception as e:
+        print_friendly_error(e)
+        return 1
+
+
 def main():
     """Main CLI entry point."""
     import argparse
@@ -1059,6 +1213,10 @@ def main():
             return run_revise_command(sys.argv[2:])
         if cmd == 'data':
             return run_data_command(sys.argv[2:])
+        if cmd == 'batch':
+            return run_batch_command(sys.argv[2:])
+        if cmd == 'queue':
+            return run_queue_command(sys.argv[2:])
 
     parser = argparse.ArgumentParser(
         prog="opendraft",
@@ -1074,6 +1232,8 @@ def main():
   opendraft digest <file>      Generate 60-second audio digest
   opendraft revise <folder> "instructions"   Revise existing draft
   opendraft data <provider> <query>          Fetch research datasets
+  opendraft batch <jobs.jsonl>               Generate many drafts in parallel
+  opendraft queue add|work|status|requeue    Durable job queue with crash-safe workers
 
 {Colors.BOLD}Examples:{Colors.RESET}
   opendraft "Impact of AI on Education"
@@ -1083,6 +1243,7 @@ def main():
   opendraft "Neural Networks" --expose              Quick research overview
   opendraft revise ./output "make the intro longer"
   opendraft data worldbank NY.GDP.MKTP.CD --countries USA;DEU
+  opendraft batch jobs.jsonl --workers 3 -o ./batch
 
 {Colors.BOLD}Languages:{Colors.RESET}
   en, de, es, fr, it, pt, nl, zh, ja, ko, ru, ar
@@ -1267,7 +1428,9 @@ def main():
                 resume_from = resume_path / "checkpoint.json"
             else:
                 resume_from = resume_path
-            if resume_from.exists():
+            # A crash inside the first phase leaves only unit checkpoints
+            from utils.checkpoint import has_checkpoint
+            if resume_from.exists() or has_checkpoint(resume_from.parent):
                 print(f"  {c.CYAN}Resuming from checkpoint...{c.RESET}")
                 # Use output_dir from checkpoint location
                 output_dir = resume_from.parent
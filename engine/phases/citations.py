@@ -15,18 +15,39 @@ def run_citation_management(ctx: DraftContext) -> None:
     """
     Execute the citation management pipeline (deterministic, no LLM).
 
-    Mutates ctx: citation_database, citation_summary
+    Pages prefetched and DOI/URL checks run by the research phase's
+    CitationStream are reused; deduplication and filtering always run on the
+    complete Scout result.
+    The finished database is recorded as a unit checkpoint, so a resumed run
+    whose structure phase was still running (see run_structure_and_citations)
+    does not repeat it.
+
+    Mutates ctx: citation_database, citation_summary, citation_stream
     """
     from utils.agent_runner import rate_limit_delay
     from utils.citation_database import CitationDatabase, save_citation_database, load_citation_database
     from utils.deduplicate_citations import deduplicate_citations
     from utils.scrape_citation_titles import TitleScraper
     from utils.scrape_citation_metadata import MetadataScraper
+    from utils.page_fetcher import PageFetcher
     from utils.citation_quality_filter import CitationQualityFilter
 
     if ctx.verbose:
         print("\n📚 PHASE 2.5: CITATION MANAGEMENT")
 
+    citation_db_path = ctx.folders['research'] / "bibliography.json"
+    units = ctx.unit_checkpoint("citations")
+    saved = units.get("database") if units is not None else None
+    if saved is not None and citation_db_path.exists():
+        if ctx.citation_stream is not None:
+            ctx.citation_stream.abort()
+            ctx.citation_stream = None
+        ctx.citation_database = load_citation_database(citation_db_path)
+        ctx.citation_summary = saved["citation_summary"]
+        if ctx.verbose:
+            print(f"\u2705 Citations: {len(ctx.citation_database.citations)} unique (restored)")
+        return
+
     # Create citation database from Scout results
     scout_citations = ctx.scout_result['citations']
     for i, citation in enumerate(scout_citations, start=1):
@@ -53,19 +74,34 @@ def run_citation_management(ctx: DraftContext) -> None:
     )
     ctx.citation_database.citations = deduplicated_citations
 
-    # Scrape titles and metadata for web sources
+    # Scrape titles and metadata for web sources: each URL is downloaded once
+    # and its parsed HTML shared by both extractors
     title_scraper = TitleScraper(verbose=False)
-    title_scraper.scrape_citations(ctx.citation_database.citations)
-
     metadata_scraper = MetadataScraper(verbose=False)
-    metadata_scraper.scrape_citations(ctx.citation_database.citations)
+    to_scrape = (
+        title_scraper.select_citations(ctx.citation_database.citations)
+        + metadata_scraper.select_citations(ctx.citation_database.citations)
+    )
+    pages = {}
+    validator = None
+    if ctx.citation_stream is not None:
+        pages = dict(ctx.citation_stream.pages())
+        validator = ctx.citation_stream.validator
+        ctx.citation_stream = None
+    wanted = list(dict.fromkeys(c.url for c in to_scrape if c.url))
+    missing = [url for url in wanted if url not in pages]
+    if ctx.verbose and pages:
+        print(f"   Reusing {len(wanted) - len(missing)} prefetched pages, fetching {len(missing)}")
+    pages.update(PageFetcher().fetch_all(missing))
+
+    title_scraper.scrape_citations(ctx.citation_database.citations, pages=pages)
+    metadata_scraper.scrape_citations(ctx.citation_database.citations, pages=pages)
 
     # Save citation database to research folder
-    citation_db_path = ctx.folders['research'] / "bibliography.json"
     save_citation_database(ctx.citation_database, citation_db_path)
 
     # Quality filtering (auto-fix mode for automated runs)
-    filter_obj = CitationQualityFilter(strict_mode=False)
+    filter_obj = CitationQualityFilter(strict_mode=False, validator=validator)
     filter_obj.filter_database(citation_db_path, citation_db_path)
 
     # Reload filtered database
@@ -91,13 +127,22 @@ def run_citation_management(ctx: DraftContext) -> None:
 
     # Build citation summary for writing agents
     ctx.citation_summary = _build_citation_summary(ctx.citation_database)
+    if units is not None:
+        units.save("database", {"citation_summary": ctx.citation_summary})
 
     rate_limit_delay()
 
 
 def _build_citation_summary(citation_database) -> str:
     """Build comprehensive citation database string for writing agent prompts."""
-    citation_summary = f"\n\n{'='*80}\n## CITATION DATABASE - {len(citation_database.citations)} CITATIONS AVAILABLE\n{'='*80}\n\n"
+    citations = citation_database.citations
+    entries = [_format_citation_entry(i, citation) for i, citation in enumerate(citations, 1)]
+    return _citation_summary_header(len(citations)) + "".join(entries) + _citation_summary_footer(len(citations))
+
+
+def _citation_summary_header(count: int) -> str:
+    """Citation restriction rules that open every citation list in a prompt."""
+    citation_summary = f"\n\n{'='*80}\n## CITATION DATABASE - {count} CITATIONS AVAILABLE\n{'='*80}\n\n"
     citation_summary += "\u26a0\ufe0f  **CRITICAL CITATION RESTRICTION** \u26a0\ufe0f\n\n"
     citation_summary += "You MUST ONLY cite papers from this database. DO NOT:\n"
     citation_summary += "- Cite papers from your training data\n"
@@ -106,30 +151,36 @@ def _build_citation_summary(citation_database) -> str:
     citation_summary += "- Use author names not in this database\n\n"
     citation_summary += "Citation format: Use {{cite_XXX}} where XXX is the citation ID shown below.\n"
     citation_summary += f"\n{'='*80}\n\n"
+    return citation_summary
+
 
-    for i, citation in enumerate(citation_database.citations, 1):
-        authors_str = ", ".join(citation.authors[:3])
-        if len(citation.authors) > 3:
-            authors_str += " et al."
+def _format_citation_entry(number: int, citation) -> str:
+    """One numbered citation in a prompt's citation list."""
+    authors_str = ", ".join(citation.authors[:3])
+    if len(citation.authors) > 3:
+        authors_str += " et al."
 
-        citation_summary += f"{i}. **[{citation.id}]** {authors_str} ({citation.year})\n"
-        citation_summary += f"   Title: {citation.title}\n"
+    entry = f"{number}. **[{citation.id}]** {authors_str} ({citation.year})\n"
+    entry += f"   Title: {citation.title}\n"
 
-        if citation.doi:
-            citation_summary += f"   DOI: {citation.doi}\n"
-        if citation.journal:
-            citation_summary += f"   Journal: {citation.journal}\n"
-        if citation.abstract:
-            abstract_preview = citation.abstract[:300]
-            if len(citation.abstract) > 300:
-                abstract_preview += "..."
-            citation_summary += f"   Abstract: {abstract_preview}\n"
+    if citation.doi:
+        entry += f"   DOI: {citation.doi}\n"
+    if citation.journal:
+        entry += f"   Journal: {citation.journal}\n"
+    if citation.abstract:
+        abstract_preview = citation.abstract[:300]
+        if len(citation.abstract) > 300:
+            abstract_preview += "..."
+        entry += f"   Abstract: {abstract_preview}\n"
 
-        citation_summary += f"   Citation format: {{{{{citation.id}}}}}\n\n"
+    entry += f"   Citation format: {{{{{citation.id}}}}}\n\n"
+    return entry
 
-    citation_summary += f"\n{'='*80}\n"
-    citation_summary += f"Total citations available: {len(citation_database.citations)}\n"
+
+def _citation_summary_footer(count: int) -> str:
+    """Closing reminder of a prompt's citation list."""
+    citation_summary = f"\n{'='*80}\n"
+    citation_summary += f"Total citations available: {count}\n"
     citation_summary += "Remember: ONLY cite from this list. No external citations allowed.\n"
     citation_summary += f"{'='*80}\n"
-
     return citation_summary
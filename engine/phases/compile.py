@@ -8,6 +8,7 @@ import re
 import time
 import logging
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Tuple
 from datetime import datetime
@@ -229,7 +230,6 @@ def run_compile_and_export(ctx: DraftContext) -> Tuple[Path, Path]:
     from utils.agent_runner import run_agent
     from utils.citation_compiler import CitationCompiler
     from utils.abstract_generator import generate_abstract_for_draft
-    from utils.export_professional import export_pdf, export_docx
     from utils.text_utils import clean_ai_language, strip_meta_text, localize_chapter_headings, clean_agent_output
     from utils.text_cleanup import apply_full_cleanup
     from utils.text_utils import slugify
@@ -425,35 +425,7 @@ generated_by: "OpenDraft AI - https://github.com/federicodeponte/opendraft"
         ctx.tracker.update_exporting(export_type="PDF and DOCX")
         ctx.tracker.check_cancellation()
 
-    # PDF export
-    pdf_path = ctx.folders['exports'] / f"{base_filename}.pdf"
-
-    if ctx.tracker:
-        ctx.tracker.log_activity("📑 Generating professional PDF document...", event_type="info", phase="exporting")
-
-    if ctx.verbose:
-        print("📄 Exporting PDF (professional formatting)...")
-
-    pdf_success = export_pdf(md_file=final_md_path, output_pdf=pdf_path, engine='pandoc')
-
-    if not pdf_success:
-        raise RuntimeError("PDF export failed - Professional formatting required!")
-    if not pdf_path.exists():
-        raise RuntimeError(f"PDF export failed - file not created: {pdf_path}")
-
-    if ctx.tracker:
-        ctx.tracker.log_activity("\u2705 PDF document ready", event_type="found", phase="exporting")
-        ctx.tracker.log_activity("📝 Creating Word document...", event_type="info", phase="exporting")
-
-    # DOCX export
-    docx_path = ctx.folders['exports'] / f"{base_filename}.docx"
-    docx_success = export_docx(md_file=final_md_path, output_docx=docx_path)
-
-    if not docx_success or not docx_path.exists():
-        raise RuntimeError(f"DOCX export failed - file not created: {docx_path}")
-
-    if ctx.tracker:
-        ctx.tracker.log_activity("\u2705 Word document ready", event_type="found", phase="exporting")
+    pdf_path, docx_path = _export_pdf_and_docx(ctx, final_md_path, base_filename)
 
     # ZIP bundle
     zip_path = ctx.folders['exports'] / f"{base_filename}.zip"
@@ -484,6 +456,50 @@ generated_by: "OpenDraft AI - https://github.com/federicodeponte/opendraft"
 # ---------------------------------------------------------------------------
 
 
+def _export_pdf_and_docx(ctx: DraftContext, final_md_path: Path, base_filename: str) -> Tuple[Path, Path]:
+    """
+    Export the final markdown to PDF and DOCX concurrently.
+
+    Both exports only read final_md_path and write their own files, so they
+    run side by side; errors are raised in the same order as before (PDF first).
+
+    Returns: (pdf_path, docx_path)
+    """
+    from utils.export_professional import export_pdf, export_docx
+
+    pdf_path = ctx.folders['exports'] / f"{base_filename}.pdf"
+    docx_path = ctx.folders['exports'] / f"{base_filename}.docx"
+
+    if ctx.tracker:
+        ctx.tracker.log_activity("📑 Generating professional PDF document...", event_type="info", phase="exporting")
+        ctx.tracker.log_activity("📝 Creating Word document...", event_type="info", phase="exporting")
+
+    if ctx.verbose:
+        print("📄 Exporting PDF (professional formatting) and DOCX...")
+
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="export") as executor:
+        pdf_future = executor.submit(export_pdf, md_file=final_md_path, output_pdf=pdf_path, engine='pandoc')
+        docx_future = executor.submit(export_docx, md_file=final_md_path, output_docx=docx_path)
+
+        pdf_success = pdf_future.result()
+        if not pdf_success:
+            raise RuntimeError("PDF export failed - Professional formatting required!")
+        if not pdf_path.exists():
+            raise RuntimeError(f"PDF export failed - file not created: {pdf_path}")
+
+        if ctx.tracker:
+            ctx.tracker.log_activity("\u2705 PDF document ready", event_type="found", phase="exporting")
+
+        docx_success = docx_future.result()
+        if not docx_success or not docx_path.exists():
+            raise RuntimeError(f"DOCX export failed - file not created: {docx_path}")
+
+    if ctx.tracker:
+        ctx.tracker.log_activity("\u2705 Word document ready", event_type="found", phase="exporting")
+
+    return pdf_path, docx_path
+
+
 def _strip_first_header(text: str) -> str:
     """Remove first line if it's a markdown header."""
     lines = text.strip().split('\n')
@@ -13,15 +13,90 @@ from .context import DraftContext
 logger = logging.getLogger(__name__)
 
 
+# Which compose steps consume which earlier compose outputs. Every step also
+# reads the outline and citation summary, which are ready before compose starts.
+# Steps with no entries here can be written concurrently.
+SECTION_DEPENDENCIES = {
+    "introduction": [],
+    "literature_review": [],
+    "methodology": [],
+    "results": ["literature_review", "methodology"],
+    "discussion": ["literature_review", "results"],
+    "body": ["literature_review", "methodology", "results", "discussion"],
+    "conclusion": ["body"],
+    "appendices": ["introduction", "body", "conclusion"],
+}
+
+# The ctx attribute each compose step produces (its sub-phase checkpoint)
+SECTION_OUTPUTS = {
+    "introduction": "intro_output",
+    "literature_review": "lit_review_output",
+    "methodology": "methodology_output",
+    "results": "results_output",
+    "discussion": "discussion_output",
+    "body": "body_output",
+    "conclusion": "conclusion_output",
+    "appendices": "appendix_output",
+}
+
+
+CRAFTER_PROMPT = "prompts/03_compose/crafter.md"
+
+# Outline tokens in the preamble that every Crafter prompt starts with
+OUTLINE_TOKENS = 750
+
+# Citation IDs named per section when the full database is in the cached prefix
+RELEVANT_CITATION_HINTS = 15
+
+# Token budget for each Crafter's own context blocks (earlier sections,
+# research notes and citation list). The shared preamble and the writing
+# instructions come on top.
+CONTEXT_BUDGETS = {
+    "introduction": 4000,
+    "literature_review": 8000,
+    "methodology": 4000,
+    "results": 4500,
+    "discussion": 5000,
+    "conclusion": 3000,
+    "appendices": 3000,
+}
+
+# What each section is about, added to the topic when ranking citations
+SECTION_FOCUS = {
+    "introduction": "background context motivation problem significance objectives questions overview",
+    "literature_review": "theory theoretical framework literature review prior studies concepts debate evidence",
+    "methodology": "methodology methods design data sample sampling survey interview experiment "
+                   "measurement instrument procedure model empirical",
+    "results": "findings evidence outcomes effects performance measured statistics empirical data",
+    "discussion": "implications interpretation limitations comparison challenges policy practice future",
+    "conclusion": "contributions implications recommendations policy practice future directions",
+    "appendices": "supplementary data instrument definitions tables technical details",
+}
+
+
 def run_compose_phase(ctx: DraftContext) -> None:
     """
-    Execute the compose phase: 7 sequential Crafter agents.
+    Execute the compose phase: 7 Crafter agents scheduled by SECTION_DEPENDENCIES.
+
+    On the paid tier (ConcurrencyConfig.crafter_parallel) independent sections
+    are written concurrently. Agent starts are paced by the shared Gemini
+    token bucket, or spaced by rate_limit_delay when the bucket is disabled.
+    Otherwise the sections run one after another in declaration order.
+
+    Each finished section is checkpointed on its own, so after a crash the
+    resumed phase restores finished sections and only writes the rest.
+
+    Every Crafter prompt starts with the same prefix (crafter.md, topic,
+    outline). If the model supports context caching, that prefix plus the
+    full citation database is cached once for the phase and each call sends
+    only its section-specific part.
 
     Mutates ctx: intro_output, lit_review_output, methodology_output,
                  results_output, discussion_output, body_output,
                  conclusion_output, appendix_output
     """
-    from utils.agent_runner import run_agent, rate_limit_delay
+    from concurrency import DagScheduler, get_concurrency_config
+    from utils.agent_runner import rate_limit_delay
 
     logger.info("=" * 80)
     logger.info("PHASE 3: COMPOSE - Writing chapters")
@@ -36,28 +111,71 @@ def run_compose_phase(ctx: DraftContext) -> None:
         ctx.tracker.check_cancellation()
         ctx.tracker.send_heartbeat()
 
-    _write_introduction(ctx)
-    rate_limit_delay()
+    config = get_concurrency_config(verbose=False)
+    max_workers = config.crafter_max_workers if config.crafter_parallel else 1
+
+    writers = {
+        "introduction": _write_introduction,
+        "literature_review": _write_literature_review,
+        "methodology": _write_methodology,
+        "results": _write_results,
+        "discussion": _write_discussion,
+        "body": _merge_body_sections,
+        "conclusion": _write_conclusion,
+        "appendices": _write_appendices,
+    }
+
+    units = ctx.unit_checkpoint("compose")
+    restored = [section for section in writers if units is not None and section in units]
+    if restored:
+        logger.info(f"[COMPOSE] Restored from checkpoint, skipping: {', '.join(restored)}")
+        if ctx.verbose:
+            print(f"   ♻️  Resuming: {len(restored)}/{len(writers)} sections already written")
+
+    scheduler = DagScheduler(
+        max_workers=max_workers,
+        # The token bucket paces each run_agent call itself
+        submit_delay=0.0 if config.token_bucket_enabled else config.rate_limit_delay,
+        name="compose",
+    )
+    for section, writer in writers.items():
+        scheduler.add(
+            section,
+            lambda section=section, writer=writer: _run_section(ctx, section, writer, units),
+            depends_on=SECTION_DEPENDENCIES[section],
+            throttled=section != "body" and section not in restored,
+        )
 
-    _write_literature_review(ctx)
-    rate_limit_delay()
+    if max_workers > 1:
+        logger.info(f"[COMPOSE] Parallel crafters enabled ({max_workers} workers)")
 
-    _write_methodology(ctx)
-    rate_limit_delay()
+    pending = [s for s in writers if s != "body" and s not in restored]
+    ctx.crafter_context = _create_crafter_context(ctx) if len(pending) > 1 else None
+    try:
+        durations = scheduler.run()
+    finally:
+        if ctx.crafter_context is not None:
+            ctx.model.delete_cached_context(ctx.crafter_context)
+            ctx.crafter_context = None
+    logger.info(
+        "[COMPOSE] Section times: "
+        + ", ".join(f"{name}={seconds:.1f}s" for name, seconds in durations.items())
+    )
 
-    _write_results(ctx)
     rate_limit_delay()
 
-    _write_discussion(ctx)
 
-    _merge_body_sections(ctx)
-    rate_limit_delay()
+def _run_section(ctx: DraftContext, section: str, writer, units) -> None:
+    """Restore a checkpointed section, or write it and checkpoint the result."""
+    attr = SECTION_OUTPUTS[section]
+    saved = units.get(section) if units is not None else None
+    if saved is not None:
+        setattr(ctx, attr, saved[attr])
+        return
 
-    _write_conclusion(ctx)
-    rate_limit_delay()
-
-    _write_appendices(ctx)
-    rate_limit_delay()
+    writer(ctx)
+    if units is not None:
+        units.save(section, {attr: getattr(ctx, attr)})
 
 
 # ---------------------------------------------------------------------------
@@ -65,6 +183,87 @@ def run_compose_phase(ctx: DraftContext) -> None:
 # ---------------------------------------------------------------------------
 
 
+def _crafter_preamble(ctx: DraftContext, with_citations: bool) -> str:
+    """Start of every Crafter user input: topic, outline and (when cached) the citation database."""
+    from utils.prompt_packer import PromptPacker, PromptSection
+
+    outline = PromptPacker(OUTLINE_TOKENS).pack([PromptSection("outline", ctx.formatter_output)])["outline"]
+    preamble = f"Topic: {ctx.topic}\n\nOutline:\n{outline}\n"
+    if with_citations:
+        preamble += f"{ctx.citation_summary}\n"
+    return preamble + "\n---\n\n"
+
+
+def _create_crafter_context(ctx: DraftContext):
+    """Cache the prefix shared by all Crafter prompts; None if the model cannot."""
+    if not hasattr(ctx.model, "create_cached_context"):
+        return None
+    from utils.agent_runner import build_full_prompt, load_prompt
+
+    prefix = build_full_prompt(load_prompt(CRAFTER_PROMPT), _crafter_preamble(ctx, with_citations=True))
+    return ctx.model.create_cached_context(prefix, display_name="opendraft-crafter")
+
+
+def _pack_context(ctx: DraftContext, section: str, blocks: list) -> dict:
+    """
+    Fit a Crafter's context blocks and citation list into CONTEXT_BUDGETS[section].
+
+    Citations are ranked by relevance to the topic, the section's focus and
+    the context blocks, and the list keeps as many whole entries as fit; it
+    gives way first but keeps at least half the budget. The context blocks
+    (PromptSections with their own priorities and caps) are trimmed after it.
+    Without a citation database the prebuilt citation_summary is trimmed instead.
+
+    When the Crafter prefix is cached (ctx.crafter_context), the full database
+    is already in the preamble, so the citation block only names the most
+    relevant IDs and the whole budget goes to the context blocks.
+
+    Returns:
+        dict: Packed text per block name, plus "preamble" and "citations"
+    """
+    from utils.prompt_packer import PromptPacker, PromptSection
+    from utils.text_relevance import rank_by_relevance
+    from utils.token_counter import estimate_tokens
+    from .citations import _citation_summary_footer, _citation_summary_header, _format_citation_entry
+
+    budget = CONTEXT_BUDGETS[section]
+    citations = list(ctx.citation_database.citations) if ctx.citation_database is not None else []
+    cached = ctx.crafter_context is not None
+    ranked = []
+    if citations:
+        query = " ".join([ctx.topic, SECTION_FOCUS[section]] + [block.text for block in blocks])
+        ranked = rank_by_relevance(citations, query, lambda c: f"{c.title} {c.abstract or ''}")
+
+    if cached:
+        texts = dict(PromptPacker(budget).pack(blocks).texts)
+        texts["preamble"] = _crafter_preamble(ctx, with_citations=True)
+        texts["citations"] = ""
+        if ranked:
+            texts["citations"] = (
+                "\nMost relevant citations for this section (full entries in the CITATION DATABASE above): "
+                + ", ".join(c.id for c in ranked[:RELEVANT_CITATION_HINTS]) + "\n"
+            )
+        return texts
+
+    if citations:
+        entries = [_format_citation_entry(i, citation) for i, citation in enumerate(ranked, 1)]
+        frame_tokens = estimate_tokens(_citation_summary_header(len(ranked)) + _citation_summary_footer(len(ranked)))
+        budget -= frame_tokens
+        citation_block = PromptSection("citations", items=entries, priority=1, min_tokens=budget // 2)
+    else:
+        citation_block = PromptSection("citations", ctx.citation_summary, priority=1, min_tokens=budget // 2)
+
+    packed = PromptPacker(budget).pack(list(blocks) + [citation_block])
+    texts = dict(packed.texts)
+    texts["preamble"] = _crafter_preamble(ctx, with_citations=False)
+    if citations:
+        kept = packed.items_kept["citations"]
+        texts["citations"] = _citation_summary_header(kept) + texts["citations"] + _citation_summary_footer(kept)
+        logger.info(f"[COMPOSE] {section}: {kept}/{len(citations)} citations, "
+                    f"~{packed.total_tokens + frame_tokens} context tokens")
+    return texts
+
+
 def _write_introduction(ctx: DraftContext) -> None:
     from utils.agent_runner import run_agent
 
@@ -76,16 +275,13 @@ def _write_introduction(ctx: DraftContext) -> None:
         if ctx.tracker:
             ctx.tracker.log_activity("\u270d\ufe0f Writing Introduction chapter...", event_type="writing", phase="writing")
 
+        context = _pack_context(ctx, "introduction", [])
         ctx.intro_output = run_agent(
             model=ctx.model,
             name="Crafter - Introduction",
-            prompt_path="prompts/03_compose/crafter.md",
-            user_input=f"""Write Introduction:
-
-Topic: {ctx.topic}
-
-Outline:
-{ctx.formatter_output[:2000]}{ctx.citation_summary}
+            prompt_path=CRAFTER_PROMPT,
+            user_input=f"""{context['preamble']}Write Introduction:
+{context['citations']}
 
 **CRITICAL REQUIREMENTS:**
 1. Write {intro_target} words minimum
@@ -97,6 +293,8 @@ Outline:
             verbose=ctx.verbose,
             token_tracker=ctx.token_tracker,
             token_stage="crafter_introduction",
+            on_partial=ctx.partial_output_callback("crafter_introduction"),
+            cached_context=ctx.crafter_context,
         )
 
         if ctx.tracker:
@@ -126,6 +324,7 @@ Outline:
 
 def _write_literature_review(ctx: DraftContext) -> None:
     from utils.agent_runner import run_agent
+    from utils.prompt_packer import PromptSection
 
     lit_review_target = ctx.word_targets['literature_review']
     logger.info("[SECTION 2.1/4] Starting Literature Review")
@@ -135,21 +334,19 @@ def _write_literature_review(ctx: DraftContext) -> None:
         if ctx.tracker:
             ctx.tracker.log_activity("\u270d\ufe0f Writing Literature Review section...", event_type="writing", phase="writing")
 
+        context = _pack_context(ctx, "literature_review", [
+            PromptSection("research", ctx.scribe_output, priority=3, max_tokens=750),
+        ])
         ctx.lit_review_output = run_agent(
             model=ctx.model,
             name="Crafter - Literature Review",
-            prompt_path="prompts/03_compose/crafter.md",
-            user_input=f"""Write section 2.1 Literature Review for this draft.
-
-Topic: {ctx.topic}
+            prompt_path=CRAFTER_PROMPT,
+            user_input=f"""{context['preamble']}Write section 2.1 Literature Review for this draft.
 
 Research summaries and abstracts:
-{ctx.scribe_output[:3000]}
+{context['research']}
 
-{ctx.citation_summary}
-
-Outline context:
-{ctx.formatter_output[:2000]}
+{context['citations']}
 
 **CRITICAL REQUIREMENTS:**
 
@@ -183,6 +380,8 @@ Outline context:
             verbose=ctx.verbose,
             token_tracker=ctx.token_tracker,
             token_stage="crafter_literature_review",
+            on_partial=ctx.partial_output_callback("crafter_literature_review"),
+            cached_context=ctx.crafter_context,
         )
 
         section_time = time.time() - section_start
@@ -209,8 +408,10 @@ Outline context:
 
 def _write_methodology(ctx: DraftContext) -> None:
     from utils.agent_runner import run_agent
+    from utils.prompt_packer import PromptSection
 
     methodology_target = ctx.word_targets['methodology']
+
     logger.info("[SECTION 2.2/4] Starting Methodology")
     section_start = time.time()
 
@@ -218,24 +419,23 @@ def _write_methodology(ctx: DraftContext) -> None:
         if ctx.tracker:
             ctx.tracker.log_activity("\u270d\ufe0f Writing Methodology section...", event_type="writing", phase="writing")
 
+        # Methodology is written alongside the Literature Review, so it builds on
+        # the Signal phase's gaps only; the prompt must not depend on which of
+        # the two finishes first.
+        context = _pack_context(ctx, "methodology", [
+            PromptSection("signal", ctx.signal_output, priority=2, max_tokens=750),
+        ])
+
         ctx.methodology_output = run_agent(
             model=ctx.model,
             name="Crafter - Methodology",
-            prompt_path="prompts/03_compose/crafter.md",
-            user_input=f"""Write section 2.2 Methodology for this draft.
-
-Topic: {ctx.topic}
-
-Literature Review context (what was identified):
-{ctx.lit_review_output[-2000:]}
+            prompt_path=CRAFTER_PROMPT,
+            user_input=f"""{context['preamble']}Write section 2.2 Methodology for this draft.
 
 Research gaps from Signal phase:
-{ctx.signal_output[:1500]}
+{context['signal']}
 
-Outline:
-{ctx.formatter_output[:2000]}
-
-{ctx.citation_summary}
+{context['citations']}
 
 **CRITICAL REQUIREMENTS:**
 
@@ -246,7 +446,7 @@ Outline:
    - **Maximum 300 characters per cell** - keep cells concise!
    - **Maximum 5 columns** per table
    - Put details in prose AFTER the table, not inside cells
-5. **Build on Literature Review:** Reference gaps identified in section 2.1
+5. **Build on the research gaps:** Address the gaps from the Signal phase above
 6. **Citations:** ONLY use citations from the CITATION DATABASE above with {{cite_XXX}} format
 
 **CITATION-CLAIM VERIFICATION:**
@@ -267,16 +467,18 @@ Outline:
 - Research design and approach (qualitative/quantitative/mixed) - from literature
 - Data collection methods - as described in cited sources
 - Analysis framework/techniques - from existing research
-- Rationale for chosen methods (connect to gaps from 2.1) - theoretical justification
+- Rationale for chosen methods (connect to the research gaps) - theoretical justification
 - Tools and technologies used - from literature, not "we used"
 - Study limitations and considerations - theoretical discussion
 
-**Connect to Literature Review:** "To address the gap identified in section 2.1 regarding X, a potential methodology could follow approaches described in {{cite_XXX}}..."**{ctx.language_instruction}""",
+**Connect to the research gaps:** "To address the gap regarding X, a potential methodology could follow approaches described in {{cite_XXX}}..."**{ctx.language_instruction}""",
             save_to=ctx.folders['drafts'] / "02_2_methodology.md",
             skip_validation=ctx.skip_validation,
             verbose=ctx.verbose,
             token_tracker=ctx.token_tracker,
             token_stage="crafter_methodology",
+            on_partial=ctx.partial_output_callback("crafter_methodology"),
+            cached_context=ctx.crafter_context,
         )
 
         section_time = time.time() - section_start
@@ -303,6 +505,7 @@ Outline:
 
 def _write_results(ctx: DraftContext) -> None:
     from utils.agent_runner import run_agent
+    from utils.prompt_packer import KEEP_TAIL, PromptSection
 
     results_target = ctx.word_targets['results']
     logger.info("[SECTION 2.3/4] Starting Analysis and Results")
@@ -312,24 +515,28 @@ def _write_results(ctx: DraftContext) -> None:
         if ctx.tracker:
             ctx.tracker.log_activity("\u270d\ufe0f Writing Analysis & Results section...", event_type="writing", phase="writing")
 
+        context = _pack_context(ctx, "results", [
+            PromptSection("methodology", ctx.methodology_output, priority=3, max_tokens=375, keep=KEEP_TAIL),
+            PromptSection("lit_review", ctx.lit_review_output, priority=2, max_tokens=375),
+            # The first research notes already went into the Literature Review
+            PromptSection("research", ctx.scribe_output[1000:], priority=2, max_tokens=375),
+        ])
         ctx.results_output = run_agent(
             model=ctx.model,
             name="Crafter - Analysis and Results",
-            prompt_path="prompts/03_compose/crafter.md",
-            user_input=f"""Write section 2.3 Analysis and Results for this draft.
-
-Topic: {ctx.topic}
+            prompt_path=CRAFTER_PROMPT,
+            user_input=f"""{context['preamble']}Write section 2.3 Analysis and Results for this draft.
 
 Methodology used (from section 2.2):
-{ctx.methodology_output[-1500:]}
+{context['methodology']}
 
 Literature Review context (theoretical framework):
-{ctx.lit_review_output[:1500]}
+{context['lit_review']}
 
 Research data:
-{ctx.scribe_output[1000:2500]}
+{context['research']}
 
-{ctx.citation_summary}
+{context['citations']}
 
 **CRITICAL REQUIREMENTS:**
 
@@ -372,6 +579,8 @@ Research data:
             verbose=ctx.verbose,
             token_tracker=ctx.token_tracker,
             token_stage="crafter_results",
+            on_partial=ctx.partial_output_callback("crafter_results"),
+            cached_context=ctx.crafter_context,
         )
 
         section_time = time.time() - section_start
@@ -398,6 +607,7 @@ Research data:
 
 def _write_discussion(ctx: DraftContext) -> None:
     from utils.agent_runner import run_agent
+    from utils.prompt_packer import KEEP_TAIL, PromptSection
 
     discussion_target = ctx.word_targets['discussion']
     logger.info("[SECTION 2.4/4] Starting Discussion")
@@ -407,24 +617,27 @@ def _write_discussion(ctx: DraftContext) -> None:
         if ctx.tracker:
             ctx.tracker.log_activity("\u270d\ufe0f Writing Discussion section...", event_type="writing", phase="writing")
 
+        context = _pack_context(ctx, "discussion", [
+            PromptSection("results", ctx.results_output, priority=3, max_tokens=500, keep=KEEP_TAIL),
+            PromptSection("lit_review", ctx.lit_review_output, priority=2, max_tokens=375),
+            PromptSection("signal", ctx.signal_output, priority=2, max_tokens=250),
+        ])
         ctx.discussion_output = run_agent(
             model=ctx.model,
             name="Crafter - Discussion",
-            prompt_path="prompts/03_compose/crafter.md",
-            user_input=f"""Write section 2.4 Discussion for this draft.
-
-Topic: {ctx.topic}
+            prompt_path=CRAFTER_PROMPT,
+            user_input=f"""{context['preamble']}Write section 2.4 Discussion for this draft.
 
 Results (from section 2.3):
-{ctx.results_output[-2000:]}
+{context['results']}
 
 Literature Review context (to compare with):
-{ctx.lit_review_output[:1500]}
+{context['lit_review']}
 
 Research gaps addressed:
-{ctx.signal_output[:1000]}
+{context['signal']}
 
-{ctx.citation_summary}
+{context['citations']}
 
 **CRITICAL REQUIREMENTS:**
 
@@ -471,6 +684,8 @@ You MUST include these explicit phrases to connect back to previous sections:
             verbose=ctx.verbose,
             token_tracker=ctx.token_tracker,
             token_stage="crafter_discussion",
+            on_partial=ctx.partial_output_callback("crafter_discussion"),
+            cached_context=ctx.crafter_context,
         )
 
         section_time = time.time() - section_start
@@ -538,6 +753,7 @@ def _merge_body_sections(ctx: DraftContext) -> None:
 
 def _write_conclusion(ctx: DraftContext) -> None:
     from utils.agent_runner import run_agent
+    from utils.prompt_packer import PromptSection
 
     conclusion_target = ctx.word_targets['conclusion']
     logger.info("[CHAPTER 3/4] Starting Conclusion")
@@ -547,18 +763,19 @@ def _write_conclusion(ctx: DraftContext) -> None:
         if ctx.tracker:
             ctx.tracker.log_activity("\u270d\ufe0f Writing Conclusion chapter...", event_type="writing", phase="writing")
 
+        context = _pack_context(ctx, "conclusion", [
+            PromptSection("body", ctx.body_output, priority=3, max_tokens=500),
+        ])
         ctx.conclusion_output = run_agent(
             model=ctx.model,
             name="Crafter - Conclusion",
-            prompt_path="prompts/03_compose/crafter.md",
-            user_input=f"""Write Conclusion:
-
-Topic: {ctx.topic}
+            prompt_path=CRAFTER_PROMPT,
+            user_input=f"""{context['preamble']}Write Conclusion:
 
 Main findings:
-{ctx.body_output[:2000]}
+{context['body']}
 
-{ctx.citation_summary}
+{context['citations']}
 
 **CRITICAL REQUIREMENTS:**
 1. Write {conclusion_target} words minimum
@@ -571,6 +788,8 @@ Main findings:
             verbose=ctx.verbose,
             token_tracker=ctx.token_tracker,
             token_stage="crafter_conclusion",
+            on_partial=ctx.partial_output_callback("crafter_conclusion"),
+            cached_context=ctx.crafter_context,
         )
 
         chapter_time = time.time() - chapter_start
@@ -597,6 +816,7 @@ Main findings:
 
 def _write_appendices(ctx: DraftContext) -> None:
     from utils.agent_runner import run_agent
+    from utils.prompt_packer import PromptSection
 
     appendices_target = ctx.word_targets['appendices']
     logger.info("[CHAPTER 4/4] Starting Appendices")
@@ -607,20 +827,23 @@ def _write_appendices(ctx: DraftContext) -> None:
             logger.info("  Skipping appendices for research paper format")
             ctx.appendix_output = ""
         else:
+            context = _pack_context(ctx, "appendices", [
+                PromptSection("introduction", ctx.intro_output, priority=2, max_tokens=375),
+                PromptSection("body", ctx.body_output, priority=3, max_tokens=500),
+                PromptSection("conclusion", ctx.conclusion_output, priority=2, max_tokens=250),
+            ])
             ctx.appendix_output = run_agent(
                 model=ctx.model,
                 name="Crafter - Appendices",
-                prompt_path="prompts/03_compose/crafter.md",
-                user_input=f"""Write 3-4 appendices for this draft:
-
-Topic: {ctx.topic}
+                prompt_path=CRAFTER_PROMPT,
+                user_input=f"""{context['preamble']}Write 3-4 appendices for this draft:
 
 Draft content summary:
-- Introduction: {ctx.intro_output[:1500]}
-- Main findings: {ctx.body_output[:2000]}
-- Conclusion: {ctx.conclusion_output[:1000]}
+- Introduction: {context['introduction']}
+- Main findings: {context['body']}
+- Conclusion: {context['conclusion']}
 
-{ctx.citation_summary}
+{context['citations']}
 
 **REQUIREMENTS:**
 1. **Citations:** ONLY use citations from the CITATION DATABASE above with {{cite_XXX}} format
@@ -649,6 +872,8 @@ Supplementary references, tools, and resources for further reading.
                 verbose=ctx.verbose,
                 token_tracker=ctx.token_tracker,
                 token_stage="crafter_appendices",
+                on_partial=ctx.partial_output_callback("crafter_appendices"),
+                cached_context=ctx.crafter_context,
             )
 
         chapter_time = time.time() - chapter_start
@@ -6,7 +6,9 @@ ABOUTME: Each phase reads inputs from ctx and writes outputs back to ctx
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.checkpoint import RestoredField, UnitCheckpoint
 
 
 @dataclass
@@ -54,39 +56,81 @@ class DraftContext:
     tracker: Any = None  # ProgressTracker
     streamer: Any = None  # MilestoneStreamer
 
+    # Set to stop the run before it writes more state (not checkpointed)
+    cancel_event: Any = None  # threading.Event
+
     # ------------------------------------------------------------------
     # Research phase outputs
+    #
+    # Checkpointed phase outputs are RestoredFields: after a resume they are
+    # read from the checkpoint blob store on first access.
     # ------------------------------------------------------------------
-    scout_result: Optional[Dict[str, Any]] = None
-    scout_output: str = ""
-    scribe_output: str = ""
-    signal_output: str = ""
+    scout_result: Optional[Dict[str, Any]] = RestoredField(None)
+    scout_output: str = RestoredField("")
+    scribe_output: str = RestoredField("")
+    signal_output: str = RestoredField("")
 
     # ------------------------------------------------------------------
     # Structure phase outputs
     # ------------------------------------------------------------------
-    architect_output: str = ""
-    formatter_output: str = ""
+    architect_output: str = RestoredField("")
+    formatter_output: str = RestoredField("")
 
     # ------------------------------------------------------------------
     # Citation management outputs
     # ------------------------------------------------------------------
     citation_database: Any = None  # CitationDatabase
-    citation_summary: str = ""
+    citation_summary: str = RestoredField("")
+
+    # Scout results streamed to citation management during research (not checkpointed)
+    citation_stream: Any = None  # CitationStream
 
     # ------------------------------------------------------------------
     # Compose phase outputs
     # ------------------------------------------------------------------
-    intro_output: str = ""
-    lit_review_output: str = ""
-    methodology_output: str = ""
-    results_output: str = ""
-    discussion_output: str = ""
-    body_output: str = ""
-    conclusion_output: str = ""
-    appendix_output: str = ""
+    intro_output: str = RestoredField("")
+    lit_review_output: str = RestoredField("")
+    methodology_output: str = RestoredField("")
+    results_output: str = RestoredField("")
+    discussion_output: str = RestoredField("")
+    body_output: str = RestoredField("")
+    conclusion_output: str = RestoredField("")
+    appendix_output: str = RestoredField("")
+
+    # Cached Crafter prompt prefix while compose runs (not checkpointed)
+    crafter_context: Any = None  # CachedContext
 
     # ------------------------------------------------------------------
     # Token tracking (optional)
     # ------------------------------------------------------------------
     token_tracker: Any = None  # TokenTracker
+
+    # ------------------------------------------------------------------
+    # Sub-phase checkpoints: phase -> unit -> saved data
+    # ------------------------------------------------------------------
+    completed_units: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def unit_checkpoint(self, phase: str) -> Optional[Any]:
+        """
+        UnitCheckpoint for fine-grained resume inside `phase`.
+
+        Returns None when the context has no output folder (nothing to save to).
+        """
+        root = self.folders.get('root')
+        if root is None:
+            return None
+        return UnitCheckpoint(root, phase, self.completed_units.setdefault(phase, {}), self.cancel_event)
+
+    def partial_output_callback(self, stage: str) -> Optional[Callable[[str], None]]:
+        """
+        Build a run_agent on_partial callback that forwards streamed text to the tracker.
+
+        Returns None when no tracker is attached.
+        """
+        if not self.tracker:
+            return None
+
+        def report(text: str) -> None:
+            self.tracker.update_partial_output(stage, text)
+
+        return report
@@ -18,9 +18,18 @@ def run_research_phase(ctx: DraftContext) -> None:
     """
     Execute the research phase: Scout -> Scribe -> Signal.
 
-    Mutates ctx: scout_result, scout_output, scribe_output, signal_output
+    Scout queries, Scribe and Signal are checkpointed as they finish, so a
+    resumed phase only repeats the work that was interrupted.
+
+    With CITATION_STREAMING on, the Scout's citations also go to a
+    CitationStream that prefetches the pages citation management will scrape
+    while Scribe and Signal run.
+
+    Mutates ctx: scout_result, scout_output, scribe_output, signal_output, citation_stream
     """
+    from concurrency.concurrency_config import get_concurrency_config
     from utils.agent_runner import run_agent, rate_limit_delay, research_citations_via_api
+    from utils.citation_stream import CitationStream
     from utils.text_utils import smart_truncate
 
     if ctx.verbose:
@@ -47,6 +56,15 @@ def run_research_phase(ctx: DraftContext) -> None:
     if ctx.blurb:
         research_topics.insert(0, f"{ctx.topic} - {ctx.blurb}")
 
+    units = ctx.unit_checkpoint("research")
+
+    # A retried phase starts a fresh stream; the Scout hands it every citation again
+    if ctx.citation_stream is not None:
+        ctx.citation_stream.abort()
+        ctx.citation_stream = None
+    if get_concurrency_config(verbose=False).citation_streaming:
+        ctx.citation_stream = CitationStream()
+
     # -----------------------------------------------------------------------
     # AGENT: Scout
     # -----------------------------------------------------------------------
@@ -69,6 +87,8 @@ def run_research_phase(ctx: DraftContext) -> None:
             scope=ctx.topic,
             min_sources_deep=deep_research_min,
             progress_callback=progress_callback,
+            unit_checkpoint=units,
+            on_citations=ctx.citation_stream.put if ctx.citation_stream else None,
         )
 
         if ctx.verbose:
@@ -94,6 +114,10 @@ def run_research_phase(ctx: DraftContext) -> None:
 
     except ValueError as e:
         raise ValueError(f"Insufficient citations for draft generation: {str(e)}")
+    finally:
+        # Scout is done: queued citations are still processed and downloads continue
+        if ctx.citation_stream is not None:
+            ctx.citation_stream.close()
 
     rate_limit_delay()
 
@@ -103,17 +127,23 @@ def run_research_phase(ctx: DraftContext) -> None:
     if ctx.tracker:
         ctx.tracker.log_activity("📝 Summarizing research findings...", event_type="info", phase="research")
 
-    ctx.scribe_output = run_agent(
-        model=ctx.model,
-        name="Scribe - Summarize Papers",
-        prompt_path="prompts/01_research/scribe.md",
-        user_input=f"Summarize these research findings:\n\n{smart_truncate(ctx.scout_output, max_chars=8000, preserve_json=True)}",
-        save_to=ctx.folders['research'] / "combined_research.md",
-        skip_validation=ctx.skip_validation,
-        verbose=ctx.verbose,
-        token_tracker=ctx.token_tracker,
-        token_stage="scribe",
-    )
+    saved = units.get("scribe") if units is not None else None
+    if saved is not None:
+        ctx.scribe_output = saved["scribe_output"]
+    else:
+        ctx.scribe_output = run_agent(
+            model=ctx.model,
+            name="Scribe - Summarize Papers",
+            prompt_path="prompts/01_research/scribe.md",
+            user_input=f"Summarize these research findings:\n\n{smart_truncate(ctx.scout_output, max_chars=8000, preserve_json=True)}",
+            save_to=ctx.folders['research'] / "combined_research.md",
+            skip_validation=ctx.skip_validation,
+            verbose=ctx.verbose,
+            token_tracker=ctx.token_tracker,
+            token_stage="scribe",
+        )
+        if units is not None:
+            units.save("scribe", {"scribe_output": ctx.scribe_output})
 
     if ctx.tracker:
         ctx.tracker.log_activity("\u2705 Research summaries complete", event_type="found", phase="research")
@@ -140,17 +170,23 @@ def run_research_phase(ctx: DraftContext) -> None:
     if ctx.tracker:
         ctx.tracker.log_activity("🔍 Analyzing research gaps...", event_type="info", phase="research")
 
-    ctx.signal_output = run_agent(
-        model=ctx.model,
-        name="Signal - Research Gaps",
-        prompt_path="prompts/01_research/signal.md",
-        user_input=f"Analyze research gaps:\n\n{smart_truncate(ctx.scribe_output, max_chars=8000)}",
-        save_to=ctx.folders['research'] / "research_gaps.md",
-        skip_validation=ctx.skip_validation,
-        verbose=ctx.verbose,
-        token_tracker=ctx.token_tracker,
-        token_stage="signal",
-    )
+    saved = units.get("signal") if units is not None else None
+    if saved is not None:
+        ctx.signal_output = saved["signal_output"]
+    else:
+        ctx.signal_output = run_agent(
+            model=ctx.model,
+            name="Signal - Research Gaps",
+            prompt_path="prompts/01_research/signal.md",
+            user_input=f"Analyze research gaps:\n\n{smart_truncate(ctx.scribe_output, max_chars=8000)}",
+            save_to=ctx.folders['research'] / "research_gaps.md",
+            skip_validation=ctx.skip_validation,
+            verbose=ctx.verbose,
+            token_tracker=ctx.token_tracker,
+            token_stage="signal",
+        )
+        if units is not None:
+            units.save("signal", {"signal_output": ctx.signal_output})
 
     if ctx.tracker:
         ctx.tracker.log_activity("\u2705 Research gaps identified", event_type="found", phase="research")
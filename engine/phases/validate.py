@@ -12,12 +12,16 @@ from .context import DraftContext
 
 logger = logging.getLogger(__name__)
 
+# Token budget for the draft excerpts every QA agent reviews
+QA_CONTEXT_BUDGET = 3000
+
 
 def run_validate_phase(ctx: DraftContext) -> None:
     """
     Execute the QA phase: Thread -> Narrator -> FactCheck.
 
-    Writes QA report files to drafts/ folder. No ctx mutations.
+    Writes QA report files to drafts/ folder. No ctx mutations. Each agent
+    that completes is checkpointed, so a resumed phase skips finished agents.
     """
     from utils.agent_runner import run_agent, rate_limit_delay
 
@@ -31,16 +35,20 @@ def run_validate_phase(ctx: DraftContext) -> None:
     # Build QA review content from chapter outputs
     all_chapters_for_qa = _build_qa_content(ctx)
 
-    # --- QA STEP 1: Thread ---
-    _run_thread(ctx, all_chapters_for_qa)
-    rate_limit_delay()
-
-    # --- QA STEP 2: Narrator ---
-    _run_narrator(ctx, all_chapters_for_qa)
-    rate_limit_delay()
-
-    # --- QA STEP 3: FactCheck ---
-    _run_factcheck(ctx, all_chapters_for_qa)
+    units = ctx.unit_checkpoint("validate")
+    qa_steps = [
+        ("thread", _run_thread),        # QA STEP 1
+        ("narrator", _run_narrator),    # QA STEP 2
+        ("factcheck", _run_factcheck),  # QA STEP 3
+    ]
+    for index, (step, run_step) in enumerate(qa_steps):
+        if units is not None and step in units:
+            logger.info(f"[QA {index + 1}/3] {step} restored from checkpoint, skipping")
+            continue
+        if run_step(ctx, all_chapters_for_qa) and units is not None:
+            units.save(step, {})
+        if index < len(qa_steps) - 1:
+            rate_limit_delay()
 
     logger.info("=" * 80)
     logger.info("PHASE 3.5 COMPLETE - QA reports generated")
@@ -51,13 +59,11 @@ def run_validate_phase(ctx: DraftContext) -> None:
 
 
 def _build_qa_content(ctx: DraftContext) -> str:
-    """Build truncated QA review content from chapter files and outputs."""
-    try:
-        lit_review_content = ""
-        methodology_content = ""
-        results_content = ""
-        discussion_content = ""
+    """Build QA review content from chapter files and outputs, packed to QA_CONTEXT_BUDGET tokens."""
+    from utils.prompt_packer import KEEP_ENDS, PromptPacker, PromptSection
 
+    body_sections = {}
+    try:
         for name, var in [
             ("02_1_literature_review.md", "lit_review"),
             ("02_2_methodology.md", "methodology"),
@@ -65,66 +71,69 @@ def _build_qa_content(ctx: DraftContext) -> str:
             ("02_4_discussion.md", "discussion"),
         ]:
             fpath = ctx.folders['drafts'] / name
-            if fpath.exists():
-                content = fpath.read_text(encoding='utf-8')
-                if var == "lit_review":
-                    lit_review_content = content
-                elif var == "methodology":
-                    methodology_content = content
-                elif var == "results":
-                    results_content = content
-                elif var == "discussion":
-                    discussion_content = content
-
-        return f"""# Complete Draft for QA Review
+            body_sections[var] = fpath.read_text(encoding='utf-8') if fpath.exists() else ""
+    except Exception as e:
+        logger.warning(f"Could not read section files for QA: {e}")
+        body_sections = {}
+
+    # Sections are cut in the middle so QA sees how each one opens and closes;
+    # short sections leave their share of the budget to the long ones
+    sections = [
+        PromptSection("introduction", ctx.intro_output, priority=3, min_tokens=250, keep=KEEP_ENDS),
+        PromptSection("conclusion", ctx.conclusion_output, priority=3, min_tokens=250, keep=KEEP_ENDS),
+        PromptSection("appendices", ctx.appendix_output, priority=1, max_tokens=250),
+    ]
+    if body_sections:
+        sections += [
+            PromptSection(var, text, priority=2, min_tokens=150, keep=KEEP_ENDS)
+            for var, text in body_sections.items()
+        ]
+    else:
+        sections.append(PromptSection("body", ctx.body_output, priority=2, min_tokens=600, keep=KEEP_ENDS))
+    packed = PromptPacker(QA_CONTEXT_BUDGET).pack(sections)
+
+    if not body_sections:
+        return f"""# Complete Draft for QA Review (Excerpts)
 
 Topic: {ctx.topic}
 
-## Chapter 1: Introduction (First 1500 chars)
-{ctx.intro_output[:1500]}
+Introduction: {packed['introduction']}
+Main Body: {packed['body']}
+Conclusion: {packed['conclusion']}
+Appendices: {packed['appendices']}
+"""
 
-## Chapter 2: Main Body
+    return f"""# Complete Draft for QA Review
 
-### Section 2.1: Literature Review (First 1000 + Last 1000 chars)
-{lit_review_content[:1000]}
-[... middle content truncated ...]
-{lit_review_content[-1000:] if len(lit_review_content) > 1000 else ''}
+Topic: {ctx.topic}
 
-### Section 2.2: Methodology (First 1000 + Last 1000 chars)
-{methodology_content[:1000]}
-[... middle content truncated ...]
-{methodology_content[-1000:] if len(methodology_content) > 1000 else ''}
+## Chapter 1: Introduction (excerpt)
+{packed['introduction']}
 
-### Section 2.3: Analysis & Results (First 1000 + Last 1000 chars)
-{results_content[:1000]}
-[... middle content truncated ...]
-{results_content[-1000:] if len(results_content) > 1000 else ''}
+## Chapter 2: Main Body
 
-### Section 2.4: Discussion (First 1000 + Last 1000 chars)
-{discussion_content[:1000]}
-[... middle content truncated ...]
-{discussion_content[-1000:] if len(discussion_content) > 1000 else ''}
+### Section 2.1: Literature Review (excerpt)
+{packed['lit_review']}
 
-## Chapter 3: Conclusion (First 1500 chars)
-{ctx.conclusion_output[:1500]}
+### Section 2.2: Methodology (excerpt)
+{packed['methodology']}
 
-## Chapter 4: Appendices (First 1000 chars)
-{ctx.appendix_output[:1000]}
-"""
-    except Exception as e:
-        logger.warning(f"Could not read section files for QA: {e}")
-        return f"""# Complete Draft for QA Review (Truncated)
+### Section 2.3: Analysis & Results (excerpt)
+{packed['results']}
 
-Topic: {ctx.topic}
+### Section 2.4: Discussion (excerpt)
+{packed['discussion']}
+
+## Chapter 3: Conclusion (excerpt)
+{packed['conclusion']}
 
-Introduction: {ctx.intro_output[:1500]}
-Main Body: {ctx.body_output[:2000]}
-Conclusion: {ctx.conclusion_output[:1500]}
-Appendices: {ctx.appendix_output[:1000]}
+## Chapter 4: Appendices (excerpt)
+{packed['appendices']}
 """
 
 
-def _run_thread(ctx: DraftContext, qa_content: str) -> None:
+def _run_thread(ctx: DraftContext, qa_content: str) -> bool:
+    """Narrative consistency check. Returns True if the agent completed."""
     from utils.agent_runner import run_agent
 
     try:
@@ -162,13 +171,16 @@ def _run_thread(ctx: DraftContext, qa_content: str) -> None:
 
         if ctx.tracker:
             ctx.tracker.update_phase("writing", progress_percent=78, chapters_count=4, details={"stage": "qa_narrative_complete"})
+        return True
 
     except Exception as e:
         logger.warning(f"[QA 1/3] \u26a0\ufe0f  Thread agent failed: {e}")
         logger.warning("Continuing without narrative consistency check...")
+        return False
 
 
-def _run_narrator(ctx: DraftContext, qa_content: str) -> None:
+def _run_narrator(ctx: DraftContext, qa_content: str) -> bool:
+    """Voice unification check. Returns True if the agent completed."""
     from utils.agent_runner import run_agent
 
     try:
@@ -204,20 +216,23 @@ def _run_narrator(ctx: DraftContext, qa_content: str) -> None:
 
         if ctx.tracker:
             ctx.tracker.update_phase("writing", progress_percent=79, chapters_count=4, details={"stage": "qa_narrator_complete"})
+        return True
 
     except Exception as e:
         logger.warning(f"[QA 2/3] \u26a0\ufe0f  Narrator agent failed: {e}")
         logger.warning("Continuing without voice unification check...")
+        return False
 
 
-def _run_factcheck(ctx: DraftContext, qa_content: str) -> None:
+def _run_factcheck(ctx: DraftContext, qa_content: str) -> bool:
+    """Factual claim verification. Returns True if the agent completed."""
     from utils.agent_runner import run_agent
 
     if not ctx.config.validation.enable_factcheck:
         logger.info("[QA 3/3] FactCheck disabled (enable_factcheck=False) \u2014 skipping")
         if ctx.tracker:
             ctx.tracker.update_phase("writing", progress_percent=80, chapters_count=4, details={"stage": "qa_complete"})
-        return
+        return False
 
     try:
         logger.info("[QA 3/3] Running FactCheck agent - Factual Claim Verification")
@@ -267,10 +282,13 @@ def _run_factcheck(ctx: DraftContext, qa_content: str) -> None:
 
         if ctx.tracker:
             ctx.tracker.update_phase("writing", progress_percent=80, chapters_count=4, details={"stage": "qa_complete"})
+        return True
 
     except json.JSONDecodeError as e:
         logger.warning(f"[QA 3/3] \u26a0\ufe0f  FactCheck claim extraction returned invalid JSON: {e}")
         logger.warning("Continuing without fact-check verification...")
+        return False
     except Exception as e:
         logger.warning(f"[QA 3/3] \u26a0\ufe0f  FactCheck agent failed: {e}")
         logger.warning("Continuing without fact-check verification...")
+        return False
@@ -7,6 +7,7 @@ Extracted from tests/test_utils.py for proper production use.
 These are the essential utilities needed by draft_generator.py and modal_worker.py.
 """
 
+import asyncio
 import sys
 import time
 import logging
@@ -45,12 +46,18 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from google import genai
 from config import get_config
 from concurrency.concurrency_config import get_concurrency_config
+from concurrency.rate_limiter import get_gemini_limiter
 from utils.output_validators import ValidationResult
+from utils.api_citations.harvest import work_key
 from utils.api_citations.orchestrator import CitationResearcher
 from utils.citation_database import Citation
 from utils.gemini_client import GeminiModelWrapper
 from utils.deep_research import DeepResearchPlanner
 from utils.token_tracker import CallStatus
+from utils.token_counter import estimate_tokens
+from utils.llm_cache import MODE_REPLAY, get_llm_cache, model_cache_identity
+from utils.llm_stream import StreamAborted, consume_stream, streaming_enabled
+from utils.perf_trace import CAT_AGENT, CAT_LLM, get_tracer, span, traced_sleep
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -113,6 +120,16 @@ def load_prompt(prompt_path: str) -> str:
         return f.read()
 
 
+def build_full_prompt(agent_prompt: str, user_input: str) -> str:
+    """
+    The prompt run_agent sends: agent prompt, separator, user request.
+
+    Callers that cache a shared prefix build it with this function so the
+    prefix matches the start of every prompt that reuses it.
+    """
+    return f"{agent_prompt}\n\n---\n\nUser Request:\n{user_input}"
+
+
 def run_agent(
     model: Any,
     name: str,
@@ -125,6 +142,9 @@ def run_agent(
     skip_validation: bool = False,
     token_tracker: Optional[Any] = None,
     token_stage: Optional[str] = None,
+    stream: Optional[bool] = None,
+    on_partial: Optional[Callable[[str], None]] = None,
+    cached_context: Optional[Any] = None,
 ) -> str:
     """
     Run an AI agent with given prompt and input, with optional validation.
@@ -142,6 +162,13 @@ def run_agent(
         validators: Optional list of validation functions to apply to output
         max_retries: Maximum retry attempts if validation fails (default: 3)
         skip_validation: If True, skip all validation checks (for automated runs)
+        stream: Stream the generation (default: LLM_STREAMING). Chunks are
+                appended to save_to as they arrive and a repetition loop
+                aborts the attempt early
+        on_partial: Optional callback receiving the text generated so far
+                    (streaming only, throttled)
+        cached_context: Optional CachedContext from model.create_cached_context;
+                        if the prompt starts with its prefix, only the rest is sent
 
     Returns:
         str: Validated agent output text
@@ -149,6 +176,32 @@ def run_agent(
     Raises:
         Exception: If agent execution fails or validation fails after all retries
     """
+    with span(name, CAT_AGENT, stage=token_stage or name) as trace_args:
+        output = _run_agent(
+            model, name, prompt_path, user_input, save_to, verbose, validators, max_retries,
+            skip_validation, token_tracker, token_stage, stream, on_partial, cached_context,
+        )
+        trace_args["chars"] = len(output)
+        return output
+
+
+def _run_agent(
+    model: Any,
+    name: str,
+    prompt_path: str,
+    user_input: str,
+    save_to: Optional[Path],
+    verbose: bool,
+    validators: Optional[List[Callable[[str], ValidationResult]]],
+    max_retries: int,
+    skip_validation: bool,
+    token_tracker: Optional[Any],
+    token_stage: Optional[str],
+    stream: Optional[bool],
+    on_partial: Optional[Callable[[str], None]],
+    cached_context: Optional[Any],
+) -> str:
+    """run_agent body (run_agent wraps it in a trace span)."""
     # Override validators if skip_validation is True
     if skip_validation:
         validators = None
@@ -162,12 +215,39 @@ def run_agent(
     agent_prompt = load_prompt(prompt_path)
 
     # Combine agent prompt with user input
-    full_prompt = f"{agent_prompt}\n\n---\n\nUser Request:\n{user_input}"
+    full_prompt = build_full_prompt(agent_prompt, user_input)
 
     logger.debug(f"Agent '{name}': Starting execution")
     logger.debug(f"Prompt length: {len(full_prompt)} chars")
     logger.debug(f"Validators: {len(validators) if validators else 0}")
 
+    # Shared RPM/TPM limiter (None when GEMINI_TOKEN_BUCKET=false)
+    limiter = get_gemini_limiter()
+    estimated_input_tokens = estimate_tokens(full_prompt)
+
+    # Optional content-addressed response cache (LLM_CACHE_MODE=on/record/replay)
+    llm_cache = get_llm_cache()
+    cache_key = None
+    if llm_cache:
+        cache_model_name, cache_temperature = model_cache_identity(model)
+        cache_key = llm_cache.make_key(cache_model_name, cache_temperature, agent_prompt, user_input)
+    raw_output = ""
+    accepted = False
+
+    # Streaming needs a model that supports it (GeminiModelWrapper does)
+    use_stream = (streaming_enabled() if stream is None else stream) and hasattr(model, 'generate_content_stream')
+
+    # Only passed when set, so models without context caching keep working
+    cache_kwargs = {"cached_context": cached_context} if cached_context is not None else {}
+
+    def generate():
+        with span(f"{name} LLM call", CAT_LLM, streamed=use_stream, input_tokens=estimated_input_tokens,
+                  cached_context=cached_context is not None):
+            if use_stream:
+                return consume_stream(model.generate_content_stream(full_prompt, **cache_kwargs),
+                                      save_to=save_to, on_partial=on_partial)
+            return model.generate_content(full_prompt, **cache_kwargs)
+
     # Initialize output variable with explicit type
     output: str = ""
 
@@ -184,12 +264,25 @@ def run_agent(
 
         start_time = time.time()
 
+        # Serve from cache on the first attempt (replay mode never calls the model;
+        # a miss raises LLMCacheMiss)
+        response = None
+        if llm_cache and (attempt == 0 or llm_cache.mode == MODE_REPLAY):
+            response = llm_cache.lookup(cache_key)
+            if response is not None:
+                logger.info(f"Agent '{name}': LLM cache hit ({llm_cache.mode})")
+                get_tracer().add_span_seconds(f"{name} LLM cache hit", CAT_LLM, 0.0)
+        from_cache = response is not None
+
         try:
             # Generate LLM response
             # Note: If Gemini tools (Google Search/URL context) hit rate limits,
             # we catch the exception and use fallbacks (DataForSEO/OpenPull)
+            if limiter and not from_cache:
+                limiter.acquire(tokens=estimated_input_tokens)
             try:
-                response = model.generate_content(full_prompt)
+                if not from_cache:
+                    response = generate()
             except Exception as tool_error:
                 error_str = str(tool_error)
                 # Check if it's a rate limit error (429) from Gemini tools
@@ -199,7 +292,9 @@ def run_agent(
                     # Note: For web search/URL context, we'd need to manually call fallbacks
                     # This is a simplified retry - full fallback integration would require
                     # detecting which tool failed and calling appropriate fallback
-                    response = model.generate_content(full_prompt)
+                    if limiter:
+                        limiter.acquire(tokens=estimated_input_tokens)
+                    response = generate()
                 else:
                     raise  # Re-raise if not a rate limit error
             
@@ -268,6 +363,7 @@ def run_agent(
                 raise ValueError(f"Agent '{name}': Unable to extract text from response")
             
             output = str(output)
+            raw_output = output
 
             # Defense-in-depth: scrub planning preambles, metadata, and cite_MISSING markers
             from utils.text_utils import clean_agent_output
@@ -290,7 +386,7 @@ def run_agent(
                 # Continue to retry
                 if attempt < max_retries - 1:
                     backoff_seconds = 2 ** attempt
-                    time.sleep(backoff_seconds)
+                    traced_sleep(backoff_seconds, "agent_backoff", agent=name)
                     continue
             else:
                 # Reset counter on successful non-empty output
@@ -298,6 +394,12 @@ def run_agent(
 
             logger.debug(f"Agent '{name}': Generated {len(output)} chars in {time.time() - start_time:.1f}s")
 
+            # Correct the limiter's estimate with the real prompt token count
+            if limiter and not from_cache and getattr(response, 'usage_metadata', None):
+                actual_input = getattr(response.usage_metadata, 'prompt_token_count', None)
+                if isinstance(actual_input, int):
+                    limiter.record_usage(actual_input, estimated_input_tokens)
+
             # Track token usage if tracker is provided
             if token_tracker and hasattr(response, 'usage_metadata'):
                 try:
@@ -331,7 +433,7 @@ def run_agent(
                         if attempt < max_retries - 1:
                             backoff_seconds = 2 ** attempt  # Exponential: 1s, 2s, 4s
                             logger.debug(f"Agent '{name}': Backing off for {backoff_seconds}s")
-                            time.sleep(backoff_seconds)
+                            traced_sleep(backoff_seconds, "agent_backoff", agent=name)
                             break  # Break validator loop to retry LLM call
                         else:
                             # Last attempt failed - raise error
@@ -347,10 +449,12 @@ def run_agent(
                 # If all validators passed, break retry loop
                 if validation_passed:
                     logger.info(f"Agent '{name}': All {len(validators)} validators passed")
+                    accepted = True
                     break
             else:
                 # No validators - success on first attempt
                 logger.debug(f"Agent '{name}': No validators, accepting output")
+                accepted = True
                 break
 
         except Exception as e:
@@ -372,11 +476,18 @@ def run_agent(
                 except Exception:
                     pass  # Never break generation for tracking failures
 
+            # A degenerate stream was cut short; regenerate like a failed validation
+            if isinstance(e, StreamAborted) and attempt < max_retries - 1:
+                backoff_seconds = 2 ** attempt
+                logger.debug(f"Agent '{name}': Stream aborted, retrying after {backoff_seconds}s")
+                traced_sleep(backoff_seconds, "agent_backoff", agent=name)
+                continue
+
             # If not last attempt and it's a transient error, retry
             if attempt < max_retries - 1 and _is_transient_error(e):
                 backoff_seconds = 2 ** attempt
                 logger.debug(f"Agent '{name}': Transient error, retrying after {backoff_seconds}s")
-                time.sleep(backoff_seconds)
+                traced_sleep(backoff_seconds, "agent_backoff", agent=name)
                 continue
             else:
                 # Partial output capture (V3 feature): on timeout, check for any files written
@@ -394,6 +505,19 @@ def run_agent(
 
     elapsed = time.time() - start_time
 
+    # Store the raw accepted response so a hit replays through the same cleanup/validation
+    if llm_cache and accepted and not from_cache:
+        usage = getattr(response, 'usage_metadata', None)
+        prompt_tokens = getattr(usage, 'prompt_token_count', 0)
+        output_tokens = getattr(usage, 'candidates_token_count', 0)
+        llm_cache.store(
+            cache_key,
+            raw_output,
+            model_name=cache_model_name,
+            prompt_tokens=prompt_tokens if isinstance(prompt_tokens, int) else 0,
+            output_tokens=output_tokens if isinstance(output_tokens, int) else 0,
+        )
+
     # Save output if path provided
     if save_to:
         try:
@@ -536,6 +660,11 @@ def _is_transient_error(error: Exception) -> bool:
             logger.debug("Signaled backpressure for rate limit error")
         except Exception:
             pass  # Don't fail on backpressure errors
+
+        # Drain the shared limiter so concurrent callers back off together
+        limiter = get_gemini_limiter()
+        if limiter:
+            limiter.penalize()
     
     return is_transient
 
@@ -544,19 +673,23 @@ def rate_limit_delay(seconds: Optional[float] = None) -> None:
     """
     Sleep for rate limiting with tier-adaptive delays.
 
-    Automatically adjusts delay based on detected API tier:
+    When the shared token-bucket limiter is enabled (default), run_agent
+    already waits for RPM/TPM capacity before each call, so the tier-adaptive
+    pause is skipped. Otherwise the delay adjusts to the detected API tier:
     - Free tier (10 RPM): 7 seconds (safe for 1 req/6s limit)
-    - Paid tier (2,000 RPM): 0.3 seconds (safe for high throughput)
+    - Paid tier (2,000 RPM): 0.5 seconds (safe for high throughput)
 
     Args:
         seconds: Manual override (default: None = use tier-adaptive delay)
     """
     if seconds is None:
-        # Use tier-adaptive delay
         config = get_concurrency_config(verbose=False)
+        if config.token_bucket_enabled:
+            return
+        # Use tier-adaptive delay
         seconds = config.rate_limit_delay
 
-    time.sleep(seconds)
+    traced_sleep(seconds, "rate_limit_delay")
 
 
 def research_citations_via_api(
@@ -575,6 +708,10 @@ def research_citations_via_api(
     per_topic_timeout_seconds: int = 90,  # Increased from 30s - citations need time to search multiple APIs
     # Progress reporting
     progress_callback: Optional[Callable[[str, str], None]] = None,
+    # Sub-phase resume
+    unit_checkpoint: Optional[Any] = None,
+    # Streaming hand-off to citation management
+    on_citations: Optional[Callable[[List[Citation]], None]] = None,
 ) -> Dict[str, Any]:
     """
     Research citations using API-backed fallback chain with optional deep research mode.
@@ -607,6 +744,10 @@ def research_citations_via_api(
         min_sources_deep: Minimum sources for deep research (default: 100)
         per_topic_timeout_seconds: Maximum time to spend on each research topic (default: 90)
         progress_callback: Optional callback(message, event_type) for progress reporting
+        unit_checkpoint: Optional UnitCheckpoint. The deep research plan and every
+            answered query are saved to it; queries it already holds are not searched again
+        on_citations: Optional callback receiving each query's citations as soon as they
+            are collected (restored ones included), e.g. CitationStream.put
 
     Returns:
         Dict with keys:
@@ -638,7 +779,15 @@ def research_citations_via_api(
     # Deep Research Mode: Autonomous research planning
     research_plan: Optional[Dict[str, Any]] = None
 
-    if use_deep_research:
+    # A resumed run reuses the saved plan, so its query list matches the saved answers
+    saved_plan = unit_checkpoint.get("plan") if unit_checkpoint is not None and use_deep_research else None
+    if saved_plan is not None:
+        research_topics = saved_plan["research_topics"]
+        research_plan = saved_plan["research_plan"]
+        if verbose:
+            safe_print(f"\n♻️  Reusing saved research plan ({len(research_topics)} queries)")
+
+    if use_deep_research and saved_plan is None:
         if verbose:
             safe_print(f"\n🧠 Deep Research Planning Phase")
             safe_print(f"{'='*80}")
@@ -831,6 +980,9 @@ def research_citations_via_api(
                 safe_print(f"   Generated {len(research_topics)} fallback queries")
                 safe_print()
 
+    if unit_checkpoint is not None and use_deep_research and saved_plan is None:
+        unit_checkpoint.save("plan", {"research_topics": research_topics, "research_plan": research_plan})
+
     # Execution Phase: Run queries through API fallback chain
     if verbose:
         safe_print(f"\n📊 Execution Configuration:")
@@ -859,8 +1011,20 @@ def research_citations_via_api(
     if not enable_semantic_scholar and verbose:
         safe_print("   ⚠️  Semantic Scholar disabled (ENABLE_SEMANTIC_SCHOLAR=false)")
 
-    # Track results
+    # Track results; early stopping counts distinct works (harvesting and
+    # overlapping queries return the same paper more than once)
     citations: List[Citation] = []
+    unique_works: set = set()
+
+    def _note_works(found: List[Citation]) -> None:
+        """Count distinct works and hand the citations to on_citations."""
+        for citation in found:
+            unique_works.add(work_key({"doi": citation.doi, "title": citation.title}))
+        if on_citations is not None:
+            try:
+                on_citations(found)
+            except Exception as e:
+                logger.warning(f"on_citations callback failed: {e}")
     sources_breakdown: Dict[str, int] = {
         "Crossref": 0,
         "Semantic Scholar": 0,
@@ -904,96 +1068,159 @@ def research_citations_via_api(
         except Exception as e:
             return (idx, research_topic, [], str(e))
 
-    # Early stopping at 50 citations
+    def _checkpoint_query(research_topic: str, citations_list: List[Citation]) -> None:
+        """Save an answered query so a resumed run skips it."""
+        if unit_checkpoint is not None:
+            unit_checkpoint.save(
+                f"query:{research_topic}",
+                {"citations": [c.to_dict() for c in citations_list]},
+            )
+
+    # Queries answered before an interruption are restored instead of searched
+    pending_topics = list(research_topics)
+    if unit_checkpoint is not None:
+        pending_topics = []
+        for research_topic in research_topics:
+            saved = unit_checkpoint.get(f"query:{research_topic}")
+            if saved is None:
+                pending_topics.append(research_topic)
+                continue
+            restored = [Citation.from_dict(c) for c in saved["citations"]]
+            if not restored:
+                failed_topics.append(research_topic)
+            citations.extend(restored)
+            _note_works(restored)
+            for citation in restored:
+                source = citation.api_source or 'Unknown'
+                if source in sources_breakdown:
+                    sources_breakdown[source] += 1
+        if verbose and len(pending_topics) < len(research_topics):
+            safe_print(
+                f"\n♻️  Restored {len(research_topics) - len(pending_topics)} answered queries "
+                f"({len(citations)} citations) from checkpoint"
+            )
+
+    # Early stopping at 50 distinct citations
     early_stop_threshold = 50
 
     # Parallel or sequential based on config
     if PARALLEL_WORKERS > 1:
-        if verbose:
-            safe_print(f"\n🚀 Parallel citation research enabled ({PARALLEL_WORKERS} workers)")
-
         # Process in batches with parallel workers
-        total_topics = len(research_topics)
+        total_topics = len(pending_topics)
         processed = 0
 
-        for batch_start in range(0, total_topics, BATCH_SIZE):
-            # Early stopping: Check if we've reached target + 10%
-            if len(citations) >= early_stop_threshold:
-                if verbose:
-                    safe_print(f"\n⏩ Early stopping: {len(citations)} citations collected (target: {target_minimum}, threshold: {early_stop_threshold})")
-                break
+        def _record_result(idx: int, research_topic: str, citations_list: List[Citation], error: Optional[str]) -> bool:
+            """Report and tally one finished topic. Returns True once early stopping triggers."""
+            nonlocal processed
+            processed += 1
 
-            batch_end = min(batch_start + BATCH_SIZE, total_topics)
-            batch = list(enumerate(research_topics[batch_start:batch_end], batch_start + 1))
+            if verbose:
+                safe_print(f"[{idx}/{total_topics}] 🔎 {research_topic[:55]}{'...' if len(research_topic) > 55 else ''}", end=' ')
 
-            if verbose and batch_start > 0 and effective_batch_delay > 0:
-                safe_print(f"\n⏸️  Batch complete ({batch_start} topics processed). Waiting {effective_batch_delay}s to respect API limits...")
-                time.sleep(effective_batch_delay)
+            if error:
+                failed_topics.append(research_topic)
+                if verbose:
+                    safe_print(f"❌ Error: {error[:30]}...")
+                logger.error(f"Citation research failed for '{research_topic}': {error}")
+                return False
+
+            _checkpoint_query(research_topic, citations_list)
+            if citations_list:
+                # Add ALL citations from this query (multiple sources)
+                citations.extend(citations_list)
+                _note_works(citations_list)
+                # Update source breakdown for all citations
+                for citation in citations_list:
+                    source = citation.api_source or 'Unknown'
+                    if source in sources_breakdown:
+                        sources_breakdown[source] += 1
+                if verbose:
+                    # Show all sources found for this query
+                    sources_str = ", ".join([c.api_source or 'Unknown' for c in citations_list])
+                    first_citation = citations_list[0]
+                    authors_str = first_citation.authors[0] if first_citation.authors else "Unknown"
+                    count_str = f" (+{len(citations_list)-1} more)" if len(citations_list) > 1 else ""
+                    safe_print(f"✅ {authors_str} et al. ({first_citation.year}) [{sources_str}]{count_str}")
+
+                # Check for early stopping within batch
+                if len(unique_works) >= early_stop_threshold:
+                    if verbose:
+                        safe_print(f"\n⏩ Early stopping: {len(unique_works)} distinct citations collected")
+                    return True
+            else:
+                failed_topics.append(research_topic)
+                if verbose:
+                    safe_print("❌ No citation found")
+            return False
 
+        try:
+            asyncio.get_running_loop()
+            loop_running = True
+        except RuntimeError:
+            loop_running = False
+
+        if config.scout_async and not loop_running:
+            # All topics on one event loop: per-API rate limits pace the requests,
+            # timeouts cancel in-flight work, early stopping cancels the rest
             if verbose:
-                safe_print(f"\n📦 Processing batch {batch_start // BATCH_SIZE + 1} ({len(batch)} topics)...")
+                safe_print(f"\n🚀 Async citation research enabled ({config.scout_async_concurrency} topics in flight)")
+
+            # Restored queries may already reach the early stopping threshold
+            if len(unique_works) < early_stop_threshold:
+                researcher.research_citations_batch(
+                    pending_topics,
+                    max_concurrency=config.scout_async_concurrency,
+                    per_topic_timeout=per_topic_timeout_seconds,
+                    on_result=lambda i, t, found, error: _record_result(i + 1, t, found, error),
+                )
+        else:
+            if verbose:
+                safe_print(f"\n🚀 Parallel citation research enabled ({PARALLEL_WORKERS} workers)")
 
-            # Execute batch in parallel
-            with ThreadPoolExecutor(max_workers=PARALLEL_WORKERS) as executor:
-                futures = {executor.submit(_research_single_topic, item): item for item in batch}
+            for batch_start in range(0, total_topics, BATCH_SIZE):
+                # Early stopping: Check if we've reached target + 10%
+                if len(unique_works) >= early_stop_threshold:
+                    if verbose:
+                        safe_print(f"\n⏩ Early stopping: {len(unique_works)} distinct citations collected (target: {target_minimum}, threshold: {early_stop_threshold})")
+                    break
 
-                for future in as_completed(futures):
-                    idx, research_topic, citations_list, error = future.result()
-                    processed += 1
+                batch_end = min(batch_start + BATCH_SIZE, total_topics)
+                batch = list(enumerate(pending_topics[batch_start:batch_end], batch_start + 1))
 
-                    if verbose:
-                        safe_print(f"[{idx}/{total_topics}] 🔎 {research_topic[:55]}{'...' if len(research_topic) > 55 else ''}", end=' ')
+                if verbose and batch_start > 0 and effective_batch_delay > 0:
+                    safe_print(f"\n⏸️  Batch complete ({batch_start} topics processed). Waiting {effective_batch_delay}s to respect API limits...")
+                    traced_sleep(effective_batch_delay, "scout_batch_delay")
 
-                    if error:
-                        failed_topics.append(research_topic)
-                        if verbose:
-                            safe_print(f"❌ Error: {error[:30]}...")
-                        logger.error(f"Citation research failed for '{research_topic}': {error}")
-                    elif citations_list:
-                        # Add ALL citations from this query (multiple sources)
-                        citations.extend(citations_list)
-                        # Update source breakdown for all citations
-                        for citation in citations_list:
-                            source = citation.api_source or 'Unknown'
-                            if source in sources_breakdown:
-                                sources_breakdown[source] += 1
-                        if verbose:
-                            # Show all sources found for this query
-                            sources_str = ", ".join([c.api_source or 'Unknown' for c in citations_list])
-                            first_citation = citations_list[0]
-                            authors_str = first_citation.authors[0] if first_citation.authors else "Unknown"
-                            count_str = f" (+{len(citations_list)-1} more)" if len(citations_list) > 1 else ""
-                            safe_print(f"✅ {authors_str} et al. ({first_citation.year}) [{sources_str}]{count_str}")
-
-                        # Check for early stopping within batch
-                        if len(citations) >= early_stop_threshold:
-                            if verbose:
-                                safe_print(f"\n⏩ Early stopping: {len(citations)} citations collected")
+                if verbose:
+                    safe_print(f"\n📦 Processing batch {batch_start // BATCH_SIZE + 1} ({len(batch)} topics)...")
+
+                # Execute batch in parallel
+                with ThreadPoolExecutor(max_workers=PARALLEL_WORKERS) as executor:
+                    futures = {executor.submit(_research_single_topic, item): item for item in batch}
+
+                    for future in as_completed(futures):
+                        if _record_result(*future.result()):
                             break
-                    else:
-                        failed_topics.append(research_topic)
-                        if verbose:
-                            safe_print("❌ No citation found")
     else:
         # Sequential execution (free tier or 1 worker)
         if verbose:
             safe_print("\n🔄 Sequential citation research (1 worker)")
 
-        for idx, research_topic in enumerate(research_topics, 1):
+        for idx, research_topic in enumerate(pending_topics, 1):
             # Early stopping: Check if we've reached target + 10%
-            if len(citations) >= early_stop_threshold:
+            if len(unique_works) >= early_stop_threshold:
                 if verbose:
-                    safe_print(f"\n⏩ Early stopping: {len(citations)} citations collected (target: {target_minimum}, threshold: {early_stop_threshold})")
+                    safe_print(f"\n⏩ Early stopping: {len(unique_works)} distinct citations collected (target: {target_minimum}, threshold: {early_stop_threshold})")
                 break
 
             # Add delay every BATCH_SIZE topics to prevent burst rate limits
             if idx > 1 and (idx - 1) % BATCH_SIZE == 0 and effective_batch_delay > 0:
                 if verbose:
                     safe_print(f"\n⏸️  Batch complete ({idx-1} topics processed). Waiting {effective_batch_delay}s to respect API limits...")
-                time.sleep(effective_batch_delay)
+                traced_sleep(effective_batch_delay, "scout_batch_delay")
 
             if verbose:
-                safe_print(f"[{idx}/{len(research_topics)}] 🔎 {research_topic[:65]}{'...' if len(research_topic) > 65 else ''}")
+                safe_print(f"[{idx}/{len(pending_topics)}] 🔎 {research_topic[:65]}{'...' if len(research_topic) > 65 else ''}")
 
             try:
                 # Wrap in executor for timeout control
@@ -1009,6 +1236,7 @@ def research_citations_via_api(
                         logger.warning(f"Citation research timed out for '{research_topic}' after {per_topic_timeout_seconds}s")
                         continue
 
+                _checkpoint_query(research_topic, citations_list)
                 if citations_list:
                     # #region agent log
                     # Note: json, time, os already imported at module level
@@ -1036,6 +1264,7 @@ def research_citations_via_api(
                     
                     # Add ALL citations from this query (multiple sources)
                     citations.extend(citations_list)
+                    _note_works(citations_list)
 
                     # Track sources for all citations
                     for citation in citations_list:
@@ -1061,6 +1290,16 @@ def research_citations_via_api(
                     safe_print(f"    ❌ Error: {str(e)}")
                 logger.error(f"Citation research failed for '{research_topic}': {str(e)}")
 
+    # Fill missing metadata for the whole batch with a few bulk DOI lookups
+    if config.doi_batch_enrich and citations:
+        from utils.api_citations.doi_resolver import get_doi_resolver
+        try:
+            enriched = get_doi_resolver().enrich_citations(citations)
+            if verbose and enriched:
+                safe_print(f"\n🔗 Enriched {enriched} citations via bulk DOI lookup")
+        except Exception as e:
+            logger.warning(f"Bulk DOI enrichment failed: {e}")
+
     # Calculate success metrics
     citation_count = len(citations)
     success_rate = (citation_count / len(research_topics) * 100) if research_topics else 0
@@ -4,11 +4,19 @@ ABOUTME: Base API client with error handling, retries, and rate limiting
 ABOUTME: Provides production-grade HTTP request infrastructure for academic APIs
 """
 
-import time
+import asyncio
 import logging
 import random
 import requests
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from concurrency.host_rate_limiter import get_host_limiter, parse_retry_after
+from utils.perf_trace import CAT_API, span, traced_async_sleep, traced_sleep
 
 # Backpressure integration for cross-container rate limit coordination
 _backpressure_manager = None
@@ -226,13 +234,35 @@ def validate_publication_year(year: int) -> tuple:
     return (True, "valid", is_recent)
 
 
+_DOI_PREFIXES = ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/", "http://dx.doi.org/", "doi:")
+
+
+def normalize_doi(doi: Optional[str]) -> str:
+    """
+    Normalize a DOI for use as a lookup key.
+
+    Strips resolver prefixes and whitespace and lowercases (DOIs are
+    case-insensitive). Returns "" for empty or non-DOI input.
+    """
+    if not doi:
+        return ""
+    doi = str(doi).strip()
+    lowered = doi.lower()
+    for prefix in _DOI_PREFIXES:
+        if lowered.startswith(prefix):
+            doi = doi[len(prefix):]
+            break
+    doi = doi.strip().rstrip(".").lower()
+    return doi if doi.startswith("10.") else ""
+
+
 class BaseAPIClient(ABC):
     """
     Base class for academic API clients.
 
     Provides:
     - Exponential backoff retries
-    - Rate limiting
+    - Rate limiting (shared per API host across all client instances)
     - Error handling
     - Request logging
     - Client IP forwarding for distributed rate limits
@@ -266,7 +296,7 @@ class BaseAPIClient(ABC):
         Args:
             base_url: Base URL for API
             api_key: Optional API key for authenticated requests
-            rate_limit_per_second: Maximum requests per second
+            rate_limit_per_second: Maximum requests per second (caps the host's shared limiter)
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts for failed requests
         """
@@ -277,26 +307,81 @@ class BaseAPIClient(ABC):
         self.max_retries = max_retries
         self.api_type = api_type  # For backpressure signaling
 
-        # Rate limiting state
-        self.last_request_time: float = 0.0
-        self.min_interval: float = 1.0 / rate_limit_per_second
+        # Rate limiting: one adaptive limiter per host, shared by every client
+        # instance in the process (see concurrency.host_rate_limiter)
+        self.host = urlparse(self.base_url).hostname or self.base_url
+        self.host_limiter = get_host_limiter(self.host, rate_limit_per_second)
 
         # Session for connection pooling
         self.session = requests.Session()
         # Apply browser headers (User-Agent rotated per request)
         self.session.headers.update(BROWSER_HEADERS)
 
+        # Async clients keyed by proxy (httpx binds the proxy per client);
+        # created lazily on the running event loop, closed by aclose()
+        self._async_clients: Dict[Optional[str], Any] = {}
+
     def _rate_limit_wait(self) -> None:
-        """Wait if necessary to respect rate limit."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        """Wait for this request's slot on the host's shared limiter."""
+        waited = self.host_limiter.acquire()
+        if waited > 0:
+            logger.debug(f"Rate limit: waited {waited:.3f}s for {self.host}")
 
-        if time_since_last_request < self.min_interval:
-            sleep_time = self.min_interval - time_since_last_request
-            logger.debug(f"Rate limit: sleeping {sleep_time:.3f}s")
-            time.sleep(sleep_time)
+    def _record_rate_limited(self, response: Any) -> float:
+        """Report a 429 to the host limiter (honouring Retry-After); returns the host pause."""
+        headers = getattr(response, "headers", None) or {}
+        return self.host_limiter.record_rate_limited(parse_retry_after(headers.get("Retry-After")))
 
-        self.last_request_time = time.time()
+    def _throttled_get(self, session: Any, url: str, **kwargs) -> Any:
+        """
+        GET a URL on another API host (e.g. NCBI E-utilities) through that host's limiter.
+
+        Returns the response; raises like session.get.
+        """
+        limiter = get_host_limiter(urlparse(url).hostname or url)
+        limiter.acquire()
+        response = session.get(url, **kwargs)
+        if response.status_code == 429:
+            limiter.record_rate_limited(parse_retry_after(response.headers.get("Retry-After")))
+        elif response.ok:
+            limiter.record_success()
+        return response
+
+    def _request_headers(self) -> Dict[str, str]:
+        """Per-request headers: rotated User-Agent, forwarded client IP, API key."""
+        # Rotate User-Agent for each request to avoid rate limiting
+        headers = {"User-Agent": random.choice(USER_AGENTS)}
+
+        # Forward client IP for rate limit distribution (helps avoid 429 across users)
+        client_ip = self.get_client_ip()
+        if client_ip and client_ip != 'unknown':
+            headers["X-Forwarded-For"] = client_ip
+
+        # Add API key header if available (e.g., Semantic Scholar uses x-api-key)
+        if self.api_key:
+            headers["x-api-key"] = self.api_key
+        return headers
+
+    def _signal_rate_limited(self) -> None:
+        """Report a 429 to the cross-container backpressure manager."""
+        bp = get_backpressure_manager()
+        proxy_used = random.choice(PROXY_LIST) if PROXY_LIST else None
+        if bp and self.api_type:
+            from utils.backpressure import APIType
+            try:
+                api_enum = APIType(self.api_type)
+                bp.signal_429(api_enum, proxy_id=proxy_used if proxy_used else None)
+            except ValueError:
+                pass  # Unknown API type
+
+    @staticmethod
+    def _retry_wait(attempt: int) -> float:
+        """Seconds to wait before the next attempt."""
+        # With proxies: minimal delay (next request uses different proxy)
+        if PROXY_LIST:
+            return 0.5
+        # Without proxies: exponential backoff
+        return 2 ** attempt
 
     def _make_request(
         self,
@@ -327,35 +412,28 @@ class BaseAPIClient(ABC):
                 # Make request
                 logger.debug(f"Request: {method} {url} (attempt {attempt + 1}/{self.max_retries})")
 
-                # Rotate User-Agent for each request to avoid rate limiting
-                headers = {"User-Agent": random.choice(USER_AGENTS)}
-
-                # Forward client IP for rate limit distribution (helps avoid 429 across users)
-                client_ip = self.get_client_ip()
-                if client_ip and client_ip != 'unknown':
-                    headers["X-Forwarded-For"] = client_ip
+                headers = self._request_headers()
 
-                # Add API key header if available (e.g., Semantic Scholar uses x-api-key)
-                if self.api_key:
-                    headers["x-api-key"] = self.api_key
-                
                 # Select proxy for this request
                 proxy_str = random.choice(PROXY_LIST) if PROXY_LIST else None
                 proxy_dict = parse_proxy(proxy_str) if proxy_str else None
                 
                 
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=json_data,
-                    headers=headers,
-                    timeout=self.timeout,
-                    proxies=proxy_dict,
-                )
+                with span(f"{type(self).__name__} {method}", CAT_API, endpoint=endpoint, attempt=attempt + 1) as trace_args:
+                    response = self.session.request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        json=json_data,
+                        headers=headers,
+                        timeout=self.timeout,
+                        proxies=proxy_dict,
+                    )
+                    trace_args["status"] = response.status_code
 
                 # Check status code
                 if response.status_code == 200:
+                    self.host_limiter.record_success()
                     return response.json()
 
                 elif response.status_code == 404:
@@ -363,35 +441,25 @@ class BaseAPIClient(ABC):
                     return None  # Not found is not an error, just no result
 
                 elif response.status_code == 429:
-                    # Rate limited - with proxy rotation, retry immediately with different proxy
-                    
-                    bp = get_backpressure_manager()
-                    proxy_used = random.choice(PROXY_LIST) if PROXY_LIST else None
-                    if bp and self.api_type:
-                        from utils.backpressure import APIType
-                        try:
-                            api_enum = APIType(self.api_type)
-                            bp.signal_429(api_enum, proxy_id=proxy_used if proxy_used else None)
-                        except ValueError:
-                            pass  # Unknown API type
-
-                    # With proxies: minimal delay (next request uses different proxy)
-                    # Without proxies: exponential backoff (Semantic Scholar needs longer waits)
+                    self._signal_rate_limited()
                     if PROXY_LIST:
-                        wait_time = 0.5  # Minimal delay, rely on proxy rotation
-                    else:
-                        # Exponential backoff: 3s, 6s, 12s, 24s, 48s for attempts 1-5
-                        # This gives Semantic Scholar time to reset rate limits
-                        wait_time = 3 * (2 ** attempt)
-                    logger.debug(f"Rate limited (429), waiting {wait_time:.1f}s before retry (attempt {attempt + 1}/{self.max_retries})")
-                    time.sleep(wait_time)
+                        # One proxy was limited: retry shortly through another proxy
+                        # without slowing down the host for every caller
+                        wait_time = self._retry_wait(attempt)
+                        logger.debug(f"Rate limited (429), waiting {wait_time:.1f}s before retry via another proxy (attempt {attempt + 1}/{self.max_retries})")
+                        traced_sleep(wait_time, "api_backoff", client=type(self).__name__)
+                        continue
+                    # Rate limited - the host limiter slows down and pauses every
+                    # caller for this host; the retry waits in _rate_limit_wait
+                    pause = self._record_rate_limited(response)
+                    logger.debug(f"Rate limited (429), {self.host} paused {pause:.1f}s before retry (attempt {attempt + 1}/{self.max_retries})")
                     continue
 
                 elif response.status_code >= 500:
                     # Server error - retry (with proxies: minimal delay, without: exponential backoff)
-                    wait_time = 0.5 if PROXY_LIST else 2**attempt
+                    wait_time = self._retry_wait(attempt)
                     logger.warning(f"Server error ({response.status_code}), waiting {wait_time}s before retry")
-                    time.sleep(wait_time)
+                    traced_sleep(wait_time, "api_backoff", client=type(self).__name__)
                     continue
 
                 else:
@@ -400,17 +468,15 @@ class BaseAPIClient(ABC):
                     return None
 
             except requests.exceptions.Timeout:
-                # With proxies: minimal delay, without: exponential backoff
-                wait_time = 0.5 if PROXY_LIST else 2**attempt
+                wait_time = self._retry_wait(attempt)
                 logger.warning(f"Request timeout, waiting {wait_time}s before retry")
-                time.sleep(wait_time)
+                traced_sleep(wait_time, "api_backoff", client=type(self).__name__)
                 continue
 
             except requests.exceptions.ConnectionError as e:
-                # With proxies: minimal delay, without: exponential backoff
-                wait_time = 0.5 if PROXY_LIST else 2**attempt
+                wait_time = self._retry_wait(attempt)
                 logger.warning(f"Connection error: {e}, waiting {wait_time}s before retry")
-                time.sleep(wait_time)
+                traced_sleep(wait_time, "api_backoff", client=type(self).__name__)
                 continue
 
             except requests.exceptions.RequestException as e:
@@ -426,6 +492,165 @@ class BaseAPIClient(ABC):
         logger.debug(f"API unavailable after {self.max_retries} retries: {url[:60]}... (fallback sources will be used)")
         return None
 
+    # =========================================================================
+    # Async engine (httpx) - same retry, backpressure and proxy semantics
+    # =========================================================================
+
+    async def _rate_limit_wait_async(self) -> None:
+        """Reserve this request's slot on the host's shared limiter, then sleep until it arrives."""
+        waited = await self.host_limiter.acquire_async()
+        if waited > 0:
+            logger.debug(f"Rate limit: waited {waited:.3f}s for {self.host}")
+
+    def _get_async_client(self, proxy_str: Optional[str] = None) -> Any:
+        """Return (creating if needed) the pooled httpx client for a proxy."""
+        client = self._async_clients.get(proxy_str)
+        if client is None:
+            proxy_url = parse_proxy(proxy_str).get("https") if proxy_str else None
+            client = httpx.AsyncClient(
+                # Carry over session-level headers set by subclasses (e.g. OpenAlex polite UA)
+                headers=dict(self.session.headers),
+                timeout=self.timeout,
+                proxy=proxy_url,
+                follow_redirects=True,
+            )
+            self._async_clients[proxy_str] = client
+        return client
+
+    async def _make_request_async(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Async counterpart of _make_request.
+
+        Cancellation (e.g. a per-topic timeout) propagates immediately and
+        aborts the in-flight HTTP request instead of leaving it running.
+        """
+        if httpx is None:
+            raise ImportError("httpx is required for async API requests (pip install httpx)")
+
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+
+        for attempt in range(self.max_retries):
+            try:
+                await self._rate_limit_wait_async()
+
+                logger.debug(f"Async request: {method} {url} (attempt {attempt + 1}/{self.max_retries})")
+
+                proxy_str = random.choice(PROXY_LIST) if PROXY_LIST else None
+                client = self._get_async_client(proxy_str)
+                with span(
+                    f"{type(self).__name__} {method}", CAT_API, async_track=True,
+                    endpoint=endpoint, attempt=attempt + 1,
+                ) as trace_args:
+                    response = await client.request(
+                        method,
+                        url,
+                        params=params,
+                        json=json_data,
+                        headers=self._request_headers(),
+                    )
+                    trace_args["status"] = response.status_code
+
+                if response.status_code == 200:
+                    self.host_limiter.record_success()
+                    return response.json()
+
+                elif response.status_code == 404:
+                    logger.debug(f"Resource not found: {url}")
+                    return None
+
+                elif response.status_code == 429:
+                    self._signal_rate_limited()
+                    if PROXY_LIST:
+                        wait_time = self._retry_wait(attempt)
+                        logger.debug(f"Rate limited (429), waiting {wait_time:.1f}s before retry via another proxy (attempt {attempt + 1}/{self.max_retries})")
+                        await traced_async_sleep(wait_time, "api_backoff", client=type(self).__name__)
+                        continue
+                    pause = self._record_rate_limited(response)
+                    logger.debug(f"Rate limited (429), {self.host} paused {pause:.1f}s before retry (attempt {attempt + 1}/{self.max_retries})")
+                    continue
+
+                elif response.status_code >= 500:
+                    wait_time = self._retry_wait(attempt)
+                    logger.warning(f"Server error ({response.status_code}), waiting {wait_time}s before retry")
+                    await traced_async_sleep(wait_time, "api_backoff", client=type(self).__name__)
+                    continue
+
+                else:
+                    logger.error(f"Client error: {response.status_code} - {response.text[:200]}")
+                    return None
+
+            except httpx.TimeoutException:
+                wait_time = self._retry_wait(attempt)
+                logger.warning(f"Request timeout, waiting {wait_time}s before retry")
+                await traced_async_sleep(wait_time, "api_backoff", client=type(self).__name__)
+                continue
+
+            except httpx.TransportError as e:
+                wait_time = self._retry_wait(attempt)
+                logger.warning(f"Connection error: {e}, waiting {wait_time}s before retry")
+                await traced_async_sleep(wait_time, "api_backoff", client=type(self).__name__)
+                continue
+
+            except httpx.HTTPError as e:
+                logger.error(f"Request failed: {e}")
+                return None
+
+            except Exception as e:
+                logger.error(f"Unexpected error: {e}")
+                return None
+
+        logger.debug(f"API unavailable after {self.max_retries} retries: {url[:60]}... (fallback sources will be used)")
+        return None
+
+    async def search_paper_async(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Async search_paper.
+
+        Clients that describe their search as a single request (by implementing
+        _search_request and _parse_search_response) run natively on httpx;
+        others fall back to running search_paper in a worker thread.
+        """
+        build_request = getattr(self, "_search_request", None)
+        if build_request is None or httpx is None:
+            return await asyncio.to_thread(self.search_paper, query)
+        response = await self._make_request_async(**build_request(query))
+        return self._parse_search_response(query, response)
+
+    def search_papers(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Search for up to limit papers, best match first.
+
+        Clients with a multi-result search implement _search_papers_request
+        and _parse_search_results; for others this is search_paper's single
+        result.
+        """
+        build_request = getattr(self, "_search_papers_request", None)
+        if build_request is None:
+            metadata = self.search_paper(query)
+            return [metadata] if metadata else []
+        response = self._make_request(**build_request(query, limit))
+        return self._parse_search_results(query, response)
+
+    async def search_papers_async(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Async search_papers."""
+        build_request = getattr(self, "_search_papers_request", None)
+        if build_request is None or httpx is None:
+            return await asyncio.to_thread(self.search_papers, query, limit)
+        response = await self._make_request_async(**build_request(query, limit))
+        return self._parse_search_results(query, response)
+
+    async def aclose(self) -> None:
+        """Close async clients (call on the loop that created them)."""
+        clients, self._async_clients = self._async_clients, {}
+        for client in clients.values():
+            await client.aclose()
+
     @abstractmethod
     def search_paper(self, query: str) -> Optional[Dict[str, Any]]:
         """
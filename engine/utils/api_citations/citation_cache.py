@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: SQLite-backed persistent cache for CitationResearcher topic lookups
+ABOUTME: WAL mode, per-topic upserts, TTLs, DOI/title indexes and one-time JSON migration
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..deduplicate_citations import normalize_text
+from ..sqlite_store import SQLiteConnections
+
+logger = logging.getLogger(__name__)
+
+# (metadata, source) pairs as returned by the API clients
+CachedResults = List[Tuple[Dict[str, Any], str]]
+
+SCHEMA_VERSION = 1
+DAY_SECONDS = 24 * 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS topics (
+    topic      TEXT PRIMARY KEY,
+    results    TEXT,              -- JSON [[metadata, source], ...]; NULL = nothing found
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_topics_expires ON topics (expires_at);
+CREATE TABLE IF NOT EXISTS works (
+    topic            TEXT NOT NULL REFERENCES topics (topic) ON DELETE CASCADE,
+    position         INTEGER NOT NULL,
+    doi              TEXT,
+    normalized_title TEXT,
+    source           TEXT,
+    PRIMARY KEY (topic, position)
+);
+CREATE INDEX IF NOT EXISTS idx_works_doi ON works (doi);
+CREATE INDEX IF NOT EXISTS idx_works_title ON works (normalized_title);
+"""
+
+
+class CitationCache:
+    """
+    Persistent topic → citation results cache backed by SQLite in WAL mode.
+
+    Each research_citation() result is written as a single-row upsert instead
+    of rewriting the whole cache, and WAL lets several scout threads or
+    processes read while one writes. Connections are per thread.
+
+    Empty results are cached too (negative caching) but expire sooner, so a
+    topic that found nothing is retried after negative_ttl.
+
+    The database file is only created (and legacy JSON imported) on the
+    first read or write.
+
+    Usage:
+        cache = CitationCache(Path(".citation_cache_orchestrator.db"))
+        hit, results = cache.get("transformer attention")
+        if not hit:
+            results = research(...)
+            cache.put("transformer attention", results)
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        ttl_seconds: float = 90 * DAY_SECONDS,
+        negative_ttl_seconds: float = 7 * DAY_SECONDS,
+        legacy_json_path: Optional[Path] = None,
+    ):
+        """
+        Initialize cache. The schema is created and legacy JSON migrated on first use.
+
+        Args:
+            db_path: SQLite database file
+            ttl_seconds: Lifetime of topics with results
+            negative_ttl_seconds: Lifetime of topics that found nothing
+            legacy_json_path: Old .citation_cache_orchestrator.json to import once
+        """
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.legacy_json_path = Path(legacy_json_path) if legacy_json_path is not None else None
+        self._connections = SQLiteConnections(self.db_path, pragmas=["foreign_keys=ON"], on_connect=self._initialize)
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _conn(self) -> sqlite3.Connection:
+        """Per-thread connection (sqlite3 connections must not cross threads)."""
+        return self._connections.get()
+
+    def _initialize(self, conn: sqlite3.Connection) -> None:
+        """Create the schema and migrate legacy JSON, once per cache object."""
+        with self._init_lock:
+            if self._initialized:
+                return
+            with conn:
+                conn.executescript(_SCHEMA)
+                conn.execute(
+                    "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                    (str(SCHEMA_VERSION),),
+                )
+            if self.legacy_json_path is not None:
+                self._migrate_json(self.legacy_json_path)
+            self._initialized = True
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        self._connections.close()
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get(self, topic: str) -> Tuple[bool, Optional[CachedResults]]:
+        """
+        Look up a topic.
+
+        Returns:
+            (hit, results): hit is False on a miss or expired entry; results is
+            None when the topic was cached as "nothing found"
+        """
+        row = self._conn().execute(
+            "SELECT results FROM topics WHERE topic = ? AND expires_at > ?",
+            (topic, time.time()),
+        ).fetchone()
+        if row is None:
+            return False, None
+        if row[0] is None:
+            return True, None
+        return True, [(metadata, source) for metadata, source in json.loads(row[0])]
+
+    def find_by_doi(self, doi: str) -> Optional[Tuple[Dict[str, Any], str]]:
+        """Return any unexpired cached work with this DOI."""
+        if not doi:
+            return None
+        return self._find_work("w.doi = ?", doi.strip().lower())
+
+    def find_by_title(self, title: str) -> Optional[Tuple[Dict[str, Any], str]]:
+        """Return any unexpired cached work whose normalized title matches."""
+        normalized = normalize_text(title)
+        if not normalized:
+            return None
+        return self._find_work("w.normalized_title = ?", normalized)
+
+    def _find_work(self, where: str, value: str) -> Optional[Tuple[Dict[str, Any], str]]:
+        row = self._conn().execute(
+            f"SELECT t.results, w.position FROM works w JOIN topics t ON t.topic = w.topic "
+            f"WHERE {where} AND t.expires_at > ? LIMIT 1",
+            (value, time.time()),
+        ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        metadata, source = json.loads(row[0])[row[1]]
+        return metadata, source
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def put(self, topic: str, results: Optional[CachedResults]) -> None:
+        """Insert or replace a single topic (None or [] = nothing found)."""
+        conn = self._conn()
+        with conn:
+            self._upsert(conn, topic, results, time.time())
+
+    def _upsert(
+        self,
+        conn: sqlite3.Connection,
+        topic: str,
+        results: Optional[CachedResults],
+        now: float,
+    ) -> None:
+        results = list(results) if results else None
+        ttl = self.ttl_seconds if results else self.negative_ttl_seconds
+        payload = (
+            json.dumps([[metadata, source] for metadata, source in results], ensure_ascii=False)
+            if results else None
+        )
+
+        conn.execute(
+            "INSERT INTO topics (topic, results, created_at, expires_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (topic) DO UPDATE SET results = excluded.results, "
+            "created_at = excluded.created_at, expires_at = excluded.expires_at",
+            (topic, payload, now, now + ttl),
+        )
+        conn.execute("DELETE FROM works WHERE topic = ?", (topic,))
+        if results:
+            conn.executemany(
+                "INSERT INTO works (topic, position, doi, normalized_title, source) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        topic,
+                        position,
+                        (metadata.get("doi") or "").strip().lower() or None,
+                        normalize_text(metadata.get("title") or "") or None,
+                        source,
+                    )
+                    for position, (metadata, source) in enumerate(results)
+                ],
+            )
+
+    def purge_expired(self) -> int:
+        """Delete expired topics. Returns the number removed."""
+        conn = self._conn()
+        with conn:
+            cursor = conn.execute("DELETE FROM topics WHERE expires_at <= ?", (time.time(),))
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        return self._conn().execute(
+            "SELECT COUNT(*) FROM topics WHERE expires_at > ?", (time.time(),)
+        ).fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Migration
+    # ------------------------------------------------------------------
+
+    def _migrate_json(self, json_path: Path) -> int:
+        """
+        Import the legacy JSON cache once, then rename it to *.migrated.
+
+        Accepts both historical layouts: [metadata, source] for a single result
+        and [[metadata, source], ...] for several. Returns entries imported.
+        """
+        if not json_path.exists():
+            return 0
+
+        conn = self._conn()
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'migrated_json'").fetchone():
+            return 0
+
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                cache_data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping citation cache migration, cannot read {json_path}: {e}")
+            return 0
+
+        now = time.time()
+        imported = 0
+        with conn:
+            # Another process may have migrated while we were reading the file
+            if conn.execute("SELECT 1 FROM meta WHERE key = 'migrated_json'").fetchone():
+                return 0
+            for topic, value in cache_data.items():
+                if value is None:
+                    results = None
+                elif isinstance(value, list) and len(value) == 2 and isinstance(value[0], dict):
+                    results = [(value[0], value[1])]
+                elif isinstance(value, list) and value and isinstance(value[0], list):
+                    results = [(item[0], item[1]) for item in value]
+                else:
+                    continue
+                # Existing rows are newer than the legacy file
+                exists = conn.execute("SELECT 1 FROM topics WHERE topic = ?", (topic,)).fetchone()
+                if not exists:
+                    self._upsert(conn, topic, results, now)
+                    imported += 1
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_json', ?)",
+                (str(json_path),),
+            )
+
+        try:
+            json_path.rename(json_path.with_name(json_path.name + ".migrated"))
+        except OSError as e:
+            logger.debug(f"Could not rename migrated cache file {json_path}: {e}")
+
+        logger.info(f"Migrated {imported} cached citations from {json_path} to {self.db_path}")
+        return imported
+
+
+def citation_cache_from_env(default_db: Path, legacy_json: Optional[Path] = None) -> CitationCache:
+    """
+    Build a CitationCache configured from environment.
+
+    Env:
+        CITATION_CACHE_DB: Database path (default: default_db)
+        CITATION_CACHE_TTL_DAYS: Lifetime of found results (default: 90)
+        CITATION_CACHE_NEGATIVE_TTL_DAYS: Lifetime of "nothing found" (default: 7)
+    """
+    return CitationCache(
+        Path(os.getenv("CITATION_CACHE_DB", str(default_db))),
+        ttl_seconds=float(os.getenv("CITATION_CACHE_TTL_DAYS", "90")) * DAY_SECONDS,
+        negative_ttl_seconds=float(os.getenv("CITATION_CACHE_NEGATIVE_TTL_DAYS", "7")) * DAY_SECONDS,
+        legacy_json_path=legacy_json,
+    )
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Completion policies for the parallel academic API fan-out in CitationResearcher
+ABOUTME: Decides when a topic stops waiting: first N DOI-backed hits, a latency budget, or all APIs
+
+research_citation queries Crossref, OpenAlex, Semantic Scholar and the web
+search client at once. Waiting for all of them ties every topic's latency to
+the slowest provider (usually Gemini Grounded), multiplied across 50-100
+topics. A policy lets a topic return once it has enough; the APIs still
+running (stragglers) finish in the background and their results are merged
+into the citation cache for later runs.
+
+Modes:
+    all:    Wait for every API, up to the researcher's timeout (pre-policy behaviour)
+    first:  Return once first_n results with a DOI arrived
+    budget: Return after latency_budget seconds with whatever usable results
+            arrived; without any, keep waiting for the first one (or the timeout)
+
+Configured from environment:
+    CITATION_COMPLETION_POLICY: all, first, budget (default: budget)
+    CITATION_FIRST_N: DOI-backed results the first mode waits for (default: 1)
+    CITATION_LATENCY_BUDGET: Seconds the budget mode waits (default: 8)
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MODE_ALL = "all"
+MODE_FIRST = "first"
+MODE_BUDGET = "budget"
+MODES = (MODE_ALL, MODE_FIRST, MODE_BUDGET)
+
+ApiResult = Tuple[Optional[Dict[str, Any]], str]
+
+
+def is_quality_result(metadata: Optional[Dict[str, Any]]) -> bool:
+    """A result backed by a DOI."""
+    return bool(metadata and metadata.get('doi'))
+
+
+def is_usable_result(metadata: Optional[Dict[str, Any]]) -> bool:
+    """A result research_citation keeps (DOI or URL)."""
+    return bool(metadata and (metadata.get('doi') or metadata.get('url')))
+
+
+@dataclass(frozen=True)
+class CompletionPolicy:
+    """
+    When a topic's parallel API fan-out stops waiting.
+
+    Attributes:
+        mode: all, first or budget
+        first_n: DOI-backed results that complete the first mode
+        latency_budget: Seconds after which the budget mode completes
+        timeout: Hard limit for every mode, in seconds
+    """
+    mode: str = MODE_BUDGET
+    first_n: int = 1
+    latency_budget: float = 8.0
+    timeout: float = 30.0
+
+    @classmethod
+    def from_env(cls, timeout: float) -> "CompletionPolicy":
+        """Policy from CITATION_COMPLETION_POLICY / CITATION_FIRST_N / CITATION_LATENCY_BUDGET."""
+        mode = os.getenv("CITATION_COMPLETION_POLICY", MODE_BUDGET).strip().lower()
+        if mode not in MODES:
+            logger.warning(f"Unknown CITATION_COMPLETION_POLICY {mode!r}, using {MODE_BUDGET}")
+            mode = MODE_BUDGET
+        return cls(
+            mode=mode,
+            first_n=max(1, int(os.getenv("CITATION_FIRST_N", "1"))),
+            latency_budget=float(os.getenv("CITATION_LATENCY_BUDGET", "8")),
+            timeout=timeout,
+        )
+
+    def is_complete(self, elapsed: float, results: List[ApiResult]) -> bool:
+        """Whether the results collected after elapsed seconds are enough to stop waiting."""
+        if self.mode == MODE_FIRST:
+            return sum(1 for metadata, _ in results if is_quality_result(metadata)) >= self.first_n
+        if self.mode == MODE_BUDGET:
+            return elapsed >= self.latency_budget and any(is_usable_result(m) for m, _ in results)
+        return False
+
+    def next_wait(self, elapsed: float) -> float:
+        """Seconds to wait for the next result before checking again (<= 0: timed out)."""
+        remaining = self.timeout - elapsed
+        if self.mode == MODE_BUDGET and elapsed < self.latency_budget:
+            return min(remaining, self.latency_budget - elapsed)
+        return remaining
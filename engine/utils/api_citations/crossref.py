@@ -5,8 +5,8 @@ ABOUTME: Primary citation source with 50M+ papers and guaranteed metadata qualit
 """
 
 import logging
-from typing import Optional, Dict, Any, List
-from .base import BaseAPIClient, validate_author_name
+from typing import Optional, Dict, Any, List, Set
+from .base import BaseAPIClient, normalize_doi, validate_author_name
 
 logger = logging.getLogger(__name__)
 
@@ -69,17 +69,24 @@ class CrossrefClient(BaseAPIClient):
             }
         """
         # Search Crossref Works API
-        response = self._make_request(
-            method="GET",
-            endpoint="/works",
-            params={
+        response = self._make_request(**self._search_request(query))
+        return self._parse_search_response(query, response)
+
+    def _search_request(self, query: str) -> Dict[str, Any]:
+        """Request arguments for a Works API search (shared by sync and async paths)."""
+        return {
+            "method": "GET",
+            "endpoint": "/works",
+            "params": {
                 "query": query,
                 "rows": 5,  # Get top 5 results
                 "sort": "relevance",
                 "select": "DOI,title,author,published,container-title,publisher,volume,issue,page,type,abstract",
             },
-        )
+        }
 
+    def _parse_search_response(self, query: str, response: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Extract the most relevant paper from a Works API response."""
         if not response:
             logger.debug(f"Crossref: No results for query '{query[:50]}...'")
             return None
@@ -109,6 +116,61 @@ class CrossrefClient(BaseAPIClient):
             logger.error(f"Crossref: Error parsing response: {e}")
             return None
 
+    # Keep filter query strings well under URL length limits
+    MAX_DOIS_PER_REQUEST = 50
+
+    def get_papers_by_dois(
+        self, dois: List[str], answered: Optional[Set[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get metadata for many DOIs with one request per 50 DOIs.
+
+        Repeated doi: filters are OR-ed by the Works API
+        (filter=doi:a,doi:b). DOIs containing commas cannot be expressed in
+        a filter and are skipped.
+
+        Args:
+            dois: DOI strings (any resolver prefix or case)
+            answered: If given, receives every normalized DOI whose request
+                      succeeded, so an absent DOI can be told apart from a
+                      failed request; DOIs with commas, which
+                      cannot be queried, are included
+
+        Returns:
+            Dict mapping normalized DOI to paper metadata; DOIs that were not
+            found or had incomplete metadata are absent
+        """
+        wanted = list(dict.fromkeys(
+            d for d in (normalize_doi(doi) for doi in dois) if d and "," not in d
+        ))
+        found: Dict[str, Dict[str, Any]] = {}
+        if answered is not None:
+            answered.update(d for d in (normalize_doi(doi) for doi in dois) if "," in d)
+
+        for start in range(0, len(wanted), self.MAX_DOIS_PER_REQUEST):
+            chunk = wanted[start:start + self.MAX_DOIS_PER_REQUEST]
+            response = self._make_request(
+                method="GET",
+                endpoint="/works",
+                params={
+                    "filter": ",".join(f"doi:{doi}" for doi in chunk),
+                    "rows": len(chunk),
+                    "select": "DOI,title,author,published,container-title,publisher,volume,issue,page,type,abstract",
+                },
+            )
+            if not response:
+                continue
+            if answered is not None:
+                answered.update(chunk)
+
+            for paper in response.get("message", {}).get("items", []):
+                metadata = self._extract_metadata(paper)
+                if metadata and normalize_doi(metadata.get("doi")):
+                    found[normalize_doi(metadata["doi"])] = metadata
+
+        logger.debug(f"Crossref: Resolved {len(found)}/{len(wanted)} DOIs in bulk")
+        return found
+
     def _extract_metadata(self, paper: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Extract and normalize paper metadata from Crossref response.
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Batched DOI metadata resolution against OpenAlex (bulk OR-filter) with Crossref fallback
+ABOUTME: Resolves a whole research batch in a few requests and fills missing citation fields
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .base import normalize_doi
+
+logger = logging.getLogger(__name__)
+
+# Fields copied from resolved metadata when the citation has no value yet
+ENRICHABLE_FIELDS = ("journal", "publisher", "volume", "issue", "pages", "abstract", "citation_count")
+
+
+def _get(target: Any, name: str) -> Any:
+    if isinstance(target, dict):
+        return target.get(name)
+    return getattr(target, name, None)
+
+
+def _set(target: Any, name: str, value: Any) -> None:
+    if isinstance(target, dict):
+        target[name] = value
+    else:
+        setattr(target, name, value)
+
+
+def _is_placeholder_authors(authors: Any) -> bool:
+    """True for missing authors or the 'Smith et al.' stubs built by the web clients."""
+    if not authors:
+        return True
+    if isinstance(authors, str):
+        return authors.strip().endswith("et al.")
+    return len(authors) == 1 and str(authors[0]).strip().endswith("et al.")
+
+
+def needs_enrichment(target: Any) -> bool:
+    """Whether a citation (object or metadata dict) has gaps a DOI lookup could fill."""
+    if _is_placeholder_authors(_get(target, "authors")) or not _get(target, "year"):
+        return True
+    return any(not _get(target, name) for name in ("journal", "volume", "pages"))
+
+
+def merge_metadata(target: Any, resolved: Dict[str, Any]) -> bool:
+    """
+    Fill empty fields of a citation object or metadata dict from resolved metadata.
+
+    Existing values are never overwritten, except placeholder authors
+    ("Smith et al.") which are replaced by the full author list.
+
+    Returns:
+        True if any field changed
+    """
+    changed = False
+
+    if _is_placeholder_authors(_get(target, "authors")) and resolved.get("authors"):
+        _set(target, "authors", list(resolved["authors"]))
+        changed = True
+
+    if not _get(target, "year") and resolved.get("year"):
+        _set(target, "year", resolved["year"])
+        changed = True
+
+    for name in ENRICHABLE_FIELDS:
+        value = resolved.get(name)
+        if value and not _get(target, name):
+            _set(target, name, value)
+            changed = True
+
+    return changed
+
+
+def to_web_metadata(resolved: Dict[str, Any], doi: str, url: Optional[str]) -> Dict[str, Any]:
+    """Shape resolved metadata like the web clients' per-DOI Crossref lookups."""
+    authors = resolved.get("authors") or []
+    author_str = None
+    if authors:
+        author_str = f"{authors[0]} et al." if len(authors) > 1 else authors[0]
+    year = resolved.get("year")
+    return {
+        "title": resolved.get("title"),
+        "authors": author_str,
+        "year": str(year) if year else None,
+        "doi": doi,
+        "url": url or f"https://doi.org/{doi}",
+        "journal": resolved.get("journal") or None,
+        "source_type": "journal",
+    }
+
+
+class BatchDOIResolver:
+    """
+    Resolves DOI metadata in bulk and memoizes the results.
+
+    Unresolved DOIs are looked up in OpenAlex first (up to 50 per request via
+    filter=doi:a|b|c), and whatever OpenAlex misses is retried against
+    Crossref's Works filter. Results, including misses, are memoized for the
+    life of the resolver so a DOI found by several topics costs one lookup;
+    DOIs whose requests failed are not memoized and are retried next time.
+
+    Usage:
+        resolver = get_doi_resolver()
+        enriched = resolver.enrich_citations(citations)
+    """
+
+    def __init__(self, openalex: Any = None, crossref: Any = None):
+        """
+        Initialize resolver.
+
+        Args:
+            openalex: OpenAlexClient (created on first use if None)
+            crossref: CrossrefClient (created on first use if None)
+        """
+        self._openalex = openalex
+        self._crossref = crossref
+        self._memo: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+        self.lookups = 0
+        self.memo_hits = 0
+
+    @property
+    def openalex(self) -> Any:
+        if self._openalex is None:
+            from .openalex import OpenAlexClient
+            self._openalex = OpenAlexClient()
+        return self._openalex
+
+    @property
+    def crossref(self) -> Any:
+        if self._crossref is None:
+            from .crossref import CrossrefClient
+            self._crossref = CrossrefClient()
+        return self._crossref
+
+    def cached(self, doi: str) -> Optional[Dict[str, Any]]:
+        """Return memoized metadata for a DOI without any network access."""
+        key = normalize_doi(doi)
+        with self._lock:
+            resolved = self._memo.get(key)
+            if resolved:
+                self.memo_hits += 1
+        return resolved
+
+    def resolve(self, dois: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Resolve many DOIs with as few requests as possible.
+
+        Args:
+            dois: DOI strings (any resolver prefix or case)
+
+        Returns:
+            Dict mapping normalized DOI to metadata for every DOI that resolved
+        """
+        keys = list(dict.fromkeys(k for k in (normalize_doi(doi) for doi in dois) if k))
+        with self._lock:
+            pending = [k for k in keys if k not in self._memo]
+            self.memo_hits += len(keys) - len(pending)
+
+        if pending:
+            found, settled = self._lookup(pending)
+            with self._lock:
+                self.lookups += len(pending)
+                # DOIs of failed requests stay unmemoized and are retried next time
+                for key in pending:
+                    if key in settled:
+                        self._memo[key] = found.get(key)
+
+        with self._lock:
+            return {k: self._memo[k] for k in keys if self._memo.get(k)}
+
+    def _lookup(self, keys: List[str]) -> Tuple[Dict[str, Dict[str, Any]], Set[str]]:
+        """
+        Look keys up in OpenAlex, then Crossref.
+
+        Returns:
+            (found, settled): metadata per resolved DOI, and the DOIs whose
+            outcome is known (resolved, or missed by both APIs' requests)
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        openalex_answered: Set[str] = set()
+        crossref_answered: Set[str] = set()
+
+        try:
+            found.update(self.openalex.get_papers_by_dois(keys, answered=openalex_answered))
+        except Exception as e:
+            logger.warning(f"OpenAlex bulk DOI lookup failed: {e}")
+
+        missing = [k for k in keys if k not in found]
+        if missing:
+            try:
+                found.update(self.crossref.get_papers_by_dois(missing, answered=crossref_answered))
+            except Exception as e:
+                logger.warning(f"Crossref bulk DOI lookup failed: {e}")
+
+        settled = set(found) | (openalex_answered & crossref_answered)
+        logger.info(f"DOI resolver: {len(found)}/{len(keys)} DOIs resolved in bulk")
+        return found, settled
+
+    def enrich_citations(self, citations: Iterable[Any]) -> int:
+        """
+        Fill missing metadata on citations (Citation objects or dicts) that have a DOI.
+
+        Returns:
+            Number of citations that gained at least one field
+        """
+        targets = [c for c in citations if normalize_doi(_get(c, "doi")) and needs_enrichment(c)]
+        if not targets:
+            return 0
+
+        resolved = self.resolve(_get(c, "doi") for c in targets)
+        enriched = 0
+        for citation in targets:
+            metadata = resolved.get(normalize_doi(_get(citation, "doi")))
+            if metadata and merge_metadata(citation, metadata):
+                enriched += 1
+        return enriched
+
+    def get_stats(self) -> Dict[str, int]:
+        """Snapshot of resolver counters for reporting."""
+        with self._lock:
+            return {
+                "memoized": len(self._memo),
+                "resolved": sum(1 for v in self._memo.values() if v),
+                "lookups": self.lookups,
+                "memo_hits": self.memo_hits,
+            }
+
+
+# Singleton instance shared by the research clients
+_doi_resolver: Optional[BatchDOIResolver] = None
+_doi_resolver_lock = threading.Lock()
+
+
+def get_doi_resolver() -> BatchDOIResolver:
+    """Get or create the process-wide DOI resolver."""
+    global _doi_resolver
+    if _doi_resolver is None:
+        with _doi_resolver_lock:
+            if _doi_resolver is None:
+                _doi_resolver = BatchDOIResolver()
+    return _doi_resolver
+
+
+def reset_doi_resolver() -> None:
+    """Reset the singleton (for testing)."""
+    global _doi_resolver
+    _doi_resolver = None
@@ -43,6 +43,7 @@ except ImportError:
     load_dotenv = None
 
 from .base import BaseAPIClient
+from .doi_resolver import get_doi_resolver, to_web_metadata
 
 # =========================================================================
 # Domain Quality Filtering for Source Validation
@@ -367,6 +368,13 @@ class GeminiGroundedClient(BaseAPIClient):
                 ]
             }
 
+            # Wait for capacity in the process-wide Gemini RPM/TPM limiter
+            from concurrency.rate_limiter import get_gemini_limiter
+            from utils.token_counter import estimate_tokens
+            limiter = get_gemini_limiter()
+            if limiter:
+                limiter.acquire(tokens=estimate_tokens(prompt))
+
             # Make REST API call
             url = f"{self.base_url}/{self.model_name}:generateContent?key={self.api_key}"
 
@@ -382,6 +390,8 @@ class GeminiGroundedClient(BaseAPIClient):
 
                 # Handle 429 rate limit with multi-key rotation
                 if response.status_code == 429:
+                    if limiter:
+                        limiter.penalize()
                     try:
                         from utils.backpressure import BackpressureManager, APIType
                         bp = BackpressureManager()
@@ -803,7 +813,7 @@ Provide the source title, URL, and a brief snippet explaining relevance."""
                 "id": pmid,
                 "retmode": "json"
             }
-            response = self.session.get(api_url, params=params, timeout=10)
+            response = self._throttled_get(self.session, api_url, params=params, timeout=10)
             if not response.ok:
                 return None
             
@@ -851,7 +861,7 @@ Provide the source title, URL, and a brief snippet explaining relevance."""
                 "term": f"PMC{pmcid}[pmcid]",
                 "retmode": "json"
             }
-            response = self.session.get(api_url, params=params, timeout=10)
+            response = self._throttled_get(self.session, api_url, params=params, timeout=10)
             if not response.ok:
                 return None
             
@@ -868,7 +878,7 @@ Provide the source title, URL, and a brief snippet explaining relevance."""
                 "id": id_list[0],
                 "retmode": "json"
             }
-            response = self.session.get(summary_url, params=params, timeout=10)
+            response = self._throttled_get(self.session, summary_url, params=params, timeout=10)
             if not response.ok:
                 return None
             
@@ -908,10 +918,15 @@ Provide the source title, URL, and a brief snippet explaining relevance."""
     
     def _fetch_crossref_metadata(self, doi: str, original_url: str) -> Optional[Dict[str, Any]]:
         """Fetch paper metadata from CrossRef using DOI."""
+        # DOIs already resolved in bulk this run need no request
+        resolved = get_doi_resolver().cached(doi)
+        if resolved:
+            return to_web_metadata(resolved, doi, original_url)
+
         try:
             api_url = f"https://api.crossref.org/works/{doi}"
             headers = {'User-Agent': 'AcademicDraftAI/1.0 (mailto:support@example.com)'}
-            response = self.session.get(api_url, headers=headers, timeout=10)
+            response = self._throttled_get(self.session, api_url, headers=headers, timeout=10)
             
             if not response.ok:
                 return None
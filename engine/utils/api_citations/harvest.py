@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Top-k result harvesting for multi-result academic APIs (OpenAlex, Semantic Scholar)
+ABOUTME: Keeps the best match plus the other results relevant to the query, deduplicated
+
+search_paper returns one paper per query, although one OpenAlex or Semantic
+Scholar search request already returns a ranked page of candidates. The
+researcher asks these APIs for the top CITATION_HARVEST_K results instead and
+keeps the ones that match the query, so fewer queries reach the Scout's
+citation target.
+
+The API's best match is always kept (it is what search_paper returns). Every
+other result must contain at least CITATION_HARVEST_MIN_RELEVANCE of the
+query's distinctive terms in its title or abstract.
+
+Configured from environment:
+    CITATION_HARVEST_K: Results requested per harvesting API and query (default: 5; 1 disables)
+    CITATION_HARVEST_MIN_RELEVANCE: Share of query terms a further result must cover (default: 0.35)
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+from utils.text_relevance import term_coverage
+
+from .base import normalize_doi
+
+# APIs whose search returns a ranked page worth harvesting
+HARVEST_APIS = ("openalex", "semantic_scholar")
+
+
+def harvest_k_from_env() -> int:
+    return max(1, int(os.getenv("CITATION_HARVEST_K", "5")))
+
+
+def harvest_min_relevance_from_env() -> float:
+    return float(os.getenv("CITATION_HARVEST_MIN_RELEVANCE", "0.35"))
+
+
+def work_key(metadata: Dict[str, Any]) -> Optional[str]:
+    """Identity of a work for deduplication: normalized DOI, else lowercased title."""
+    doi = normalize_doi(metadata.get("doi"))
+    if doi:
+        return f"doi:{doi}"
+    title = " ".join((metadata.get("title") or "").lower().split())
+    return f"title:{title}" if title else None
+
+
+def select_relevant(
+    papers: Sequence[Dict[str, Any]], query: str, min_relevance: float
+) -> List[Dict[str, Any]]:
+    """
+    Harvested papers worth keeping, in API rank order.
+
+    Args:
+        papers: Metadata dicts as ranked by the API
+        query: The search query
+        min_relevance: Share of query terms results after the first must cover
+
+    Returns:
+        The first paper plus every later relevant one, without duplicates
+    """
+    selected: List[Dict[str, Any]] = []
+    seen = set()
+    for rank, paper in enumerate(papers):
+        if not paper:
+            continue
+        key = work_key(paper)
+        if key in seen:
+            continue
+        if rank > 0:
+            text = f"{paper.get('title', '')} {paper.get('abstract') or ''}"
+            if term_coverage(query, text) < min_relevance:
+                continue
+        seen.add(key)
+        selected.append(paper)
+    return selected
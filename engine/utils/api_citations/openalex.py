@@ -6,8 +6,8 @@ ABOUTME: 250M+ scholarly works, free API with optional key for higher limits
 
 import logging
 import os
-from typing import Optional, Dict, Any, List
-from .base import BaseAPIClient, validate_author_name
+from typing import Optional, Dict, Any, List, Set
+from .base import BaseAPIClient, normalize_doi, validate_author_name
 
 logger = logging.getLogger(__name__)
 
@@ -78,18 +78,30 @@ class OpenAlexClient(BaseAPIClient):
         Returns:
             Paper metadata dict with standardized fields or None if not found
         """
+        # Search OpenAlex works
+        response = self._make_request(**self._search_request(query))
+        return self._parse_search_response(query, response)
+
+    def _search_request(self, query: str) -> Dict[str, Any]:
+        """Request arguments for a works search (shared by sync and async paths)."""
+        return self._search_papers_request(query, 5)
+
+    def _search_papers_request(self, query: str, limit: int) -> Dict[str, Any]:
+        """Request arguments for a works search returning up to limit results."""
         # OpenAlex uses filter-based search
         # search= does full-text search across title, abstract, etc.
-        response = self._make_request(
-            method="GET",
-            endpoint="/works",
-            params={
+        return {
+            "method": "GET",
+            "endpoint": "/works",
+            "params": {
                 "search": query,
-                "per_page": 5,
+                "per_page": min(limit, 200),
                 "select": "id,doi,title,authorships,publication_year,primary_location,type,cited_by_count,abstract_inverted_index",
             },
-        )
+        }
 
+    def _parse_search_response(self, query: str, response: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Extract the most relevant paper from a works search response."""
         if not response:
             logger.debug(f"OpenAlex: No results for query '{query[:50]}...'")
             return None
@@ -116,27 +128,8 @@ class OpenAlexClient(BaseAPIClient):
             logger.error(f"OpenAlex: Error parsing response: {e}")
             return None
 
-    def search_papers(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """
-        Search for multiple papers by query.
-
-        Args:
-            query: Search query
-            limit: Maximum number of results (default 10, max 200)
-
-        Returns:
-            List of paper metadata dicts
-        """
-        response = self._make_request(
-            method="GET",
-            endpoint="/works",
-            params={
-                "search": query,
-                "per_page": min(limit, 200),
-                "select": "id,doi,title,authorships,publication_year,primary_location,type,cited_by_count,abstract_inverted_index",
-            },
-        )
-
+    def _parse_search_results(self, query: str, response: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Extract every paper with complete metadata from a works search response, in rank order."""
         if not response:
             return []
 
@@ -172,6 +165,55 @@ class OpenAlexClient(BaseAPIClient):
 
         return self._extract_metadata(response)
 
+    # OpenAlex caps OR-filters at 50 values per request
+    MAX_DOIS_PER_REQUEST = 50
+
+    def get_papers_by_dois(
+        self, dois: List[str], answered: Optional[Set[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get metadata for many DOIs with one request per 50 DOIs.
+
+        Uses the pipe-separated OR filter (filter=doi:a|b|c) instead of one
+        /works/{doi} call per paper.
+
+        Args:
+            dois: DOI strings (any resolver prefix or case)
+            answered: If given, receives every normalized DOI whose request
+                      succeeded, so an absent DOI can be told apart from a
+                      failed request
+
+        Returns:
+            Dict mapping normalized DOI to paper metadata; DOIs that were not
+            found or had incomplete metadata are absent
+        """
+        wanted = list(dict.fromkeys(d for d in (normalize_doi(doi) for doi in dois) if d))
+        found: Dict[str, Dict[str, Any]] = {}
+
+        for start in range(0, len(wanted), self.MAX_DOIS_PER_REQUEST):
+            chunk = wanted[start:start + self.MAX_DOIS_PER_REQUEST]
+            response = self._make_request(
+                method="GET",
+                endpoint="/works",
+                params={
+                    "filter": "doi:" + "|".join(chunk),
+                    "per_page": len(chunk),
+                    "select": "id,doi,title,authorships,publication_year,primary_location,type,cited_by_count,abstract_inverted_index,biblio",
+                },
+            )
+            if not response:
+                continue
+            if answered is not None:
+                answered.update(chunk)
+
+            for paper in response.get("results", []):
+                metadata = self._extract_metadata(paper)
+                if metadata and normalize_doi(metadata.get("doi")):
+                    found[normalize_doi(metadata["doi"])] = metadata
+
+        logger.debug(f"OpenAlex: Resolved {len(found)}/{len(wanted)} DOIs in bulk")
+        return found
+
     def _extract_metadata(self, paper: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Extract and normalize paper metadata from OpenAlex response.
@@ -237,6 +279,12 @@ class OpenAlexClient(BaseAPIClient):
             # Abstract (OpenAlex uses inverted index format)
             abstract = self._reconstruct_abstract(paper.get("abstract_inverted_index"))
 
+            # Volume/issue/pages are only present when "biblio" is selected
+            biblio = paper.get("biblio") or {}
+            first_page = biblio.get("first_page") or ""
+            last_page = biblio.get("last_page") or ""
+            pages = f"{first_page}-{last_page}" if first_page and last_page and first_page != last_page else first_page
+
             # Calculate confidence
             confidence = self._calculate_confidence(
                 has_doi=bool(doi),
@@ -253,9 +301,9 @@ class OpenAlexClient(BaseAPIClient):
                 "url": url,
                 "journal": journal,
                 "publisher": publisher,
-                "volume": "",  # Not in basic select
-                "issue": "",
-                "pages": "",
+                "volume": biblio.get("volume") or "",
+                "issue": biblio.get("issue") or "",
+                "pages": pages,
                 "source_type": source_type,
                 "confidence": confidence,
                 "abstract": abstract,
@@ -4,13 +4,16 @@ ABOUTME: Citation research orchestrator with intelligent fallback chain
 ABOUTME: Coordinates Crossref → Semantic Scholar → Gemini Grounded → Gemini LLM for 95%+ success rate
 """
 
+import asyncio
 import logging
 import json
 import os
 import sys
-from typing import Optional, Dict, Any, Tuple, List, Callable
+import threading
+import time
+from typing import Optional, Dict, Any, Tuple, List, Callable, Sequence
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
 from pydantic import ValidationError
 
@@ -40,6 +43,15 @@ from .gemini_grounded import GeminiGroundedClient
 from .serper_client import SerperClient
 from .query_router import QueryRouter, QueryClassification
 from .base import validate_publication_year, validate_author_name
+from .citation_cache import citation_cache_from_env
+from .completion_policy import CompletionPolicy, is_usable_result
+from .harvest import (
+    HARVEST_APIS,
+    harvest_k_from_env,
+    harvest_min_relevance_from_env,
+    select_relevant,
+    work_key,
+)
 
 from ..models import strip_markdown_json, LLMCitationResponse
 
@@ -83,38 +95,6 @@ def set_research_verbosity(verbose: bool) -> None:
     _verbose_research = verbose
 
 
-# =========================================================================
-# Rate Limiting
-# =========================================================================
-class GeminiRateLimiter:
-    """Simple rate limiter for Gemini API calls (free tier: ~60 req/min)."""
-
-    def __init__(self, requests_per_minute: int = 60):
-        self.requests_per_minute = requests_per_minute
-        self.min_interval = 60.0 / requests_per_minute
-        self.last_request_time = 0
-
-    def wait_if_needed(self) -> None:
-        """Wait if necessary to respect rate limit."""
-        import time
-
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.min_interval:
-            sleep_time = self.min_interval - time_since_last
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
-
-
-# Global rate limiter instance
-_gemini_rate_limiter = GeminiRateLimiter()
-
-
-def get_gemini_rate_limiter() -> GeminiRateLimiter:
-    """Get the global Gemini rate limiter instance."""
-    return _gemini_rate_limiter
-
-
 class CitationResearcher:
     """
     Orchestrates citation research across multiple sources with intelligent fallback.
@@ -135,8 +115,15 @@ class CitationResearcher:
     Gemini Grounded uses DataForSEO SERP API as fallback when googleSearch hits quota limits.
     """
 
-    # Persistent cache file path
-    CACHE_FILE = Path(".citation_cache_orchestrator.json")
+    # Persistent cache (SQLite); the JSON file is the pre-SQLite format, migrated once
+    CACHE_DB = Path(".citation_cache_orchestrator.db")
+    LEGACY_CACHE_FILE = Path(".citation_cache_orchestrator.json")
+
+    # How long a topic waits for the parallel academic API fan-out
+    PARALLEL_API_TIMEOUT_SECONDS = 30
+
+    # How long a finished batch waits for stragglers before closing (the rest are cancelled)
+    STRAGGLER_DRAIN_SECONDS = 2.0
 
     def __init__(
         self,
@@ -150,6 +137,7 @@ class CitationResearcher:
         use_serper: bool = None,  # None = auto-detect from env
         verbose: bool = True,
         progress_callback: Optional[Callable[[str, str], None]] = None,
+        completion_policy: Optional[CompletionPolicy] = None,
     ):
         """
         Initialize Citation Researcher.
@@ -165,6 +153,7 @@ class CitationResearcher:
             use_serper: Whether to use Serper.dev instead of Gemini Grounded for web search
             verbose: Whether to print progress
             progress_callback: Optional callback(message, event_type) for progress reporting
+            completion_policy: When the parallel fan-out stops waiting (None = from env)
         """
         self.gemini_model = gemini_model
         self.progress_callback = progress_callback
@@ -209,8 +198,18 @@ class CitationResearcher:
         if self.enable_smart_routing:
             self.query_router = QueryRouter()
 
-        # Load persistent cache (or initialize empty if file doesn't exist)
-        self.cache: Dict[str, Optional[Tuple[Dict[str, Any], str]]] = self._load_cache()
+        # Open persistent cache (created on first use, legacy JSON imported once)
+        self.cache = citation_cache_from_env(self.CACHE_DB, legacy_json=self.LEGACY_CACHE_FILE)
+
+        # Parallel fan-out completion; APIs still running when a topic returns
+        # (stragglers) are merged into the cache when they finish
+        self.completion_policy = completion_policy or CompletionPolicy.from_env(self.PARALLEL_API_TIMEOUT_SECONDS)
+        self._straggler_lock = threading.Lock()
+        self._straggler_tasks: set = set()
+
+        # Top-k results per query from multi-result APIs (1 = best match only)
+        self.harvest_k = harvest_k_from_env()
+        self.harvest_min_relevance = harvest_min_relevance_from_env()
 
         # Track source usage for round-robin variety (reset each session)
         self.source_usage_count: Dict[str, int] = {
@@ -240,120 +239,27 @@ class CitationResearcher:
             except Exception as e:
                 logger.debug(f"Progress callback error: {e}")
 
-    def _load_cache(self) -> Dict[str, Optional[Tuple[Dict[str, Any], str]]]:
-        """
-        Load citation cache from disk.
-
-        Returns:
-            Dict mapping topics to (metadata, source) tuples, list of tuples, or None
-        """
-        if not self.CACHE_FILE.exists():
-            logger.info(f"No existing cache file found at {self.CACHE_FILE}")
-            return {}
-
-        try:
-            with open(self.CACHE_FILE, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-
-            logger.info(f"Loaded {len(cache_data)} cached citations from {self.CACHE_FILE}")
-
-            # Convert JSON back to cache format
-            cache = {}
-            for topic, value in cache_data.items():
-                if value is None:
-                    cache[topic] = None
-                elif isinstance(value, list) and len(value) == 2 and isinstance(value[0], dict):
-                    # Old format: [metadata_dict, source_string] - single citation
-                    cache[topic] = (value[0], value[1])
-                elif isinstance(value, list) and len(value) > 0 and isinstance(value[0], list):
-                    # New format: [[metadata1, source1], [metadata2, source2], ...] - multiple citations
-                    cache[topic] = [(item[0], item[1]) for item in value]
-                else:
-                    # Fallback for unexpected format
-                    cache[topic] = (value[0], value[1]) if isinstance(value, list) and len(value) >= 2 else None
-
-            return cache
-        except Exception as e:
-            logger.warning(f"Failed to load cache from {self.CACHE_FILE}: {e}")
-            return {}
-
-    def _save_cache(self) -> None:
-        """
-        Save citation cache to disk.
-
-        Persists the in-memory cache to a JSON file for reuse across runs.
-        """
-        try:
-            # Convert cache to JSON-serializable format
-            cache_data = {}
-            for topic, value in self.cache.items():
-                if value is None:
-                    cache_data[topic] = None
-                elif isinstance(value, list):
-                    if len(value) == 0:
-                        # Empty list - treat as no results
-                        cache_data[topic] = None
-                    elif isinstance(value[0], tuple):
-                        # List of (metadata, source) tuples - convert to list of [metadata, source] lists
-                        cache_data[topic] = [[metadata, source] for metadata, source in value]
-                    else:
-                        # Unexpected format - skip
-                        logger.warning(f"Unexpected cache format for topic '{topic}': {type(value[0])}")
-                        cache_data[topic] = None
-                elif isinstance(value, tuple) and len(value) == 2:
-                    # Single (metadata, source) tuple - for backward compatibility
-                    metadata, source = value
-                    cache_data[topic] = [metadata, source]
-                else:
-                    # Unexpected format - skip
-                    logger.warning(f"Unexpected cache format for topic '{topic}': {type(value)}")
-                    cache_data[topic] = None
-
-            with open(self.CACHE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
-
-            logger.debug(f"Saved {len(cache_data)} citations to cache file {self.CACHE_FILE}")
-        except Exception as e:
-            logger.error(f"Failed to save cache to {self.CACHE_FILE}: {e}")
-
-    def research_citation(self, topic: str) -> List[Citation]:
-        """
-        Research citations using parallel API calls.
-
-        Args:
-            topic: Topic or description to research
-
-        Returns:
-            List of Citation objects (may be empty if none found)
-        """
-        # Check cache first
-        if topic in self.cache:
-            cached = self.cache[topic]
-            if cached is None:
-                return []
-            # Cache may store either single tuple or list of tuples
-            if isinstance(cached, list):
-                # List of (metadata, source) tuples
-                cached_list = cached
-            else:
-                # Single (metadata, source) tuple - convert to list
-                cached_list = [cached]
-
-            citations = []
-            for cached_metadata, cached_source in cached_list:
-                if self.verbose:
-                    safe_print(
-                        f"    ✓ Cached: {cached_metadata.get('authors', ['Unknown'])[0] if cached_metadata.get('authors') else 'Unknown'} et al. ({cached_metadata.get('year', 'n.d.')}) [from {cached_source}]"
-                    )
-                citation = self._create_citation(cached_metadata, cached_source)
-                if citation:
-                    citations.append(citation)
-            return citations
-
+    def _cached_citations(self, topic: str) -> Optional[List[Citation]]:
+        """Citations for a cached topic, or None on a cache miss."""
+        hit, cached_list = self.cache.get(topic)
+        if not hit:
+            return None
+        if cached_list is None:
+            return []
 
-        if self.verbose:
-                    safe_print(f"  🔍 Researching: {topic[:70]}{'...' if len(topic) > 70 else ''}")
+        citations = []
+        for cached_metadata, cached_source in cached_list:
+            if self.verbose:
+                safe_print(
+                    f"    ✓ Cached: {cached_metadata.get('authors', ['Unknown'])[0] if cached_metadata.get('authors') else 'Unknown'} et al. ({cached_metadata.get('year', 'n.d.')}) [from {cached_source}]"
+                )
+            citation = self._create_citation(cached_metadata, cached_source)
+            if citation:
+                citations.append(citation)
+        return citations
 
+    def _plan_api_chain(self, topic: str) -> List[str]:
+        """Classify the topic and return the enabled APIs to query, in order."""
         # Classify query and determine API chain
         api_chain = None
         if self.enable_smart_routing:
@@ -383,72 +289,135 @@ class CitationResearcher:
         if self.verbose and api_chain:
             safe_print(f"    🔀 API chain: {' → '.join(api_chain)}")
 
+        return api_chain
 
-        # Collect ALL valid results from API chain
-        valid_results: List[Tuple[Dict[str, Any], str]] = []
-
+    def _parallel_apis(self, api_chain: List[str]) -> List[str]:
+        """
+        APIs to fan out to at once, or [] to walk api_chain sequentially.
 
-        # Determine if we should use parallel queries
-        # Use parallel for academic/journal queries where multiple academic APIs are in chain
+        Parallel is used for academic/journal queries where multiple academic
+        APIs are in the chain, querying all of them for source diversity.
+        """
         use_parallel = (
             'crossref' in api_chain
             and ('openalex' in api_chain or 'semantic_scholar' in api_chain)
             and self.enable_crossref
         )
+        if not use_parallel:
+            return []
 
-        if use_parallel:
-            # Query ALL academic APIs in parallel for maximum source diversity
-            parallel_apis = ['crossref']
-            if self.enable_openalex:
-                parallel_apis.append('openalex')
-            if self.enable_semantic_scholar:
-                parallel_apis.append('semantic_scholar')
-            if self.enable_gemini_grounded:
-                parallel_apis.append('gemini_grounded')
+        parallel_apis = ['crossref']
+        if self.enable_openalex:
+            parallel_apis.append('openalex')
+        if self.enable_semantic_scholar:
+            parallel_apis.append('semantic_scholar')
+        if self.enable_gemini_grounded:
+            parallel_apis.append('gemini_grounded')
+        return parallel_apis
+
+    def _collect_valid_results(
+        self,
+        results: List[Tuple[Optional[Dict[str, Any]], str]],
+        valid_results: List[Tuple[Dict[str, Any], str]],
+    ) -> None:
+        """Append every result with a DOI or URL to valid_results (not just the best one)."""
+        for result_metadata, result_source in results:
+            if result_metadata and (result_metadata.get('doi') or result_metadata.get('url')):
+                valid_results.append((result_metadata, result_source))
+                # Update source usage count for logging
+                self.source_usage_count[result_source] = self.source_usage_count.get(result_source, 0) + 1
+
+    def _collect_api_results(
+        self,
+        api_results: List[List[Tuple[Optional[Dict[str, Any]], str]]],
+        valid_results: List[Tuple[Dict[str, Any], str]],
+    ) -> int:
+        """
+        Collect each API's results (best match first) into valid_results.
+
+        Every API's best match is kept as before; its further (harvested)
+        results only when no API already contributed the same work.
+
+        Returns:
+            Number of results added
+        """
+        before = len(valid_results)
+        for results in api_results:
+            self._collect_valid_results(results[:1], valid_results)
+            seen = {work_key(metadata) for metadata, _ in valid_results}
+            for metadata, source in results[1:]:
+                key = metadata and work_key(metadata)
+                if key and key not in seen:
+                    self._collect_valid_results([(metadata, source)], valid_results)
+                    seen.add(key)
+        return len(valid_results) - before
+
+    def _harvests(self, api_name: str) -> bool:
+        """Whether api_name is searched for top-k results instead of the best match."""
+        client, _ = self._api_client(api_name)
+        return self.harvest_k > 1 and api_name in HARVEST_APIS and hasattr(client, 'search_papers')
+
+    def _harvest(self, api_name: str, topic: str) -> List[Tuple[Optional[Dict[str, Any]], str]]:
+        """Top-k relevant, deduplicated works from a multi-result API (raises on API errors)."""
+        client, source_name = self._api_client(api_name)
+        papers = client.search_papers(topic, limit=self.harvest_k)
+        selected = select_relevant(papers, topic, self.harvest_min_relevance)
+        logger.debug(f"  {source_name}: kept {len(selected)} of {len(papers)} results for {topic[:60]}")
+        return [(metadata, source_name) for metadata in selected] or [(None, api_name)]
+
+    def _search_api_results(self, api_name: str, topic: str) -> List[Tuple[Optional[Dict[str, Any]], str]]:
+        """_search_api, harvesting top-k results where the API supports it. Never raises."""
+        if self._harvests(api_name):
+            try:
+                return self._harvest(api_name, topic)
+            except Exception as e:
+                logger.error(f"❌ [{api_name.upper()}] Error during search: {type(e).__name__}: {str(e)[:100]}")
+                return [(None, api_name)]
+        return [self._search_api(api_name, topic)]
+
+    def research_citation(self, topic: str) -> List[Citation]:
+        """
+        Research citations using parallel API calls.
 
+        The parallel fan-out returns as soon as self.completion_policy is
+        satisfied; results of APIs still running are cached when they arrive.
 
+        Args:
+            topic: Topic or description to research
+
+        Returns:
+            List of Citation objects (may be empty if none found)
+        """
+        # Check cache first
+        cached = self._cached_citations(topic)
+        if cached is not None:
+            return cached
+
+        if self.verbose:
+                    safe_print(f"  🔍 Researching: {topic[:70]}{'...' if len(topic) > 70 else ''}")
+
+        api_chain = self._plan_api_chain(topic)
+
+        # Collect ALL valid results from API chain
+        valid_results: List[Tuple[Dict[str, Any], str]] = []
+
+
+        # Determine if we should use parallel queries
+        parallel_apis = self._parallel_apis(api_chain)
+        stragglers: List[Future] = []
+
+        if parallel_apis:
+            # Query ALL academic APIs in parallel for maximum source diversity
             # Report progress for parallel search
             self._report_progress("Querying academic APIs in parallel...", "search")
 
             if self.verbose:
                 apis_str = " + ".join([a.replace("_", " ").title() for a in parallel_apis])
                 safe_print(f"    → Querying {apis_str} in parallel...", end=" ", flush=True)
-            results: List[Tuple[Optional[Dict[str, Any]], str]] = []
-
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                futures = {
-                    executor.submit(self._search_api, api, topic): api
-                    for api in parallel_apis
-                }
-                try:
-                    for future in as_completed(futures, timeout=30):  # 30s timeout - balanced for Gemini
-                        try:
-                            result = future.result()
-                            results.append(result)
-                        except Exception as e:
-                            api = futures[future]
-                            logger.debug(f"Parallel {api} error: {e}")
-                            results.append((None, api))
-                except (TimeoutError, FuturesTimeoutError):
-                    # Graceful degradation: use whatever results we have
-                    logger.warning(f"Parallel query timeout - {len(results)} of {len(futures)} APIs responded")
-                    # Collect any completed futures
-                    for future, api in futures.items():
-                        if future.done():
-                            try:
-                                result = future.result(timeout=0)
-                                if result not in results:
-                                    results.append(result)
-                            except Exception:
-                                pass
+            api_results, stragglers = self._gather_parallel(topic, parallel_apis)
 
             # Collect ALL valid results (not just best one)
-            for result_metadata, result_source in results:
-                if result_metadata and (result_metadata.get('doi') or result_metadata.get('url')):
-                    valid_results.append((result_metadata, result_source))
-                    # Update source usage count for logging
-                    self.source_usage_count[result_source] = self.source_usage_count.get(result_source, 0) + 1
-
+            self._collect_api_results(api_results, valid_results)
 
             if valid_results:
                 if self.verbose:
@@ -484,10 +453,11 @@ class CitationResearcher:
                     if self.verbose:
                         safe_print(f"    → Trying OpenAlex API...", end=" ", flush=True)
                     try:
-                        metadata = self.openalex.search_paper(topic)
-                        if metadata and (metadata.get('doi') or metadata.get('url')):
-                            valid_results.append((metadata, "OpenAlex"))
-                            self.source_usage_count["OpenAlex"] = self.source_usage_count.get("OpenAlex", 0) + 1
+                        if self._harvests('openalex'):
+                            results = self._harvest('openalex', topic)
+                        else:
+                            results = [(self.openalex.search_paper(topic), "OpenAlex")]
+                        if self._collect_api_results([results], valid_results):
                             if self.verbose:
                                 safe_print(f"✓")
                         else:
@@ -503,10 +473,11 @@ class CitationResearcher:
                     if self.verbose:
                         safe_print(f"    → Trying Semantic Scholar API...", end=" ", flush=True)
                     try:
-                        metadata = self.semantic_scholar.search_paper(topic)
-                        if metadata and (metadata.get('doi') or metadata.get('url')):
-                            valid_results.append((metadata, "Semantic Scholar"))
-                            self.source_usage_count["Semantic Scholar"] = self.source_usage_count.get("Semantic Scholar", 0) + 1
+                        if self._harvests('semantic_scholar'):
+                            results = self._harvest('semantic_scholar', topic)
+                        else:
+                            results = [(self.semantic_scholar.search_paper(topic), "Semantic Scholar")]
+                        if self._collect_api_results([results], valid_results):
                             if self.verbose:
                                 safe_print(f"✓")
                         else:
@@ -556,14 +527,89 @@ class CitationResearcher:
                     safe_print(f"✗ Error: {e}")
                 logger.error(f"Gemini LLM error: {e}")
 
-        # Cache results (even if empty list)
-        if valid_results:
-            self.cache[topic] = valid_results
-        else:
-            self.cache[topic] = None
+        citations = self._finish_research(topic, valid_results)
+        # Attached after the topic is cached so late results extend, not precede, it
+        for future in stragglers:
+            future.add_done_callback(
+                lambda done, topic=topic: self._merge_straggler_results(topic, self._future_result(done))
+            )
+        return citations
+
+    def _gather_parallel(
+        self, topic: str, parallel_apis: List[str]
+    ) -> Tuple[List[List[Tuple[Optional[Dict[str, Any]], str]]], List[Future]]:
+        """
+        Fan out to parallel_apis until the completion policy is satisfied.
+
+        Returns:
+            (each finished API's results, in chain order; futures of the APIs still running)
+        """
+        policy = self.completion_policy
+        executor = ThreadPoolExecutor(max_workers=len(parallel_apis))
+        futures = [executor.submit(self._search_api_results, api, topic) for api in parallel_apis]
+        # Don't join on return: stragglers finish in the background
+        executor.shutdown(wait=False)
+
+        pending = set(futures)
+        collected: List[Tuple[Optional[Dict[str, Any]], str]] = []
+        start = time.monotonic()
+        while pending:
+            wait_for = policy.next_wait(time.monotonic() - start)
+            if wait_for <= 0:
+                logger.warning(f"Parallel query timeout - {len(futures) - len(pending)} of {len(futures)} APIs responded")
+                break
+            done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            for future in done:
+                collected.extend(self._future_result(future))
+            if pending and policy.is_complete(time.monotonic() - start, collected):
+                logger.debug(f"{policy.mode} policy complete - not waiting for {len(pending)} API(s)")
+                break
+
+        # Keep chain order so results are deterministic
+        api_results = [self._future_result(future) for future in futures if future not in pending]
+        return api_results, [future for future in futures if future in pending]
+
+    @staticmethod
+    def _future_result(future: Future) -> List[Tuple[Optional[Dict[str, Any]], str]]:
+        """Results of a finished _search_api_results future (which never raises)."""
+        try:
+            return future.result(timeout=0)
+        except Exception as e:
+            logger.debug(f"Parallel API error: {e}")
+            return [(None, "unknown")]
+
+    def _merge_straggler_results(
+        self, topic: str, results: List[Tuple[Optional[Dict[str, Any]], str]]
+    ) -> None:
+        """Add results that arrived after a topic returned to its cache entry."""
+        late = [(metadata, source) for metadata, source in results if is_usable_result(metadata)]
+        if not late:
+            return
+        try:
+            with self._straggler_lock:
+                _, cached = self.cache.get(topic)
+                merged = list(cached or [])
+                seen = {metadata.get('doi') or metadata.get('url') for metadata, _ in merged}
+                added = 0
+                for metadata, source in late:
+                    key = metadata.get('doi') or metadata.get('url')
+                    if key not in seen:
+                        merged.append((metadata, source))
+                        seen.add(key)
+                        added += 1
+                if added:
+                    self.cache.put(topic, merged)
+            if added:
+                logger.debug(f"Cached {added} late result(s) for: {topic[:60]}")
+        except Exception as e:
+            logger.debug(f"Could not cache late results for {topic[:60]}: {e}")
 
-        # Persist cache to disk
-        self._save_cache()
+    def _finish_research(
+        self, topic: str, valid_results: List[Tuple[Dict[str, Any], str]]
+    ) -> List[Citation]:
+        """Cache a topic's results and convert them to Citation objects."""
+        # Cache results (even if empty list) - single-row upsert, safe across threads
+        self.cache.put(topic, valid_results or None)
 
         # Convert to Citation objects
         citations = []
@@ -586,6 +632,235 @@ class CitationResearcher:
 
         return citations
 
+    # =========================================================================
+    # Async research (one event loop, cancellable per-topic timeouts)
+    # =========================================================================
+
+    def _api_client(self, api_name: str) -> Tuple[Optional[Any], str]:
+        """Enabled client and display source name for an API in the chain."""
+        if api_name == 'crossref' and self.enable_crossref:
+            return self.crossref, "Crossref"
+        if api_name == 'openalex' and self.enable_openalex:
+            return self.openalex, "OpenAlex"
+        if api_name == 'semantic_scholar' and self.enable_semantic_scholar:
+            return self.semantic_scholar, "Semantic Scholar"
+        if api_name == 'gemini_grounded' and self.enable_gemini_grounded:
+            return self.gemini_grounded, "Serper" if self.use_serper else "Gemini Grounded"
+        return None, api_name
+
+    async def _search_api_async(self, api_name: str, topic: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Async counterpart of _search_api. Never raises except on cancellation."""
+        client, source_name = self._api_client(api_name)
+        if client is None:
+            return (None, api_name)
+        try:
+            metadata = await client.search_paper_async(topic)
+            if metadata:
+                logger.info(
+                    f"  ✓ {source_name} found: {metadata.get('title', 'Unknown')[:80]}... "
+                    f"(DOI: {metadata.get('doi', 'N/A')})"
+                )
+                return (metadata, source_name)
+            logger.debug(f"  ✗ {source_name} returned no results")
+            return (None, api_name)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ [{api_name.upper()}] Error during search: {type(e).__name__}: {str(e)[:100]}")
+            return (None, api_name)
+
+    async def _search_api_results_async(self, api_name: str, topic: str) -> List[Tuple[Optional[Dict[str, Any]], str]]:
+        """Async _search_api_results. Never raises except on cancellation."""
+        if not self._harvests(api_name):
+            return [await self._search_api_async(api_name, topic)]
+        client, source_name = self._api_client(api_name)
+        try:
+            papers = await client.search_papers_async(topic, limit=self.harvest_k)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ [{api_name.upper()}] Error during search: {type(e).__name__}: {str(e)[:100]}")
+            return [(None, api_name)]
+        selected = select_relevant(papers, topic, self.harvest_min_relevance)
+        logger.debug(f"  {source_name}: kept {len(selected)} of {len(papers)} results for {topic[:60]}")
+        return [(metadata, source_name) for metadata in selected] or [(None, api_name)]
+
+    async def research_citation_async(self, topic: str) -> List[Citation]:
+        """
+        Async research_citation.
+
+        Same routing, caching and result handling as the sync version, but the
+        academic APIs run as coroutines on the caller's event loop. Cancelling
+        the returned coroutine (e.g. via asyncio.wait_for) cancels the in-flight
+        HTTP requests instead of leaving orphaned threads behind.
+        """
+        cached = await asyncio.to_thread(self._cached_citations, topic)
+        if cached is not None:
+            return cached
+
+        if self.verbose:
+            safe_print(f"  🔍 Researching: {topic[:70]}{'...' if len(topic) > 70 else ''}")
+
+        api_chain = self._plan_api_chain(topic)
+        valid_results: List[Tuple[Dict[str, Any], str]] = []
+
+        parallel_apis = self._parallel_apis(api_chain)
+        pending: set = set()
+        if parallel_apis:
+            self._report_progress("Querying academic APIs in parallel...", "search")
+            tasks = [asyncio.create_task(self._search_api_results_async(api, topic)) for api in parallel_apis]
+            try:
+                pending = await self._wait_parallel_async(tasks)
+            except asyncio.CancelledError:
+                for task in tasks:
+                    task.cancel()
+                raise
+            # Keep chain order so results are deterministic
+            api_results = [task.result() for task in tasks if task not in pending]
+            self._collect_api_results(api_results, valid_results)
+        else:
+            # Sequential fallback for industry queries or when parallel not applicable
+            for api_name in api_chain:
+                results = await self._search_api_results_async(api_name, topic)
+                self._collect_api_results([results], valid_results)
+
+        # Try Gemini LLM as absolute last resort (not part of smart routing)
+        if not valid_results and self.enable_llm_fallback:
+            try:
+                metadata = await asyncio.to_thread(self._llm_research, topic)
+                if metadata and (metadata.get('doi') or metadata.get('url')):
+                    valid_results.append((metadata, "Gemini LLM"))
+            except Exception as e:
+                logger.error(f"Gemini LLM error: {e}")
+
+        citations = await asyncio.to_thread(self._finish_research, topic, valid_results)
+        # Tasks cancelled at the timeout are done; the rest are stragglers
+        pending = {task for task in pending if not task.done()}
+        if pending:
+            straggler = asyncio.create_task(self._merge_stragglers_async(topic, pending))
+            self._straggler_tasks.add(straggler)
+            straggler.add_done_callback(self._straggler_tasks.discard)
+        return citations
+
+    async def _wait_parallel_async(self, tasks: List["asyncio.Task"]) -> set:
+        """Wait for API tasks until the completion policy is satisfied; returns the pending ones."""
+        policy = self.completion_policy
+        pending = set(tasks)
+        collected: List[Tuple[Optional[Dict[str, Any]], str]] = []
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        while pending:
+            wait_for = policy.next_wait(loop.time() - start)
+            if wait_for <= 0:
+                logger.warning(f"Parallel query timeout - {len(tasks) - len(pending)} of {len(tasks)} APIs responded")
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                return pending
+            done, pending = await asyncio.wait(pending, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                collected.extend(task.result())
+            if pending and policy.is_complete(loop.time() - start, collected):
+                logger.debug(f"{policy.mode} policy complete - not waiting for {len(pending)} API(s)")
+                return pending
+        return pending
+
+    async def _merge_stragglers_async(self, topic: str, pending: set) -> None:
+        """Let a returned topic's remaining API tasks finish (up to the timeout) and cache them."""
+        done, still_pending = await asyncio.wait(pending, timeout=self.completion_policy.timeout)
+        for task in still_pending:
+            task.cancel()
+        results = [result for task in done if not task.cancelled() for result in task.result()]
+        await asyncio.to_thread(self._merge_straggler_results, topic, results)
+
+    async def research_citations_async(
+        self,
+        topics: Sequence[str],
+        max_concurrency: int = 32,
+        per_topic_timeout: float = 90.0,
+        on_result: Optional[Callable[[int, str, List[Citation], Optional[str]], bool]] = None,
+    ) -> List[Tuple[int, str, List[Citation], Optional[str]]]:
+        """
+        Research many topics concurrently on the running event loop.
+
+        Args:
+            topics: Topics to research
+            max_concurrency: Topics in flight at once (per-API rate limits still apply)
+            per_topic_timeout: Seconds before a topic is cancelled
+            on_result: Optional callback(index, topic, citations, error) called as each
+                       topic finishes; returning True cancels all remaining topics
+
+        Returns:
+            (index, topic, citations, error_or_None) tuples in completion order
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _one(index: int, topic: str) -> Tuple[int, str, List[Citation], Optional[str]]:
+            async with semaphore:
+                try:
+                    citations = await asyncio.wait_for(self.research_citation_async(topic), per_topic_timeout)
+                    return (index, topic, citations, None)
+                except asyncio.TimeoutError:
+                    return (index, topic, [], f"Timeout after {per_topic_timeout}s")
+                except Exception as e:
+                    return (index, topic, [], str(e))
+
+        tasks = [asyncio.create_task(_one(i, topic)) for i, topic in enumerate(topics)]
+        results: List[Tuple[int, str, List[Citation], Optional[str]]] = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                results.append(result)
+                if on_result and on_result(*result):
+                    break
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.drain_stragglers(timeout=self.STRAGGLER_DRAIN_SECONDS)
+            await self.aclose()
+        return results
+
+    def research_citations_batch(
+        self,
+        topics: Sequence[str],
+        max_concurrency: int = 32,
+        per_topic_timeout: float = 90.0,
+        on_result: Optional[Callable[[int, str, List[Citation], Optional[str]], bool]] = None,
+    ) -> List[Tuple[int, str, List[Citation], Optional[str]]]:
+        """Blocking wrapper around research_citations_async (runs its own event loop)."""
+        return asyncio.run(
+            self.research_citations_async(
+                topics,
+                max_concurrency=max_concurrency,
+                per_topic_timeout=per_topic_timeout,
+                on_result=on_result,
+            )
+        )
+
+    async def drain_stragglers(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for straggler tasks to cache their late results.
+
+        Each straggler already gives up after the completion policy timeout,
+        so this waits at most that long (or timeout seconds, if given).
+        """
+        stragglers = list(self._straggler_tasks)
+        if stragglers:
+            await asyncio.wait(stragglers, timeout=timeout if timeout is not None else self.completion_policy.timeout)
+
+    async def aclose(self) -> None:
+        """Close the API clients' async HTTP connections (cancels unfinished straggler tasks)."""
+        stragglers = list(self._straggler_tasks)
+        for task in stragglers:
+            task.cancel()
+        await asyncio.gather(*stragglers, return_exceptions=True)
+        for api_name in ('crossref', 'openalex', 'semantic_scholar', 'gemini_grounded'):
+            client, _ = self._api_client(api_name)
+            if client is not None and hasattr(client, 'aclose'):
+                await client.aclose()
+
     def _create_citation(self, metadata: Dict[str, Any], source: Optional[str] = None) -> Optional[Citation]:
         """
         Create Citation object from metadata.
@@ -831,9 +1106,7 @@ class CitationResearcher:
                 else:
                     logger.debug(f"  ✗ Semantic Scholar returned no results")
             elif api_name == 'gemini_grounded' and self.enable_gemini_grounded:
-                logger.debug(f"  → Applying rate limiting before Gemini Grounded call...")
-                rate_limiter = get_gemini_rate_limiter()
-                rate_limiter.wait_if_needed()
+                # Rate limiting happens inside the client via the shared Gemini limiter
                 logger.debug(f"  → Calling Gemini Grounded API...")
                 metadata = self.gemini_grounded.search_paper(topic)
                 if metadata:
@@ -975,6 +1248,9 @@ Return a JSON object with this structure:
 
             # Call Gemini for LLM fallback
             # Note: Safety settings are handled by model/provider configuration.
+            from concurrency.rate_limiter import acquire_gemini
+            from utils.token_counter import estimate_tokens
+            acquire_gemini(estimate_tokens(scout_prompt) + estimate_tokens(user_input))
             response = self.gemini_model.generate_content(
                 [scout_prompt, user_input],
                 generation_config={"temperature": 0.2, "max_output_tokens": 2048},
@@ -88,16 +88,41 @@ class SemanticScholarClient(BaseAPIClient):
             }
         """
         # Search Semantic Scholar API
-        response = self._make_request(
-            method="GET",
-            endpoint="/graph/v1/paper/search",
-            params={
+        response = self._make_request(**self._search_request(query))
+        return self._parse_search_response(query, response)
+
+    def _search_request(self, query: str) -> Dict[str, Any]:
+        """Request arguments for a paper search (shared by sync and async paths)."""
+        return self._search_papers_request(query, 5)  # Get top 5 results
+
+    def _search_papers_request(self, query: str, limit: int) -> Dict[str, Any]:
+        """Request arguments for a paper search returning up to limit results."""
+        return {
+            "method": "GET",
+            "endpoint": "/graph/v1/paper/search",
+            "params": {
                 "query": query,
-                "limit": 5,  # Get top 5 results
+                "limit": min(limit, 100),
                 "fields": "title,authors,year,venue,externalIds,url,citationCount,publicationTypes,abstract",
             },
-        )
+        }
+
+    def _parse_search_results(self, query: str, response: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Extract every paper with complete metadata from a paper search response, in rank order."""
+        if not response:
+            return []
+
+        results = []
+        for paper in response.get("data", []) or []:
+            metadata = self._extract_metadata(paper)
+            if metadata:
+                results.append(metadata)
+
+        logger.debug(f"SemanticScholar: {len(results)} usable results for '{query[:50]}...'")
+        return results
 
+    def _parse_search_response(self, query: str, response: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Extract the most relevant paper from a paper search response."""
         if not response:
             logger.debug(f"SemanticScholar: No results for query '{query[:50]}...'")
             return None
@@ -4,6 +4,7 @@ ABOUTME: Serper.dev API client for web search with citation extraction
 ABOUTME: Drop-in replacement for GeminiGroundedClient using Serper's Google Search API
 """
 
+import asyncio
 import os
 import re
 import logging
@@ -21,6 +22,7 @@ except ImportError:
     load_dotenv = None
 
 from .base import BaseAPIClient, validate_author_name, validate_publication_year
+from .doi_resolver import get_doi_resolver, to_web_metadata
 
 logger = logging.getLogger(__name__)
 
@@ -186,6 +188,77 @@ class SerperClient(BaseAPIClient):
             logger.error(f"Serper search error: {e}")
             return None
 
+    async def search_paper_async(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Async search_paper: the Serper query runs on httpx, URL validation and
+        enrichment (blocking, per-result) run in a worker thread.
+        """
+        try:
+            results = await self._search_serper_async(query)
+
+            if not results:
+                return None
+
+            for result in results:
+                validated = await asyncio.to_thread(self._validate_and_enrich, result)
+                if validated:
+                    return validated
+
+            return None
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Serper search error: {e}")
+            return None
+
+    def _serper_headers(self) -> Dict[str, str]:
+        return {
+            'X-API-KEY': self.serper_api_key,
+            'Content-Type': 'application/json',
+        }
+
+    def _parse_serper_results(self, query: str, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Extract organic results from a Serper response body."""
+        organic = data.get('organic', [])
+
+        results = []
+        for item in organic:
+            results.append({
+                'title': item.get('title', ''),
+                'url': item.get('link', ''),
+                'snippet': item.get('snippet', ''),
+                'position': item.get('position', 0),
+            })
+
+        logger.info(f"Serper: Found {len(results)} results for: {query[:50]}...")
+        return results
+
+    async def _search_serper_async(self, query: str) -> List[Dict[str, Any]]:
+        """Async counterpart of _search_serper (single attempt, like the sync path)."""
+        import httpx
+
+        try:
+            client = self._get_async_client()
+            response = await client.post(
+                self.SERPER_API_URL,
+                headers=self._serper_headers(),
+                json={'q': query, 'num': self.num_results},
+            )
+
+            if not response.is_success:
+                logger.warning(f"Serper API error {response.status_code}: {response.text[:200]}")
+                return []
+
+            return self._parse_serper_results(query, response.json())
+
+        except httpx.TimeoutException:
+            logger.warning(f"Serper timeout for query: {query[:50]}...")
+            return []
+        except Exception as e:
+            logger.error(f"Serper request error: {e}")
+            return []
+
     def _search_serper(self, query: str) -> List[Dict[str, Any]]:
         """
         Execute search via Serper API.
@@ -196,10 +269,7 @@ class SerperClient(BaseAPIClient):
         Returns:
             List of raw search result dicts
         """
-        headers = {
-            'X-API-KEY': self.serper_api_key,
-            'Content-Type': 'application/json',
-        }
+        headers = self._serper_headers()
 
         payload = {
             'q': query,
@@ -218,22 +288,8 @@ class SerperClient(BaseAPIClient):
                 logger.warning(f"Serper API error {response.status_code}: {response.text[:200]}")
                 return []
 
-            data = response.json()
-
             # Extract organic results
-            organic = data.get('organic', [])
-
-            results = []
-            for item in organic:
-                results.append({
-                    'title': item.get('title', ''),
-                    'url': item.get('link', ''),
-                    'snippet': item.get('snippet', ''),
-                    'position': item.get('position', 0),
-                })
-
-            logger.info(f"Serper: Found {len(results)} results for: {query[:50]}...")
-            return results
+            return self._parse_serper_results(query, response.json())
 
         except requests.exceptions.Timeout:
             logger.warning(f"Serper timeout for query: {query[:50]}...")
@@ -404,7 +460,7 @@ class SerperClient(BaseAPIClient):
             api_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
             params = {"db": "pubmed", "id": pmid, "retmode": "json"}
 
-            response = self.validation_session.get(api_url, params=params, timeout=10)
+            response = self._throttled_get(self.validation_session, api_url, params=params, timeout=10)
             if not response.ok:
                 return None
 
@@ -449,7 +505,7 @@ class SerperClient(BaseAPIClient):
             search_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
             params = {"db": "pmc", "term": f"PMC{pmcid}[pmcid]", "retmode": "json"}
 
-            response = self.validation_session.get(search_url, params=params, timeout=10)
+            response = self._throttled_get(self.validation_session, search_url, params=params, timeout=10)
             if not response.ok:
                 return None
 
@@ -463,7 +519,7 @@ class SerperClient(BaseAPIClient):
             summary_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
             params = {"db": "pmc", "id": id_list[0], "retmode": "json"}
 
-            response = self.validation_session.get(summary_url, params=params, timeout=10)
+            response = self._throttled_get(self.validation_session, summary_url, params=params, timeout=10)
             if not response.ok:
                 return None
 
@@ -500,11 +556,16 @@ class SerperClient(BaseAPIClient):
 
     def _fetch_crossref_metadata(self, doi: str, original_url: str = None) -> Optional[Dict[str, Any]]:
         """Fetch metadata from CrossRef using DOI."""
+        # DOIs already resolved in bulk this run need no request
+        resolved = get_doi_resolver().cached(doi)
+        if resolved:
+            return to_web_metadata(resolved, doi, original_url)
+
         try:
             api_url = f"https://api.crossref.org/works/{doi}"
             headers = {'User-Agent': 'OpenDraft/1.0 (mailto:support@opendraft.ai)'}
 
-            response = self.validation_session.get(api_url, headers=headers, timeout=10)
+            response = self._throttled_get(self.validation_session, api_url, headers=headers, timeout=10)
             if not response.ok:
                 return None
 
@@ -2,13 +2,28 @@
 """
 ABOUTME: Checkpoint/resume system for long-running draft generation
 ABOUTME: Saves context state after each phase, allows resuming from checkpoint
+
+checkpoint.json is a small manifest: large phase outputs are stored once as
+gzip-compressed, content-addressed blobs in checkpoint_blobs/ and referenced
+by hash, so unchanged outputs are never rewritten. Every phase's manifest is
+kept in checkpoint_manifests/, and blobs are read lazily on first access.
+
+Within a phase, finished units (scout queries, chapters, QA agents) are saved
+as they complete by UnitCheckpoint, so a crash mid-phase only repeats the
+unit that was running.
 """
 
+import gzip
+import hashlib
 import json
 import logging
+import os
+import re
+import shutil
+import threading
 from dataclasses import asdict, fields
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -16,11 +31,41 @@ logger = logging.getLogger(__name__)
 # Phases in order of execution
 PHASES = ["research", "structure", "citations", "compose", "validate", "compile"]
 
+CHECKPOINT_FILENAME = "checkpoint.json"
+CHECKPOINT_VERSION = "2.0"
+UNITS_DIRNAME = "checkpoint_units"
+MANIFESTS_DIRNAME = "checkpoint_manifests"
+BLOBS_DIRNAME = "checkpoint_blobs"
+
+# Phase outputs large enough to be worth storing as blobs (smaller values stay inline)
+BLOB_FIELDS = (
+    "scout_output", "scribe_output", "signal_output", "scout_result",
+    "architect_output", "formatter_output", "citation_summary",
+    "intro_output", "lit_review_output", "methodology_output", "results_output",
+    "discussion_output", "body_output", "conclusion_output", "appendix_output",
+)
+BLOB_MIN_BYTES = 4096
+BLOB_COMPRESSION_LEVEL = 6
+BLOB_REF_KEY = "$blob"
+
+
+class DraftCancelled(Exception):
+    """The run was cancelled (e.g. its queue lease was lost) and must not write more state."""
+
+
+def raise_if_cancelled(cancel_event: Optional[threading.Event], where: str) -> None:
+    """Raise DraftCancelled if cancel_event is set."""
+    if cancel_event is not None and cancel_event.is_set():
+        raise DraftCancelled(f"Draft cancelled before {where}")
+
 
 def save_checkpoint(ctx: 'DraftContext', phase: str, checkpoint_dir: Path) -> Path:
     """
     Save checkpoint after a phase completes.
 
+    Large outputs go to the blob store (only new content is written), then
+    the manifest is written to checkpoint.json and kept in the phase history.
+
     Args:
         ctx: Current DraftContext with phase outputs
         phase: Name of the phase that just completed
@@ -28,12 +73,16 @@ def save_checkpoint(ctx: 'DraftContext', phase: str, checkpoint_dir: Path) -> Pa
 
     Returns:
         Path to saved checkpoint file
+
+    Raises:
+        DraftCancelled: If ctx.cancel_event is set (nothing is written)
     """
-    checkpoint_path = checkpoint_dir / "checkpoint.json"
+    raise_if_cancelled(ctx.cancel_event, f"checkpointing {phase}")
+    checkpoint_path = checkpoint_dir / CHECKPOINT_FILENAME
 
     # Serialize context to dict
     checkpoint_data = {
-        "version": "1.0",
+        "version": CHECKPOINT_VERSION,
         "completed_phase": phase,
         "timestamp": datetime.now().isoformat(),
 
@@ -65,34 +114,22 @@ def save_checkpoint(ctx: 'DraftContext', phase: str, checkpoint_dir: Path) -> Pa
         # Folders as strings
         "folders": {k: str(v) for k, v in ctx.folders.items()},
 
-        # Research phase outputs
-        "scout_output": ctx.scout_output,
-        "scribe_output": ctx.scribe_output,
-        "signal_output": ctx.signal_output,
-        "scout_result": _serialize_scout_result(ctx.scout_result),
-
-        # Structure phase outputs
-        "architect_output": ctx.architect_output,
-        "formatter_output": ctx.formatter_output,
-
-        # Citation management outputs
-        "citation_summary": ctx.citation_summary,
-        # Note: citation_database is saved separately as bibliography.json
-
-        # Compose phase outputs
-        "intro_output": ctx.intro_output,
-        "lit_review_output": ctx.lit_review_output,
-        "methodology_output": ctx.methodology_output,
-        "results_output": ctx.results_output,
-        "discussion_output": ctx.discussion_output,
-        "body_output": ctx.body_output,
-        "conclusion_output": ctx.conclusion_output,
-        "appendix_output": ctx.appendix_output,
+        # Phase outputs (BLOB_FIELDS) are added below; citation_database is
+        # saved separately as bibliography.json
     }
 
-    checkpoint_path.write_text(json.dumps(checkpoint_data, indent=2, ensure_ascii=False), encoding='utf-8')
+    for name in BLOB_FIELDS:
+        checkpoint_data[name] = _checkpoint_blob_field(ctx, name, checkpoint_dir)
+
+    # Blobs are in place before any manifest references them
+    manifest = json.dumps(checkpoint_data, indent=2, ensure_ascii=False)
+    _atomic_write_text(checkpoint_dir / MANIFESTS_DIRNAME / _manifest_filename(phase), manifest)
+    _atomic_write_text(checkpoint_path, manifest)
     logger.info(f"Checkpoint saved after {phase} phase: {checkpoint_path}")
 
+    # The phase is now fully captured, so its unit checkpoints are obsolete
+    clear_units(checkpoint_dir, phase)
+
     return checkpoint_path
 
 
@@ -100,8 +137,11 @@ def load_checkpoint(checkpoint_path: Path) -> Tuple[Dict[str, Any], str]:
     """
     Load checkpoint data from file.
 
+    Only the manifest is read here; blob-stored outputs are decompressed when
+    first accessed (see CheckpointData).
+
     Args:
-        checkpoint_path: Path to checkpoint.json
+        checkpoint_path: Path to checkpoint.json or a manifest in checkpoint_manifests/
 
     Returns:
         Tuple of (checkpoint_data dict, completed_phase name)
@@ -109,7 +149,11 @@ def load_checkpoint(checkpoint_path: Path) -> Tuple[Dict[str, Any], str]:
     if not checkpoint_path.exists():
         raise FileNotFoundError(f"Checkpoint not found: {checkpoint_path}")
 
-    checkpoint_data = json.loads(checkpoint_path.read_text(encoding='utf-8'))
+    checkpoint_dir = checkpoint_path.parent
+    if checkpoint_dir.name == MANIFESTS_DIRNAME:
+        checkpoint_dir = checkpoint_dir.parent
+
+    checkpoint_data = CheckpointData(json.loads(checkpoint_path.read_text(encoding='utf-8')), checkpoint_dir)
     completed_phase = checkpoint_data.get("completed_phase", "")
 
     logger.info(f"Loaded checkpoint from {checkpoint_path}, last phase: {completed_phase}")
@@ -121,6 +165,9 @@ def restore_context(ctx: 'DraftContext', checkpoint_data: Dict[str, Any]) -> Non
     """
     Restore context state from checkpoint data.
 
+    Outputs still stored as blobs are attached as LazyBlob values and only
+    decompressed when the resumed run reads them (see RestoredField).
+
     Args:
         ctx: DraftContext to restore into (must have model, config already set)
         checkpoint_data: Data loaded from checkpoint file
@@ -154,28 +201,10 @@ def restore_context(ctx: 'DraftContext', checkpoint_data: Dict[str, Any]) -> Non
     folders_data = checkpoint_data.get("folders", {})
     ctx.folders = {k: Path(v) for k, v in folders_data.items()}
 
-    # Restore research phase outputs
-    ctx.scout_output = checkpoint_data.get("scout_output", "")
-    ctx.scribe_output = checkpoint_data.get("scribe_output", "")
-    ctx.signal_output = checkpoint_data.get("signal_output", "")
-    ctx.scout_result = _deserialize_scout_result(checkpoint_data.get("scout_result"))
-
-    # Restore structure phase outputs
-    ctx.architect_output = checkpoint_data.get("architect_output", "")
-    ctx.formatter_output = checkpoint_data.get("formatter_output", "")
-
-    # Restore citation summary (citation_database loaded separately from bibliography.json)
-    ctx.citation_summary = checkpoint_data.get("citation_summary", "")
-
-    # Restore compose phase outputs
-    ctx.intro_output = checkpoint_data.get("intro_output", "")
-    ctx.lit_review_output = checkpoint_data.get("lit_review_output", "")
-    ctx.methodology_output = checkpoint_data.get("methodology_output", "")
-    ctx.results_output = checkpoint_data.get("results_output", "")
-    ctx.discussion_output = checkpoint_data.get("discussion_output", "")
-    ctx.body_output = checkpoint_data.get("body_output", "")
-    ctx.conclusion_output = checkpoint_data.get("conclusion_output", "")
-    ctx.appendix_output = checkpoint_data.get("appendix_output", "")
+    # Restore phase outputs (citation_database loaded separately from bibliography.json).
+    # Blob-stored outputs stay on disk until the resumed phases read them.
+    for name in BLOB_FIELDS:
+        setattr(ctx, name, _restored_blob_field(checkpoint_data, name))
 
     logger.info(f"Context restored from checkpoint")
 
@@ -199,6 +228,260 @@ def get_next_phase(completed_phase: str) -> Optional[str]:
     return None
 
 
+def list_manifests(checkpoint_dir: Path) -> List[Path]:
+    """Saved phase manifests in pipeline order (load any of them with load_checkpoint)."""
+    return sorted((Path(checkpoint_dir) / MANIFESTS_DIRNAME).glob("*.json"))
+
+
+# =========================================================================
+# Blob store
+# =========================================================================
+
+class CheckpointData(dict):
+    """
+    Checkpoint fields as loaded from a manifest.
+
+    Values stored as blob references are read and decompressed on first
+    access through [] / get() / items() / values(), then kept in memory.
+    """
+
+    def __init__(self, data: Dict[str, Any], checkpoint_dir: Path):
+        super().__init__(data)
+        self.checkpoint_dir = Path(checkpoint_dir)
+
+    def __getitem__(self, key: str) -> Any:
+        value = super().__getitem__(key)
+        if _is_blob_ref(value):
+            value = _read_blob(self.checkpoint_dir, value[BLOB_REF_KEY])
+            super().__setitem__(key, value)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def values(self):
+        return [self[key] for key in self]
+
+
+class LazyBlob:
+    """A restored phase output whose blob has not been read yet."""
+
+    def __init__(self, checkpoint_dir: Path, ref: Dict[str, Any], decode: Optional[Callable[[Any], Any]] = None):
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.ref = ref
+        self.decode = decode
+
+    def load(self) -> Any:
+        value = _read_blob(self.checkpoint_dir, self.ref[BLOB_REF_KEY])
+        return self.decode(value) if self.decode is not None else value
+
+
+class RestoredField:
+    """
+    DraftContext attribute that can hold a LazyBlob after restore_context.
+
+    The blob is read on first access and replaces the pending value, so a
+    resumed run only decompresses the outputs its remaining phases use.
+    """
+
+    def __init__(self, default: Any):
+        self.default = default
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self.default
+        value = obj.__dict__.get(self.name, self.default)
+        if isinstance(value, LazyBlob):
+            value = value.load()
+            obj.__dict__[self.name] = value
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj.__dict__[self.name] = value
+
+
+def _checkpoint_blob_field(ctx: 'DraftContext', name: str, checkpoint_dir: Path) -> Any:
+    """Manifest value of a blob field; outputs still pending from this checkpoint_dir keep their ref unread."""
+    pending = getattr(ctx, '__dict__', {}).get(name)
+    if isinstance(pending, LazyBlob) and pending.checkpoint_dir.resolve() == Path(checkpoint_dir).resolve():
+        return pending.ref
+
+    value = getattr(ctx, name)
+    if name == "scout_result":
+        value = _serialize_scout_result(value)
+    return _store_blob(checkpoint_dir, value)
+
+
+def _restored_blob_field(checkpoint_data: Dict[str, Any], name: str) -> Any:
+    """Context value for a blob field: a LazyBlob for stored blobs, else the decoded value."""
+    decode = _deserialize_scout_result if name == "scout_result" else None
+    default = None if name == "scout_result" else ""
+
+    if isinstance(checkpoint_data, CheckpointData):
+        raw = dict.get(checkpoint_data, name, default)
+        if _is_blob_ref(raw):
+            return LazyBlob(checkpoint_data.checkpoint_dir, raw, decode)
+
+    value = checkpoint_data.get(name, default)
+    return decode(value) if decode is not None else value
+
+
+def _store_blob(checkpoint_dir: Path, value: Any) -> Any:
+    """Store a large value as a blob and return its reference; small values are returned as-is."""
+    payload = json.dumps(value, ensure_ascii=False).encode('utf-8')
+    if len(payload) < BLOB_MIN_BYTES:
+        return value
+
+    digest = hashlib.sha256(payload).hexdigest()
+    path = _blob_path(checkpoint_dir, digest)
+    if not path.exists():
+        _atomic_write_bytes(path, gzip.compress(payload, compresslevel=BLOB_COMPRESSION_LEVEL, mtime=0))
+    return {BLOB_REF_KEY: digest, "bytes": len(payload)}
+
+
+def _read_blob(checkpoint_dir: Path, digest: str) -> Any:
+    path = _blob_path(checkpoint_dir, digest)
+    if not path.exists():
+        raise FileNotFoundError(f"Checkpoint blob missing: {path}")
+    return json.loads(gzip.decompress(path.read_bytes()).decode('utf-8'))
+
+
+def _blob_path(checkpoint_dir: Path, digest: str) -> Path:
+    return Path(checkpoint_dir) / BLOBS_DIRNAME / digest[:2] / f"{digest}.json.gz"
+
+
+def _is_blob_ref(value: Any) -> bool:
+    return isinstance(value, dict) and BLOB_REF_KEY in value
+
+
+def _manifest_filename(phase: str) -> str:
+    position = PHASES.index(phase) + 1 if phase in PHASES else 0
+    return f"{position:02d}_{phase}.json"
+
+
+# =========================================================================
+# Sub-phase (unit) checkpoints
+# =========================================================================
+
+class UnitCheckpoint:
+    """
+    Incremental checkpoints for the units of one phase.
+
+    Each finished unit is written atomically to its own small JSON file in
+    checkpoint_units/<phase>/, so saving stays cheap however many units the
+    phase has. `completed` is shared with DraftContext.completed_units, so a
+    phase retry within the same run also skips finished units. Once
+    cancel_event is set, save() raises DraftCancelled instead of writing.
+    Thread-safe.
+
+    Usage:
+        units = UnitCheckpoint(output_dir, "compose", ctx.completed_units.setdefault("compose", {}))
+        if "introduction" not in units:
+            write_introduction()
+            units.save("introduction", {"intro_output": ctx.intro_output})
+    """
+
+    def __init__(
+        self,
+        checkpoint_dir: Path,
+        phase: str,
+        completed: Optional[Dict[str, Any]] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ):
+        self.phase = phase
+        self.directory = Path(checkpoint_dir) / UNITS_DIRNAME / phase
+        self._completed = completed if completed is not None else {}
+        self._cancel_event = cancel_event
+        self._lock = threading.Lock()
+
+    def __contains__(self, unit: str) -> bool:
+        with self._lock:
+            return unit in self._completed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._completed)
+
+    def get(self, unit: str) -> Optional[Any]:
+        """Saved data of a finished unit, or None."""
+        with self._lock:
+            return self._completed.get(unit)
+
+    def save(self, unit: str, data: Any) -> None:
+        """Record a finished unit (atomic write of one file)."""
+        raise_if_cancelled(self._cancel_event, f"saving {self.phase}/{unit}")
+        payload = json.dumps({"unit": unit, "data": data}, ensure_ascii=False, default=str)
+        with self._lock:
+            self._completed[unit] = data
+            _atomic_write_text(self.directory / f"{_unit_filename(unit)}.json", payload)
+        logger.debug(f"Unit checkpoint saved: {self.phase}/{unit}")
+
+
+def load_units(checkpoint_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Load all unit checkpoints.
+
+    Returns:
+        Dict mapping phase -> unit -> saved data (unreadable files are skipped)
+    """
+    units: Dict[str, Dict[str, Any]] = {}
+    root = Path(checkpoint_dir) / UNITS_DIRNAME
+    if not root.is_dir():
+        return units
+
+    for phase_dir in sorted(p for p in root.iterdir() if p.is_dir()):
+        for unit_file in sorted(phase_dir.glob("*.json")):
+            try:
+                record = json.loads(unit_file.read_text(encoding='utf-8'))
+                units.setdefault(phase_dir.name, {})[record["unit"]] = record["data"]
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Skipping unreadable unit checkpoint {unit_file}: {e}")
+
+    count = sum(len(v) for v in units.values())
+    if count:
+        logger.info(f"Loaded {count} unit checkpoints ({', '.join(f'{k}: {len(v)}' for k, v in units.items())})")
+    return units
+
+
+def clear_units(checkpoint_dir: Path, phase: str) -> None:
+    """Remove a phase's unit checkpoints."""
+    shutil.rmtree(Path(checkpoint_dir) / UNITS_DIRNAME / phase, ignore_errors=True)
+
+
+def has_checkpoint(output_dir: Path) -> bool:
+    """True if output_dir holds a phase checkpoint or any unit checkpoints."""
+    output_dir = Path(output_dir)
+    units_dir = output_dir / UNITS_DIRNAME
+    return (output_dir / CHECKPOINT_FILENAME).exists() or (
+        units_dir.is_dir() and any(units_dir.glob("*/*.json"))
+    )
+
+
+def _unit_filename(unit: str) -> str:
+    """Readable, filesystem-safe and collision-free file name for a unit."""
+    slug = re.sub(r'[^\w-]+', '_', unit.lower()).strip('_')[:40]
+    digest = hashlib.sha1(unit.encode('utf-8')).hexdigest()[:12]
+    return f"{slug}_{digest}"
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write via a temp file and rename, so readers never see a partial file."""
+    _atomic_write_bytes(path, text.encode('utf-8'))
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
 def _serialize_scout_result(scout_result: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     """Serialize scout_result, converting Citation objects to dicts."""
     if scout_result is None:
@@ -6,14 +6,25 @@ ABOUTME: Replaces {cite_001} with formatted citations, researches {cite_MISSING:
 
 import re
 import logging
-from typing import Any, Dict, List, Tuple, Set, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Tuple, Set, Optional
 from pathlib import Path
 
+from concurrency.concurrency_config import get_concurrency_config
 from utils.citation_database import Citation, CitationDatabase, CitationStyle
 from utils.api_citations import CitationResearcher
 
 logger = logging.getLogger(__name__)
 
+# {cite_MISSING:topic} placeholders left by the Crafter for unknown sources
+MISSING_CITATION_PATTERN = re.compile(r'\{cite_MISSING:([^}]+)\}')
+
+# {cite_001} references to the citation database
+CITED_ID_PATTERN = re.compile(r'\{(cite_\d{3})\}')
+
+# Every placeholder compile_citations rewrites: group 1 = missing topic, group 2 = citation ID
+PLACEHOLDER_PATTERN = re.compile(r'\{cite_MISSING:([^}]+)\}|\{(cite_\d{3})\}')
+
 
 class CitationCompiler:
     """Deterministic citation compiler with automatic missing citation research."""
@@ -38,6 +49,9 @@ class CitationCompiler:
         self._nalt_footnote_counter = 0
         self._nalt_footnote_definitions: List[str] = []
 
+        # Formatted in-text/reference strings per (kind, style, citation ID)
+        self._format_cache: Dict[Tuple[str, str, str], Tuple[Citation, str]] = {}
+
         # Initialize API-backed citation researcher (Crossref → Semantic Scholar → Gemini Grounded → Gemini LLM)
         # Semantic Scholar can be disabled via env var if rate limited (403 errors)
         import os
@@ -74,40 +88,95 @@ class CitationCompiler:
         # Set verbose mode on researcher
         self.researcher.verbose = verbose
 
+        citation = self._lookup_citation(topic)
+        return self._register_citation(citation) if citation else None
+
+    def _lookup_citation(self, topic: str) -> Optional[Citation]:
+        """Find a citation for a topic without touching the database (safe to call from worker threads)."""
         # Delegate to CitationResearcher (handles caching internally)
         result = self.researcher.research_citation(topic)
 
         # Handle both list and single citation (orchestrator now returns list)
         if isinstance(result, list):
-            citation = result[0] if result else None
+            return result[0] if result else None
+        return result
+
+    def _register_citation(self, citation: Citation) -> Citation:
+        """Give a researched citation the next free ID and add it to the database."""
+        # Generate next citation ID
+        existing_ids = list(self.citation_lookup.keys())
+        if existing_ids:
+            # Get max number from cite_XXX
+            max_num = max(int(cid.replace("cite_", "")) for cid in existing_ids if cid.startswith("cite_"))
+            next_id = f"cite_{max_num + 1:03d}"
         else:
-            citation = result
-
-        if citation:
-            # Generate next citation ID
-            existing_ids = list(self.citation_lookup.keys())
-            if existing_ids:
-                # Get max number from cite_XXX
-                max_num = max(int(cid.replace("cite_", "")) for cid in existing_ids if cid.startswith("cite_"))
-                next_id = f"cite_{max_num + 1:03d}"
-            else:
-                next_id = "cite_001"
+            next_id = "cite_001"
+
+        # Update citation ID
+        citation.id = next_id
+
+        # Add to database and lookup
+        self.database.citations.append(citation)
+        self.citation_lookup[citation.id] = citation
+
+        return citation
+
+    def _research_missing_citations(self, topics: List[str], verbose: bool = True) -> Dict[str, Citation]:
+        """
+        Research many missing citations concurrently.
+
+        Lookups fan out over scout_parallel_workers threads. Found citations
+        are registered afterwards in topic order, so citation IDs do not
+        depend on which lookup finished first.
+
+        Args:
+            topics: Unique, stripped topics to research
+            verbose: Whether to print progress
 
-            # Update citation ID
-            citation.id = next_id
+        Returns:
+            dict: topic -> registered Citation, for topics that were found
+        """
+        if not topics:
+            return {}
+        if not self.research_enabled:
+            if verbose:
+                print(f"  ⚠️  Research disabled - no model provided")
+            return {}
+
+        self.researcher.verbose = verbose
+        found: List[Optional[Citation]] = [None] * len(topics)
+        workers = max(1, min(get_concurrency_config().scout_parallel_workers, len(topics)))
 
-            # Add to database and lookup
-            self.database.citations.append(citation)
-            self.citation_lookup[citation.id] = citation
+        def report(done: int, index: int) -> None:
+            if verbose:
+                status = "✓" if found[index] else "✗"
+                print(f"[{done}/{len(topics)}] {status} {topics[index][:65]}")
 
-            return citation
+        if workers == 1:
+            for index, topic in enumerate(topics):
+                found[index] = self._lookup_citation(topic)
+                report(index + 1, index)
         else:
-            return None
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(self._lookup_citation, topic): index for index, topic in enumerate(topics)}
+                for done, future in enumerate(as_completed(futures), 1):
+                    index = futures[future]
+                    found[index] = future.result()
+                    report(done, index)
+
+        return {
+            topic: self._register_citation(citation)
+            for topic, citation in zip(topics, found)
+            if citation
+        }
 
     def compile_citations(self, text: str, research_missing: bool = True, verbose: bool = True) -> Tuple[str, List[str], List[str]]:
         """
         Replace citation IDs with formatted citations and research missing citations.
 
+        Missing topics are researched concurrently, then every placeholder is
+        rewritten in a single pass over the text.
+
         Args:
             text: Text containing {cite_001} and/or {cite_MISSING:topic} patterns
             research_missing: Whether to research {cite_MISSING:topic} placeholders
@@ -117,7 +186,8 @@ class CitationCompiler:
             tuple: (formatted_text, list_of_missing_ids, list_of_researched_topics)
         """
         missing_ids: List[str] = []
-        researched_topics: List[str] = []
+        missing_topics: List[str] = []
+        researched: Dict[str, Citation] = {}
 
         # Reset NALT footnote state for each compilation
         if self.style == "NALT":
@@ -126,61 +196,55 @@ class CitationCompiler:
 
         # Step 1: Find and research all {cite_MISSING:topic} placeholders
         if research_missing:
-            missing_pattern = r'\{cite_MISSING:([^}]+)\}'
-            missing_matches = re.findall(missing_pattern, text)
+            missing_matches = MISSING_CITATION_PATTERN.findall(text)
+            unique_topics = list(dict.fromkeys(topic.strip() for topic in missing_matches))
 
             if missing_matches and verbose:
-                unique_topics = list(dict.fromkeys(missing_matches))  # Preserve order, remove duplicates
                 print(f"\n🔍 Found {len(missing_matches)} missing citation placeholders ({len(unique_topics)} unique topics)")
                 print(f"📚 Researching citations with Scout agent...")
 
-            # Research each unique topic
-            unique_topics = list(dict.fromkeys(missing_matches))
-            for i, topic in enumerate(unique_topics, 1):
-                if verbose:
-                    print(f"\n[{i}/{len(unique_topics)}]", end=" ")
-
-                citation = self._research_missing_citation(topic.strip(), verbose=verbose)
-                if citation:
-                    researched_topics.append(topic.strip())
-                    # Create a mapping for this topic to citation ID
-                    # We'll replace {cite_MISSING:topic} with {cite_XXX} first
-                    text = text.replace(f"{{cite_MISSING:{topic}}}", f"{{{citation.id}}}")
+            researched = self._research_missing_citations(unique_topics, verbose=verbose)
 
-            if verbose and researched_topics:
-                print(f"\n✅ Successfully researched {len(researched_topics)}/{len(unique_topics)} citations")
+            if verbose and researched:
+                print(f"\n✅ Successfully researched {len(researched)}/{len(unique_topics)} citations")
 
-        # Step 2: Replace all {cite_XXX} patterns (including newly created ones from research)
+        # Step 2: Replace {cite_XXX} and {cite_MISSING:topic} in one pass, in text order
         def replace_citation(match: re.Match) -> str:
-            """Replace single citation ID with formatted citation."""
-            cite_id = match.group(0).strip('{}')  # Extract cite_001 from {cite_001}
+            """Replace a single placeholder with its formatted citation."""
+            topic, cite_id = match.group(1), match.group(2)
+
+            if topic is not None:
+                citation = researched.get(topic.strip())
+                if citation is None:
+                    # Could not be researched: leave a visible marker
+                    missing_topics.append(f"TOPIC:{topic.strip()}")
+                    return f"[MISSING: {topic.strip()}]"
+                return self.format_in_text_citation(citation)
 
             if cite_id not in self.citation_lookup:
                 missing_ids.append(cite_id)
                 return f"[MISSING: {cite_id}]"
 
-            citation = self.citation_lookup[cite_id]
-            return self.format_in_text_citation(citation)
+            return self.format_in_text_citation(self.citation_lookup[cite_id])
 
-        # Replace all {cite_XXX} patterns
-        citation_pattern = r'\{cite_\d{3}\}'
-        formatted_text = re.sub(citation_pattern, replace_citation, text)
+        formatted_text = PLACEHOLDER_PATTERN.sub(replace_citation, text)
+        missing_ids.extend(missing_topics)
 
-        # Step 3: Handle any remaining {cite_MISSING:topic} that couldn't be researched
-        remaining_missing_pattern = r'\{cite_MISSING:([^}]+)\}'
-        remaining_matches = re.findall(remaining_missing_pattern, formatted_text)
-        if remaining_matches:
-            # Replace with [MISSING: topic] markers
-            for topic in remaining_matches:
-                formatted_text = formatted_text.replace(f"{{cite_MISSING:{topic}}}", f"[MISSING: {topic.strip()}]")
-                if topic.strip() not in missing_ids:
-                    missing_ids.append(f"TOPIC:{topic.strip()}")
-
-        # Step 4: Append NALT footnote definitions
+        # Step 3: Append NALT footnote definitions
         if self.style == "NALT" and self._nalt_footnote_definitions:
             formatted_text += "\n\n" + "\n\n".join(self._nalt_footnote_definitions)
 
-        return formatted_text, missing_ids, researched_topics
+        return formatted_text, missing_ids, list(researched)
+
+    def _memoized(self, kind: str, citation: Citation, formatter: Callable[[Citation], str]) -> str:
+        """Format a citation once per (kind, style); later calls reuse the string."""
+        key = (kind, self.style, citation.id)
+        cached = self._format_cache.get(key)
+        if cached is not None and cached[0] is citation:
+            return cached[1]
+        formatted = formatter(citation)
+        self._format_cache[key] = (citation, formatted)
+        return formatted
 
     def format_in_text_citation(self, citation: Citation) -> str:
         """
@@ -192,12 +256,17 @@ class CitationCompiler:
         Returns:
             str: Formatted in-text citation (e.g., "(Smith et al., 2023)")
         """
+        if self.style == "NALT":
+            # Footnote markers are numbered per use; only the footnote text is memoized
+            return self._format_nalt_in_text(citation)
+        return self._memoized("in_text", citation, self._format_in_text)
+
+    def _format_in_text(self, citation: Citation) -> str:
+        """Dispatch in-text formatting to the current style."""
         if self.style == "APA 7th":
             return self._format_apa_in_text(citation)
         elif self.style == "IEEE":
             return self._format_ieee_in_text(citation)
-        elif self.style == "NALT":
-            return self._format_nalt_in_text(citation)
         elif self.style == "Chicago":
             return self._format_chicago_in_text(citation)
         elif self.style == "MLA":
@@ -256,7 +325,7 @@ class CitationCompiler:
         """Format in-text citation as NALT footnote marker [^N]."""
         self._nalt_footnote_counter += 1
         n = self._nalt_footnote_counter
-        footnote_text = self._format_nalt_footnote(citation)
+        footnote_text = self._memoized("footnote", citation, self._format_nalt_footnote)
         self._nalt_footnote_definitions.append(f"[^{n}]: {footnote_text}")
         return f"[^{n}]"
 
@@ -529,24 +598,7 @@ class CitationCompiler:
         references = []
 
         for citation in cited_citations:
-            if self.style == "APA 7th":
-                ref = self._format_apa_reference(citation)
-            elif self.style == "IEEE":
-                ref = self._format_ieee_reference(citation)
-            elif self.style == "NALT":
-                ref = self._format_nalt_bibliography_entry(citation)
-            elif self.style == "Chicago":
-                ref = self._format_chicago_reference(citation)
-            elif self.style == "MLA":
-                ref = self._format_mla_reference(citation)
-            else:
-                raise NotImplementedError(
-                    f"Citation style '{self.style}' is not yet implemented. "
-                    f"Supported styles: 'APA 7th', 'IEEE', 'NALT', 'Chicago', 'MLA'. "
-                    f"See docs/CITATION_STYLES_ROADMAP.md for planned styles."
-                )
-
-            references.append(ref)
+            references.append(self.format_reference(citation))
 
         references_content = "\n\n".join(references)
 
@@ -565,13 +617,42 @@ class CitationCompiler:
             # Add full section with header
             return f"\n\n## {ref_header}\n\n{references_content}"
 
+    def format_reference(self, citation: Citation) -> str:
+        """
+        Format a full reference list entry based on style.
+
+        Args:
+            citation: Citation to format
+
+        Returns:
+            str: Formatted reference (memoized per citation and style)
+        """
+        return self._memoized("reference", citation, self._format_reference)
+
+    def _format_reference(self, citation: Citation) -> str:
+        """Dispatch reference formatting to the current style."""
+        if self.style == "APA 7th":
+            return self._format_apa_reference(citation)
+        elif self.style == "IEEE":
+            return self._format_ieee_reference(citation)
+        elif self.style == "NALT":
+            return self._format_nalt_bibliography_entry(citation)
+        elif self.style == "Chicago":
+            return self._format_chicago_reference(citation)
+        elif self.style == "MLA":
+            return self._format_mla_reference(citation)
+        else:
+            raise NotImplementedError(
+                f"Citation style '{self.style}' is not yet implemented. "
+                f"Supported styles: 'APA 7th', 'IEEE', 'NALT', 'Chicago', 'MLA'. "
+                f"See docs/CITATION_STYLES_ROADMAP.md for planned styles."
+            )
+
     def _extract_cited_ids(self, text: str) -> Set[str]:
         """Extract all citation IDs mentioned in text."""
         # Find both {cite_XXX} and formatted citations
         # For now, look for {cite_XXX} patterns
-        pattern = r'\{cite_\d{3}\}'
-        matches = re.findall(pattern, text)
-        return {match.strip('{}') for match in matches}
+        return set(CITED_ID_PATTERN.findall(text))
 
     def _has_placeholder_references(self, text: str) -> bool:
         """
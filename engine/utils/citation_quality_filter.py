@@ -7,26 +7,39 @@ ABOUTME: Uses enhanced citation validator to filter out invalid/junk citations b
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Add parent directory to path for imports
 if __name__ == '__main__':
     sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.citation_validator import CitationValidator, ValidationIssue
+from utils.verdict_cache import VerdictCache, verdict_cache_from_env
 
 
 class CitationQualityFilter:
     """Filters low-quality citations from citation database."""
 
-    def __init__(self, strict_mode: bool = True):
+    def __init__(
+        self,
+        strict_mode: bool = True,
+        verdict_cache: Optional[VerdictCache] = None,
+        validator: Optional[CitationValidator] = None,
+    ):
         """
         Initialize filter.
 
         Args:
             strict_mode: If True, filter all critical issues. If False, only filter worst offenders.
+            verdict_cache: DOI/URL verdict cache (default: configured from VERDICT_CACHE* env)
+            validator: Validator to reuse, e.g. one a CitationStream already ran checks on
+                       (verdict_cache is then ignored)
         """
-        self.validator = CitationValidator()
+        if validator is None:
+            if verdict_cache is None:
+                verdict_cache = verdict_cache_from_env()
+            validator = CitationValidator(verdict_cache=verdict_cache)
+        self.validator = validator
         self.strict_mode = strict_mode
 
     def should_filter_citation(self, issues: List[ValidationIssue]) -> Tuple[bool, str]:
@@ -104,8 +117,7 @@ class CitationQualityFilter:
             'removal_reasons': {}
         }
 
-        for citation in citations:
-            issues = self.validator.validate_citation(citation)
+        for citation, issues in zip(citations, self.validator.validate_citations(citations)):
             should_filter, reason = self.should_filter_citation(issues)
 
             if should_filter:
@@ -233,11 +245,9 @@ def main():
                 print(f"Invalid JSON in {args.database}: {e}")
                 return 1
 
-        validator = CitationValidator()
         to_remove = 0
 
-        for citation in data.get('citations', []):
-            issues = validator.validate_citation(citation)
+        for issues in filter_obj.validator.validate_citations(data.get('citations', [])):
             should_filter, reason = filter_obj.should_filter_citation(issues)
             if should_filter:
                 to_remove += 1
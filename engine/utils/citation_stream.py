@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Streams Scout citations to citation management while research is still running
+ABOUTME: Bounded queue feeding a consumer that dedups, prefetches pages and pre-validates DOIs/URLs
+
+Citation management used to start only after every Scout query had returned,
+and then spent most of its time downloading the web pages of sources whose
+titles or metadata need scraping. With a CitationStream the Scout hands over
+each query's citations as they arrive; a consumer thread drops works it has
+already seen, picks the citations the title and metadata scrapers will ask
+for, and starts their page downloads right away. It also starts the DOI and
+URL checks of the quality filter, whose verdicts land in the validator's
+memo and the persistent VerdictCache. Downloads and checks therefore overlap
+the remaining queries and the Scribe and Signal agents.
+
+Citation management stays the single place that decides: it still
+deduplicates, scrapes and filters the complete list, and takes prefetched
+pages and verdicts from the stream instead of repeating the requests
+(anything the stream did not cover is fetched or checked then). The final
+database is the same with or without streaming.
+
+Usage:
+    stream = CitationStream()
+    research_citations_via_api(..., on_citations=stream.put)
+    stream.close()                 # no more input; downloads continue
+    ...
+    pages = stream.pages()         # waits for in-flight downloads and checks
+    CitationQualityFilter(validator=stream.validator)
+
+    stream.abort()                 # or: give up, cancelling queued work
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Optional
+
+from utils.citation_validator import CitationValidator
+from utils.page_fetcher import FetchedPage, PageFetcher
+
+logger = logging.getLogger(__name__)
+
+# Queue item telling the consumer that research has finished
+_END = object()
+
+
+class CitationStream:
+    """
+    Bounded producer/consumer hand-off from the Scout to citation management.
+
+    put() blocks only while max_batches batches are waiting, which the
+    consumer drains quickly: it submits downloads and validation checks to
+    the pool and never waits for them itself.
+    """
+
+    def __init__(
+        self,
+        max_batches: Optional[int] = None,
+        fetcher: Optional[PageFetcher] = None,
+        selectors: Optional[List[Callable[[List], List]]] = None,
+        validator: Optional[CitationValidator] = None,
+    ):
+        """
+        Start the consumer thread.
+
+        Args:
+            max_batches: Batches buffered before put() waits (default: CITATION_STREAM_QUEUE)
+            fetcher: PageFetcher used for downloads (per-domain politeness is shared)
+            selectors: Functions picking the citations whose URLs to prefetch
+                       (default: the title and metadata scrapers' select_citations)
+            validator: CitationValidator whose DOI/URL checks to run early
+                       (default: one using the VERDICT_CACHE* verdict cache)
+        """
+        if max_batches is None:
+            from concurrency.concurrency_config import get_concurrency_config
+            max_batches = get_concurrency_config(verbose=False).citation_stream_queue
+        if selectors is None:
+            from utils.scrape_citation_titles import TitleScraper
+            from utils.scrape_citation_metadata import MetadataScraper
+            selectors = [
+                TitleScraper(verbose=False).select_citations,
+                MetadataScraper(verbose=False).select_citations,
+            ]
+        if validator is None:
+            from utils.verdict_cache import verdict_cache_from_env
+            validator = CitationValidator(verdict_cache=verdict_cache_from_env())
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, max_batches))
+        self._fetcher = fetcher or PageFetcher()
+        self._selectors = selectors
+        self.validator = validator
+        self._pool = ThreadPoolExecutor(max_workers=self._fetcher.max_workers, thread_name_prefix="citation-prefetch")
+        self._downloads: Dict[str, Future] = {}
+        self._checks: Dict[tuple, Future] = {}
+        self._seen_works: set = set()
+        self._closed = False
+        self._aborted = False
+        self._lock = threading.Lock()
+        self._pages: Optional[Dict[str, FetchedPage]] = None
+
+        # Stats for reporting
+        self.received = 0
+        self.unique = 0
+
+        self._consumer = threading.Thread(target=self._consume, name="citation-stream", daemon=True)
+        self._consumer.start()
+
+    def put(self, citations: Iterable) -> None:
+        """Hand over one query's citations (ignored after close())."""
+        batch = list(citations)
+        if not batch:
+            return
+        with self._lock:
+            if self._closed:
+                logger.debug(f"Citation stream closed, dropping {len(batch)} citations")
+                return
+        self._queue.put(batch)
+
+    def close(self) -> None:
+        """No more citations will arrive; queued batches and downloads still finish."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(_END)
+
+    def abort(self) -> None:
+        """Close the stream and drop queued batches, downloads and checks (running ones finish)."""
+        self._aborted = True
+        self.close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def pages(self) -> Dict[str, FetchedPage]:
+        """
+        Close the stream, wait for every download and check, and return the pages.
+
+        Safe to call more than once (the same dict is returned).
+        """
+        self.close()
+        self._consumer.join()
+        if self._pages is None:
+            self._pages = {url: future.result() for url, future in self._downloads.items()}
+            wait(self._checks.values())
+            self._pool.shutdown(wait=False)
+            fetched = sum(1 for page in self._pages.values() if page.ok)
+            logger.info(
+                f"Citation stream: {self.unique} unique of {self.received} citations, "
+                f"prefetched {fetched}/{len(self._pages)} pages, {len(self._checks)} DOI/URL checks"
+            )
+        return self._pages
+
+    def _consume(self) -> None:
+        while True:
+            batch = self._queue.get()
+            if batch is _END:
+                return
+            if self._aborted:
+                continue
+            try:
+                self._process(batch)
+            except Exception as e:
+                logger.warning(f"Citation stream could not process a batch: {e}")
+
+    def _process(self, batch: List) -> None:
+        """Dedup a batch against earlier ones and start downloads and checks for the new works."""
+        from utils.api_citations.harvest import work_key
+
+        new = []
+        for citation in batch:
+            self.received += 1
+            key = work_key({"doi": citation.doi, "title": citation.title}) or id(citation)
+            if key not in self._seen_works:
+                self._seen_works.add(key)
+                new.append(citation)
+        self.unique += len(new)
+
+        for select in self._selectors:
+            for citation in select(new):
+                url = citation.url
+                if url and url not in self._downloads:
+                    self._downloads[url] = self._pool.submit(self._fetcher.fetch, url)
+
+        # The quality filter checks every citation's DOI and URL
+        for citation in new:
+            for check, value in ((self.validator.validate_doi, citation.doi),
+                                 (self.validator.validate_url_status, citation.url)):
+                key = (check.__name__, value)
+                if value and key not in self._checks:
+                    self._checks[key] = self._pool.submit(check, value)
@@ -5,13 +5,25 @@ ABOUTME: Uses CrossRef API to verify DOIs, URL status checks, and metadata quali
 """
 
 import json
+import logging
 import re
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import zip_longest
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import Any, Callable, Iterator, List, Dict, Tuple, Optional
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
+from utils.verdict_cache import KIND_DOI, KIND_URL, VerdictCache
+
+logger = logging.getLogger(__name__)
+
+DOI_USER_AGENT = 'OpenDraft/1.3 (https://github.com/federicodeponte/opendraft)'
+URL_USER_AGENT = 'AcademicDraftAI/1.0 Citation Validator'
+
 
 @dataclass
 class ValidationIssue:
@@ -24,17 +36,73 @@ class ValidationIssue:
 
 
 class CitationValidator:
-    """Validates citations for academic integrity."""
-
-    def __init__(self, timeout: int = 10):
+    """
+    Validates citations for academic integrity.
+
+    Network checks (DOI existence, URL status) share one pooled session and
+    are memoized per validator. validate_citations() runs every unique check
+    up front on a bounded worker pool, with at most per_host requests to any
+    one host, and an optional VerdictCache makes checks already done by
+    earlier drafts free.
+    """
+
+    def __init__(
+        self,
+        timeout: int = 10,
+        max_workers: Optional[int] = None,
+        per_host: Optional[int] = None,
+        verdict_cache: Optional[VerdictCache] = None,
+        session: Optional[requests.Session] = None,
+    ):
         """
         Initialize validator.
 
         Args:
             timeout: HTTP request timeout in seconds
+            max_workers: Concurrent checks (default: VALIDATION_MAX_WORKERS)
+            per_host: Concurrent checks per host (default: VALIDATION_PER_HOST)
+            verdict_cache: Persistent verdict cache shared across drafts (optional)
+            session: Session to reuse (a pooled session is created if None)
         """
+        if max_workers is None or per_host is None:
+            from concurrency.concurrency_config import get_concurrency_config
+            config = get_concurrency_config(verbose=False)
+            max_workers = max_workers or config.validation_max_workers
+            per_host = per_host or config.validation_per_host
+
         self.timeout = timeout
         self.crossref_api_base = "https://api.crossref.org/works/"
+        self.max_workers = max(1, max_workers)
+        self.per_host = max(1, per_host)
+        self.verdict_cache = verdict_cache
+
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.max_workers)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+
+        self._lock = threading.Lock()
+        self._host_semaphores: Dict[str, threading.Semaphore] = {}
+        self._doi_verdicts: Dict[str, Optional[bool]] = {}
+        self._url_verdicts: Dict[str, Tuple[Optional[int], str]] = {}
+        self.network_checks = 0
+        self.cache_hits = 0
+
+    @contextmanager
+    def _host_slot(self, url: str) -> Iterator[None]:
+        """Hold one of the host's concurrency slots."""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            semaphore = self._host_semaphores.setdefault(host, threading.Semaphore(self.per_host))
+        with semaphore:
+            yield
+
+    @staticmethod
+    def _doi_key(doi: str) -> str:
+        # Clean DOI (remove prefix if present)
+        return doi.replace('https://doi.org/', '').replace('http://doi.org/', '').strip()
 
     def validate_doi(self, doi: str) -> Optional[bool]:
         """
@@ -46,19 +114,38 @@ class CitationValidator:
         Returns:
             True if DOI exists, False if DOI not found (404), None if network error
         """
-        # Clean DOI (remove prefix if present)
-        doi_clean = doi.replace('https://doi.org/', '').replace('http://doi.org/', '')
-
+        doi_clean = self._doi_key(doi)
+        key = doi_clean.lower()
+        with self._lock:
+            if key in self._doi_verdicts:
+                return self._doi_verdicts[key]
+
+        if self.verdict_cache is not None:
+            cached = self.verdict_cache.get_many(KIND_DOI, [key]).get(key)
+            if cached is not None:
+                return self._remember_doi(key, cached['exists'], from_cache=True)
+
+        url = f"{self.crossref_api_base}{doi_clean}"
         try:
-            response = requests.get(
-                f"{self.crossref_api_base}{doi_clean}",
-                timeout=self.timeout,
-                headers={'User-Agent': 'OpenDraft/1.3 (https://github.com/federicodeponte/opendraft)'}
-            )
-            return response.status_code == 200
+            with self._host_slot(url):
+                response = self.session.get(url, timeout=self.timeout, headers={'User-Agent': DOI_USER_AGENT})
+            exists = response.status_code == 200
         except requests.exceptions.RequestException:
             # Network error - assume DOI might be valid
-            return None  # Unknown
+            exists = None  # Unknown
+        return self._remember_doi(key, exists)
+
+    def _remember_doi(self, key: str, exists: Optional[bool], from_cache: bool = False) -> Optional[bool]:
+        with self._lock:
+            self._doi_verdicts[key] = exists
+            if from_cache:
+                self.cache_hits += 1
+            else:
+                self.network_checks += 1
+        # Only definitive answers are worth keeping across drafts
+        if self.verdict_cache is not None and not from_cache and exists is not None:
+            self.verdict_cache.put(KIND_DOI, key, {'exists': exists}, positive=exists)
+        return exists
 
     def check_author_sanity(self, authors: List[str]) -> List[str]:
         """
@@ -116,26 +203,111 @@ class CitationValidator:
         if not url:
             return None, "No URL provided"
 
+        with self._lock:
+            if url in self._url_verdicts:
+                return self._url_verdicts[url]
+
+        if self.verdict_cache is not None:
+            cached = self.verdict_cache.get_many(KIND_URL, [url]).get(url)
+            if cached is not None:
+                return self._remember_url(url, (cached['status'], ""), from_cache=True)
+
         try:
-            response = requests.head(
-                url,
-                timeout=self.timeout,
-                allow_redirects=True,
-                headers={'User-Agent': 'AcademicDraftAI/1.0 Citation Validator'}
-            )
+            with self._host_slot(url):
+                response = self.session.head(
+                    url,
+                    timeout=self.timeout,
+                    allow_redirects=True,
+                    headers={'User-Agent': URL_USER_AGENT}
+                )
 
-            # Some servers block HEAD, try GET
-            if response.status_code == 405:
-                response = requests.get(url, timeout=self.timeout, allow_redirects=True)
+                # Some servers block HEAD, try GET
+                if response.status_code == 405:
+                    response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
 
-            return response.status_code, ""
+            verdict = (response.status_code, "")
 
         except requests.exceptions.Timeout:
-            return None, "Timeout"
+            verdict = (None, "Timeout")
         except requests.exceptions.ConnectionError:
-            return None, "Connection failed"
+            verdict = (None, "Connection failed")
         except requests.exceptions.RequestException as e:
-            return None, f"Request error: {str(e)[:50]}"
+            verdict = (None, f"Request error: {str(e)[:50]}")
+
+        return self._remember_url(url, verdict)
+
+    def _remember_url(
+        self,
+        url: str,
+        verdict: Tuple[Optional[int], str],
+        from_cache: bool = False,
+    ) -> Tuple[Optional[int], str]:
+        with self._lock:
+            self._url_verdicts[url] = verdict
+            if from_cache:
+                self.cache_hits += 1
+            else:
+                self.network_checks += 1
+        status = verdict[0]
+        if self.verdict_cache is not None and not from_cache and status is not None:
+            self.verdict_cache.put(KIND_URL, url, {'status': status}, positive=status < 400)
+        return verdict
+
+    def prefetch(self, citations: List[Dict]) -> None:
+        """
+        Run every unique DOI and URL check for these citations concurrently.
+
+        Verdicts already in the verdict cache are loaded in one query per
+        kind; the remaining checks run on a pool of max_workers threads,
+        ordered round-robin across hosts so one slow host cannot occupy
+        every worker. validate_citation() then answers from memory.
+
+        Args:
+            citations: Citation dicts (keys: doi, url)
+        """
+        dois = list(dict.fromkeys(
+            self._doi_key(c['doi']).lower() for c in citations if c.get('doi')
+        ))
+        urls = list(dict.fromkeys(c['url'] for c in citations if c.get('url')))
+
+        with self._lock:
+            dois = [d for d in dois if d not in self._doi_verdicts]
+            urls = [u for u in urls if u not in self._url_verdicts]
+
+        if self.verdict_cache is not None:
+            for key, cached in self.verdict_cache.get_many(KIND_DOI, dois).items():
+                self._remember_doi(key, cached['exists'], from_cache=True)
+            for url, cached in self.verdict_cache.get_many(KIND_URL, urls).items():
+                self._remember_url(url, (cached['status'], ""), from_cache=True)
+            with self._lock:
+                dois = [d for d in dois if d not in self._doi_verdicts]
+                urls = [u for u in urls if u not in self._url_verdicts]
+
+        checks: Dict[str, List[Tuple[Callable[[str], Any], str]]] = {}
+        for doi in dois:
+            checks.setdefault(urlparse(self.crossref_api_base).netloc, []).append((self.validate_doi, doi))
+        for url in urls:
+            checks.setdefault(urlparse(url).netloc.lower(), []).append((self.validate_url_status, url))
+        ordered = [check for batch in zip_longest(*checks.values()) for check in batch if check]
+        if not ordered:
+            return
+
+        logger.info(f"Validating {len(dois)} DOIs and {len(urls)} URLs ({self.max_workers} workers)")
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(ordered))) as executor:
+            list(executor.map(lambda check: check[0](check[1]), ordered))
+
+    def validate_citations(self, citations: List[Dict]) -> List[List[ValidationIssue]]:
+        """
+        Validate many citations, running their network checks concurrently.
+
+        Args:
+            citations: Citation dicts from a citation database
+
+        Returns:
+            Validation issues for each citation, in input order
+        """
+        self.prefetch(citations)
+        return [self.validate_citation(citation) for citation in citations]
 
     def check_metadata_quality(self, citation: Dict) -> List[str]:
         """
@@ -316,8 +488,7 @@ class CitationValidator:
 
         print(f"🔍 Validating {len(citations)} citations from {database_path.name}...")
 
-        for citation in citations:
-            issues = self.validate_citation(citation)
+        for issues in self.validate_citations(citations):
             all_issues.extend(issues)
 
         # Compute statistics
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Explicit context caching for prompt prefixes shared by several agent calls
+ABOUTME: Gemini cachedContents backend plus an in-process local backend for offline runs and tests
+
+Several agents in a draft send the same long prefix: the seven Crafter calls
+all start with crafter.md, the topic, the outline and the citation database.
+A cached context registers that prefix once; later calls that start with it
+send only the rest of the prompt plus a reference to the cache.
+
+    cached = model.create_cached_context(prefix)        # once per draft
+    run_agent(..., cached_context=cached)               # prompt starts with prefix
+    model.delete_cached_context(cached)                 # when the phase is done
+
+The prompt passed to run_agent is always the full prompt; GeminiModelWrapper
+strips the prefix only when the prompt really starts with it, so callers can
+never send a mismatched suffix. If the cache has expired or the backend
+rejects it, the call is repeated with the full prompt.
+
+Backends:
+    GeminiContextCacheBackend: client.caches (server-side, billed at the cached-token rate)
+    LocalContextCacheBackend: keeps prefixes in memory and re-joins them before the call;
+        same code path without server state, for offline runs and tests
+
+Configured from environment:
+    GEMINI_CONTEXT_CACHE: true (default, server-side), local, false
+    GEMINI_CONTEXT_CACHE_TTL: Cache lifetime in seconds (default: 3600)
+    GEMINI_CONTEXT_CACHE_MIN_TOKENS: Smallest prefix worth caching (default: 4096);
+        Gemini rejects caches below a model-dependent minimum
+"""
+
+import itertools
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from utils.token_counter import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Cache modes (GEMINI_CONTEXT_CACHE)
+MODE_OFF = "false"
+MODE_SERVER = "true"
+MODE_LOCAL = "local"
+
+# A context this close to its expiry is not used for new calls
+EXPIRY_MARGIN_SECONDS = 60
+
+
+class ContextCacheError(RuntimeError):
+    """Raised by a backend when a cached context is unknown or expired."""
+
+
+@dataclass
+class CachedContext:
+    """
+    A prompt prefix registered with a context cache backend.
+
+    Attributes:
+        name: Backend handle (e.g. "cachedContents/abc123")
+        prefix: Exact prompt text the cache holds
+        model_name: Model the cache was created for (caches are per model)
+        prefix_tokens: Estimated tokens in the prefix
+        expires_at: Unix time the backend drops the cache
+        backend: Backend that owns the cache
+        valid: False once deleted or rejected by the backend
+    """
+    name: str
+    prefix: str
+    model_name: str
+    prefix_tokens: int
+    expires_at: float
+    backend: Any = field(repr=False, default=None)
+    valid: bool = True
+
+    def covers(self, contents: Any, model_name: str) -> bool:
+        """Whether a request can use this cache (same model, prompt starts with the prefix)."""
+        return (
+            self.valid
+            and model_name == self.model_name
+            and time.time() < self.expires_at - EXPIRY_MARGIN_SECONDS
+            and isinstance(contents, str)
+            and len(contents) > len(self.prefix)
+            and contents.startswith(self.prefix)
+        )
+
+    def invalidate(self) -> None:
+        self.valid = False
+
+
+class GeminiContextCacheBackend:
+    """Server-side caching through google.genai client.caches."""
+
+    def __init__(self, client: Any):
+        self.client = client
+
+    def create(self, model_name: str, prefix: str, ttl_seconds: int, display_name: Optional[str]) -> str:
+        config = {"contents": prefix, "ttl": f"{ttl_seconds}s"}
+        if display_name:
+            config["display_name"] = display_name
+        return self.client.caches.create(model=model_name, config=config).name
+
+    def delete(self, name: str) -> None:
+        self.client.caches.delete(name=name)
+
+    def request(self, cached: CachedContext, contents: str, config: Optional[dict]) -> Tuple[str, dict]:
+        """Contents and config for a call that reuses the cache."""
+        return contents[len(cached.prefix):], {**(config or {}), "cached_content": cached.name}
+
+
+class LocalContextCacheBackend:
+    """
+    In-process stand-in for server-side caching.
+
+    Stores each prefix under a generated name and re-joins it with the
+    suffix before the call, so the model receives exactly the uncached
+    prompt. Deleted names raise ContextCacheError like an expired server
+    cache. Counters show how the cache was used.
+    """
+
+    def __init__(self):
+        self._prefixes: Dict[str, str] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.created = 0
+        self.requests = 0
+        self.cached_tokens = 0
+
+    def create(self, model_name: str, prefix: str, ttl_seconds: int, display_name: Optional[str]) -> str:
+        with self._lock:
+            name = f"localCachedContents/{next(self._ids)}"
+            self._prefixes[name] = prefix
+            self.created += 1
+        return name
+
+    def delete(self, name: str) -> None:
+        with self._lock:
+            self._prefixes.pop(name, None)
+
+    def request(self, cached: CachedContext, contents: str, config: Optional[dict]) -> Tuple[str, dict]:
+        with self._lock:
+            prefix = self._prefixes.get(cached.name)
+            if prefix is None:
+                raise ContextCacheError(f"Cached content {cached.name} not found")
+            self.requests += 1
+            self.cached_tokens += cached.prefix_tokens
+        return prefix + contents[len(cached.prefix):], dict(config or {})
+
+
+def default_context_cache_backend(client: Any) -> Optional[Any]:
+    """
+    Backend selected by GEMINI_CONTEXT_CACHE for a google.genai client.
+
+    Returns None when caching is off, or when the client has no caches API
+    (test doubles) and server-side caching was requested.
+    """
+    mode = os.getenv("GEMINI_CONTEXT_CACHE", MODE_SERVER).strip().lower()
+    if mode == MODE_LOCAL:
+        return LocalContextCacheBackend()
+    if mode == MODE_SERVER and hasattr(client, "caches"):
+        return GeminiContextCacheBackend(client)
+    return None
+
+
+def create_cached_context(
+    backend: Any,
+    model_name: str,
+    prefix: str,
+    ttl_seconds: Optional[int] = None,
+    display_name: Optional[str] = None,
+) -> Optional[CachedContext]:
+    """
+    Register a prefix with a backend.
+
+    Returns None (callers then send full prompts) when the prefix is below
+    GEMINI_CONTEXT_CACHE_MIN_TOKENS or the backend fails; a cache is an
+    optimization and never a reason to fail a draft.
+    """
+    prefix_tokens = estimate_tokens(prefix)
+    min_tokens = int(os.getenv("GEMINI_CONTEXT_CACHE_MIN_TOKENS", "4096"))
+    if prefix_tokens < min_tokens:
+        logger.info(f"Context cache skipped: prefix ~{prefix_tokens} tokens < {min_tokens}")
+        return None
+
+    ttl_seconds = ttl_seconds or int(os.getenv("GEMINI_CONTEXT_CACHE_TTL", "3600"))
+    try:
+        name = backend.create(model_name, prefix, ttl_seconds, display_name)
+    except Exception as e:
+        logger.warning(f"Could not create cached context ({model_name}): {e}")
+        return None
+
+    logger.info(f"Cached context {name}: ~{prefix_tokens} prefix tokens, ttl {ttl_seconds}s")
+    return CachedContext(
+        name=name,
+        prefix=prefix,
+        model_name=model_name,
+        prefix_tokens=prefix_tokens,
+        expires_at=time.time() + ttl_seconds,
+        backend=backend,
+    )
+
+
+def is_cache_error(error: Exception) -> bool:
+    """Whether a failed call was rejected because of its cached context."""
+    if isinstance(error, ContextCacheError):
+        return True
+    message = str(error).lower()
+    return "cachedcontent" in message or "cached content" in message or "cached_content" in message
@@ -16,11 +16,26 @@ Design Principles:
 - Defensive: Preserves original data, returns new deduplicated list
 """
 
-from typing import List, Dict, Tuple, Optional
-from collections import defaultdict
+from typing import List, Dict, Tuple, Optional, Set
+from collections import Counter, defaultdict
+import math
 import re
 from difflib import SequenceMatcher
 
+# Title similarity thresholds for find_duplicate_groups
+TITLE_MATCH_THRESHOLD = 0.9
+POTENTIAL_MATCH_THRESHOLD = 0.7
+
+# Up to this many titles every pair is compared; above it, candidate pairs
+# come from blocking on shared title words (see title_candidate_pairs)
+EXHAUSTIVE_TITLE_LIMIT = 200
+
+# Candidate pairs must share at least this fraction (Jaccard) of title words
+BLOCKING_JACCARD = 0.4
+
+# Words found in more titles than this are too common to block on
+MAX_BLOCK_SIZE = 200
+
 
 def safe_get(obj, key, default=None):
     """
@@ -117,7 +132,89 @@ def calculate_title_similarity(title1: str, title2: str) -> float:
     return SequenceMatcher(None, norm1, norm2).ratio()
 
 
-def find_duplicate_groups(citations: List[Dict]) -> Dict[str, List[Dict]]:
+def title_tokens(normalized_title: str) -> Set[str]:
+    """
+    Blocking tokens for a normalized title: words cut to 5 characters.
+
+    Truncation makes "effect"/"effects" and "climate"/"climatic" share a
+    token, and splitting on non-word characters handles hyphenation.
+    """
+    return {word[:5] for word in re.split(r'\W+', normalized_title) if word}
+
+
+def title_candidate_pairs(normalized_titles: List[str]) -> Set[Tuple[int, int]]:
+    """
+    Generate index pairs of titles that may be near-duplicates.
+
+    Uses prefix-filtered blocking: each title's tokens are ordered rarest
+    first and only the first |tokens| - ceil(BLOCKING_JACCARD * |tokens|) + 1
+    are indexed, which is enough for any pair with token Jaccard >=
+    BLOCKING_JACCARD to share an indexed token; blocked pairs are then
+    checked against the exact token Jaccard. Tokens in more than
+    MAX_BLOCK_SIZE titles are skipped. Identical normalized titles are
+    always paired.
+
+    Args:
+        normalized_titles: Titles already passed through normalize_text
+
+    Returns:
+        Set of (i, j) index pairs with i < j
+    """
+    tokens = [title_tokens(t) for t in normalized_titles]
+    frequency = Counter(token for token_set in tokens for token in token_set)
+
+    candidates = set()
+    blocked = set()
+
+    exact = defaultdict(list)
+    for i, title in enumerate(normalized_titles):
+        if title:
+            exact[title].append(i)
+    for indexes in exact.values():
+        for a, i in enumerate(indexes):
+            for j in indexes[a + 1:]:
+                candidates.add((i, j))
+
+    # Index shorter titles first so the size filter only looks backwards
+    postings = defaultdict(list)
+    for i in sorted(range(len(tokens)), key=lambda k: len(tokens[k])):
+        size = len(tokens[i])
+        if not size:
+            continue
+        ordered = sorted(tokens[i], key=lambda token: (frequency[token], token))
+        prefix_length = size - math.ceil(BLOCKING_JACCARD * size) + 1
+        min_size = BLOCKING_JACCARD * size
+        for token in ordered[:prefix_length]:
+            if frequency[token] > MAX_BLOCK_SIZE:
+                break
+            for j in postings[token]:
+                if len(tokens[j]) >= min_size:
+                    blocked.add((j, i) if j < i else (i, j))
+            postings[token].append(i)
+
+    # Verify: sharing one rare word is not enough
+    for i, j in blocked:
+        shared = len(tokens[i] & tokens[j])
+        if shared >= BLOCKING_JACCARD * (len(tokens[i]) + len(tokens[j]) - shared):
+            candidates.add((i, j))
+
+    return candidates
+
+
+def _classify_title_pair(matcher: SequenceMatcher) -> Optional[str]:
+    """Return 'title_match', 'potential' or None for a prepared SequenceMatcher."""
+    # quick_ratio() is a cheap upper bound on ratio()
+    if matcher.quick_ratio() <= POTENTIAL_MATCH_THRESHOLD:
+        return None
+    similarity = matcher.ratio()
+    if similarity > TITLE_MATCH_THRESHOLD:
+        return 'title_match'
+    if similarity > POTENTIAL_MATCH_THRESHOLD:
+        return 'potential'
+    return None
+
+
+def find_duplicate_groups(citations: List[Dict], exhaustive: Optional[bool] = None) -> Dict[str, List[Dict]]:
     """
     Group citations by duplicate criteria.
 
@@ -127,8 +224,14 @@ def find_duplicate_groups(citations: List[Dict]) -> Dict[str, List[Dict]]:
     - 'title_match': Citations with very similar titles (>0.9 similarity)
     - 'potential': Citations that might be duplicates (0.7-0.9 similarity)
 
+    Title similarity is only computed for candidate pairs from
+    title_candidate_pairs() once more than EXHAUSTIVE_TITLE_LIMIT citations
+    remain, so large bibliographies scale near-linearly. Pairs whose titles
+    share few distinctive words are then not compared.
+
     Args:
         citations: List of citation dictionaries
+        exhaustive: Compare every title pair (None = only for small inputs)
 
     Returns:
         Dictionary mapping duplicate type to list of citation groups
@@ -160,39 +263,62 @@ def find_duplicate_groups(citations: List[Dict]) -> Dict[str, List[Dict]]:
         if url:
             url_groups[url].append(c)
 
+    doi_matched = {id(c) for group in groups['exact_doi'] for c in group}
     for url, cites in url_groups.items():
         if len(cites) > 1:
             # Check if already in DOI duplicates (avoid double-counting)
-            doi_matched = any(c in sum(groups['exact_doi'], []) for c in cites)
-            if not doi_matched:
+            if not any(id(c) in doi_matched for c in cites):
                 groups['exact_url'].append(cites)
 
     # Group by title similarity (expensive, so do after URL/DOI)
-    already_matched = set(safe_get(c, 'id') for c in sum(groups['exact_doi'] + groups['exact_url'], []))
+    already_matched = set(safe_get(c, 'id') for group in groups['exact_doi'] + groups['exact_url'] for c in group)
     remaining = [c for c in citations if safe_get(c, 'id') not in already_matched]
+    titles = [safe_get(c, 'title', '') for c in remaining]
+    normalized = [normalize_text(t) if t else '' for t in titles]
+
+    if exhaustive is None:
+        exhaustive = len(remaining) <= EXHAUSTIVE_TITLE_LIMIT
+
+    if exhaustive:
+        pairs = ((i, j) for i in range(len(remaining)) for j in range(i + 1, len(remaining)))
+    else:
+        pairs = sorted(title_candidate_pairs(normalized))
 
     checked_pairs = set()
-    for i, c1 in enumerate(remaining):
-        for c2 in remaining[i+1:]:
-            pair = tuple(sorted([safe_get(c1, 'id'), safe_get(c2, 'id')]))
-            if pair in checked_pairs:
-                continue
-            checked_pairs.add(pair)
-
-            title1 = safe_get(c1, 'title', '')
-            title2 = safe_get(c2, 'title', '')
-
-            if not title1 or not title2:
-                continue
-
-            similarity = calculate_title_similarity(title1, title2)
-
-            if similarity > 0.9:
-                # Very high similarity - likely duplicate
-                groups['title_match'].append([c1, c2])
-            elif similarity > 0.7:
-                # Medium similarity - potential duplicate
-                groups['potential'].append([c1, c2])
+    to_compare = []
+    for i, j in pairs:
+        pair = tuple(sorted([safe_get(remaining[i], 'id'), safe_get(remaining[j], 'id')]))
+        if pair in checked_pairs:
+            continue
+        checked_pairs.add(pair)
+
+        if not titles[i] or not titles[j]:
+            continue
+
+        # ratio() <= 2 * min(len) / (len1 + len2): skip pairs that cannot reach the threshold
+        len1, len2 = len(normalized[i]), len(normalized[j])
+        if not len1 or not len2 or 2.0 * min(len1, len2) / (len1 + len2) <= POTENTIAL_MATCH_THRESHOLD:
+            continue
+        to_compare.append((i, j))
+
+    # SequenceMatcher caches its analysis of the second sequence, so compare
+    # grouped by the second title and report in the original pair order
+    match_types = {}
+    matcher = SequenceMatcher(None)
+    current = None
+    for i, j in sorted(to_compare, key=lambda p: (p[1], p[0])):
+        if current != j:
+            matcher.set_seq2(normalized[j])
+            current = j
+        matcher.set_seq1(normalized[i])
+        match_type = _classify_title_pair(matcher)
+        if match_type:
+            match_types[(i, j)] = match_type
+
+    for i, j in to_compare:
+        match_type = match_types.get((i, j))
+        if match_type:
+            groups[match_type].append([remaining[i], remaining[j]])
 
     return groups
 
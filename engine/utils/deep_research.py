@@ -57,6 +57,9 @@ except ImportError:
     genai = None
     GeminiModelWrapper = None
 
+from concurrency.rate_limiter import acquire_gemini
+from .token_counter import estimate_tokens
+
 logger = logging.getLogger(__name__)
 
 
@@ -181,8 +184,10 @@ class DeepResearchPlanner:
                 try:
                     # Wrap API call in timeout to prevent 504 Deadline Exceeded
                     def _generate_with_timeout():
+                        planning_prompt = self._build_planning_prompt(current_topic, scope, seed_references)
+                        acquire_gemini(estimate_tokens(planning_prompt))
                         return self.model.generate_content(
-                            self._build_planning_prompt(current_topic, scope, seed_references),
+                            planning_prompt,
                             generation_config={
                                 "temperature": 0.3,  # Lower temperature for systematic planning
                                 "max_output_tokens": 8192,
@@ -679,6 +684,7 @@ Return ONLY valid JSON, no markdown blocks.
 """
 
         try:
+            acquire_gemini(estimate_tokens(prompt))
             response = self.model.generate_content(
                 prompt,
                 generation_config={
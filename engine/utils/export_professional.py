@@ -24,6 +24,7 @@ from utils.pdf_engines import (
     get_available_engines,
     get_recommended_engine
 )
+from utils.perf_trace import CAT_EXPORT, span
 
 
 def extract_metadata_from_yaml(md_file: Path) -> dict:
@@ -155,12 +156,14 @@ def export_pdf(
     logger.info("="*70)
 
     # Use factory to generate with automatic fallback
-    result = PDFEngineFactory.generate_with_fallback(
-        md_file=md_file,
-        output_pdf=output_pdf,
-        options=options,
-        preferred_engine=engine if engine != 'auto' else None
-    )
+    with span("export_pdf", CAT_EXPORT, output=output_pdf.name) as trace_args:
+        result = PDFEngineFactory.generate_with_fallback(
+            md_file=md_file,
+            output_pdf=output_pdf,
+            options=options,
+            preferred_engine=engine if engine != 'auto' else None
+        )
+        trace_args["engine"] = result.engine_name
 
     # Display result
     if result.success:
@@ -501,12 +504,13 @@ def export_docx(
         logger.info("="*70)
 
         # Run pandoc
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        with span("pandoc_docx", CAT_EXPORT, output=output_docx.name):
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=60
+            )
 
         if result.returncode != 0:
             logger.error(f"Pandoc failed with return code {result.returncode}")
@@ -3,15 +3,23 @@ ABOUTME: Shared Gemini client wrapper for new google.genai API.
 ABOUTME: Provides backward-compatible interface matching legacy GenerativeModel-style usage.
 """
 
+import itertools
 import logging
 import os
-from typing import Any, Optional, Protocol, runtime_checkable
+from typing import Any, Callable, Iterator, Optional, Protocol, Tuple, runtime_checkable
 
 try:
     from google import genai
 except ImportError:
     genai = None
 
+from utils.context_cache import (
+    CachedContext,
+    create_cached_context,
+    default_context_cache_backend,
+    is_cache_error,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,6 +64,11 @@ class GeminiModelWrapper:
         model = GeminiModelWrapper(client, "gemini-2.0-flash")
         response = model.generate_content("Hello")
         print(response.text)
+
+    Prompt prefixes shared by several calls can be cached explicitly
+    (see utils.context_cache):
+        cached = model.create_cached_context(prefix)
+        response = model.generate_content(prefix + rest, cached_context=cached)
     """
 
     def __init__(
@@ -63,6 +76,7 @@ class GeminiModelWrapper:
         client: "genai.Client",
         model_name: str,
         temperature: float = 0.7,
+        context_cache_backend: Any = None,
     ):
         """
         Initialize wrapper.
@@ -71,16 +85,23 @@ class GeminiModelWrapper:
             client: google.genai.Client instance
             model_name: Model name (e.g., "gemini-2.0-flash")
             temperature: Default temperature for generation
+            context_cache_backend: Backend for create_cached_context
+                (default: selected by GEMINI_CONTEXT_CACHE)
         """
         self.client = client
         self.model_name = model_name
         self.default_temperature = temperature
+        self.context_cache_backend = (
+            context_cache_backend if context_cache_backend is not None
+            else default_context_cache_backend(client)
+        )
 
     def generate_content(
         self,
         prompt: Any,
         generation_config: Any = None,
         safety_settings: Any = None,
+        cached_context: Optional[CachedContext] = None,
     ) -> Any:
         """
         Generate content using the new API.
@@ -91,11 +112,86 @@ class GeminiModelWrapper:
             prompt: Text prompt or list of prompts
             generation_config: GenerationConfig or dict with settings
             safety_settings: Ignored (new API handles safety differently)
+            cached_context: Cached prefix to reuse if the prompt starts with it
 
         Returns:
             Response object with .text attribute
         """
         _ = safety_settings
+        return self._call(self.client.models.generate_content, prompt, generation_config, cached_context, False)
+
+    def generate_content_stream(
+        self,
+        prompt: Any,
+        generation_config: Any = None,
+        safety_settings: Any = None,
+        cached_context: Optional[CachedContext] = None,
+    ) -> Iterator[Any]:
+        """
+        Stream content using the new API.
+
+        Same arguments as generate_content().
+
+        Returns:
+            Iterator of response chunks, each with a .text attribute; the
+            last chunk carries finish_reason and usage_metadata
+        """
+        _ = safety_settings
+        return self._call(self.client.models.generate_content_stream, prompt, generation_config, cached_context, True)
+
+    def _call(
+        self,
+        method: Callable[..., Any],
+        prompt: Any,
+        generation_config: Any,
+        cached_context: Optional[CachedContext],
+        stream: bool,
+    ) -> Any:
+        """Call the API, sending only the uncached suffix when a cached context covers the prompt."""
+        contents, config = self._build_request(prompt, generation_config)
+        if cached_context is not None and cached_context.covers(contents, self.model_name):
+            cached_contents, cached_config = cached_context.backend.request(cached_context, contents, config)
+            try:
+                response = method(model=self.model_name, contents=cached_contents, config=cached_config)
+                # The SDK stream is lazy: a rejected cache only raises once
+                # iteration starts, so pull the first chunk inside the try.
+                return _prime_stream(response) if stream else response
+            except Exception as e:
+                if not is_cache_error(e):
+                    raise
+                logger.warning(f"Cached context {cached_context.name} rejected, sending full prompt: {e}")
+                cached_context.invalidate()
+        return method(model=self.model_name, contents=contents, config=config)
+
+    def create_cached_context(
+        self,
+        prefix: str,
+        ttl_seconds: Optional[int] = None,
+        display_name: Optional[str] = None,
+    ) -> Optional[CachedContext]:
+        """
+        Cache a prompt prefix that several later calls start with.
+
+        Returns:
+            CachedContext, or None if caching is off, the prefix is too
+            small to cache, or the backend failed
+        """
+        if self.context_cache_backend is None:
+            return None
+        return create_cached_context(self.context_cache_backend, self.model_name, prefix, ttl_seconds, display_name)
+
+    def delete_cached_context(self, cached_context: Optional[CachedContext]) -> None:
+        """Delete a cached context early (it otherwise expires with its TTL)."""
+        if cached_context is None or not cached_context.valid:
+            return
+        cached_context.invalidate()
+        try:
+            cached_context.backend.delete(cached_context.name)
+        except Exception as e:
+            logger.warning(f"Could not delete cached context {cached_context.name}: {e}")
+
+    def _build_request(self, prompt: Any, generation_config: Any) -> Tuple[str, Optional[dict]]:
+        """Translate legacy prompt/config arguments into contents and config."""
         config = {"temperature": self.default_temperature}
 
         if generation_config:
@@ -119,11 +215,7 @@ class GeminiModelWrapper:
         else:
             contents = str(prompt)
 
-        return self.client.models.generate_content(
-            model=self.model_name,
-            contents=contents,
-            config=config if config else None,
-        )
+        return contents, config if config else None
 
     def count_tokens(self, text: str) -> Any:
         """Count tokens in text."""
@@ -133,6 +225,16 @@ class GeminiModelWrapper:
         )
 
 
+def _prime_stream(stream: Iterator[Any]) -> Iterator[Any]:
+    """Start a lazy stream so request errors surface now, then yield every chunk."""
+    iterator = iter(stream)
+    try:
+        first = next(iterator)
+    except StopIteration:
+        return iter(())
+    return itertools.chain((first,), iterator)
+
+
 def create_gemini_client(
     api_key: Optional[str] = None,
     model_name: str = "gemini-2.0-flash",
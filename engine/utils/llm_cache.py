@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Persistent, content-addressed cache of LLM responses for run_agent
+ABOUTME: Supports read/write caching plus record/replay for deterministic offline runs
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Cache modes (LLM_CACHE_MODE)
+MODE_OFF = "off"         # No caching (default)
+MODE_ON = "on"           # Serve hits, store misses
+MODE_RECORD = "record"   # Always call the model, store every accepted response
+MODE_REPLAY = "replay"   # Serve hits only, a miss is an error (no network)
+CACHE_MODES = (MODE_OFF, MODE_ON, MODE_RECORD, MODE_REPLAY)
+
+CACHE_FORMAT_VERSION = 1
+
+
+class LLMCacheMiss(RuntimeError):
+    """Raised in replay mode when a prompt has no recorded response."""
+
+
+# =========================================================================
+# Response stand-ins
+# =========================================================================
+# run_agent inspects candidates/parts/finish_reason before reading .text, so
+# a cached response mirrors the shape of a google.genai response.
+
+@dataclass
+class _CachedPart:
+    text: str
+
+
+@dataclass
+class _CachedContent:
+    parts: List[_CachedPart]
+
+
+@dataclass
+class _CachedCandidate:
+    content: _CachedContent
+    finish_reason: int = 1  # STOP
+
+
+@dataclass
+class _CachedUsage:
+    prompt_token_count: int = 0
+    candidates_token_count: int = 0
+
+
+@dataclass
+class CachedResponse:
+    """A stored LLM response that quacks like a google.genai response."""
+
+    text: str
+    candidates: List[_CachedCandidate] = field(default_factory=list)
+    usage_metadata: Optional[_CachedUsage] = None
+    from_cache: bool = True
+
+    @classmethod
+    def from_text(cls, text: str) -> "CachedResponse":
+        # Cache hits cost nothing, so usage is reported as zero tokens
+        candidate = _CachedCandidate(content=_CachedContent(parts=[_CachedPart(text=text)]))
+        return cls(text=text, candidates=[candidate], usage_metadata=_CachedUsage())
+
+
+# =========================================================================
+# Cache
+# =========================================================================
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    On-disk LLM response cache keyed by model, temperature, prompt and input.
+
+    Each entry is a small JSON file named by the SHA-256 of the key, sharded
+    into two-character subdirectories. Hits refresh the file's mtime, and when
+    the total size exceeds max_bytes the least recently used entries are
+    evicted until the cache is back under 90% of the budget.
+
+    Usage:
+        cache = LLMResponseCache(Path(".llm_cache"), mode="on")
+        key = cache.make_key("gemini-2.5-flash", 0.7, agent_prompt, user_input)
+        response = cache.lookup(key)
+        if response is None:
+            response = model.generate_content(full_prompt)
+            cache.store(key, response.text)
+    """
+
+    def __init__(self, cache_dir: Path, mode: str = MODE_ON, max_bytes: int = 500 * 1024 * 1024):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory that holds cache entries (created if missing)
+            mode: One of CACHE_MODES
+            max_bytes: Size budget before LRU eviction kicks in
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown LLM cache mode '{mode}' (expected one of {', '.join(CACHE_MODES)})")
+
+        self.cache_dir = Path(cache_dir)
+        self.mode = mode
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._size = sum(p.stat().st_size for p in self._entries())
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != MODE_OFF
+
+    @staticmethod
+    def make_key(model_name: str, temperature: Optional[float], prompt: str, user_input: str) -> str:
+        """Content-address a call from its model settings and both halves of the prompt."""
+        material = json.dumps(
+            {
+                "v": CACHE_FORMAT_VERSION,
+                "model": model_name,
+                "temperature": temperature,
+                "prompt": _sha256(prompt),
+                "input": _sha256(user_input),
+            },
+            sort_keys=True,
+        )
+        return _sha256(material)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _entries(self):
+        return self.cache_dir.glob("*/*.json")
+
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        """
+        Return the cached response for key, or None on a miss.
+
+        Raises:
+            LLMCacheMiss: In replay mode when the key was never recorded
+        """
+        if self.mode in (MODE_OFF, MODE_RECORD):
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            text = entry["text"]
+        except (OSError, ValueError, KeyError):
+            with self._lock:
+                self.misses += 1
+            if self.mode == MODE_REPLAY:
+                raise LLMCacheMiss(f"No recorded LLM response for key {key[:12]} in {self.cache_dir}")
+            return None
+
+        # Touch for LRU ordering
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        with self._lock:
+            self.hits += 1
+        return CachedResponse.from_text(text)
+
+    def store(
+        self,
+        key: str,
+        text: str,
+        model_name: str = "",
+        prompt_tokens: int = 0,
+        output_tokens: int = 0,
+    ) -> None:
+        """Persist a response atomically, then evict if over budget."""
+        if self.mode in (MODE_OFF, MODE_REPLAY):
+            return
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(
+            {
+                "version": CACHE_FORMAT_VERSION,
+                "model": model_name,
+                "created": time.time(),
+                "prompt_tokens": prompt_tokens,
+                "output_tokens": output_tokens,
+                "text": text,
+            },
+            ensure_ascii=False,
+        )
+
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            old_size = path.stat().st_size if path.exists() else 0
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            new_size = path.stat().st_size
+        except OSError as e:
+            logger.warning(f"LLM cache write failed for {key[:12]}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            self.stores += 1
+            self._size += new_size - old_size
+            over_budget = self._size > self.max_bytes
+
+        if over_budget:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under 90% of max_bytes."""
+        with self._lock:
+            entries = []
+            for p in self._entries():
+                try:
+                    st = p.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, p))
+            entries.sort()
+
+            self._size = sum(size for _, size, _ in entries)
+            target = int(self.max_bytes * 0.9)
+            for _, size, p in entries:
+                if self._size <= target:
+                    break
+                try:
+                    p.unlink()
+                except OSError:
+                    continue
+                self._size -= size
+                self.evictions += 1
+
+        logger.debug(f"LLM cache evicted down to {self._size:,} bytes")
+
+    def get_stats(self) -> dict:
+        """Snapshot of cache counters for reporting."""
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "size_bytes": self._size,
+            }
+
+
+def model_cache_identity(model: Any) -> tuple:
+    """Best-effort (model_name, temperature) for a model wrapper or test double."""
+    model_name = getattr(model, "model_name", None) or type(model).__name__
+    temperature = getattr(model, "default_temperature", getattr(model, "temperature", None))
+    if not isinstance(temperature, (int, float)):
+        temperature = None
+    return str(model_name), temperature
+
+
+# Singleton instance (configured from environment)
+_llm_cache: Optional[LLMResponseCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """
+    Get or create the process-wide LLM response cache.
+
+    Configured from environment:
+        LLM_CACHE_MODE: off (default), on, record, replay
+        LLM_CACHE_DIR: Cache directory (default: .llm_cache)
+        LLM_CACHE_MAX_MB: Size budget before LRU eviction (default: 500)
+
+    Returns:
+        LLMResponseCache, or None when caching is off
+    """
+    global _llm_cache
+    if _llm_cache is None:
+        mode = os.getenv("LLM_CACHE_MODE", MODE_OFF).strip().lower()
+        if mode == MODE_OFF:
+            return None
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                cache_dir = Path(os.getenv("LLM_CACHE_DIR", ".llm_cache"))
+                max_mb = float(os.getenv("LLM_CACHE_MAX_MB", "500"))
+                _llm_cache = LLMResponseCache(cache_dir, mode=mode, max_bytes=int(max_mb * 1024 * 1024))
+                logger.info(f"LLM response cache: mode={mode}, dir={cache_dir}")
+    return _llm_cache
+
+
+def reset_llm_cache() -> None:
+    """Reset the singleton (for testing)."""
+    global _llm_cache
+    _llm_cache = None
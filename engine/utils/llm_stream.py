@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Streaming consumption of LLM output for run_agent
+ABOUTME: Appends chunks to the draft file, reports partial text and aborts degenerate generations early
+"""
+
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional
+
+from utils.output_validators import OutputValidator
+
+logger = logging.getLogger(__name__)
+
+# Early-abort thresholds are far looser than the final repetition validator
+# (10 / 3) so markdown tables and lists never trip them; they only catch
+# generations that have clearly fallen into a loop.
+ABORT_CONSECUTIVE_REPEATS = 50
+ABORT_PATTERN_REPEATS = 20
+REPETITION_WINDOW_WORDS = 400
+REPETITION_CHECK_CHARS = 1000
+
+
+def streaming_enabled() -> bool:
+    """Whether run_agent streams by default (LLM_STREAMING=true)."""
+    return os.getenv("LLM_STREAMING", "false").lower() == "true"
+
+
+class StreamAborted(ValueError):
+    """Raised when a streamed generation is abandoned as degenerate."""
+
+    def __init__(self, message: str, partial_text: str = ""):
+        super().__init__(message)
+        self.partial_text = partial_text
+
+
+# =========================================================================
+# Response stand-ins
+# =========================================================================
+# run_agent inspects candidates/parts/finish_reason before reading .text, so
+# the assembled stream mirrors the shape of a google.genai response.
+
+@dataclass
+class _StreamedPart:
+    text: str
+
+
+@dataclass
+class _StreamedContent:
+    parts: List[_StreamedPart]
+
+
+@dataclass
+class _StreamedCandidate:
+    content: _StreamedContent
+    finish_reason: Any = None
+
+
+@dataclass
+class StreamedResponse:
+    """The concatenated text of a streamed generation plus its final metadata."""
+
+    text: str
+    candidates: List[_StreamedCandidate] = field(default_factory=list)
+    usage_metadata: Any = None
+    chunk_count: int = 0
+
+
+class RepetitionGuard:
+    """
+    Incremental token-repetition check over the tail of a growing text.
+
+    Keeps only the last window_words words (approximately) and runs
+    OutputValidator.detect_token_repetition on them every check_every_chars
+    new characters, so each check costs the same no matter how long the
+    generation has become.
+    """
+
+    def __init__(
+        self,
+        max_consecutive_repeats: int = ABORT_CONSECUTIVE_REPEATS,
+        max_pattern_repeats: int = ABORT_PATTERN_REPEATS,
+        window_words: int = REPETITION_WINDOW_WORDS,
+        check_every_chars: int = REPETITION_CHECK_CHARS,
+    ):
+        self.max_consecutive_repeats = max_consecutive_repeats
+        self.max_pattern_repeats = max_pattern_repeats
+        self.window_words = max(window_words, 5 * max_pattern_repeats, max_consecutive_repeats)
+        self.check_every_chars = check_every_chars
+        # Words average well under 20 chars, so this tail always covers the window
+        self._tail_chars = self.window_words * 20
+        self._tail = ""
+        self._pending = 0
+
+    def feed(self, piece: str) -> Optional[str]:
+        """
+        Add newly generated text.
+
+        Returns:
+            Error message if the tail is degenerate, else None
+        """
+        self._tail = (self._tail + piece)[-self._tail_chars:]
+        self._pending += len(piece)
+        if self._pending < self.check_every_chars:
+            return None
+        self._pending = 0
+        return self._check(final=False)
+
+    def finish(self) -> Optional[str]:
+        """Check the tail once the stream has ended."""
+        return self._check(final=True)
+
+    def _check(self, final: bool) -> Optional[str]:
+        words = self._tail.split()
+        if not final and words and not self._tail[-1].isspace():
+            words = words[:-1]  # The last word may still be arriving
+        words = words[-self.window_words:]
+        if not words:
+            return None
+
+        result = OutputValidator.detect_token_repetition(
+            " ".join(words),
+            max_consecutive_repeats=self.max_consecutive_repeats,
+            max_pattern_repeats=self.max_pattern_repeats,
+        )
+        return None if result.is_valid else result.error_message
+
+
+def _chunk_text(chunk: Any) -> str:
+    """Text of one streamed chunk (chunks without text parts yield '')."""
+    try:
+        text = chunk.text
+    except ValueError:
+        text = None
+    if text:
+        return str(text)
+
+    parts = []
+    for candidate in getattr(chunk, "candidates", None) or []:
+        content = getattr(candidate, "content", None)
+        for part in getattr(content, "parts", None) or []:
+            if getattr(part, "text", None):
+                parts.append(part.text)
+    return "".join(parts)
+
+
+def consume_stream(
+    chunks: Iterable[Any],
+    save_to: Optional[Path] = None,
+    on_partial: Optional[Callable[[str], None]] = None,
+    progress_interval: float = 2.0,
+    guard: Optional[RepetitionGuard] = None,
+) -> StreamedResponse:
+    """
+    Drain a streamed generation into a single response.
+
+    Each chunk is appended to save_to as it arrives (the file is truncated
+    first), on_partial receives the text so far at most every
+    progress_interval seconds, and the repetition guard can abort the
+    stream before the rest of the token budget is spent.
+
+    Args:
+        chunks: Iterable of streamed response chunks
+        save_to: Optional file to append raw text to incrementally
+        on_partial: Optional callback receiving the accumulated text
+        progress_interval: Minimum seconds between on_partial calls
+        guard: Repetition guard (default: RepetitionGuard())
+
+    Returns:
+        StreamedResponse with the full text, last finish_reason and usage
+
+    Raises:
+        StreamAborted: If the guard detects a repetition loop
+    """
+    guard = guard or RepetitionGuard()
+    pieces: List[str] = []
+    length = 0
+    finish_reason = None
+    usage = None
+    chunk_count = 0
+    last_report = time.monotonic()
+
+    handle = None
+    if save_to:
+        save_to.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(save_to, "w", encoding="utf-8")
+
+    try:
+        for chunk in chunks:
+            chunk_count += 1
+            if getattr(chunk, "usage_metadata", None) is not None:
+                usage = chunk.usage_metadata
+            for candidate in getattr(chunk, "candidates", None) or []:
+                if getattr(candidate, "finish_reason", None) is not None:
+                    finish_reason = candidate.finish_reason
+
+            piece = _chunk_text(chunk)
+            if not piece:
+                continue
+            pieces.append(piece)
+            length += len(piece)
+
+            if handle:
+                handle.write(piece)
+                handle.flush()
+
+            error = guard.feed(piece)
+            if error:
+                raise StreamAborted(f"Generation aborted after {length:,} chars: {error}", partial_text="".join(pieces))
+
+            if on_partial and time.monotonic() - last_report >= progress_interval:
+                last_report = time.monotonic()
+                _report(on_partial, "".join(pieces))
+
+        error = guard.finish()
+        if error:
+            raise StreamAborted(f"Generation aborted after {length:,} chars: {error}", partial_text="".join(pieces))
+    finally:
+        if handle:
+            handle.close()
+
+    text = "".join(pieces)
+    if on_partial and text:
+        _report(on_partial, text)
+
+    parts = [_StreamedPart(text=text)] if text else []
+    candidate = _StreamedCandidate(content=_StreamedContent(parts=parts), finish_reason=finish_reason)
+    return StreamedResponse(text=text, candidates=[candidate], usage_metadata=usage, chunk_count=chunk_count)
+
+
+def _report(on_partial: Callable[[str], None], text: str) -> None:
+    """Progress reporting must never break generation."""
+    try:
+        on_partial(text)
+    except Exception as e:
+        logger.debug(f"Partial output callback failed: {e}")
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Shared concurrent page fetch stage for the citation title and metadata scrapers
+ABOUTME: Downloads each URL once with per-domain concurrency limits and politeness delays
+
+The title scraper and the metadata scraper both need the HTML of the same
+web-source URLs. PageFetcher downloads every unique URL once, in parallel
+across domains but politely within a domain, and hands out FetchedPage
+objects whose parsed soup is shared by all extractors.
+
+Usage:
+    pages = PageFetcher().fetch_all(urls)
+    title_scraper.scrape_citations(citations, pages=pages)
+    metadata_scraper.scrape_citations(citations, pages=pages)
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from itertools import zip_longest
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from bs4 import BeautifulSoup
+
+from utils.logging_config import get_logger
+from utils.perf_trace import traced_sleep
+from utils.retry import exponential_backoff_with_jitter
+
+logger = get_logger(__name__)
+
+DEFAULT_USER_AGENT = "Academic-Draft-AI/1.0 (Citation Metadata Scraper)"
+
+# Cap on the backoff between attempts at one URL
+MAX_RETRY_DELAY = 30.0
+
+
+@dataclass
+class FetchedPage:
+    """Result of fetching one URL; the parsed soup is built once and shared."""
+
+    url: str
+    content: Optional[bytes] = None
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+    _soup: Any = field(default=None, repr=False)
+    _soup_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        return self.content is not None
+
+    @property
+    def soup(self) -> Optional[BeautifulSoup]:
+        """Parsed HTML (None if the fetch failed)."""
+        if self.content is None:
+            return None
+        with self._soup_lock:
+            if self._soup is None:
+                self._soup = BeautifulSoup(self.content, 'html.parser')
+        return self._soup
+
+
+class PageFetcher:
+    """
+    Fetches many URLs concurrently, once each, with per-domain politeness.
+
+    At most max_workers requests are in flight overall and at most per_domain
+    to any one domain, and request starts to the same domain are spaced at
+    least domain_delay seconds apart. Timeouts, connection errors and 5xx
+    responses are retried up to max_attempts times with exponential backoff,
+    inside the URL's domain slot.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        per_domain: Optional[int] = None,
+        domain_delay: float = 1.0,
+        timeout: int = 10,
+        user_agent: str = DEFAULT_USER_AGENT,
+        session: Optional[requests.Session] = None,
+        max_attempts: int = 3,
+        retry_base_delay: float = 2.0,
+    ):
+        """
+        Initialize fetcher.
+
+        Args:
+            max_workers: Total concurrent requests (default: SCRAPE_MAX_WORKERS)
+            per_domain: Concurrent requests per domain (default: SCRAPE_PER_DOMAIN)
+            domain_delay: Minimum seconds between request starts to one domain
+            timeout: HTTP request timeout in seconds
+            user_agent: User agent string for requests
+            session: Session to reuse (a pooled session is created if None)
+            max_attempts: Attempts per URL for transient failures
+            retry_base_delay: First backoff in seconds (doubles per retry, capped at MAX_RETRY_DELAY)
+        """
+        if max_workers is None or per_domain is None:
+            from concurrency.concurrency_config import get_concurrency_config
+            config = get_concurrency_config(verbose=False)
+            max_workers = max_workers or config.scrape_max_workers
+            per_domain = per_domain or config.scrape_per_domain
+
+        self.max_workers = max(1, max_workers)
+        self.per_domain = max(1, per_domain)
+        self.domain_delay = domain_delay
+        self.timeout = timeout
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base_delay = retry_base_delay
+
+        if session is None:
+            session = requests.Session()
+            session.headers.update({'User-Agent': user_agent})
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.max_workers)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+
+        self._lock = threading.Lock()
+        self._domain_semaphores: Dict[str, threading.Semaphore] = {}
+        self._domain_next_start: Dict[str, float] = {}
+
+    @contextmanager
+    def _domain_slot(self, domain: str) -> Iterator[None]:
+        """Hold one of the domain's concurrency slots, honoring its delay."""
+        with self._lock:
+            semaphore = self._domain_semaphores.setdefault(domain, threading.Semaphore(self.per_domain))
+
+        with semaphore:
+            with self._lock:
+                now = time.monotonic()
+                start_at = max(now, self._domain_next_start.get(domain, now))
+                self._domain_next_start[domain] = start_at + self.domain_delay
+            traced_sleep(start_at - time.monotonic(), "scrape_domain_delay", domain=domain)
+            yield
+
+    def fetch(self, url: str) -> FetchedPage:
+        """Fetch a single URL, retrying transient failures (errors are captured on the page, never raised)."""
+        domain = urlparse(url).netloc.lower()
+        with self._domain_slot(domain):
+            for attempt in range(self.max_attempts):
+                page, transient = self._get(url)
+                if not transient or attempt + 1 >= self.max_attempts:
+                    return page
+                delay = exponential_backoff_with_jitter(attempt, self.retry_base_delay, MAX_RETRY_DELAY)
+                logger.debug(f"Retrying {url[:60]} in {delay:.1f}s after {page.error or page.status_code} "
+                             f"(attempt {attempt + 1}/{self.max_attempts})")
+                traced_sleep(delay, "scrape_retry_backoff", domain=domain)
+        return page
+
+    def _get(self, url: str) -> Tuple[FetchedPage, bool]:
+        """One attempt at a URL; returns the page and whether the failure is worth retrying."""
+        try:
+            response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
+            response.raise_for_status()
+            return FetchedPage(url=url, content=response.content, status_code=response.status_code), False
+        except requests.exceptions.Timeout:
+            logger.debug(f"Timeout fetching {url[:60]}")
+            return FetchedPage(url=url, error="timeout"), True
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Request error fetching {url[:60]}: {str(e)[:50]}")
+            status = getattr(getattr(e, 'response', None), 'status_code', None)
+            transient = isinstance(e, requests.exceptions.ConnectionError) or (status is not None and status >= 500)
+            return FetchedPage(url=url, status_code=status, error=str(e)[:200]), transient
+        except Exception as e:
+            logger.debug(f"Unexpected error fetching {url[:60]}: {str(e)[:50]}")
+            return FetchedPage(url=url, error=str(e)[:200]), False
+
+    def fetch_all(self, urls: Iterable[Optional[str]]) -> Dict[str, FetchedPage]:
+        """
+        Fetch every unique URL once.
+
+        Args:
+            urls: URLs to fetch (duplicates and empty values are ignored)
+
+        Returns:
+            Dict mapping each URL to its FetchedPage
+        """
+        unique = list(dict.fromkeys(u for u in urls if u))
+        if not unique:
+            return {}
+
+        # Round-robin across domains so one large domain cannot tie up every
+        # worker waiting for its own slots
+        by_domain: Dict[str, list] = {}
+        for url in unique:
+            by_domain.setdefault(urlparse(url).netloc.lower(), []).append(url)
+        ordered = [url for batch in zip_longest(*by_domain.values()) for url in batch if url]
+
+        logger.info(f"Fetching {len(unique)} pages ({self.max_workers} workers, {self.per_domain} per domain)")
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(unique))) as executor:
+            pages = dict(zip(ordered, executor.map(self.fetch, ordered)))
+
+        fetched = sum(1 for page in pages.values() if page.ok)
+        logger.info(f"Fetched {fetched}/{len(unique)} pages")
+        return {url: pages[url] for url in unique}
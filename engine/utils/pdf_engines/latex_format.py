@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Precompiled XeLaTeX formats for the Pandoc/LaTeX engine (dumped preambles)
+ABOUTME: Builds one .fmt per distinct preamble with mylatexformat and compiles drafts against it
+
+Most of a cold XeLaTeX run is spent loading the same packages (fontspec,
+titlesec, longtable, ...) for every draft. mylatexformat can dump everything
+before an \\endofdump marker into a format file; a document compiled with
+that format skips the dumped part of its preamble.
+
+The Pandoc preamble marks the split point with ENDOFDUMP_MARKER (a LaTeX
+comment, so documents compile unchanged without a format). Everything before
+it is hashed together with the XeLaTeX version to name the format, so a
+changed template, option or TeX install builds a new format instead of
+reusing a stale one.
+
+Configured from environment:
+    LATEX_FORMAT_CACHE: true (default) or false to always compile cold
+    LATEX_FORMAT_DIR: Format directory (default: ~/.cache/opendraft/latex)
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..perf_trace import CAT_EXPORT, span
+
+logger = logging.getLogger(__name__)
+
+# Split point in the generated preamble: everything before it goes into the format
+ENDOFDUMP_MARKER = "% opendraft:endofdump"
+
+FORMAT_PREFIX = "opendraft-"
+
+# XeLaTeX passes: first run writes the .toc, second typesets it, a third only if LaTeX asks
+MAX_RUNS = 3
+
+
+class LatexFormatCache:
+    """Builds and reuses dumped-preamble formats for one XeLaTeX binary."""
+
+    def __init__(self, cache_dir: Path, xelatex_path: str):
+        self.cache_dir = Path(cache_dir)
+        self.xelatex_path = xelatex_path
+        self._version: Optional[str] = None
+        self._lock = threading.Lock()
+        self._build_locks: Dict[str, threading.Lock] = {}
+
+    def is_available(self) -> bool:
+        """mylatexformat must be installed to dump a preamble."""
+        kpsewhich = shutil.which("kpsewhich")
+        if not kpsewhich:
+            return False
+        try:
+            result = subprocess.run([kpsewhich, "mylatexformat.ltx"], capture_output=True, text=True, timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return result.returncode == 0 and bool(result.stdout.strip())
+
+    def xelatex_version(self) -> str:
+        """First line of `xelatex --version`, part of every format key."""
+        if self._version is None:
+            try:
+                result = subprocess.run([self.xelatex_path, "--version"], capture_output=True, text=True, timeout=10)
+                self._version = result.stdout.splitlines()[0] if result.stdout else self.xelatex_path
+            except (OSError, subprocess.TimeoutExpired):
+                self._version = self.xelatex_path
+        return self._version
+
+    def format_name(self, preamble_prefix: str) -> str:
+        """Format name for a preamble prefix (the text before the marker)."""
+        digest = hashlib.sha256()
+        digest.update(self.xelatex_version().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(preamble_prefix.encode("utf-8"))
+        return FORMAT_PREFIX + digest.hexdigest()[:16]
+
+    def format_path(self, name: str) -> Path:
+        return self.cache_dir / f"{name}.fmt"
+
+    def ensure_format(self, preamble_prefix: str) -> Optional[str]:
+        """
+        Return the format name for a preamble prefix, dumping it on first use.
+
+        Args:
+            preamble_prefix: LaTeX source up to (not including) the marker
+
+        Returns:
+            Format name to pass as -fmt, or None if the dump failed
+        """
+        name = self.format_name(preamble_prefix)
+        if self.format_path(name).exists():
+            return name
+
+        with self._lock:
+            build_lock = self._build_locks.setdefault(name, threading.Lock())
+        with build_lock:
+            if self.format_path(name).exists():
+                return name
+            return name if self._dump_format(name, preamble_prefix) else None
+
+    def _dump_format(self, name: str, preamble_prefix: str) -> bool:
+        """Dump a preamble into cache_dir/<name>.fmt (atomic; safe across processes)."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=self.cache_dir) as build_dir:
+            source = Path(build_dir) / "preamble.tex"
+            source.write_text(preamble_prefix + "\\endofdump\n", encoding="utf-8")
+            cmd = [
+                self.xelatex_path, "-ini", "-interaction=nonstopmode", "-halt-on-error",
+                f"-jobname={name}", "&xelatex", "mylatexformat.ltx", source.name,
+            ]
+            try:
+                with span("latex_dump_format", CAT_EXPORT, format=name):
+                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=180, cwd=build_dir)
+            except (OSError, subprocess.TimeoutExpired) as e:
+                logger.warning(f"Could not dump LaTeX format {name}: {e}")
+                return False
+
+            built = Path(build_dir) / f"{name}.fmt"
+            if result.returncode != 0 or not built.exists():
+                logger.warning(f"Could not dump LaTeX format {name}: {result.stdout[-300:]}")
+                return False
+            os.replace(built, self.format_path(name))
+
+        logger.info(f"Dumped LaTeX format {name} to {self.cache_dir}")
+        return True
+
+    def compile(self, tex_file: Path, format_name: str, toc: bool) -> bool:
+        """
+        Compile a .tex file against a dumped format, writing <stem>.pdf next to it.
+
+        Args:
+            tex_file: Standalone LaTeX document containing \\endofdump
+            format_name: Name returned by ensure_format
+            toc: Whether the document has a table of contents (needs a second run)
+
+        Returns:
+            bool: True if XeLaTeX produced the PDF
+        """
+        env = dict(os.environ)
+        # Trailing separator keeps the default format search path after cache_dir
+        env["TEXFORMATS"] = f"{self.cache_dir}{os.pathsep}"
+        cmd = [
+            self.xelatex_path, f"-fmt={format_name}", "-interaction=nonstopmode", "-halt-on-error",
+            tex_file.name,
+        ]
+        log_file = tex_file.with_suffix(".log")
+
+        for run in range(1, MAX_RUNS + 1):
+            with span("xelatex_warm", CAT_EXPORT, output=tex_file.name, run=run):
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=180,
+                                        cwd=tex_file.parent, env=env)
+            if result.returncode != 0:
+                logger.warning(f"XeLaTeX with format {format_name} failed: {result.stdout[-300:]}")
+                return False
+            log = log_file.read_text(encoding="utf-8", errors="replace") if log_file.exists() else ""
+            if not (toc and run == 1) and "Rerun to get" not in log:
+                break
+
+        return tex_file.with_suffix(".pdf").exists()
+
+
+# Shared instances per XeLaTeX binary (None: mylatexformat missing)
+_format_caches: Dict[str, Optional[LatexFormatCache]] = {}
+_format_cache_lock = threading.Lock()
+
+
+def get_latex_format_cache(xelatex_path: Optional[str]) -> Optional[LatexFormatCache]:
+    """
+    Get the shared format cache, or None if formats are disabled or unsupported.
+
+    Configured from environment:
+        LATEX_FORMAT_CACHE: true (default), false
+        LATEX_FORMAT_DIR: Format directory (default: ~/.cache/opendraft/latex)
+    """
+    if not xelatex_path or os.getenv("LATEX_FORMAT_CACHE", "true").lower() == "false":
+        return None
+
+    with _format_cache_lock:
+        if xelatex_path not in _format_caches:
+            cache_dir = Path(os.getenv("LATEX_FORMAT_DIR", str(Path.home() / ".cache" / "opendraft" / "latex")))
+            cache = LatexFormatCache(cache_dir, xelatex_path)
+            if not cache.is_available():
+                logger.info("mylatexformat not installed - compiling LaTeX without a dumped preamble")
+                cache = None
+            _format_caches[xelatex_path] = cache
+        return _format_caches[xelatex_path]
+
+
+def reset_latex_format_cache():
+    """Reset the shared instances (for testing)."""
+    with _format_cache_lock:
+        _format_caches.clear()
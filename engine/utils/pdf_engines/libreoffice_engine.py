@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Optional
 
 from .base import PDFEngine, PDFGenerationOptions, EngineResult
+from ..perf_trace import CAT_EXPORT, span
 
 # Import DOCX generation from python-docx
 try:
@@ -318,12 +319,13 @@ class LibreOfficeEngine(PDFEngine):
                 str(docx_file)
             ]
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60  # 60 second timeout
-            )
+            with span("libreoffice_pdf", CAT_EXPORT, output=docx_file.name):
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=60  # 60 second timeout
+                )
 
             if result.returncode != 0:
                 return EngineResult(
@@ -4,15 +4,23 @@ ABOUTME: Pandoc/LaTeX-based PDF generation engine for academic papers
 ABOUTME: Professional typesetting using LaTeX with proper font rendering
 """
 
+import hashlib
+import logging
 import re
 import subprocess
 import shutil
+import threading
 import yaml
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 from .base import PDFEngine, PDFGenerationOptions, EngineResult
+from .latex_format import ENDOFDUMP_MARKER, get_latex_format_cache
+from ..perf_trace import CAT_EXPORT, span
+
+logger = logging.getLogger(__name__)
 
 
 class PandocLatexEngine(PDFEngine):
@@ -36,8 +44,16 @@ class PandocLatexEngine(PDFEngine):
     - xelatex (texlive-xetex)
     - texlive-latex-recommended (for additional packages)
     - fonts-noto-cjk (for CJK character support)
+
+    Optional:
+    - mylatexformat (texlive-latex-extra): dumps the package-loading part of
+      the preamble into a cached XeLaTeX format, see latex_format.py
     """
 
+    # Generated preambles by options hash (shared across instances and threads)
+    _preamble_cache: Dict[str, str] = {}
+    _preamble_cache_lock = threading.Lock()
+
     def get_name(self) -> str:
         """Get engine name."""
         return "Pandoc/LaTeX"
@@ -173,7 +189,10 @@ class PandocLatexEngine(PDFEngine):
                 f.write(latex_preamble)
 
             # Convert markdown to PDF using Pandoc + LaTeX (use normalized temp file)
-            result = self._run_pandoc(temp_md, output_pdf, preamble_path, options)
+            # Prefer XeLaTeX with the dumped preamble; compile cold if that is unavailable or fails
+            result = self._run_pandoc_warm(temp_md, output_pdf, preamble_path, options)
+            if result is None:
+                result = self._run_pandoc(temp_md, output_pdf, preamble_path, options)
 
             # Cleanup preamble file
             if preamble_path.exists():
@@ -199,6 +218,35 @@ class PandocLatexEngine(PDFEngine):
             )
 
     def _create_latex_preamble(self, options: PDFGenerationOptions, md_content: str = "") -> str:
+        """
+        Create LaTeX preamble for header customization, cached by options hash.
+
+        The preamble depends only on the options (and today's date when the
+        options carry none), so repeated exports reuse the generated text.
+
+        Args:
+            options: PDF generation options
+            md_content: Markdown content (for YAML metadata extraction)
+
+        Returns:
+            str: LaTeX preamble content
+        """
+        key_source = repr(sorted(asdict(options).items()))
+        if not (options.date or getattr(options, 'submission_date', None)):
+            key_source += datetime.now().strftime('%Y-%m-%d')
+        key = hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+
+        with self._preamble_cache_lock:
+            cached = self._preamble_cache.get(key)
+        if cached is not None:
+            return cached
+
+        preamble = self._build_latex_preamble(options, md_content)
+        with self._preamble_cache_lock:
+            self._preamble_cache[key] = preamble
+        return preamble
+
+    def _build_latex_preamble(self, options: PDFGenerationOptions, md_content: str = "") -> str:
         """
         Create LaTeX preamble for header customization.
 
@@ -287,7 +335,9 @@ class PandocLatexEngine(PDFEngine):
 \let\oldlongtable\longtable
 \let\endoldlongtable\endlongtable
 \renewenvironment{longtable}{\small\oldlongtable}{\endoldlongtable}
-'''
+
+% Everything above is package loading shared by all drafts (dumped into the cached format)
+''' + ENDOFDUMP_MARKER + '\n'
 
         # Add APA 7th edition title page formatting if metadata provided
         # ORIGINAL APPROACH: Use titling package to customize Pandoc's template
@@ -429,6 +479,138 @@ class PandocLatexEngine(PDFEngine):
 
         return preamble
 
+    def _pandoc_command(
+        self,
+        md_file: Path,
+        output_path: Path,
+        preamble_path: Path,
+        options: PDFGenerationOptions
+    ) -> List[str]:
+        """
+        Build the Pandoc command line (output format follows output_path: .pdf or .tex).
+
+        Args:
+            md_file: Input markdown file
+            output_path: Output PDF (or standalone .tex) path
+            preamble_path: LaTeX preamble path
+            options: Generation options
+
+        Returns:
+            list: Pandoc argv
+        """
+        # Pandoc command with default template + custom preamble
+        # This is more robust than a full custom template
+        # Use absolute paths to avoid any path resolution issues
+        margin = options.margins.replace('in', 'in').replace('cm', 'cm')
+
+        # Find xelatex path (may not be in PATH)
+        xelatex_path = self._find_xelatex()
+
+        cmd = [
+            'pandoc',
+            str(md_file.resolve()),
+            '-o', str(output_path.resolve()),
+            f'--pdf-engine={xelatex_path}',  # Use XeLaTeX for full Unicode support
+            '--include-in-header', str(preamble_path.resolve()),
+            '--from', 'markdown+autolink_bare_uris+raw_tex',
+            '--variable', f'geometry:margin={margin}',
+            '--variable', f'fontsize={options.font_size}',
+            '--variable', 'papersize:letter',
+            '--variable', 'documentclass:article',
+        ]
+
+        # Add title page metadata if provided
+        if options.title:
+            cmd.extend(['--variable', f'title={options.title}'])
+        if options.author:
+            cmd.extend(['--variable', f'author={options.author}'])
+        if options.date:
+            cmd.extend(['--variable', f'date={options.date}'])
+
+        # Add institutional metadata for professional cover page
+        if options.institution:
+            cmd.extend(['--variable', f'institution={options.institution}'])
+        if options.department:
+            cmd.extend(['--variable', f'department={options.department}'])
+        if options.course:
+            cmd.extend(['--variable', f'course={options.course}'])
+        if options.instructor:
+            cmd.extend(['--variable', f'instructor={options.instructor}'])
+
+        # Add table of contents if enabled
+        if options.enable_toc:
+            cmd.append('--toc')
+            cmd.extend(['--variable', f'toc-depth={options.toc_depth}'])
+            cmd.extend(['--variable', 'toc-title=Table of Contents'])
+
+        # NOTE: Do NOT use --number-sections because draft markdown files
+        # typically have manual section numbering embedded (e.g., "2.1 The Evolution...")
+        # Using --number-sections would create duplicates like "1.1 2.1 The Evolution..."
+
+        return cmd
+
+    def _run_pandoc_warm(
+        self,
+        md_file: Path,
+        output_pdf: Path,
+        preamble_path: Path,
+        options: PDFGenerationOptions
+    ) -> Optional[EngineResult]:
+        """
+        Convert via standalone LaTeX and XeLaTeX with a dumped preamble format.
+
+        Pandoc writes the .tex it would otherwise typeset itself; the part of
+        its preamble before ENDOFDUMP_MARKER comes from the cached format, so
+        XeLaTeX skips package and font loading.
+
+        Args:
+            md_file: Input markdown file
+            output_pdf: Output PDF path
+            preamble_path: LaTeX preamble path
+            options: Generation options
+
+        Returns:
+            EngineResult on success, None to fall back to a cold Pandoc run
+        """
+        format_cache = get_latex_format_cache(self._find_xelatex())
+        if format_cache is None:
+            return None
+
+        tex_file = output_pdf.with_suffix('.tex').resolve()
+        try:
+            cmd = self._pandoc_command(md_file, tex_file, preamble_path, options)
+            cmd.append('--standalone')
+            with span("pandoc_tex", CAT_EXPORT, output=tex_file.name):
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=180, cwd=output_pdf.parent)
+            if result.returncode != 0 or not tex_file.exists():
+                return None
+
+            tex = tex_file.read_text(encoding='utf-8')
+            marker = tex.find(ENDOFDUMP_MARKER)
+            if marker == -1:
+                return None
+
+            format_name = format_cache.ensure_format(tex[:marker])
+            if format_name is None:
+                return None
+
+            tex_file.write_text(tex[:marker] + '\\endofdump' + tex[marker + len(ENDOFDUMP_MARKER):], encoding='utf-8')
+            if not format_cache.compile(tex_file, format_name, toc=options.enable_toc):
+                return None
+
+            return EngineResult(
+                success=True,
+                engine_name=self.get_name(),
+                output_path=output_pdf
+            )
+
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"Warm LaTeX compile failed, compiling cold: {e}")
+            return None
+        finally:
+            if tex_file.exists():
+                tex_file.unlink()
+
     def _run_pandoc(
         self,
         md_file: Path,
@@ -451,63 +633,17 @@ class PandocLatexEngine(PDFEngine):
             EngineResult with success/failure
         """
         try:
-            # Pandoc command with default template + custom preamble
-            # This is more robust than a full custom template
-            # Use absolute paths to avoid any path resolution issues
-            margin = options.margins.replace('in', 'in').replace('cm', 'cm')
-
-            # Find xelatex path (may not be in PATH)
-            xelatex_path = self._find_xelatex()
-
-            cmd = [
-                'pandoc',
-                str(md_file.resolve()),
-                '-o', str(output_pdf.resolve()),
-                f'--pdf-engine={xelatex_path}',  # Use XeLaTeX for full Unicode support
-                '--include-in-header', str(preamble_path.resolve()),
-                '--from', 'markdown+autolink_bare_uris+raw_tex',
-                '--variable', f'geometry:margin={margin}',
-                '--variable', f'fontsize={options.font_size}',
-                '--variable', 'papersize:letter',
-                '--variable', 'documentclass:article',
-            ]
-
-            # Add title page metadata if provided
-            if options.title:
-                cmd.extend(['--variable', f'title={options.title}'])
-            if options.author:
-                cmd.extend(['--variable', f'author={options.author}'])
-            if options.date:
-                cmd.extend(['--variable', f'date={options.date}'])
-
-            # Add institutional metadata for professional cover page
-            if options.institution:
-                cmd.extend(['--variable', f'institution={options.institution}'])
-            if options.department:
-                cmd.extend(['--variable', f'department={options.department}'])
-            if options.course:
-                cmd.extend(['--variable', f'course={options.course}'])
-            if options.instructor:
-                cmd.extend(['--variable', f'instructor={options.instructor}'])
-
-            # Add table of contents if enabled
-            if options.enable_toc:
-                cmd.append('--toc')
-                cmd.extend(['--variable', f'toc-depth={options.toc_depth}'])
-                cmd.extend(['--variable', 'toc-title=Table of Contents'])
-
-            # NOTE: Do NOT use --number-sections because draft markdown files
-            # typically have manual section numbering embedded (e.g., "2.1 The Evolution...")
-            # Using --number-sections would create duplicates like "1.1 2.1 The Evolution..."
+            cmd = self._pandoc_command(md_file, output_pdf, preamble_path, options)
 
             # Run Pandoc
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=180,  # 3 minute timeout for LaTeX compilation
-                cwd=output_pdf.parent  # Run in output directory
-            )
+            with span("pandoc_pdf", CAT_EXPORT, output=output_pdf.name):
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=180,  # 3 minute timeout for LaTeX compilation
+                    cwd=output_pdf.parent  # Run in output directory
+                )
 
             if result.returncode != 0:
                 # Extract useful error message from LaTeX output
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Pipeline performance trace in Chrome trace-event JSON format
+ABOUTME: Records spans for phases, agents, LLM calls, API requests, throttling sleeps and exports
+
+The trace is written as trace.json next to checkpoint.json and can be opened
+in chrome://tracing or https://ui.perfetto.dev. Each span is a complete
+("X") event on the thread that ran it; spans opened in asyncio code use
+async ("b"/"e") events so concurrent coroutines on one thread do not nest.
+
+Usage:
+    from utils.perf_trace import span, traced_sleep
+
+    with span("research", CAT_PHASE):
+        ...
+    traced_sleep(2.0, "backoff")
+
+Disable with PERF_TRACE=false (spans then cost a single attribute check).
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TRACE_FILENAME = "trace.json"
+
+# Span categories
+CAT_PHASE = "phase"
+CAT_AGENT = "agent"
+CAT_LLM = "llm"
+CAT_API = "api"
+CAT_SLEEP = "sleep"
+CAT_EXPORT = "export"
+
+MAX_EVENTS = 200_000
+
+
+class PerfTracer:
+    """
+    Thread-safe collector of Chrome trace events.
+
+    Timestamps are microseconds since the tracer was created, so a trace
+    always starts at zero.
+    """
+
+    def __init__(self, enabled: bool = True, max_events: int = MAX_EVENTS):
+        self.enabled = enabled
+        self.max_events = max_events
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._events: List[Dict[str, Any]] = []
+        self._thread_names: Dict[int, str] = {}
+        self._async_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def _now_us(self) -> float:
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def _append(self, *events: Dict[str, Any]) -> None:
+        with self._lock:
+            if len(self._events) + len(events) > self.max_events:
+                self.dropped += len(events)
+                return
+            self._events.extend(events)
+            thread = threading.current_thread()
+            self._thread_names.setdefault(thread.ident, thread.name)
+
+    @contextmanager
+    def span(self, name: str, cat: str, async_track: bool = False, **args: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Time the enclosed block.
+
+        Yields the span's args dict so the block can attach results
+        (e.g. output size or cache hit) before the span closes.
+
+        Args:
+            name: Span name shown in the trace viewer
+            cat: Category (CAT_*)
+            async_track: Record as an async event (use inside coroutines)
+            **args: Extra key/values stored on the span
+        """
+        if not self.enabled:
+            yield args
+            return
+
+        start = self._now_us()
+        try:
+            yield args
+        except BaseException as e:
+            args["error"] = f"{type(e).__name__}: {str(e)[:200]}"
+            raise
+        finally:
+            self.add_span(name, cat, start, self._now_us(), args, async_track=async_track)
+
+    def add_span(
+        self,
+        name: str,
+        cat: str,
+        start_us: float,
+        end_us: float,
+        args: Optional[Dict[str, Any]] = None,
+        async_track: bool = False,
+    ) -> None:
+        """Record a span whose start and end were measured by the caller."""
+        if not self.enabled:
+            return
+        tid = threading.get_ident()
+        args = {k: v for k, v in (args or {}).items() if v is not None}
+
+        if async_track:
+            span_id = next(self._async_ids)
+            base = {"name": name, "cat": cat, "pid": self._pid, "tid": tid, "id": span_id}
+            self._append(
+                {**base, "ph": "b", "ts": start_us, "args": args},
+                {**base, "ph": "e", "ts": end_us},
+            )
+        else:
+            self._append({
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": start_us,
+                "dur": max(end_us - start_us, 0.0),
+                "pid": self._pid,
+                "tid": tid,
+                "args": args,
+            })
+
+    def add_span_seconds(self, name: str, cat: str, seconds: float, **args: Any) -> None:
+        """Record a span that just ended and lasted `seconds`."""
+        if not self.enabled:
+            return
+        end = self._now_us()
+        self.add_span(name, cat, end - seconds * 1e6, end, args)
+
+    def counter(self, name: str, **values: float) -> None:
+        """Record a counter sample (e.g. RSS memory)."""
+        if not self.enabled:
+            return
+        self._append({"name": name, "ph": "C", "ts": self._now_us(), "pid": self._pid, "args": values})
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Total seconds per category.
+
+        Spans of one category can overlap when they run in parallel, so a
+        total may exceed wall-clock time.
+        """
+        totals: Dict[str, float] = {}
+        open_async: Dict[int, Dict[str, Any]] = {}
+        with self._lock:
+            events = list(self._events)
+        for event in events:
+            if event["ph"] == "X":
+                totals[event["cat"]] = totals.get(event["cat"], 0.0) + event["dur"] / 1e6
+            elif event["ph"] == "b":
+                open_async[event["id"]] = event
+            elif event["ph"] == "e" and event["id"] in open_async:
+                begin = open_async.pop(event["id"])
+                totals[begin["cat"]] = totals.get(begin["cat"], 0.0) + (event["ts"] - begin["ts"]) / 1e6
+        return {cat: round(seconds, 3) for cat, seconds in sorted(totals.items())}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Trace in Chrome's JSON Object Format."""
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+            for tid, name in thread_names.items()
+        ]
+        return {
+            "traceEvents": metadata + events,
+            "displayTimeUnit": "ms",
+            "otherData": {"summary_seconds": self.summary(), "dropped_events": self.dropped},
+        }
+
+    def write(self, output_dir: Path) -> Optional[Path]:
+        """
+        Write trace.json into output_dir (next to checkpoint.json).
+
+        Returns:
+            Path written, or None if tracing is disabled or the write failed
+        """
+        if not self.enabled:
+            return None
+        path = Path(output_dir) / TRACE_FILENAME
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+            tmp_path.replace(path)
+            return path
+        except Exception as e:
+            logger.warning(f"Failed to write performance trace: {e}")
+            return None
+
+
+# =========================================================================
+# Process-wide tracer
+# =========================================================================
+
+_tracer: Optional[PerfTracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> PerfTracer:
+    """Get or create the process-wide tracer (disabled when PERF_TRACE=false)."""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = PerfTracer(enabled=os.getenv("PERF_TRACE", "true").lower() != "false")
+    return _tracer
+
+
+def reset_tracer() -> PerfTracer:
+    """Start a fresh trace (called at the start of each draft generation)."""
+    global _tracer
+    with _tracer_lock:
+        _tracer = None
+    return get_tracer()
+
+
+def span(name: str, cat: str, async_track: bool = False, **args: Any):
+    """Time a block on the process-wide tracer (see PerfTracer.span)."""
+    return get_tracer().span(name, cat, async_track=async_track, **args)
+
+
+def traced_sleep(seconds: float, name: str = "sleep", **args: Any) -> None:
+    """time.sleep that shows up in the trace as a CAT_SLEEP span."""
+    if seconds <= 0:
+        return
+    with span(name, CAT_SLEEP, seconds=round(seconds, 3), **args):
+        time.sleep(seconds)
+
+
+async def traced_async_sleep(seconds: float, name: str = "sleep", **args: Any) -> None:
+    """asyncio.sleep that shows up in the trace as a CAT_SLEEP span."""
+    if seconds <= 0:
+        return
+    with span(name, CAT_SLEEP, async_track=True, seconds=round(seconds, 3), **args):
+        await asyncio.sleep(seconds)
@@ -425,6 +425,34 @@ class ProgressTracker:
         except Exception as e:
             logger.warning(f"Activity log update failed: {e}")
 
+    def update_partial_output(self, stage: str, text: str, preview_chars: int = 500):
+        """
+        Report text streamed so far by an agent (callers throttle these calls).
+
+        Also sends a heartbeat, since streaming chapters are the longest operations.
+
+        Args:
+            stage: Agent stage producing the text (e.g. 'crafter_introduction')
+            text: Text generated so far
+            preview_chars: Length of the trailing preview stored for the frontend
+        """
+        self.send_heartbeat()
+        try:
+            self.supabase.table(self.table_name).update({
+                "progress_details": {
+                    "activity_log": self._activity_log,
+                    "partial_output": {
+                        "stage": stage,
+                        "words": len(text.split()),
+                        "preview": text[-preview_chars:],
+                    },
+                },
+                "updated_at": datetime.now().isoformat()
+            }).eq("id", self.record_id).execute()
+
+        except Exception as e:
+            logger.warning(f"Partial output update failed: {e}")
+
     def log_source_found(self, title: str, authors: List[str] = None, year: int = None, source_type: str = "paper", doi: str = None, url: str = None, verified: bool = True):
         """
         Log when a research source is found - appears in activity log AND source_data array.
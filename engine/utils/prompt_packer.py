@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Token-budget prompt packer for agent context (outline, earlier sections, citation lists)
+ABOUTME: Trims sections by priority to fit a budget, cutting list blocks at whole items
+
+Agent prompts combine several context blocks of very different value. Instead
+of cutting each block at a fixed character count, callers declare the blocks
+with a priority, a floor (min_tokens) and a cap (max_tokens), and the packer
+trims the least important blocks first until the whole context fits the
+budget. Token counts come from utils.token_counter.estimate_tokens (offline),
+so packing costs no API calls.
+
+Blocks can be plain text (trimmed at word boundaries, keeping the head, the
+tail or both ends) or lists of items (trimmed by dropping whole items from the
+end, so a citation entry is never cut in half). utils.text_relevance.rank_by_relevance
+orders items for such lists, most relevant to the query first.
+
+Usage:
+    packed = PromptPacker(budget_tokens=6000).pack([
+        PromptSection("outline", ctx.formatter_output, priority=3, max_tokens=750),
+        PromptSection("previous", ctx.results_output, priority=2, keep=KEEP_TAIL),
+        PromptSection("citations", items=entries, priority=1, min_tokens=2000),
+    ])
+    prompt = f"Outline:\\n{packed['outline']}\\n..."
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from utils.token_counter import estimate_tokens
+
+# Which part of a trimmed text block survives
+KEEP_HEAD = "head"
+KEEP_TAIL = "tail"
+KEEP_ENDS = "ends"
+
+TRUNCATION_MARK = "\n[... middle content truncated ...]\n"
+
+
+@dataclass
+class PromptSection:
+    """
+    One context block of a prompt.
+
+    Attributes:
+        name: Key of the packed text in the result
+        text: Block text (ignored when items is given)
+        priority: Higher priorities are trimmed last
+        min_tokens: Never trimmed below this (unless the block is smaller)
+        max_tokens: Cap applied even when the budget has room
+        keep: KEEP_HEAD, KEEP_TAIL or KEEP_ENDS for text blocks
+        items: List block; trimmed by dropping whole items from the end
+        separator: Joins list items
+    """
+    name: str
+    text: str = ""
+    priority: int = 0
+    min_tokens: int = 0
+    max_tokens: Optional[int] = None
+    keep: str = KEEP_HEAD
+    items: Optional[Sequence[str]] = None
+    separator: str = ""
+
+
+@dataclass
+class PackedPrompt:
+    """Packed text per section, plus how many list items each list block kept."""
+    texts: Dict[str, str] = field(default_factory=dict)
+    items_kept: Dict[str, int] = field(default_factory=dict)
+    tokens: Dict[str, int] = field(default_factory=dict)
+
+    def __getitem__(self, name: str) -> str:
+        return self.texts[name]
+
+    @property
+    def total_tokens(self) -> int:
+        return sum(self.tokens.values())
+
+
+class PromptPacker:
+    """Fits prompt sections into a token budget, trimming low-priority sections first."""
+
+    def __init__(self, budget_tokens: int, count_tokens: Callable[[str], int] = estimate_tokens):
+        self.budget_tokens = budget_tokens
+        self.count_tokens = count_tokens
+
+    def pack(self, sections: Iterable[PromptSection]) -> PackedPrompt:
+        """
+        Allocate the budget across sections and trim each to its allocation.
+
+        Every section first asks for its full size (up to max_tokens). If that
+        exceeds the budget, the lowest-priority sections give tokens back, down
+        to their min_tokens, until the total fits; sections of equal priority
+        give back in proportion to their size above the floor. Floors are
+        never violated, so a budget below the sum of floors is exceeded rather
+        than starving a section the caller marked as essential.
+
+        Args:
+            sections: Prompt sections
+
+        Returns:
+            PackedPrompt with the trimmed text of every section
+        """
+        sections = list(sections)
+        wanted = {}
+        for section in sections:
+            size = self.count_tokens(self._full_text(section))
+            wanted[section.name] = size if section.max_tokens is None else min(size, section.max_tokens)
+
+        overflow = sum(wanted.values()) - self.budget_tokens
+        for priority in sorted({section.priority for section in sections}):
+            if overflow <= 0:
+                break
+            group = [section for section in sections if section.priority == priority]
+            overflow = self._shrink(group, wanted, overflow)
+
+        packed = PackedPrompt()
+        for section in sections:
+            if section.items is not None:
+                kept = self._fit_items(section.items, wanted[section.name], section.separator)
+                packed.items_kept[section.name] = kept
+                text = section.separator.join(section.items[:kept])
+            else:
+                text = self._fit_text(section.text, wanted[section.name], section.keep)
+            packed.texts[section.name] = text
+            packed.tokens[section.name] = self.count_tokens(text)
+        return packed
+
+    @staticmethod
+    def _shrink(group: List[PromptSection], wanted: Dict[str, int], overflow: int) -> int:
+        """Cut equal-priority sections in proportion to their room above the floor."""
+        room = {s.name: wanted[s.name] - min(s.min_tokens, wanted[s.name]) for s in group}
+        total_room = sum(room.values())
+        if total_room <= overflow:
+            for name, tokens in room.items():
+                wanted[name] -= tokens
+            return overflow - total_room
+
+        remaining = overflow
+        for section in group:
+            cut = min(room[section.name], overflow * room[section.name] // total_room)
+            wanted[section.name] -= cut
+            remaining -= cut
+        # Rounding leftovers come off the later sections
+        for section in reversed(group):
+            cut = min(remaining, wanted[section.name] - min(section.min_tokens, wanted[section.name]))
+            wanted[section.name] -= cut
+            remaining -= cut
+        return 0
+
+    @staticmethod
+    def _full_text(section: PromptSection) -> str:
+        if section.items is not None:
+            return section.separator.join(section.items)
+        return section.text
+
+    def _fit_items(self, items: Sequence[str], tokens: int, separator: str) -> int:
+        """Number of leading items that fit in a token allocation."""
+        used = 0
+        separator_tokens = self.count_tokens(separator) if separator else 0
+        for kept, item in enumerate(items):
+            used += self.count_tokens(item) + (separator_tokens if kept else 0)
+            if used > tokens:
+                return kept
+        return len(items)
+
+    def _fit_text(self, text: str, tokens: int, keep: str) -> str:
+        """Trim text to a token allocation at word boundaries."""
+        if not text or self.count_tokens(text) <= tokens:
+            return text
+        if tokens <= 0:
+            return ""
+
+        if keep == KEEP_ENDS:
+            mark_tokens = self.count_tokens(TRUNCATION_MARK)
+            half = max(0, (tokens - mark_tokens) // 2)
+            return (self._fit_text(text, half, KEEP_HEAD) + TRUNCATION_MARK
+                    + self._fit_text(text, half, KEEP_TAIL))
+
+        # Estimate the character count from the text's own chars-per-token ratio,
+        # then shrink until the counter agrees
+        chars = int(len(text) * tokens / self.count_tokens(text))
+        while True:
+            piece = _cut(text, chars, keep)
+            if chars <= 0 or self.count_tokens(piece) <= tokens:
+                return piece
+            chars = int(chars * 0.9)
+
+
+def _cut(text: str, chars: int, keep: str) -> str:
+    """First (or last) chars of text, backed off to a whitespace boundary."""
+    if chars <= 0:
+        return ""
+    if keep == KEEP_TAIL:
+        piece = text[-chars:]
+        if text[-chars - 1:-chars].isspace():
+            return piece
+        match = re.search(r"\s", piece)
+        return piece[match.end():] if match and match.start() < len(piece) // 2 else piece
+    piece = text[:chars]
+    if text[chars:chars + 1].isspace():
+        return piece
+    boundary = max(piece.rfind(" "), piece.rfind("\n"))
+    return piece[:boundary] if boundary > len(piece) // 2 else piece
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Precompiled regex rewrite rules for whole-document cleanup passes
+ABOUTME: Literal prefilter and anchored matching; output identical to sequential re.sub calls
+
+Cleanup passes (text_cleanup.apply_full_cleanup, text_utils.clean_ai_language)
+run dozens of rules in a fixed order, each over the whole draft. With plain
+re.sub every rule costs a full regex scan, even when it cannot match, and
+patterns starting with \\b or compiled with IGNORECASE get no literal-prefix
+speedup from the re engine.
+
+Each RewriteRule is compiled once and analysed from its parsed pattern:
+
+- literal: the longest literal run every match contains. If the current text
+  does not contain it, the rule is skipped without running the regex.
+- anchor: the literal every match starts with (after zero-width assertions
+  such as \\b). Matches can only start where the anchor occurs, so when it
+  occurs rarely the regex is tried at those positions only, with str.find
+  doing the scanning.
+
+Rules still run one after another on the current text, so later rules see
+earlier rules' output exactly as with sequential re.sub calls. Merging all
+rules into a single alternation would not preserve that: once
+"Furthermore, Moreover, X" loses "Furthermore, ", the next filler rule must
+see "Moreover, " at the sentence start.
+
+Usage:
+    RULES = [RewriteRule(r"\\bin order to\\b", "to", re.IGNORECASE), ...]
+
+    doc = RewriteDocument(text)
+    for rule in RULES:
+        doc.sub(rule)
+    text, counts = doc.text, doc.rule_counts
+"""
+
+import re
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_parse as _sre_parse
+
+Replacement = Union[str, Callable[[re.Match], str]]
+
+# Above this many anchor occurrences a full regex scan is cheaper than
+# trying the regex at each occurrence from Python
+MAX_ANCHOR_CANDIDATES = 2000
+
+# Characters that re.IGNORECASE matches to ASCII letters but that str.lower()
+# does not map to those letters one-to-one. Folded before lowering so the
+# prefilter never hides a match and positions stay aligned with the text.
+_IGNORECASE_FOLDS = (("İ", "i"), ("ı", "i"), ("ſ", "s"))
+
+_ZERO_WIDTH_OPS = (_sre_parse.AT, _sre_parse.ASSERT, _sre_parse.ASSERT_NOT)
+
+
+def _parse(pattern: re.Pattern) -> Optional[list]:
+    try:
+        return list(_sre_parse.parse(pattern.pattern, pattern.flags))
+    except Exception:
+        return None
+
+
+def _casefold_literal(literal: str, pattern: re.Pattern) -> Optional[str]:
+    if not literal:
+        return None
+    return literal.lower() if pattern.flags & re.IGNORECASE else literal
+
+
+def required_literal(pattern: re.Pattern) -> Optional[str]:
+    """
+    Longest run of literal characters at the top level of a pattern.
+
+    Every match contains this run, so a text without it cannot match.
+    Lowercased for IGNORECASE patterns. None if there is no such run (or the
+    pattern cannot be inspected), meaning the rule always runs.
+    """
+    items = _parse(pattern)
+    if items is None:
+        return None
+
+    best, run = "", []
+    for op, av in items + [(None, None)]:
+        if op is _sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+    return _casefold_literal(best, pattern)
+
+
+def anchor_literal(pattern: re.Pattern) -> Optional[str]:
+    """
+    Literal that every match starts with, after leading zero-width assertions.
+
+    Lowercased for IGNORECASE patterns. None if matches can start otherwise.
+    """
+    items = _parse(pattern)
+    if items is None:
+        return None
+
+    position = 0
+    while position < len(items) and items[position][0] in _ZERO_WIDTH_OPS:
+        position += 1
+    run = []
+    while position < len(items) and items[position][0] is _sre_parse.LITERAL:
+        run.append(chr(items[position][1]))
+        position += 1
+    return _casefold_literal("".join(run), pattern)
+
+
+class RewriteRule:
+    """One compiled substitution with its prefilter and anchor literals."""
+
+    __slots__ = ("name", "regex", "replacement", "literal", "anchor", "ignore_case")
+
+    def __init__(self, pattern: str, replacement: Replacement = "", flags: int = 0, name: Optional[str] = None):
+        self.regex = re.compile(pattern, flags)
+        self.replacement = replacement
+        self.name = name or pattern
+        self.literal = required_literal(self.regex)
+        self.anchor = anchor_literal(self.regex)
+        self.ignore_case = bool(self.regex.flags & re.IGNORECASE)
+
+    def __repr__(self) -> str:
+        return f"RewriteRule({self.name!r})"
+
+
+class RewriteDocument:
+    """
+    A text being rewritten by a sequence of rules.
+
+    text changes only when a rule actually changes it, so callers can detect
+    "this rule changed the text" with an identity check on doc.text.
+    rule_counts maps rule name to the number of matches replaced.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.rule_counts: Dict[str, int] = {}
+        self.rules_skipped = 0
+        self._lowered: Optional[str] = None
+
+    def sub(self, rule: RewriteRule) -> int:
+        """Apply a rule to the whole text. Returns the number of matches replaced."""
+        new_text, count = self.subn(rule, rule.replacement)
+        self.record(rule, new_text, count)
+        return count
+
+    def subn(self, rule: RewriteRule, replacement: Replacement) -> Tuple[str, int]:
+        """Like rule.regex.subn on the current text, without committing the result (see record)."""
+        haystack = self._haystack(rule)
+        if haystack is not None and rule.literal is not None and rule.literal not in haystack:
+            self.rules_skipped += 1
+            return self.text, 0
+
+        if (
+            rule.anchor is not None
+            and haystack is not None
+            and len(haystack) == len(self.text)
+            and haystack.count(rule.anchor) <= MAX_ANCHOR_CANDIDATES
+        ):
+            return self._anchored_subn(rule, replacement, haystack)
+        return rule.regex.subn(replacement, self.text)
+
+    def record(self, rule: RewriteRule, new_text: str, count: int) -> None:
+        """Commit the result of a rule."""
+        if count:
+            self.rule_counts[rule.name] = self.rule_counts.get(rule.name, 0) + count
+        if new_text != self.text:
+            self.text = new_text
+            self._lowered = None
+
+    def _haystack(self, rule: RewriteRule) -> Optional[str]:
+        """Text to search for the rule's literals (lowered for IGNORECASE rules)."""
+        if rule.literal is None and rule.anchor is None:
+            return None
+        if not rule.ignore_case:
+            return self.text
+        if self._lowered is None:
+            text = self.text
+            if not text.isascii():
+                for source, target in _IGNORECASE_FOLDS:
+                    if source in text:
+                        text = text.replace(source, target)
+            self._lowered = text.lower()
+        return self._lowered
+
+    def _anchored_subn(self, rule: RewriteRule, replacement: Replacement, haystack: str) -> Tuple[str, int]:
+        """
+        subn that tries the regex only where the anchor occurs.
+
+        Every match starts at an anchor occurrence and matches are non-empty,
+        so scanning occurrences left to right finds exactly the matches a
+        full scan finds. haystack is position-aligned with the text.
+        """
+        text, regex, anchor = self.text, rule.regex, rule.anchor
+        expand = callable(replacement) or "\\" in replacement
+        pieces: List[str] = []
+        last_end = 0
+        position = haystack.find(anchor)
+        while position != -1:
+            match = regex.match(text, position)
+            if match is None:
+                position = haystack.find(anchor, position + 1)
+                continue
+            pieces.append(text[last_end:match.start()])
+            if callable(replacement):
+                pieces.append(replacement(match))
+            else:
+                pieces.append(match.expand(replacement) if expand else replacement)
+            last_end = match.end()
+            position = haystack.find(anchor, last_end)
+
+        if not pieces:
+            return text, 0
+        pieces.append(text[last_end:])
+        return "".join(pieces), (len(pieces) - 1) // 2
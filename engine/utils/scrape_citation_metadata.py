@@ -10,19 +10,19 @@ Design Principles:
 - Defensive: Handles network errors, timeouts, malformed HTML gracefully
 - Intelligent: Uses multiple extraction strategies (meta tags, JSON-LD, microdata)
 - Accurate: Validates dates and author names against common patterns
-- Efficient: Reuses sessions from title scraper, respects rate limits
+- Efficient: Shares fetched pages with the title scraper, polite per-domain concurrency
 """
 
 import requests
 from bs4 import BeautifulSoup
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
-import time
 import re
 import json
 from datetime import datetime
 from utils.retry import retry_on_network_error
 from utils.logging_config import get_logger
+from utils.page_fetcher import FetchedPage, PageFetcher
 
 # Initialize logger for this module
 logger = get_logger(__name__)
@@ -109,75 +109,7 @@ class MetadataScraper:
                 response.raise_for_status()
                 soup = BeautifulSoup(response.content, 'html.parser')
 
-            # Strategy 1: Open Graph article:published_time
-            og_date = soup.find('meta', property='article:published_time')
-            if og_date and og_date.get('content'):
-                year = self._extract_year(og_date['content'])
-                if year:
-                    if self.verbose:
-                        logger.debug(f"Found Open Graph date: {year}")
-                    return year
-
-            # Strategy 2: pubdate meta tag
-            pubdate = soup.find('meta', attrs={'name': 'pubdate'})
-            if pubdate and pubdate.get('content'):
-                year = self._extract_year(pubdate['content'])
-                if year:
-                    if self.verbose:
-                        logger.debug(f"Found pubdate meta tag: {year}")
-                    return year
-
-            # Strategy 3: Dublin Core date
-            dc_date = soup.find('meta', attrs={'name': 'DC.date'})
-            if dc_date and dc_date.get('content'):
-                year = self._extract_year(dc_date['content'])
-                if year:
-                    if self.verbose:
-                        logger.debug(f"Found Dublin Core date: {year}")
-                    return year
-
-            # Strategy 4: JSON-LD structured data
-            json_ld_scripts = soup.find_all('script', type='application/ld+json')
-            for script in json_ld_scripts:
-                try:
-                    data = json.loads(script.string)
-                    # Handle array of objects
-                    if isinstance(data, list):
-                        for item in data:
-                            year = self._extract_year_from_jsonld(item)
-                            if year:
-                                if self.verbose:
-                                    logger.debug(f"Found JSON-LD date: {year}")
-                                return year
-                    else:
-                        year = self._extract_year_from_jsonld(data)
-                        if year:
-                            if self.verbose:
-                                logger.debug(f"Found JSON-LD date: {year}")
-                            return year
-                except (json.JSONDecodeError, AttributeError):
-                    continue
-
-            # Strategy 5: <time> tags
-            time_tags = soup.find_all('time', datetime=True)
-            for time_tag in time_tags:
-                year = self._extract_year(time_tag['datetime'])
-                if year:
-                    if self.verbose:
-                        logger.debug(f"Found time tag date: {year}")
-                    return year
-
-            # Strategy 6: URL path pattern (e.g., /2024/03/article-name)
-            year = self._extract_year_from_url(url)
-            if year:
-                if self.verbose:
-                    logger.warning(f"Using URL fallback date: {year}")
-                return year
-
-            if self.verbose:
-                logger.warning(f"No publication date found for {url[:60]}")
-
-            return None
+            return self.extract_publication_date(url, soup)
 
         except requests.exceptions.Timeout:
             if self.verbose:
@@ -222,67 +154,7 @@ class MetadataScraper:
                 response.raise_for_status()
                 soup = BeautifulSoup(response.content, 'html.parser')
 
-            authors = []
-
-            # Strategy 1: meta name="author"
-            author_tags = soup.find_all('meta', attrs={'name': 'author'})
-            for tag in author_tags:
-                if tag.get('content'):
-                    author_names = self._parse_author_string(tag['content'])
-                    authors.extend(author_names)
-
-            # Strategy 2: Open Graph article:author
-            og_authors = soup.find_all('meta', property='article:author')
-            for tag in og_authors:
-                if tag.get('content'):
-                    author_names = self._parse_author_string(tag['content'])
-                    authors.extend(author_names)
-
-            # Strategy 3: JSON-LD structured data
-            json_ld_scripts = soup.find_all('script', type='application/ld+json')
-            for script in json_ld_scripts:
-                try:
-                    data = json.loads(script.string)
-                    # Handle array of objects
-                    if isinstance(data, list):
-                        for item in data:
-                            author_names = self._extract_authors_from_jsonld(item)
-                            if author_names:
-                                authors.extend(author_names)
-                    else:
-                        author_names = self._extract_authors_from_jsonld(data)
-                        if author_names:
-                            authors.extend(author_names)
-                except (json.JSONDecodeError, AttributeError):
-                    continue
-
-            # Strategy 4: Dublin Core creator
-            dc_creators = soup.find_all('meta', attrs={'name': 'DC.creator'})
-            for tag in dc_creators:
-                if tag.get('content'):
-                    author_names = self._parse_author_string(tag['content'])
-                    authors.extend(author_names)
-
-            # Strategy 5: rel="author" links
-            author_links = soup.find_all('a', rel='author')
-            for link in author_links:
-                if link.get_text():
-                    author_names = self._parse_author_string(link.get_text())
-                    authors.extend(author_names)
-
-            # Remove duplicates and validate
-            authors = list(dict.fromkeys(authors))  # Preserve order, remove dupes
-            authors = [a for a in authors if self._is_valid_author(a)]
-
-            if authors:
-                if self.verbose:
-                    logger.info(f"Found authors: {', '.join(authors[:3])}{'...' if len(authors) > 3 else ''}")
-                return authors
-
-            if self.verbose:
-                logger.warning(f"No authors found for {url[:60]}")
-
-            return None
+            return self.extract_authors(url, soup)
 
         except requests.exceptions.Timeout:
             if self.verbose:
@@ -297,6 +169,160 @@ class MetadataScraper:
                 logger.error(f"Unexpected error scraping authors from {url[:60]}: {str(e)[:50]}", exc_info=True)
             return None
 
+    def extract_publication_date(self, url: str, soup: BeautifulSoup) -> Optional[int]:
+        """
+        Extract the publication year from already-parsed HTML.
+
+        Args:
+            url: Page URL (used for the URL-path fallback)
+            soup: Parsed HTML
+
+        Returns:
+            Publication year (int) or None if not found
+        """
+        # Strategy 1: Open Graph article:published_time
+        og_date = soup.find('meta', property='article:published_time')
+        if og_date and og_date.get('content'):
+            year = self._extract_year(og_date['content'])
+            if year:
+                if self.verbose:
+                    logger.debug(f"Found Open Graph date: {year}")
+                return year
+
+        # Strategy 2: pubdate meta tag
+        pubdate = soup.find('meta', attrs={'name': 'pubdate'})
+        if pubdate and pubdate.get('content'):
+            year = self._extract_year(pubdate['content'])
+            if year:
+                if self.verbose:
+                    logger.debug(f"Found pubdate meta tag: {year}")
+                return year
+
+        # Strategy 3: Dublin Core date
+        dc_date = soup.find('meta', attrs={'name': 'DC.date'})
+        if dc_date and dc_date.get('content'):
+            year = self._extract_year(dc_date['content'])
+            if year:
+                if self.verbose:
+                    logger.debug(f"Found Dublin Core date: {year}")
+                return year
+
+        # Strategy 4: JSON-LD structured data
+        json_ld_scripts = soup.find_all('script', type='application/ld+json')
+        for script in json_ld_scripts:
+            try:
+                data = json.loads(script.string)
+                # Handle array of objects
+                if isinstance(data, list):
+                    for item in data:
+                        year = self._extract_year_from_jsonld(item)
+                        if year:
+                            if self.verbose:
+                                logger.debug(f"Found JSON-LD date: {year}")
+                            return year
+                else:
+                    year = self._extract_year_from_jsonld(data)
+                    if year:
+                        if self.verbose:
+                            logger.debug(f"Found JSON-LD date: {year}")
+                        return year
+            except (json.JSONDecodeError, AttributeError):
+                continue
+
+        # Strategy 5: <time> tags
+        time_tags = soup.find_all('time', datetime=True)
+        for time_tag in time_tags:
+            year = self._extract_year(time_tag['datetime'])
+            if year:
+                if self.verbose:
+                    logger.debug(f"Found time tag date: {year}")
+                return year
+
+        # Strategy 6: URL path pattern (e.g., /2024/03/article-name)
+        year = self._extract_year_from_url(url)
+        if year:
+            if self.verbose:
+                logger.warning(f"Using URL fallback date: {year}")
+            return year
+
+        if self.verbose:
+            logger.warning(f"No publication date found for {url[:60]}")
+
+        return None
+
+    def extract_authors(self, url: str, soup: BeautifulSoup) -> Optional[List[str]]:
+        """
+        Extract author names from already-parsed HTML.
+
+        Args:
+            url: Page URL (for log messages)
+            soup: Parsed HTML
+
+        Returns:
+            List of author names or None if not found
+        """
+        authors = []
+
+        # Strategy 1: meta name="author"
+        author_tags = soup.find_all('meta', attrs={'name': 'author'})
+        for tag in author_tags:
+            if tag.get('content'):
+                author_names = self._parse_author_string(tag['content'])
+                authors.extend(author_names)
+
+        # Strategy 2: Open Graph article:author
+        og_authors = soup.find_all('meta', property='article:author')
+        for tag in og_authors:
+            if tag.get('content'):
+                author_names = self._parse_author_string(tag['content'])
+                authors.extend(author_names)
+
+        # Strategy 3: JSON-LD structured data
+        json_ld_scripts = soup.find_all('script', type='application/ld+json')
+        for script in json_ld_scripts:
+            try:
+                data = json.loads(script.string)
+                # Handle array of objects
+                if isinstance(data, list):
+                    for item in data:
+                        author_names = self._extract_authors_from_jsonld(item)
+                        if author_names:
+                            authors.extend(author_names)
+                else:
+                    author_names = self._extract_authors_from_jsonld(data)
+                    if author_names:
+                        authors.extend(author_names)
+            except (json.JSONDecodeError, AttributeError):
+                continue
+
+        # Strategy 4: Dublin Core creator
+        dc_creators = soup.find_all('meta', attrs={'name': 'DC.creator'})
+        for tag in dc_creators:
+            if tag.get('content'):
+                author_names = self._parse_author_string(tag['content'])
+                authors.extend(author_names)
+
+        # Strategy 5: rel="author" links
+        author_links = soup.find_all('a', rel='author')
+        for link in author_links:
+            if link.get_text():
+                author_names = self._parse_author_string(link.get_text())
+                authors.extend(author_names)
+
+        # Remove duplicates and validate
+        authors = list(dict.fromkeys(authors))  # Preserve order, remove dupes
+        authors = [a for a in authors if self._is_valid_author(a)]
+
+        if authors:
+            if self.verbose:
+                logger.info(f"Found authors: {', '.join(authors[:3])}{'...' if len(authors) > 3 else ''}")
+            return authors
+
+        if self.verbose:
+            logger.warning(f"No authors found for {url[:60]}")
+
+        return None
+
     def scrape_metadata(self, url: str) -> Tuple[Optional[int], Optional[List[str]]]:
         """
         Scrape both publication date and authors in one HTTP request.
@@ -315,11 +341,11 @@ class MetadataScraper:
 
             response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
             response.raise_for_status()
-            html_content = response.content.decode('utf-8', errors='ignore')
+            soup = BeautifulSoup(response.content, 'html.parser')
 
-            # Extract both date and authors from same HTML
-            year = self.scrape_publication_date(url, html_content)
-            authors = self.scrape_authors(url, html_content)
+            # Extract both date and authors from the same parsed HTML
+            year = self.extract_publication_date(url, soup)
+            authors = self.extract_authors(url, soup)
 
             return year, authors
 
@@ -328,13 +354,13 @@ class MetadataScraper:
                 logger.error(f"Metadata scraping failed for {url[:60]}: {str(e)[:50]}", exc_info=True)
             return None, None
 
-    def scrape_citations(
+    def select_citations(
         self,
         citations: List[Dict],
         filter_condition: Optional[callable] = None
-    ) -> Tuple[int, int]:
+    ) -> List[Dict]:
         """
-        Scrape metadata for multiple citations.
+        Pick the citations whose metadata needs scraping.
 
         Args:
             citations: List of citation dictionaries
@@ -342,7 +368,7 @@ class MetadataScraper:
                              (default: Gemini Grounded with bad metadata)
 
         Returns:
-            Tuple of (successful_count, failed_count)
+            Citations to scrape
         """
         if filter_condition is None:
             # Default: Gemini Grounded with domain-name authors or year == 2025
@@ -370,8 +396,28 @@ class MetadataScraper:
 
             filter_condition = default_filter
 
-        # Filter citations
-        to_scrape = [c for c in citations if filter_condition(c)]
+        return [c for c in citations if filter_condition(c)]
+
+    def scrape_citations(
+        self,
+        citations: List[Dict],
+        filter_condition: Optional[callable] = None,
+        pages: Optional[Dict[str, FetchedPage]] = None
+    ) -> Tuple[int, int]:
+        """
+        Scrape metadata for multiple citations.
+
+        Args:
+            citations: List of citation dictionaries
+            filter_condition: Optional function to filter which citations to scrape
+                             (default: Gemini Grounded with bad metadata)
+            pages: Pages already downloaded by a shared PageFetcher; URLs
+                   missing from it are fetched concurrently here
+
+        Returns:
+            Tuple of (successful_count, failed_count)
+        """
+        to_scrape = self.select_citations(citations, filter_condition)
 
         if not to_scrape:
             if self.verbose:
@@ -380,6 +426,16 @@ class MetadataScraper:
 
         logger.info(f"Scraping metadata for {len(to_scrape)} citations...")
 
+        pages = dict(pages or {})
+        missing = [safe_get(c, 'url') for c in to_scrape if safe_get(c, 'url') and safe_get(c, 'url') not in pages]
+        if missing:
+            fetcher = PageFetcher(
+                domain_delay=self.rate_limit_delay,
+                timeout=self.timeout,
+                session=self.session,
+            )
+            pages.update(fetcher.fetch_all(missing))
+
         success_count = 0
         fail_count = 0
 
@@ -398,8 +454,17 @@ class MetadataScraper:
                 logger.info(f"Processing citation [{i}/{len(to_scrape)}]: {citation_id}")
                 logger.debug(f"Old metadata: {old_year} - {old_authors}")
 
-            # Scrape metadata
-            year, authors = self.scrape_metadata(url)
+            # Extract metadata from the shared page
+            year, authors = None, None
+            page = pages.get(url)
+            if page is not None and page.ok:
+                try:
+                    soup = page.soup
+                    year = self.extract_publication_date(url, soup)
+                    authors = self.extract_authors(url, soup)
+                except Exception as e:
+                    if self.verbose:
+                        logger.error(f"Metadata scraping failed for {url[:60]}: {str(e)[:50]}", exc_info=True)
 
             # Update citation if we found new metadata
             updated = False
@@ -428,10 +493,6 @@ class MetadataScraper:
                 if self.verbose:
                     logger.warning(f"No improvement for {citation_id}")
 
-            # Rate limiting
-            if i < len(to_scrape):
-                time.sleep(self.rate_limit_delay)
-
         return success_count, fail_count
 
     def _extract_year(self, date_string: str) -> Optional[int]:
@@ -8,7 +8,7 @@ and update citation databases with accurate, descriptive titles.
 
 Design Principles:
 - Defensive: Handles network errors, timeouts, malformed HTML gracefully
-- Efficient: Uses connection pooling, respects rate limits
+- Efficient: Shares fetched pages with the metadata scraper, polite per-domain concurrency
 - Accurate: Extracts <title>, <meta> tags, fallback to <h1>
 """
 
@@ -16,9 +16,9 @@ import requests
 from bs4 import BeautifulSoup
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
-import time
 import re
 from utils.logging_config import get_logger
+from utils.page_fetcher import FetchedPage, PageFetcher
 from utils.retry import retry_on_network_error
 
 # Initialize logger for this module
@@ -101,56 +101,7 @@ class TitleScraper:
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Strategy 1: <title> tag
-            title_tag = soup.find('title')
-            if title_tag and title_tag.string:
-                title = title_tag.string.strip()
-                if self._is_valid_title(title):
-                    if self.verbose:
-                        logger.debug(f"Found title tag: {title[:60]}...")
-                    return self._clean_title(title)
-
-            # Strategy 2: Open Graph title
-            og_title = soup.find('meta', property='og:title')
-            if og_title and og_title.get('content'):
-                title = og_title['content'].strip()
-                if self._is_valid_title(title):
-                    if self.verbose:
-                        logger.debug(f"Found Open Graph title: {title[:60]}...")
-                    return self._clean_title(title)
-
-            # Strategy 3: Twitter Card title
-            twitter_title = soup.find('meta', attrs={'name': 'twitter:title'})
-            if twitter_title and twitter_title.get('content'):
-                title = twitter_title['content'].strip()
-                if self._is_valid_title(title):
-                    if self.verbose:
-                        logger.debug(f"Found Twitter Card title: {title[:60]}...")
-                    return self._clean_title(title)
-
-            # Strategy 4: First <h1> tag
-            h1_tag = soup.find('h1')
-            if h1_tag:
-                title = h1_tag.get_text().strip()
-                if self._is_valid_title(title):
-                    if self.verbose:
-                        logger.debug(f"Found H1 title: {title[:60]}...")
-                    return self._clean_title(title)
-
-            # Strategy 5: URL path (last resort)
-            parsed = urlparse(url)
-            path_title = parsed.path.rstrip('/').split('/')[-1]
-            if path_title and len(path_title) > 3:
-                title = path_title.replace('-', ' ').replace('_', ' ').title()
-                if self.verbose:
-                    logger.warning(f"Using URL fallback title: {title[:60]}...")
-                return self._clean_title(title)
-
-            if self.verbose:
-                logger.warning(f"No title found for {url[:60]}")
-
-            return None
+            return self.extract_title(url, soup)
 
         except requests.exceptions.Timeout:
             if self.verbose:
@@ -165,6 +116,67 @@ class TitleScraper:
                 logger.error(f"Unexpected error scraping {url[:60]}: {str(e)[:50]}", exc_info=True)
             return None
 
+    def extract_title(self, url: str, soup: BeautifulSoup) -> Optional[str]:
+        """
+        Extract the page title from already-parsed HTML.
+
+        Args:
+            url: Page URL (used for the URL-path fallback)
+            soup: Parsed HTML
+
+        Returns:
+            Page title or None if no usable title was found
+        """
+        # Strategy 1: <title> tag
+        title_tag = soup.find('title')
+        if title_tag and title_tag.string:
+            title = title_tag.string.strip()
+            if self._is_valid_title(title):
+                if self.verbose:
+                    logger.debug(f"Found title tag: {title[:60]}...")
+                return self._clean_title(title)
+
+        # Strategy 2: Open Graph title
+        og_title = soup.find('meta', property='og:title')
+        if og_title and og_title.get('content'):
+            title = og_title['content'].strip()
+            if self._is_valid_title(title):
+                if self.verbose:
+                    logger.debug(f"Found Open Graph title: {title[:60]}...")
+                return self._clean_title(title)
+
+        # Strategy 3: Twitter Card title
+        twitter_title = soup.find('meta', attrs={'name': 'twitter:title'})
+        if twitter_title and twitter_title.get('content'):
+            title = twitter_title['content'].strip()
+            if self._is_valid_title(title):
+                if self.verbose:
+                    logger.debug(f"Found Twitter Card title: {title[:60]}...")
+                return self._clean_title(title)
+
+        # Strategy 4: First <h1> tag
+        h1_tag = soup.find('h1')
+        if h1_tag:
+            title = h1_tag.get_text().strip()
+            if self._is_valid_title(title):
+                if self.verbose:
+                    logger.debug(f"Found H1 title: {title[:60]}...")
+                return self._clean_title(title)
+
+        # Strategy 5: URL path (last resort)
+        parsed = urlparse(url)
+        path_title = parsed.path.rstrip('/').split('/')[-1]
+        if path_title and len(path_title) > 3:
+            title = path_title.replace('-', ' ').replace('_', ' ').title()
+            if self.verbose:
+                logger.warning(f"Using URL fallback title: {title[:60]}...")
+            return self._clean_title(title)
+
+        if self.verbose:
+            logger.warning(f"No title found for {url[:60]}")
+
+        return None
+
     def _is_valid_title(self, title: str) -> bool:
         """
         Check if title is valid (not empty, not too short, not just a domain).
@@ -227,13 +239,13 @@ class TitleScraper:
 
         return title
 
-    def scrape_citations(
+    def select_citations(
         self,
         citations: List[Dict],
         filter_condition: Optional[callable] = None
-    ) -> Tuple[int, int]:
+    ) -> List[Dict]:
         """
-        Scrape titles for multiple citations.
+        Pick the citations whose titles need scraping.
 
         Args:
             citations: List of citation dictionaries
@@ -241,7 +253,7 @@ class TitleScraper:
                              (default: only Gemini Grounded with bad titles)
 
         Returns:
-            Tuple of (successful_count, failed_count)
+            Citations to scrape
         """
         if filter_condition is None:
             # Default: Gemini Grounded with domain-name titles
@@ -263,8 +275,28 @@ class TitleScraper:
                 )
             filter_condition = default_filter
 
-        # Filter citations
-        to_scrape = [c for c in citations if filter_condition(c)]
+        return [c for c in citations if filter_condition(c)]
+
+    def scrape_citations(
+        self,
+        citations: List[Dict],
+        filter_condition: Optional[callable] = None,
+        pages: Optional[Dict[str, FetchedPage]] = None
+    ) -> Tuple[int, int]:
+        """
+        Scrape titles for multiple citations.
+
+        Args:
+            citations: List of citation dictionaries
+            filter_condition: Optional function to filter which citations to scrape
+                             (default: only Gemini Grounded with bad titles)
+            pages: Pages already downloaded by a shared PageFetcher; URLs
+                   missing from it are fetched concurrently here
+
+        Returns:
+            Tuple of (successful_count, failed_count)
+        """
+        to_scrape = self.select_citations(citations, filter_condition)
 
         if not to_scrape:
             if self.verbose:
@@ -273,6 +305,16 @@ class TitleScraper:
 
         logger.info(f"Scraping titles for {len(to_scrape)} citations...")
 
+        pages = dict(pages or {})
+        missing = [safe_get(c, 'url') for c in to_scrape if safe_get(c, 'url') and safe_get(c, 'url') not in pages]
+        if missing:
+            fetcher = PageFetcher(
+                domain_delay=self.rate_limit_delay,
+                timeout=self.timeout,
+                session=self.session,
+            )
+            pages.update(fetcher.fetch_all(missing))
+
         success_count = 0
         fail_count = 0
 
@@ -286,8 +328,15 @@ class TitleScraper:
                 logger.info(f"Processing citation [{i}/{len(to_scrape)}]: {safe_get(citation, 'id')}")
                 logger.debug(f"Old title: '{safe_get(citation, 'title', 'N/A')}'")
 
-            # Scrape title
-            new_title = self.scrape_title(url)
+            # Extract title from the shared page
+            page = pages.get(url)
+            new_title = None
+            if page is not None and page.ok:
+                try:
+                    new_title = self.extract_title(url, page.soup)
+                except Exception as e:
+                    if self.verbose:
+                        logger.error(f"Unexpected error scraping {url[:60]}: {str(e)[:50]}", exc_info=True)
 
             if new_title:
                 if hasattr(citation, 'title'):
@@ -302,10 +351,6 @@ class TitleScraper:
                 if self.verbose:
                     logger.warning(f"Failed to scrape title for {safe_get(citation, 'id')}")
 
-            # Rate limiting
-            if i < len(to_scrape):
-                time.sleep(self.rate_limit_delay)
-
         return success_count, fail_count
 
 
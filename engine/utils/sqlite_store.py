@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Per-thread SQLite connections in WAL mode for the persistent stores
+ABOUTME: Shared by the citation cache, the verdict cache and the job queue
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+
+class SQLiteConnections:
+    """
+    One connection per thread to a SQLite database in WAL mode.
+
+    sqlite3 connections must not cross threads, so each thread opens its own
+    on first use; WAL lets those threads (and other processes) read while one
+    writes. The database's directory is created when the first connection
+    opens.
+
+    Usage:
+        connections = SQLiteConnections(Path("cache.db"), pragmas=["foreign_keys=ON"])
+        connections.get().execute("SELECT 1")
+        connections.close()
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        pragmas: Sequence[str] = (),
+        isolation_level: Optional[str] = "",
+        on_connect: Optional[Callable[[sqlite3.Connection], None]] = None,
+        timeout: float = 30.0,
+    ):
+        """
+        Args:
+            db_path: SQLite database file
+            pragmas: Extra PRAGMA statements (e.g. "foreign_keys=ON")
+            isolation_level: sqlite3 isolation level (None = autocommit)
+            on_connect: Called with each new connection after the pragmas; if it
+                        raises, the connection is closed and the error re-raised
+            timeout: Seconds to wait for a lock held by another connection
+        """
+        self.db_path = Path(db_path)
+        self.pragmas = ["journal_mode=WAL", "synchronous=NORMAL", *pragmas]
+        self.isolation_level = isolation_level
+        self.on_connect = on_connect
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def get(self) -> sqlite3.Connection:
+        """This thread's connection, opened on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self.db_path.parent and not self.db_path.parent.exists():
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=self.timeout, isolation_level=self.isolation_level)
+            for pragma in self.pragmas:
+                conn.execute(f"PRAGMA {pragma}")
+            self._local.conn = conn
+            if self.on_connect is not None:
+                try:
+                    self.on_connect(conn)
+                except Exception:
+                    self.close()
+                    raise
+        return conn
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
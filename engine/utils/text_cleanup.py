@@ -3,6 +3,8 @@ Deterministic text cleanup utilities.
 
 Ported from OpenDraft V2 - pure functions with zero external dependencies.
 Use apply_full_cleanup(text) for the complete 10-step cleanup pipeline.
+The patterns are compiled once into RewriteRules (utils.rewrite_rules), which
+skip rules whose required text does not occur in the draft.
 
 Usage:
     from utils.text_cleanup import apply_full_cleanup
@@ -10,11 +12,14 @@ Usage:
     result = apply_full_cleanup(draft_text)
     cleaned_text = result["text"]
     stats = result["stats"]  # {"fillers": 3, "vocab_diversified": 12, ...}
+    rules = result["rules"]  # {pattern: matches replaced} for rules that fired
 """
 
 import re
 from typing import Dict, List, Tuple, Any
 
+from utils.rewrite_rules import RewriteDocument, RewriteRule
+
 # =============================================================================
 # CLEANUP PATTERNS (all pure data, no dependencies)
 # =============================================================================
@@ -136,6 +141,66 @@ CLAIM_CALIBRATION = [
 ]
 
 
+# =============================================================================
+# COMPILED RULES (built once at import, applied in list order)
+# =============================================================================
+
+_FILLER_RULES = [RewriteRule(r"(?m)(^|\.\s+)" + pattern, r"\1", name=pattern) for pattern in FILLER_STARTS]
+_INTENSIFIER_RULE = RewriteRule(INTENSIFIERS.pattern, "", INTENSIFIERS.flags)
+_SYNONYM_RULES = [RewriteRule(p, r, re.IGNORECASE) for p, r in SYNONYM_CHAINS]
+_META_RULES = [RewriteRule(p) for p in META_PATTERNS]
+_VERBOSE_RULES = [RewriteRule(p, r, re.IGNORECASE) for p, r in VERBOSE_PHRASES]
+_THESIS_RULES = [RewriteRule(p, r, re.IGNORECASE) for p, r in THESIS_RESTATEMENTS]
+_VOCAB_RULES = [(RewriteRule(p, flags=re.IGNORECASE), synonyms) for p, synonyms in VOCAB_DIVERSITY]
+_CLAIM_RULES = [RewriteRule(p, r, re.IGNORECASE) for p, r in CLAIM_CALIBRATION]
+
+_REFERENCES_HEADING = re.compile(r"\n##\s+References\s*\n")
+_BLANK_LINES = re.compile(r"\n{3,}")
+_DOUBLE_SPACES = re.compile(r"  +")
+
+
+def _apply_stage(doc: RewriteDocument, rules: List[RewriteRule]) -> int:
+    """Apply rules in order. Returns how many of them changed the text."""
+    changed = 0
+    for rule in rules:
+        before = doc.text
+        doc.sub(rule)
+        if doc.text is not before:
+            changed += 1
+    return changed
+
+
+def _diversify(doc: RewriteDocument, rule: RewriteRule, synonyms: List[str]) -> int:
+    """
+    Rotate an overused word (more than 3 occurrences) through synonyms.
+
+    The first two occurrences are kept; occurrence k (k >= 2) becomes
+    synonyms[(k - 2) % len(synonyms)], with the original's case. One
+    substitution pass instead of rebuilding the string per match.
+    """
+    seen = 0
+
+    def replace(match: re.Match) -> str:
+        nonlocal seen
+        index = seen
+        seen += 1
+        if index < 2:
+            return match.group()
+        synonym = synonyms[(index - 2) % len(synonyms)]
+        # Preserve case
+        if match.group().istitle():
+            synonym = synonym.title()
+        elif match.group().isupper():
+            synonym = synonym.upper()
+        return synonym
+
+    new_text, count = doc.subn(rule, replace)
+    if count <= 3:  # Only diversify if overused (>3 occurrences)
+        return 0
+    doc.record(rule, new_text, count - 2)
+    return count - 2
+
+
 # =============================================================================
 # PURE FUNCTIONS (no external dependencies)
 # =============================================================================
@@ -154,6 +219,7 @@ def apply_full_cleanup(text: str) -> Dict[str, Any]:
         dict with:
             - "text": cleaned text
             - "stats": dict of cleanup counts
+            - "rules": dict of matches replaced per rule (rules that fired only)
     """
     stats = {
         "fillers": 0,
@@ -165,89 +231,51 @@ def apply_full_cleanup(text: str) -> Dict[str, Any]:
         "vocab_diversified": 0,
         "claims_calibrated": 0,
     }
+    doc = RewriteDocument(text)
 
     # 1. Strip filler transitions at sentence start
-    for pattern in FILLER_STARTS:
-        before = text
-        text = re.sub(
-            r"(?m)(^|\.\s+)" + pattern,
-            lambda m: m.group(1),
-            text,
-        )
-        if text != before:
-            stats["fillers"] += 1
+    stats["fillers"] = _apply_stage(doc, _FILLER_RULES)
 
     # 2. Remove empty intensifiers
-    text, n = INTENSIFIERS.subn(r"", text)
-    stats["intensifiers"] = n
+    stats["intensifiers"] = doc.sub(_INTENSIFIER_RULE)
 
     # 3. Collapse synonym chains
-    for pattern, replacement in SYNONYM_CHAINS:
-        before = text
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-        if text != before:
-            stats["synonyms"] += 1
+    stats["synonyms"] = _apply_stage(doc, _SYNONYM_RULES)
 
     # 4. Strip meta-commentary
-    for pattern in META_PATTERNS:
-        before = text
-        text = re.sub(pattern, "", text)
-        if text != before:
-            stats["meta"] += 1
+    stats["meta"] = _apply_stage(doc, _META_RULES)
 
     # 5. Compress verbose phrases
-    for pattern, replacement in VERBOSE_PHRASES:
-        before = text
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-        if text != before:
-            stats["verbose"] += 1
+    stats["verbose"] = _apply_stage(doc, _VERBOSE_RULES)
 
     # 6. Neutralize mid-document thesis restatements
-    for pattern, replacement in THESIS_RESTATEMENTS:
-        before = text
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-        if text != before:
-            stats["thesis"] += 1
+    stats["thesis"] = _apply_stage(doc, _THESIS_RULES)
 
     # 7. Vocabulary diversification
     # Rotates overused words through synonyms to increase lexical diversity
-    for pattern, synonyms in VOCAB_DIVERSITY:
-        matches = list(re.finditer(pattern, text, flags=re.IGNORECASE))
-        if len(matches) > 3:  # Only diversify if overused (>3 occurrences)
-            # Replace from end to preserve string positions
-            for i, match in enumerate(reversed(matches[2:])):
-                idx = len(matches) - 3 - i
-                synonym = synonyms[idx % len(synonyms)]
-                # Preserve case
-                if match.group().istitle():
-                    synonym = synonym.title()
-                elif match.group().isupper():
-                    synonym = synonym.upper()
-                text = text[:match.start()] + synonym + text[match.end():]
-                stats["vocab_diversified"] += 1
+    for rule, synonyms in _VOCAB_RULES:
+        stats["vocab_diversified"] += _diversify(doc, rule, synonyms)
 
     # 8. Claim calibration
     # Replaces overconfident claims with calibrated academic hedging
-    for pattern, replacement in CLAIM_CALIBRATION:
-        before = text
-        count = len(re.findall(pattern, text, flags=re.IGNORECASE))
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-        if text != before:
+    for rule in _CLAIM_RULES:
+        before = doc.text
+        count = doc.sub(rule)
+        if doc.text is not before:
             stats["claims_calibrated"] += count
 
+    text = doc.text
+
     # 9. Remove duplicate ## References headings (keep last one only)
-    refs_splits = re.split(r"\n##\s+References\s*\n", text)
+    refs_splits = _REFERENCES_HEADING.split(text)
     if len(refs_splits) > 2:
-        text = refs_splits[0]
-        for part in refs_splits[1:-1]:
-            text += "\n" + part
-        text += "\n## References\n" + refs_splits[-1]
+        text = "\n".join(refs_splits[:-1]) + "\n## References\n" + refs_splits[-1]
 
     # 10. Clean up double whitespace left by removals
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    text = re.sub(r"  +", " ", text)
+    text = _BLANK_LINES.sub("\n\n", text)
+    text = _DOUBLE_SPACES.sub(" ", text)
 
-    return {"text": text, "stats": stats}
+    return {"text": text, "stats": stats, "rules": doc.rule_counts}
 
 
 def ensure_authors_list(value) -> List[str]:
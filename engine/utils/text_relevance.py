@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Lexical relevance of texts to a query (term extraction, IDF ranking, term coverage)
+ABOUTME: Used to rank citations for Crafter prompts and to filter harvested API search results
+
+Both scores work on the same distinctive terms: lowercase words of three or
+more characters, minus words too common in academic prose to say anything
+about relevance. Everything is offline and deterministic.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Callable, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+_WORD = re.compile(r"[a-z][a-z0-9-]{2,}")
+
+# Words too common in academic prose to say anything about relevance
+_STOPWORDS = frozenset(
+    "the and for with that this from are was were been have has had its their these those which into "
+    "than then also such can may not but all any more most other some only between within about over "
+    "using used use based study studies paper research analysis results approach new two one".split()
+)
+
+
+def _terms(text: str) -> List[str]:
+    """Distinctive terms of a text, in order (repeats kept)."""
+    return [w for w in _WORD.findall(text.lower()) if w not in _STOPWORDS]
+
+
+def rank_by_relevance(items: Sequence[T], query: str, text_of: Callable[[T], str]) -> List[T]:
+    """
+    Order items by how well their text matches a query, most relevant first.
+
+    Scores are the IDF-weighted overlap between query terms and item terms, so
+    words shared by every item (e.g. the draft topic) count for little and
+    distinctive words decide the order. Ties keep the input order.
+
+    Args:
+        items: Items to rank (e.g. Citation objects)
+        query: What the prompt is about (topic, section focus, nearby text)
+        text_of: Text to match for an item (e.g. title + abstract)
+
+    Returns:
+        list: The same items, reordered
+    """
+    item_terms = [set(_terms(text_of(item))) for item in items]
+    if not items:
+        return []
+
+    document_frequency = Counter(term for terms in item_terms for term in terms)
+    query_terms = Counter(_terms(query))
+    total = len(items)
+
+    def score(index: int) -> float:
+        return sum(
+            math.log(1 + total / document_frequency[term]) * min(count, 3)
+            for term, count in query_terms.items()
+            if term in item_terms[index]
+        )
+
+    scores = [score(i) for i in range(total)]
+    order = sorted(range(total), key=lambda i: (-scores[i], i))
+    return [items[i] for i in order]
+
+
+def term_coverage(query: str, text: str) -> float:
+    """
+    Share of the query's distinctive terms that occur in text (0.0-1.0).
+
+    Plural "s" is ignored on both sides. A query without distinctive terms
+    covers every text (1.0).
+    """
+    query_terms = {term.rstrip("s") for term in _terms(query)}
+    if not query_terms:
+        return 1.0
+    text_terms = {term.rstrip("s") for term in _terms(text)}
+    return len(query_terms & text_terms) / len(query_terms)
@@ -162,6 +162,25 @@ def _count_fallback_tokens(text: str) -> int:
     return token_count
 
 
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap, offline token estimate for rate limiting and budgeting.
+
+    Uses the same 1 token ≈ 4 characters approximation as the fallback
+    counter but skips whitespace normalization, so it is safe to call on
+    every prompt without a network round-trip.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated token count (0 for empty text)
+    """
+    if not text:
+        return 0
+    return max(1, len(text) // 4)
+
+
 def estimate_tokens_in_messages(
     messages: list, model_name: str = "gemini-2.0-flash"
 ) -> int:
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: SQLite-backed persistent cache of citation validation verdicts
+ABOUTME: Stores DOI existence and URL status checks with TTLs so later drafts skip the network
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from utils.sqlite_store import SQLiteConnections
+
+logger = logging.getLogger(__name__)
+
+DAY_SECONDS = 24 * 60 * 60
+
+# Verdict kinds
+KIND_DOI = "doi"
+KIND_URL = "url"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    kind       TEXT NOT NULL,
+    key        TEXT NOT NULL,
+    verdict    TEXT NOT NULL,     -- JSON
+    checked_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (kind, key)
+);
+CREATE INDEX IF NOT EXISTS idx_verdicts_expires ON verdicts (expires_at);
+"""
+
+# SQLite's default limit on host parameters is 999
+_LOOKUP_CHUNK = 500
+
+
+class VerdictCache:
+    """
+    Persistent (kind, key) → verdict cache backed by SQLite in WAL mode.
+
+    Positive verdicts (DOI exists, URL reachable) live for ttl_seconds;
+    negative ones (DOI not found, URL 4xx/5xx) expire after
+    negative_ttl_seconds so a page that comes back is re-checked. Network
+    failures are never cached. Connections are per thread.
+
+    Usage:
+        cache = VerdictCache(Path(".citation_verdicts.db"))
+        cache.put(KIND_DOI, "10.1038/nature14539", {"exists": True}, positive=True)
+        cache.get_many(KIND_DOI, ["10.1038/nature14539"])
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        ttl_seconds: float = 30 * DAY_SECONDS,
+        negative_ttl_seconds: float = 7 * DAY_SECONDS,
+    ):
+        """
+        Initialize cache, creating the schema if needed.
+
+        Args:
+            db_path: SQLite database file
+            ttl_seconds: Lifetime of positive verdicts
+            negative_ttl_seconds: Lifetime of negative verdicts
+        """
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._connections = SQLiteConnections(self.db_path)
+
+        conn = self._conn()
+        with conn:
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        """Per-thread connection (sqlite3 connections must not cross threads)."""
+        return self._connections.get()
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        self._connections.close()
+
+    def get_many(self, kind: str, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up unexpired verdicts.
+
+        Returns:
+            Dict mapping each cached key to its verdict (misses are absent)
+        """
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Dict[str, Any]] = {}
+        now = time.time()
+        conn = self._conn()
+        for start in range(0, len(keys), _LOOKUP_CHUNK):
+            chunk = keys[start:start + _LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT key, verdict FROM verdicts WHERE kind = ? AND key IN ({placeholders}) AND expires_at > ?",
+                (kind, *chunk, now),
+            ).fetchall()
+            for key, verdict in rows:
+                found[key] = json.loads(verdict)
+        return found
+
+    def put(self, kind: str, key: str, verdict: Dict[str, Any], positive: bool) -> None:
+        """Insert or replace a single verdict."""
+        now = time.time()
+        ttl = self.ttl_seconds if positive else self.negative_ttl_seconds
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT INTO verdicts (kind, key, verdict, checked_at, expires_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (kind, key) DO UPDATE SET verdict = excluded.verdict, "
+                "checked_at = excluded.checked_at, expires_at = excluded.expires_at",
+                (kind, key, json.dumps(verdict), now, now + ttl),
+            )
+
+    def purge_expired(self) -> int:
+        """Delete expired verdicts. Returns the number removed."""
+        conn = self._conn()
+        with conn:
+            cursor = conn.execute("DELETE FROM verdicts WHERE expires_at <= ?", (time.time(),))
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        return self._conn().execute(
+            "SELECT COUNT(*) FROM verdicts WHERE expires_at > ?", (time.time(),)
+        ).fetchone()[0]
+
+
+def verdict_cache_from_env(default_db: Path = Path(".citation_verdicts.db")) -> Optional[VerdictCache]:
+    """
+    Build a VerdictCache configured from environment.
+
+    Env:
+        VERDICT_CACHE: Set to false to disable (default: true)
+        VERDICT_CACHE_DB: Database path (default: default_db)
+        VERDICT_CACHE_TTL_DAYS: Lifetime of positive verdicts (default: 30)
+        VERDICT_CACHE_NEGATIVE_TTL_DAYS: Lifetime of negative verdicts (default: 7)
+
+    Returns:
+        VerdictCache, or None if disabled or the database cannot be opened
+    """
+    if os.getenv("VERDICT_CACHE", "true").lower() == "false":
+        return None
+    try:
+        return VerdictCache(
+            Path(os.getenv("VERDICT_CACHE_DB", str(default_db))),
+            ttl_seconds=float(os.getenv("VERDICT_CACHE_TTL_DAYS", "30")) * DAY_SECONDS,
+            negative_ttl_seconds=float(os.getenv("VERDICT_CACHE_NEGATIVE_TTL_DAYS", "7")) * DAY_SECONDS,
+        )
+    except sqlite3.Error as e:
+        logger.warning(f"Verdict cache unavailable, validating without it: {e}")
+        return None
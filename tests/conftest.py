@@ -0,0 +1,13 @@
+"""
+ABOUTME: Shared pytest fixtures for the test suite
+ABOUTME: Keeps the persistent citation caches out of the working directory
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_citation_caches(tmp_path, monkeypatch):
+    """Point the SQLite citation and verdict caches at the test's tmp_path."""
+    monkeypatch.setenv("CITATION_CACHE_DB", str(tmp_path / "citation_cache.db"))
+    monkeypatch.setenv("VERDICT_CACHE_DB", str(tmp_path / "citation_verdicts.db"))
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for the async (httpx) academic API clients and async citation research
+ABOUTME: Uses httpx.MockTransport and fake clients - no network access
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from concurrency.host_rate_limiter import reset_host_limiters
+from utils.api_citations.crossref import CrossrefClient
+from utils.api_citations.orchestrator import CitationResearcher
+
+CROSSREF_ITEM = {
+    "DOI": "10.1000/test.1",
+    "title": ["Asynchronous Citation Research"],
+    "author": [{"family": "Smith", "given": "Jane"}],
+    "published": {"date-parts": [[2021]]},
+    "container-title": ["Journal of Tests"],
+    "publisher": "Test Press",
+    "type": "journal-article",
+}
+
+
+def _mock_client(client, handler):
+    """Install an httpx client backed by a MockTransport on an API client."""
+    client._async_clients[None] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture(autouse=True)
+def _reset_limiters():
+    reset_host_limiters()
+    yield
+    reset_host_limiters()
+
+
+class TestAsyncBaseClient:
+    """Async request engine mirrors the sync retry semantics."""
+
+    def test_search_matches_sync_parser(self):
+        client = CrossrefClient(rate_limit_per_second=1000)
+        body = {"message": {"items": [CROSSREF_ITEM]}}
+        _mock_client(client, lambda request: httpx.Response(200, json=body))
+
+        async def run():
+            try:
+                return await client.search_paper_async("async citation research")
+            finally:
+                await client.aclose()
+
+        metadata = asyncio.run(run())
+        assert metadata == client._parse_search_response("async citation research", body)
+        assert metadata["doi"] == "10.1000/test.1"
+
+    def test_retries_after_429_and_signals_backpressure(self, monkeypatch):
+        client = CrossrefClient(rate_limit_per_second=1000)
+        signals = []
+        monkeypatch.setattr(client, "_signal_rate_limited", lambda: signals.append(1))
+        monkeypatch.setattr(CrossrefClient, "_retry_wait", staticmethod(lambda attempt: 0))
+
+        responses = iter([
+            httpx.Response(429),
+            httpx.Response(200, json={"message": {"items": [CROSSREF_ITEM]}}),
+        ])
+        _mock_client(client, lambda request: next(responses))
+
+        async def run():
+            try:
+                return await client._make_request_async(**client._search_request("q"))
+            finally:
+                await client.aclose()
+
+        assert asyncio.run(run())["message"]["items"]
+        assert signals == [1]
+
+    def test_not_found_returns_none(self):
+        client = CrossrefClient(rate_limit_per_second=1000)
+        _mock_client(client, lambda request: httpx.Response(404))
+
+        async def run():
+            try:
+                return await client._make_request_async("GET", "/works/missing")
+            finally:
+                await client.aclose()
+
+        assert asyncio.run(run()) is None
+
+    def test_rate_limit_spaces_concurrent_requests(self):
+        client = CrossrefClient(rate_limit_per_second=20)  # 50ms apart
+        stamps = []
+
+        def handler(request):
+            stamps.append(time.monotonic())
+            return httpx.Response(404)
+
+        _mock_client(client, handler)
+
+        async def run():
+            try:
+                await asyncio.gather(*[client._make_request_async("GET", "/x") for _ in range(4)])
+            finally:
+                await client.aclose()
+
+        asyncio.run(run())
+        stamps.sort()
+        assert stamps[-1] - stamps[0] >= 0.12
+
+
+class FakeAsyncClient:
+    """Stands in for an academic API client; sleeps then returns fixed metadata."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.cancelled = 0
+
+    async def search_paper_async(self, query):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return {
+            "title": f"Paper about {query}",
+            "authors": ["Smith"],
+            "year": 2020,
+            "doi": f"10.1000/{abs(hash(query)) % 10**6}",
+            "journal": "Journal of Tests",
+            "source_type": "journal",
+        }
+
+    async def aclose(self):
+        pass
+
+
+@pytest.fixture
+def researcher(tmp_path, monkeypatch):
+    monkeypatch.setenv("CITATION_CACHE_DB", str(tmp_path / "cache.db"))
+    r = CitationResearcher(
+        enable_semantic_scholar=False,
+        enable_gemini_grounded=False,
+        enable_llm_fallback=False,
+        enable_smart_routing=False,
+        verbose=False,
+    )
+    r.crossref = FakeAsyncClient(delay=0.1)
+    r.openalex = FakeAsyncClient(delay=0.1)
+    return r
+
+
+class TestAsyncResearch:
+    """research_citation_async / research_citations_async."""
+
+    def test_many_topics_share_one_loop(self, researcher):
+        topics = [f"topic {i}" for i in range(20)]
+        start = time.monotonic()
+        results = researcher.research_citations_batch(topics, max_concurrency=20)
+        elapsed = time.monotonic() - start
+
+        assert len(results) == 20
+        assert all(error is None and len(found) == 2 for _, _, found, error in results)
+        # 20 topics x 2 APIs x 0.1s each would take 4s sequentially
+        assert elapsed < 2.0
+
+    def test_results_are_cached(self, researcher):
+        researcher.research_citations_batch(["cached topic"])
+        researcher.crossref = FakeAsyncClient(delay=10)
+        results = researcher.research_citations_batch(["cached topic"], per_topic_timeout=1)
+        assert results[0][3] is None
+        assert len(results[0][2]) == 2
+
+    def test_timeout_cancels_in_flight_requests(self, researcher):
+        slow = FakeAsyncClient(delay=10)
+        researcher.crossref = slow
+        researcher.openalex = slow
+        results = researcher.research_citations_batch(["slow topic"], per_topic_timeout=0.2)
+
+        assert results[0][3].startswith("Timeout")
+        assert slow.cancelled == 2
+
+    def test_on_result_can_stop_early(self, researcher):
+        seen = []
+
+        def on_result(index, topic, found, error):
+            seen.append(topic)
+            return True
+
+        results = researcher.research_citations_batch(
+            [f"topic {i}" for i in range(10)], max_concurrency=2, on_result=on_result
+        )
+        assert len(results) == 1
+        assert seen == [results[0][1]]
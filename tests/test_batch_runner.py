@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for the multi-draft batch runner
+ABOUTME: Validates job parsing, process-pool execution, the shared cross-process limiter and throughput reporting
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from batch_runner import REPORT_FILENAME, BatchJob, BatchReport, JobResult, load_jobs, run_batch
+from concurrency.concurrency_config import reset_config
+from concurrency.rate_limiter import reset_gemini_limiter
+
+
+# Runners execute in spawned worker processes, so they live at module level
+
+def sleepy_runner(job: BatchJob) -> JobResult:
+    start = time.time()
+    time.sleep(1.0)
+    return JobResult(
+        index=job.index, topic=job.topic, output_dir=str(job.output_dir), status="completed",
+        seconds=time.time() - start, tokens=6000, pdf_path=os.environ.get("CITATION_CACHE_DB"),
+    )
+
+
+def limited_runner(job: BatchJob) -> JobResult:
+    from concurrency.rate_limiter import get_gemini_limiter
+
+    try:
+        get_gemini_limiter().acquire(tokens=10, timeout=1.0)
+        status, error = "completed", None
+    except TimeoutError as e:
+        status, error = "failed", str(e)
+    return JobResult(
+        index=job.index, topic=job.topic, output_dir=str(job.output_dir), status=status,
+        seconds=0.0, error=error,
+    )
+
+
+def crashing_runner(job: BatchJob) -> JobResult:
+    raise RuntimeError("worker blew up")
+
+
+@pytest.fixture
+def batch_env(monkeypatch):
+    monkeypatch.setenv("API_TIER", "custom")
+    monkeypatch.setenv("GEMINI_TOKEN_BUCKET", "true")
+    reset_config()
+    reset_gemini_limiter()
+    yield
+    reset_gemini_limiter()
+    reset_config()
+
+
+class TestLoadJobs:
+    """Parsing the JSONL jobs file."""
+
+    def test_parses_jobs_with_aliases_and_default_folders(self, tmp_path):
+        jobs_file = tmp_path / "jobs.jsonl"
+        jobs_file.write_text(
+            "# bulk run\n"
+            '{"topic": "AI in Education", "level": "master", "lang": "de"}\n'
+            "\n"
+            '{"topic": "Climate Policy", "citation_style": "ieee", "output_dir": "climate"}\n',
+            encoding="utf-8",
+        )
+
+        jobs = load_jobs(jobs_file, tmp_path / "out")
+
+        assert [j.index for j in jobs] == [1, 2]
+        assert jobs[0].options == {"academic_level": "master", "language": "de"}
+        assert jobs[0].output_dir == tmp_path / "out" / "001_ai_in_education"
+        assert jobs[1].output_dir == tmp_path / "out" / "climate"
+
+    def test_rejects_missing_topic_and_unknown_options(self, tmp_path):
+        with pytest.raises(ValueError, match="missing 'topic'"):
+            BatchJob.from_dict({"level": "phd"}, 1, tmp_path)
+        with pytest.raises(ValueError, match="unknown option 'colour'"):
+            BatchJob.from_dict({"topic": "X", "colour": "blue"}, 1, tmp_path)
+
+    def test_reports_bad_lines(self, tmp_path):
+        jobs_file = tmp_path / "jobs.jsonl"
+        jobs_file.write_text('{"topic": "ok"}\n{not json\n', encoding="utf-8")
+        with pytest.raises(ValueError, match=":2: invalid JSON"):
+            load_jobs(jobs_file, tmp_path)
+
+
+class TestBatchReport:
+    """Aggregate throughput."""
+
+    def test_throughput_metrics(self):
+        results = [
+            JobResult(1, "a", "/a", "completed", 600, tokens=300_000),
+            JobResult(2, "b", "/b", "completed", 900, tokens=200_000),
+            JobResult(3, "c", "/c", "failed", 60, error="boom"),
+        ]
+        report = BatchReport(results=results, wall_seconds=1800, workers=3)
+
+        assert report.completed == 2 and report.failed == 1
+        assert report.drafts_per_hour == pytest.approx(4.0)
+        assert report.tokens_per_minute == pytest.approx(500_000 / 30)
+        assert "2/3 drafts" in report.summary()
+
+
+class TestRunBatch:
+    """Process pool execution."""
+
+    def test_jobs_run_in_parallel_processes(self, tmp_path, batch_env):
+        jobs = [BatchJob(i, f"Topic {i}", tmp_path / f"job{i}") for i in range(1, 4)]
+        seen = []
+
+        start = time.time()
+        report = run_batch(jobs, tmp_path, max_workers=3, runner=sleepy_runner, on_result=seen.append)
+        elapsed = time.time() - start
+
+        assert report.completed == 3
+        assert sorted(r.index for r in seen) == [1, 2, 3]
+        # Three 1s jobs back to back would take 3s plus process startup
+        assert elapsed < 2.9
+        assert report.tokens_per_minute > 0
+
+        saved = json.loads((tmp_path / REPORT_FILENAME).read_text(encoding="utf-8"))
+        assert saved["completed"] == 3
+        assert [r["index"] for r in saved["results"]] == [1, 2, 3]
+
+    def test_workers_share_cache_paths(self, tmp_path, batch_env, monkeypatch):
+        monkeypatch.setenv("CITATION_CACHE_DB", "relative/citations.db")
+        jobs = [BatchJob(1, "Topic", tmp_path / "job1")]
+
+        report = run_batch(jobs, tmp_path, max_workers=1, runner=sleepy_runner)
+
+        assert report.results[0].pdf_path == str(Path("relative/citations.db").resolve())
+
+    def test_workers_share_one_rate_limiter(self, tmp_path, batch_env, monkeypatch):
+        # A 2-request bucket refilling every 30s: only two of three workers get in
+        monkeypatch.setenv("RPM_LIMIT", "2")
+        reset_config()
+        jobs = [BatchJob(i, f"Topic {i}", tmp_path / f"job{i}") for i in range(1, 4)]
+
+        report = run_batch(jobs, tmp_path, max_workers=3, runner=limited_runner)
+
+        assert report.completed == 2
+        assert report.failed == 1
+        assert "rate limiter" in next(r.error for r in report.results if r.status == "failed")
+
+    def test_worker_crash_is_reported(self, tmp_path, batch_env):
+        jobs = [BatchJob(1, "Topic", tmp_path / "job1")]
+
+        report = run_batch(jobs, tmp_path, max_workers=1, runner=crashing_runner)
+
+        assert report.failed == 1
+        assert "worker blew up" in report.results[0].error
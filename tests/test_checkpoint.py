@@ -4,7 +4,7 @@
 import json
 import pytest
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
@@ -18,6 +18,7 @@ from utils.checkpoint import (
     _serialize_scout_result,
     _deserialize_scout_result,
 )
+import utils.checkpoint as checkpoint_module
 from phases.context import DraftContext
 from utils.citation_database import Citation
 
@@ -149,6 +150,38 @@ class TestRestoreContext:
         assert new_ctx.architect_output == "# Outline\n## Section 1"
         assert new_ctx.intro_output == "Introduction text with {cite_001}"
     
+    def test_restore_reads_only_accessed_blobs(self, mock_context, tmp_path):
+        """Test blob-stored outputs are read on first access, not by restore_context."""
+        mock_context.lit_review_output = "Literature review. " * 400
+        mock_context.results_output = "Results. " * 800
+        save_checkpoint(mock_context, "compose", tmp_path)
+        data, _ = load_checkpoint(tmp_path / "checkpoint.json")
+
+        new_ctx = DraftContext()
+        with patch("utils.checkpoint._read_blob", wraps=checkpoint_module._read_blob) as read_blob:
+            restore_context(new_ctx, data)
+            assert read_blob.call_count == 0
+
+            assert new_ctx.results_output == mock_context.results_output
+            assert new_ctx.results_output == mock_context.results_output
+
+        assert read_blob.call_count == 1
+
+    def test_resave_keeps_unread_blobs_unread(self, mock_context, tmp_path):
+        """Test checkpointing a resumed run references untouched blobs without reading them."""
+        mock_context.lit_review_output = "Literature review. " * 400
+        save_checkpoint(mock_context, "compose", tmp_path)
+        data, _ = load_checkpoint(tmp_path / "checkpoint.json")
+        new_ctx = DraftContext()
+        restore_context(new_ctx, data)
+
+        with patch("utils.checkpoint._read_blob", wraps=checkpoint_module._read_blob) as read_blob:
+            save_checkpoint(new_ctx, "validate", tmp_path)
+        assert read_blob.call_count == 0
+
+        resaved, _ = load_checkpoint(tmp_path / "checkpoint.json")
+        assert resaved["lit_review_output"] == mock_context.lit_review_output
+
     def test_restore_folders_as_paths(self, mock_context, tmp_path):
         """Test folders are restored as Path objects."""
         save_checkpoint(mock_context, "research", tmp_path)
@@ -10,10 +10,13 @@ Performance Targets:
 - Small context (research paper): save < 50ms, load < 20ms
 - Medium context (master thesis): save < 100ms, load < 50ms
 - Large context (PhD dissertation): save < 500ms, load < 200ms
+- Full PhD run (~75k words of chapters, 400 citations, all six phases): every save < 500ms,
+  compressed blob store for the whole history smaller than one legacy checkpoint
 """
 
 import time
 import json
+import random
 import pytest
 import statistics
 from pathlib import Path
@@ -23,6 +26,9 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
 
 from utils.checkpoint import (
+    BLOB_REF_KEY,
+    BLOBS_DIRNAME,
+    list_manifests,
     save_checkpoint,
     load_checkpoint,
     restore_context,
@@ -399,3 +405,143 @@ class TestRoundtripBenchmarks:
             assert citation.authors == original.authors
             assert citation.year == original.year
             assert citation.title == original.title
+
+
+# Vocabulary for non-repetitive text, so compression ratios are realistic
+_VOCABULARY = (
+    "analysis framework empirical evidence model data results method approach "
+    "significant research literature theory study findings sample variable effect "
+    "education learning students digital technology policy adoption outcomes impact "
+    "however therefore furthermore moreover although whereas consequently the of and "
+    "in to a is that for on with as by this are be which from an was were it its "
+    "their these between within across over under through during regression survey "
+    "interview qualitative quantitative mixed longitudinal cross-sectional cohort"
+).split()
+
+
+def _academic_text(words: int, seed: int) -> str:
+    """Pseudo-random prose with sentence and paragraph breaks."""
+    rng = random.Random(seed)
+    sentences = []
+    while words > 0:
+        length = min(words, rng.randint(12, 30))
+        sentence = " ".join(rng.choice(_VOCABULARY) for _ in range(length))
+        sentences.append(sentence.capitalize() + f" (Author{rng.randint(1, 400)}, {rng.randint(2000, 2025)}).")
+        words -= length
+    paragraphs = [" ".join(sentences[i:i + 6]) for i in range(0, len(sentences), 6)]
+    return "\n\n".join(paragraphs)
+
+
+def _create_phd_context(tmp_path: Path) -> DraftContext:
+    """A PhD dissertation run with 400 citations; _run_phd_phases fills in the outputs."""
+    ctx = _create_context_with_size("phd", word_multiplier=1, citation_count=400)
+    ctx.folders = {'root': tmp_path}
+    return ctx
+
+
+# Outputs each phase adds, with their word counts
+_PHD_PHASE_OUTPUTS = {
+    "research": {"scout_output": 15000, "scribe_output": 10000, "signal_output": 3000},
+    "structure": {"architect_output": 4000, "formatter_output": 4000},
+    "citations": {"citation_summary": 6000},
+    "compose": {
+        "intro_output": 6000, "lit_review_output": 18000, "methodology_output": 12000,
+        "results_output": 15000, "discussion_output": 15000, "conclusion_output": 5000,
+        "appendix_output": 4000,
+    },
+    "validate": {},
+    "compile": {},
+}
+
+
+def _run_phd_phases(ctx: DraftContext, tmp_path: Path) -> List[Tuple[str, float, int]]:
+    """Save a checkpoint after each phase. Returns (phase, save_ms, new blob bytes)."""
+    blob_dir = tmp_path / BLOBS_DIRNAME
+    runs = []
+    for phase_index, (phase, outputs) in enumerate(_PHD_PHASE_OUTPUTS.items()):
+        for output_index, (name, words) in enumerate(outputs.items()):
+            setattr(ctx, name, _academic_text(words, seed=phase_index * 100 + output_index))
+        if phase == "compose":
+            ctx.body_output = "\n\n".join(
+                [ctx.lit_review_output, ctx.methodology_output, ctx.results_output, ctx.discussion_output]
+            )
+
+        before = sum(f.stat().st_size for f in blob_dir.rglob("*.gz")) if blob_dir.exists() else 0
+        elapsed, _ = _time_operation(save_checkpoint, ctx, phase, tmp_path)
+        after = sum(f.stat().st_size for f in blob_dir.rglob("*.gz"))
+        runs.append((phase, elapsed, after - before))
+    return runs
+
+
+class TestPhdCheckpointStore:
+    """Blob store with a full PhD-sized run through every phase."""
+
+    def test_every_phase_save_is_fast_and_incremental(self, tmp_path):
+        """Benchmark: each phase save < 500ms and only writes its new outputs."""
+        runs = _run_phd_phases(_create_phd_context(tmp_path), tmp_path)
+
+        for phase, elapsed, new_bytes in runs:
+            print(f"\nPhD {phase} save: {elapsed:.1f}ms, {new_bytes / 1024:.1f}KB new blobs")
+            assert elapsed < 500, f"PhD {phase} save too slow: {elapsed:.1f}ms (target: <500ms)"
+
+        # Validate and compile change no stored outputs, so nothing is rewritten
+        assert dict((phase, new_bytes) for phase, _, new_bytes in runs)["validate"] == 0
+        assert dict((phase, new_bytes) for phase, _, new_bytes in runs)["compile"] == 0
+        assert [p.name for p in list_manifests(tmp_path)] == [
+            "01_research.json", "02_structure.json", "03_citations.json",
+            "04_compose.json", "05_validate.json", "06_compile.json",
+        ]
+
+    def test_history_is_smaller_than_one_legacy_checkpoint(self, tmp_path):
+        """Verify all six compressed phase snapshots cost less than one uncompressed checkpoint."""
+        _run_phd_phases(_create_phd_context(tmp_path), tmp_path)
+
+        data, _ = load_checkpoint(tmp_path / "checkpoint.json")
+        legacy_kb = len(json.dumps(dict(data.items()), indent=2, ensure_ascii=False).encode("utf-8")) / 1024
+        store_kb = sum(
+            f.stat().st_size for f in tmp_path.rglob("*") if f.is_file() and f.name != "checkpoint.json"
+        ) / 1024
+        manifest_kb = (tmp_path / "checkpoint.json").stat().st_size / 1024
+
+        print(f"\nPhD legacy checkpoint: {legacy_kb:.0f}KB, store with 6-phase history: {store_kb:.0f}KB, "
+              f"manifest: {manifest_kb:.1f}KB")
+        assert store_kb < legacy_kb
+        assert manifest_kb < 10
+
+    def test_load_is_lazy(self, tmp_path):
+        """Benchmark: loading reads only the manifest (< 20ms); outputs decompress on access."""
+        ctx = _create_phd_context(tmp_path)
+        _run_phd_phases(ctx, tmp_path)
+        checkpoint_path = tmp_path / "checkpoint.json"
+
+        times = []
+        for _ in range(5):
+            elapsed, (data, _) = _time_operation(load_checkpoint, checkpoint_path)
+            times.append(elapsed)
+        avg_time = statistics.mean(times)
+
+        assert BLOB_REF_KEY in dict.__getitem__(data, "body_output")
+        assert data["body_output"] == ctx.body_output
+        assert avg_time < 20, f"PhD manifest load too slow: {avg_time:.1f}ms (target: <20ms)"
+
+        print(f"\nPhD lazy load: avg={avg_time:.2f}ms")
+
+    def test_roundtrip_from_any_phase(self, tmp_path):
+        """Benchmark: restore the compose snapshot from history (< 750ms) with intact data."""
+        ctx = _create_phd_context(tmp_path)
+        _run_phd_phases(ctx, tmp_path)
+        compose_manifest = next(p for p in list_manifests(tmp_path) if p.name == "04_compose.json")
+
+        start = time.perf_counter()
+        data, phase = load_checkpoint(compose_manifest)
+        restored = DraftContext()
+        restore_context(restored, data)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        assert phase == "compose"
+        assert restored.lit_review_output == ctx.lit_review_output
+        assert restored.body_output == ctx.body_output
+        assert len(restored.scout_result["citations"]) == 400
+        assert elapsed < 750, f"PhD roundtrip too slow: {elapsed:.1f}ms (target: <750ms)"
+
+        print(f"\nPhD roundtrip from history: {elapsed:.1f}ms")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for the SQLite citation cache used by CitationResearcher
+ABOUTME: Validates upserts, TTL expiry, DOI/title lookups, JSON migration and concurrent writers
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from utils.api_citations.citation_cache import CitationCache
+
+PAPER = {"title": "Attention Is All You Need", "doi": "10.5555/3295222.3295349", "year": 2017}
+OTHER = {"title": "Deep Residual Learning", "doi": "10.1109/CVPR.2016.90", "year": 2016}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = CitationCache(tmp_path / "cache.db")
+    yield c
+    c.close()
+
+
+class TestCitationCache:
+    """Basic read/write semantics."""
+
+    def test_miss_then_hit(self, cache):
+        assert cache.get("transformers") == (False, None)
+        cache.put("transformers", [(PAPER, "Crossref")])
+        hit, results = cache.get("transformers")
+        assert hit
+        assert results == [(PAPER, "Crossref")]
+
+    def test_negative_cache(self, cache):
+        cache.put("nothing here", [])
+        assert cache.get("nothing here") == (True, None)
+
+    def test_upsert_replaces(self, cache):
+        cache.put("topic", [(PAPER, "Crossref")])
+        cache.put("topic", [(OTHER, "OpenAlex")])
+        assert cache.get("topic") == (True, [(OTHER, "OpenAlex")])
+        assert cache.find_by_doi(PAPER["doi"]) is None
+        assert len(cache) == 1
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = CitationCache(tmp_path / "ttl.db", ttl_seconds=0.05, negative_ttl_seconds=0.05)
+        cache.put("topic", [(PAPER, "Crossref")])
+        time.sleep(0.1)
+        assert cache.get("topic") == (False, None)
+        assert cache.purge_expired() == 1
+
+    def test_negative_entries_use_shorter_ttl(self, tmp_path):
+        cache = CitationCache(tmp_path / "ttl.db", ttl_seconds=60, negative_ttl_seconds=0.05)
+        cache.put("found", [(PAPER, "Crossref")])
+        cache.put("missing", None)
+        time.sleep(0.1)
+        assert cache.get("found")[0]
+        assert not cache.get("missing")[0]
+
+    def test_secondary_indexes(self, cache):
+        cache.put("topic", [(OTHER, "OpenAlex"), (PAPER, "Crossref")])
+        assert cache.find_by_doi(PAPER["doi"].upper()) == (PAPER, "Crossref")
+        assert cache.find_by_title("attention is all you need.") == (PAPER, "Crossref")
+        assert cache.find_by_title("unknown") is None
+
+    def test_persists_across_instances(self, tmp_path):
+        CitationCache(tmp_path / "c.db").put("topic", [(PAPER, "Crossref")])
+        assert CitationCache(tmp_path / "c.db").get("topic")[0]
+
+
+class TestMigration:
+    """One-time import of the legacy JSON cache."""
+
+    def test_imports_both_legacy_layouts(self, tmp_path):
+        legacy = tmp_path / ".citation_cache_orchestrator.json"
+        legacy.write_text(json.dumps({
+            "single": [PAPER, "Crossref"],
+            "multi": [[PAPER, "Crossref"], [OTHER, "OpenAlex"]],
+            "none": None,
+        }))
+        cache = CitationCache(tmp_path / "c.db", legacy_json_path=legacy)
+
+        assert cache.get("single") == (True, [(PAPER, "Crossref")])
+        assert cache.get("multi") == (True, [(PAPER, "Crossref"), (OTHER, "OpenAlex")])
+        assert cache.get("none") == (True, None)
+        assert not legacy.exists()
+        assert legacy.with_name(legacy.name + ".migrated").exists()
+
+    def test_migration_runs_once(self, tmp_path):
+        legacy = tmp_path / "legacy.json"
+        legacy.write_text(json.dumps({"a": [PAPER, "Crossref"]}))
+        assert CitationCache(tmp_path / "c.db", legacy_json_path=legacy).get("a")[0]
+
+        # A fresh legacy file appearing later is not re-imported
+        legacy.write_text(json.dumps({"b": [OTHER, "OpenAlex"]}))
+        cache = CitationCache(tmp_path / "c.db", legacy_json_path=legacy)
+        assert not cache.get("b")[0]
+
+
+    def test_database_created_on_first_use(self, tmp_path):
+        legacy = tmp_path / "legacy.json"
+        legacy.write_text(json.dumps({"a": [PAPER, "Crossref"]}))
+        cache = CitationCache(tmp_path / "sub" / "c.db", legacy_json_path=legacy)
+
+        assert not (tmp_path / "sub").exists() and legacy.exists()
+        assert cache.get("a") == (True, [(PAPER, "Crossref")])
+        assert (tmp_path / "sub" / "c.db").exists() and not legacy.exists()
+
+
+class TestConcurrency:
+    """Many threads writing at once (scout workers)."""
+
+    def test_parallel_writers(self, tmp_path):
+        cache = CitationCache(tmp_path / "c.db")
+        errors = []
+
+        def worker(worker_id):
+            try:
+                for i in range(25):
+                    cache.put(f"topic-{worker_id}-{i}", [({"title": f"t{i}"}, "Crossref")])
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(w,)) for w in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert len(cache) == 100
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for concurrent missing-citation research and single-pass compilation in CitationCompiler
+ABOUTME: Validates parallel speedup, deterministic citation IDs, unchanged output and memoized formatting
+"""
+
+import random
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from concurrency.concurrency_config import reset_config
+from utils.citation_compiler import CitationCompiler
+from utils.citation_database import Citation, CitationDatabase
+
+
+class FakeResearcher:
+    """CitationResearcher stand-in: slow lookups, topics containing 'unknown' are not found."""
+
+    def __init__(self, delay=0.0, jitter=0.0):
+        self.delay = delay
+        self.jitter = jitter
+        self.verbose = False
+        self.calls = []
+        self.max_active = 0
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def research_citation(self, topic):
+        with self._lock:
+            self.calls.append(topic)
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+        time.sleep(self.delay + random.random() * self.jitter)
+        with self._lock:
+            self._active -= 1
+        if "unknown" in topic:
+            return []
+        return [Citation("tmp", [f"Author {topic}"], 2024, f"Paper on {topic}", "journal")]
+
+
+def make_citation(number, author):
+    return Citation(f"cite_{number:03d}", [author], 2020 + number, f"Title {number}", "journal", journal="Journal")
+
+
+def make_compiler(style="APA 7th", researcher=None):
+    db = CitationDatabase(citations=[make_citation(1, "Smith"), make_citation(2, "Jones")], citation_style=style)
+    compiler = CitationCompiler(db, model=object())
+    compiler.researcher = researcher or FakeResearcher()
+    return compiler
+
+
+@pytest.fixture
+def workers(monkeypatch):
+    """Set scout_parallel_workers for the compiler's research fan-out."""
+    def set_workers(count):
+        monkeypatch.setenv("SCOUT_PARALLEL_WORKERS", str(count))
+        reset_config()
+    yield set_workers
+    reset_config()
+
+
+DRAFT = (
+    "Intro {cite_001} and {cite_MISSING:topic b}. Again {cite_MISSING: topic a } with {cite_002}.\n"
+    "Unknown {cite_MISSING:unknown x} and {cite_099}. Repeat {cite_MISSING:topic b} {cite_001}."
+)
+
+
+class TestCompileOutput:
+    """Single-pass compilation keeps the previous output."""
+
+    def test_apa_output(self, workers):
+        workers(4)
+        compiler = make_compiler()
+
+        text, missing, researched = compiler.compile_citations(DRAFT, verbose=False)
+
+        assert text == (
+            "Intro (Smith, 2021) and (Author topic b, 2024). Again (Author topic a, 2024) with (Jones, 2022).\n"
+            "Unknown [MISSING: unknown x] and [MISSING: cite_099]. Repeat (Author topic b, 2024) (Smith, 2021)."
+        )
+        assert missing == ["cite_099", "TOPIC:unknown x"]
+        assert researched == ["topic b", "topic a"]
+        assert [c.id for c in compiler.database.citations] == ["cite_001", "cite_002", "cite_003", "cite_004"]
+        assert compiler.citation_lookup["cite_003"].title == "Paper on topic b"
+
+    def test_nalt_footnotes_follow_text_order(self, workers):
+        workers(4)
+        compiler = make_compiler(style="NALT")
+
+        text, _, _ = compiler.compile_citations("A {cite_MISSING:topic} B {cite_001} C {cite_MISSING:topic}.",
+                                                verbose=False)
+
+        assert text.startswith("A [^1] B [^2] C [^3].")
+        assert "[^1]:" in text and "[^3]:" in text
+        assert text.count("Author topic") == 2
+
+    def test_research_disabled_marks_topics(self):
+        db = CitationDatabase(citations=[make_citation(1, "Smith")], citation_style="APA 7th")
+        compiler = CitationCompiler(db)
+
+        text, missing, researched = compiler.compile_citations("{cite_001} {cite_MISSING:x}", verbose=False)
+
+        assert text == "(Smith, 2021) [MISSING: x]"
+        assert missing == ["TOPIC:x"]
+        assert researched == []
+
+
+class TestParallelResearch:
+    """Missing topics are researched concurrently."""
+
+    def test_ids_do_not_depend_on_completion_order(self, workers):
+        workers(8)
+        topics = [f"topic {i}" for i in range(20)]
+        draft = " ".join(f"{{cite_MISSING:{t}}}" for t in topics)
+        compiler = make_compiler(researcher=FakeResearcher(delay=0.001, jitter=0.02))
+
+        compiler.compile_citations(draft, verbose=False)
+
+        for i, topic in enumerate(topics):
+            assert compiler.citation_lookup[f"cite_{i + 3:03d}"].title == f"Paper on {topic}"
+
+    def test_thirty_missing_markers_fan_out(self, workers):
+        """Benchmark: 30 unique topics at 50ms each with 8 workers vs 1 worker."""
+        topics = [f"topic {i}" for i in range(30)]
+        draft = "\n".join(f"Claim {i} {{cite_MISSING:{t}}} and {{cite_001}}." for i, t in enumerate(topics))
+
+        timings = {}
+        outputs = {}
+        for count in (1, 8):
+            workers(count)
+            researcher = FakeResearcher(delay=0.05)
+            compiler = make_compiler(researcher=researcher)
+            start = time.perf_counter()
+            outputs[count] = compiler.compile_citations(draft, verbose=False)
+            timings[count] = time.perf_counter() - start
+            assert sorted(researcher.calls) == sorted(topics)
+            assert researcher.max_active <= count
+
+        print(f"\n30 missing citations: 1 worker {timings[1]:.2f}s, 8 workers {timings[8]:.2f}s")
+        assert outputs[1] == outputs[8]
+        assert timings[8] * 4 < timings[1]
+
+
+class TestFormattingMemo:
+    """In-text and reference strings are formatted once per citation and style."""
+
+    def test_repeated_citations_format_once(self, monkeypatch):
+        compiler = make_compiler()
+        calls = []
+        original = compiler._format_apa_in_text
+        monkeypatch.setattr(compiler, "_format_apa_in_text", lambda c: calls.append(c.id) or original(c))
+
+        compiler.compile_citations("{cite_001} " * 50 + "{cite_002}", verbose=False)
+
+        assert sorted(calls) == ["cite_001", "cite_002"]
+
+    def test_reference_list_reuses_formatted_entries(self, monkeypatch):
+        compiler = make_compiler()
+        calls = []
+        original = compiler._format_apa_reference
+        monkeypatch.setattr(compiler, "_format_apa_reference", lambda c: calls.append(c.id) or original(c))
+
+        first = compiler.generate_reference_list("{cite_001} {cite_002}")
+        second = compiler.generate_reference_list("{cite_002} {cite_001}")
+
+        assert first == second
+        assert sorted(calls) == ["cite_001", "cite_002"]
+
+    def test_style_change_is_not_served_from_cache(self):
+        compiler = make_compiler()
+        citation = compiler.citation_lookup["cite_001"]
+        apa = compiler.format_in_text_citation(citation)
+        compiler.style = "IEEE"
+
+        assert apa == "(Smith, 2021)"
+        assert compiler.format_in_text_citation(citation) == "[1]"
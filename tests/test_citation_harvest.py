@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for top-k result harvesting from OpenAlex and Semantic Scholar
+ABOUTME: Validates relevance filtering, deduplication and multi-citation topics in CitationResearcher
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from utils.api_citations.completion_policy import MODE_ALL, CompletionPolicy
+from utils.api_citations.harvest import select_relevant, work_key
+from utils.api_citations.openalex import OpenAlexClient
+from utils.api_citations.orchestrator import CitationResearcher
+from utils.api_citations.semantic_scholar import SemanticScholarClient
+from utils.text_relevance import term_coverage
+
+TOPIC = "electric vehicle adoption barriers"
+
+
+def paper(title, doi=None, abstract=""):
+    return {
+        "title": title,
+        "authors": ["Smith"],
+        "year": 2021,
+        "doi": doi,
+        "url": f"https://doi.org/{doi}" if doi else "",
+        "journal": "Journal of Tests",
+        "source_type": "journal",
+        "abstract": abstract,
+    }
+
+
+HARVEST = [
+    paper("Charging infrastructure and EV uptake", "10.1000/best"),
+    paper("Barriers to electric vehicle adoption in Europe", "10.1000/two"),
+    paper("Deep learning for protein folding", "10.1000/off"),
+    paper("Consumer survey", "10.1000/three", abstract="Adoption barriers for electric vehicles."),
+    paper("Barriers to electric vehicle adoption in Europe", "10.1000/TWO"),
+]
+
+
+class TestSelectRelevant:
+    """Best match kept; later results filtered by query coverage and deduplicated."""
+
+    def test_filters_and_dedupes(self):
+        selected = select_relevant(HARVEST, TOPIC, min_relevance=0.5)
+        assert [p["doi"] for p in selected] == ["10.1000/best", "10.1000/two", "10.1000/three"]
+
+    def test_term_coverage(self):
+        assert term_coverage(TOPIC, "Barriers to electric vehicles") == 0.75
+        assert term_coverage("the and", "anything") == 1.0
+
+    def test_work_key(self):
+        assert work_key(paper("A", "https://doi.org/10.1/X")) == work_key(paper("B", "10.1/x"))
+        assert work_key(paper("Some  Title")) == "title:some title"
+
+
+class TestClientSearchPapers:
+    """search_papers parses every result of one request."""
+
+    def test_openalex(self, monkeypatch):
+        client = OpenAlexClient()
+        requests = []
+        work = {
+            "title": "Paper", "publication_year": 2020, "doi": "https://doi.org/10.1/a",
+            "authorships": [{"author": {"display_name": "Jane Smith"}}],
+        }
+        monkeypatch.setattr(client, "_make_request", lambda **kw: requests.append(kw) or {"results": [work, {}, work]})
+
+        results = client.search_papers("query", limit=7)
+
+        assert requests[0]["params"]["per_page"] == 7
+        assert [r["doi"] for r in results] == ["10.1/a", "10.1/a"]
+
+    def test_semantic_scholar(self, monkeypatch):
+        client = SemanticScholarClient()
+        item = {"title": "Paper", "year": 2020, "authors": [{"name": "Jane Smith"}], "externalIds": {"DOI": "10.1/b"}}
+        monkeypatch.setattr(client, "_make_request", lambda **kw: {"data": [item, {"title": ""}]})
+
+        results = client.search_papers("query", limit=5)
+
+        assert [r["doi"] for r in results] == ["10.1/b"]
+        assert client._search_papers_request("q", 500)["params"]["limit"] == 100
+
+
+class FakeHarvestClient:
+    """Multi-result API stand-in (sync and async)."""
+
+    def __init__(self, papers):
+        self.papers = papers
+        self.limits = []
+
+    def search_paper(self, query):
+        return self.papers[0]
+
+    def search_papers(self, query, limit=10):
+        self.limits.append(limit)
+        return self.papers[:limit]
+
+    async def search_papers_async(self, query, limit=10):
+        return self.search_papers(query, limit)
+
+    async def search_paper_async(self, query):
+        return self.search_paper(query)
+
+    async def aclose(self):
+        pass
+
+
+@pytest.fixture
+def researcher(tmp_path, monkeypatch):
+    monkeypatch.setenv("CITATION_CACHE_DB", str(tmp_path / "cache.db"))
+    monkeypatch.setenv("CITATION_HARVEST_MIN_RELEVANCE", "0.5")
+    r = CitationResearcher(
+        enable_semantic_scholar=False,
+        enable_gemini_grounded=False,
+        enable_llm_fallback=False,
+        enable_smart_routing=False,
+        verbose=False,
+        completion_policy=CompletionPolicy(mode=MODE_ALL),
+    )
+    r.crossref = FakeHarvestClient([paper("Barriers to electric vehicle adoption in Europe", "10.1000/two")])
+    r.openalex = FakeHarvestClient(HARVEST)
+    return r
+
+
+class TestResearcherHarvest:
+    """One query yields several distinct citations."""
+
+    def test_sync(self, researcher):
+        citations = researcher.research_citation(TOPIC)
+
+        # Crossref's best match, OpenAlex's best match, and OpenAlex's relevant
+        # extra that Crossref did not already return
+        assert [(c.doi, c.api_source) for c in citations] == [
+            ("10.1000/two", "Crossref"), ("10.1000/best", "OpenAlex"), ("10.1000/three", "OpenAlex"),
+        ]
+        assert researcher.openalex.limits == [5]
+
+    def test_async_matches_sync(self, researcher):
+        citations = asyncio.run(researcher.research_citation_async(TOPIC))
+        assert [c.doi for c in citations] == ["10.1000/two", "10.1000/best", "10.1000/three"]
+
+    def test_harvest_k_one_uses_best_match(self, researcher, monkeypatch):
+        researcher.harvest_k = 1
+        citations = researcher.research_citation(TOPIC)
+        assert [c.doi for c in citations] == ["10.1000/two", "10.1000/best"]
+        assert researcher.openalex.limits == []
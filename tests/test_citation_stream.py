@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for streaming Scout citations into citation management
+ABOUTME: Validates incremental dedup, non-blocking page prefetch and the close/pages hand-off
+"""
+
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from utils.citation_database import Citation
+from utils.citation_quality_filter import CitationQualityFilter
+from utils.citation_stream import CitationStream
+from utils.citation_validator import CitationValidator
+from utils.page_fetcher import PageFetcher
+from utils.verdict_cache import KIND_DOI, KIND_URL, VerdictCache
+
+HTML = b"<html><head><title>Streamed Page</title></head><body></body></html>"
+
+
+class FakeResponse:
+    def __init__(self, content: bytes):
+        self.content = content
+        self.status_code = 200
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Counts requests per URL; each one takes delay seconds."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = Counter()
+        self._lock = threading.Lock()
+
+    def get(self, url, timeout=None, allow_redirects=True, headers=None):
+        with self._lock:
+            self.calls[url] += 1
+        time.sleep(self.delay)
+        return FakeResponse(HTML)
+
+    def head(self, url, timeout=None, allow_redirects=True, headers=None):
+        return self.get(url)
+
+
+def citation(n, url, title=None, doi=None, api_source="Gemini Grounded"):
+    return Citation(
+        citation_id=f"cite_{n:03d}",
+        authors=["Smith"],
+        year=2022,
+        title=title or f"Paper {n}",
+        source_type="website",
+        url=url,
+        doi=doi,
+        api_source=api_source,
+    )
+
+
+def make_validator(session=None, verdict_cache=None):
+    return CitationValidator(max_workers=4, per_host=4, verdict_cache=verdict_cache, session=session or FakeSession())
+
+
+def make_stream(session, **kwargs):
+    fetcher = PageFetcher(max_workers=4, per_domain=4, domain_delay=0, session=session)
+    kwargs.setdefault("validator", make_validator())
+    return CitationStream(fetcher=fetcher, **kwargs)
+
+
+def select_all(citations):
+    return list(citations)
+
+
+class TestCitationStream:
+    """Citations in, prefetched pages out."""
+
+    def test_prefetches_selected_urls_once(self):
+        session = FakeSession()
+        stream = make_stream(session)
+
+        # Domain-name titles from Gemini Grounded are what the title scraper fixes
+        stream.put([citation(1, "https://a.org/1", title="a.org"), citation(2, "https://b.org/1", doi="10.1/x", api_source="Crossref")])
+        stream.put([citation(3, "https://a.org/1", title="a.org")])
+        pages = stream.pages()
+
+        assert list(pages) == ["https://a.org/1"]
+        assert pages["https://a.org/1"].ok
+        assert session.calls["https://a.org/1"] == 1
+
+    def test_dedups_works_across_batches(self):
+        stream = make_stream(FakeSession(), selectors=[select_all])
+
+        stream.put([citation(1, "https://a.org/1", doi="10.1/a"), citation(2, "https://a.org/2", title="Same Title")])
+        stream.put([citation(3, "https://a.org/3", doi="https://doi.org/10.1/A"), citation(4, "https://a.org/4", title="same  title")])
+        pages = stream.pages()
+
+        assert (stream.received, stream.unique) == (4, 2)
+        assert sorted(pages) == ["https://a.org/1", "https://a.org/2"]
+
+    def test_put_does_not_wait_for_downloads(self):
+        stream = make_stream(FakeSession(delay=0.3), max_batches=2, selectors=[select_all])
+
+        start = time.monotonic()
+        for n in range(8):
+            stream.put([citation(n, f"https://site{n}.org/page")])
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.2
+        assert len(stream.pages()) == 8
+
+    def test_closed_stream_ignores_input(self):
+        session = FakeSession()
+        stream = make_stream(session, selectors=[select_all])
+
+        stream.put([citation(1, "https://a.org/1")])
+        stream.close()
+        stream.put([citation(2, "https://a.org/2")])
+
+        assert list(stream.pages()) == ["https://a.org/1"]
+        assert stream.pages() is stream.pages()
+        assert "https://a.org/2" not in session.calls
+
+    def test_warms_verdict_cache_for_the_quality_filter(self, tmp_path):
+        checks = FakeSession()
+        verdicts = VerdictCache(tmp_path / "verdicts.db")
+        stream = make_stream(FakeSession(), selectors=[], validator=make_validator(checks, verdicts))
+
+        stream.put([citation(1, "https://a.org/1", doi="10.1/a"), citation(2, "https://b.org/2")])
+        stream.put([citation(3, "https://a.org/1", doi="10.1/A")])
+        stream.pages()
+
+        assert set(verdicts.get_many(KIND_DOI, ["10.1/a"])) == {"10.1/a"}
+        assert set(verdicts.get_many(KIND_URL, ["https://a.org/1", "https://b.org/2"])) == {
+            "https://a.org/1", "https://b.org/2"}
+        assert sum(checks.calls.values()) == 3
+
+        # A later filter answers from the cache without touching the network
+        offline = FakeSession()
+        quality_filter = CitationQualityFilter(validator=make_validator(offline, verdicts))
+        quality_filter.validator.validate_citations([{"doi": "10.1/a", "url": "https://a.org/1"}])
+        assert sum(offline.calls.values()) == 0
+
+    def test_abort_cancels_queued_downloads(self):
+        session = FakeSession(delay=0.2)
+        fetcher = PageFetcher(max_workers=1, per_domain=1, domain_delay=0, session=session)
+        stream = CitationStream(fetcher=fetcher, selectors=[select_all], validator=make_validator())
+
+        stream.put([citation(n, f"https://site{n}.org/page") for n in range(5)])
+        time.sleep(0.05)
+        stream.abort()
+        time.sleep(0.3)
+
+        assert sum(session.calls.values()) == 1
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for concurrent citation DOI/URL validation and the persistent verdict cache
+ABOUTME: Validates deduplication, per-host limits, parallel speedup, cache reuse and unchanged filter results
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pytest
+import requests
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from utils.citation_quality_filter import CitationQualityFilter
+from utils.citation_validator import CitationValidator
+from utils.verdict_cache import KIND_DOI, KIND_URL, VerdictCache
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class FakeSession:
+    """Session stand-in that records calls and per-host concurrency."""
+
+    def __init__(self, delay=0.0, statuses=None, fail=()):
+        self.delay = delay
+        self.statuses = statuses or {}
+        self.fail = set(fail)
+        self.calls = []
+        self._lock = threading.Lock()
+        self._active = {}
+        self.max_active = {}
+
+    def _request(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            self.calls.append(url)
+            self._active[host] = self._active.get(host, 0) + 1
+            self.max_active[host] = max(self.max_active.get(host, 0), self._active[host])
+        try:
+            time.sleep(self.delay)
+            if url in self.fail:
+                raise requests.exceptions.ConnectionError("offline")
+            return FakeResponse(self.statuses.get(url, 200))
+        finally:
+            with self._lock:
+                self._active[host] -= 1
+
+    def get(self, url, **kwargs):
+        return self._request(url)
+
+    def head(self, url, **kwargs):
+        return self._request(url)
+
+
+def citation(i, doi=None, url=None):
+    return {
+        'id': f'cite_{i:03d}',
+        'authors': ['Smith, J.'],
+        'year': 2021,
+        'title': f'Distributed systems study number {i}',
+        'doi': doi,
+        'url': url,
+        'source_type': 'journal',
+    }
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = VerdictCache(tmp_path / "verdicts.db")
+    yield cache
+    cache.close()
+
+
+class TestConcurrentValidation:
+    """CitationValidator.validate_citations"""
+
+    def test_each_unique_check_runs_once(self):
+        session = FakeSession()
+        citations = [citation(i, doi='10.1000/shared', url='https://example.org/paper') for i in range(10)]
+        validator = CitationValidator(max_workers=8, per_host=4, session=session)
+
+        results = validator.validate_citations(citations)
+
+        assert len(results) == 10
+        assert sorted(session.calls) == [
+            'https://api.crossref.org/works/10.1000/shared',
+            'https://example.org/paper',
+        ]
+
+    def test_per_host_limit_is_respected(self):
+        session = FakeSession(delay=0.02)
+        citations = [citation(i, url=f'https://slow.example.org/{i}') for i in range(12)]
+        validator = CitationValidator(max_workers=12, per_host=3, session=session)
+
+        validator.validate_citations(citations)
+
+        assert len(session.calls) == 12
+        assert session.max_active['slow.example.org'] <= 3
+
+    def test_checks_run_in_parallel(self):
+        session = FakeSession(delay=0.1)
+        citations = [citation(i, url=f'https://host{i}.example.org/paper') for i in range(20)]
+        validator = CitationValidator(max_workers=20, per_host=2, session=session)
+
+        start = time.perf_counter()
+        validator.validate_citations(citations)
+        elapsed = time.perf_counter() - start
+
+        # 20 sequential checks would take 2s
+        assert elapsed < 1.0
+
+    def test_results_match_serial_validation(self):
+        statuses = {
+            'https://api.crossref.org/works/10.1000/missing': 404,
+            'https://example.org/gone': 404,
+        }
+        citations = [
+            citation(0, doi='10.1000/ok', url='https://example.org/ok'),
+            citation(1, doi='10.1000/missing'),
+            citation(2, url='https://example.org/gone'),
+        ]
+        serial = CitationValidator(max_workers=1, per_host=1, session=FakeSession(statuses=statuses))
+        concurrent = CitationValidator(max_workers=8, per_host=4, session=FakeSession(statuses=statuses))
+
+        expected = [[(i.issue_type, i.message) for i in serial.validate_citation(c)] for c in citations]
+        actual = [[(i.issue_type, i.message) for i in issues] for issues in concurrent.validate_citations(citations)]
+
+        assert actual == expected
+        assert any(t == 'invalid_doi' for t, _ in actual[1])
+
+
+class TestVerdictCache:
+    """Verdicts persist across validator instances."""
+
+    def test_second_validator_skips_the_network(self, cache):
+        citations = [citation(i, doi=f'10.1000/{i}', url=f'https://example.org/{i}') for i in range(5)]
+        CitationValidator(session=FakeSession(), verdict_cache=cache).validate_citations(citations)
+
+        session = FakeSession()
+        validator = CitationValidator(session=session, verdict_cache=cache)
+        validator.validate_citations(citations)
+
+        assert session.calls == []
+        assert validator.cache_hits == 10
+
+    def test_doi_keys_are_normalized(self, cache):
+        validator = CitationValidator(session=FakeSession(), verdict_cache=cache)
+        validator.validate_doi('https://doi.org/10.1000/ABC')
+
+        assert cache.get_many(KIND_DOI, ['10.1000/abc']) == {'10.1000/abc': {'exists': True}}
+
+    def test_network_errors_are_not_cached(self, cache):
+        session = FakeSession(fail={'https://example.org/flaky'})
+        validator = CitationValidator(session=session, verdict_cache=cache)
+
+        assert validator.validate_url_status('https://example.org/flaky') == (None, "Connection failed")
+        assert len(cache) == 0
+
+    def test_negative_verdicts_expire_sooner(self, tmp_path):
+        cache = VerdictCache(tmp_path / "verdicts.db", ttl_seconds=3600, negative_ttl_seconds=0)
+        session = FakeSession(statuses={'https://example.org/gone': 404})
+        CitationValidator(session=session, verdict_cache=cache).validate_citations(
+            [citation(0, url='https://example.org/gone'), citation(1, url='https://example.org/ok')]
+        )
+
+        assert cache.get_many(KIND_URL, ['https://example.org/gone', 'https://example.org/ok']) == {
+            'https://example.org/ok': {'status': 200},
+        }
+        assert cache.purge_expired() == 1
+
+
+class TestQualityFilter:
+    """filter_database uses the concurrent path."""
+
+    def test_filter_database_removes_invalid_dois(self, tmp_path, cache):
+        db_path = tmp_path / "bibliography.json"
+        citations = [citation(0, doi='10.1000/ok'), citation(1, doi='10.1000/missing')]
+        db_path.write_text(json.dumps({'citations': citations}), encoding='utf-8')
+
+        filter_obj = CitationQualityFilter(strict_mode=True, verdict_cache=cache)
+        filter_obj.validator.session = FakeSession(
+            statuses={'https://api.crossref.org/works/10.1000/missing': 404}
+        )
+        stats = filter_obj.filter_database(db_path)
+
+        kept = json.loads(db_path.read_text(encoding='utf-8'))['citations']
+        assert [c['id'] for c in kept] == ['cite_000']
+        assert stats['total_removed'] == 1
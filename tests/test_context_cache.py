@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for explicit context caching in GeminiModelWrapper and the compose phase
+ABOUTME: Uses a fake google.genai client and the local backend; validates prefix reuse and fallbacks
+"""
+
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from concurrency.concurrency_config import reset_config
+from concurrency.rate_limiter import reset_gemini_limiter
+from phases import compose
+from phases.citations import _build_citation_summary
+from phases.context import DraftContext
+from utils.agent_runner import run_agent
+from utils.citation_database import Citation, CitationDatabase
+from utils.context_cache import (
+    ContextCacheError,
+    GeminiContextCacheBackend,
+    LocalContextCacheBackend,
+    default_context_cache_backend,
+)
+from utils.gemini_client import GeminiModelWrapper
+from utils.llm_cache import CachedResponse
+
+RESPONSE = "A generated section that is comfortably longer than the empty-output guard of run_agent."
+PREFIX = "Agent prompt. " * 2000
+
+
+class FakeModels:
+    """client.models stand-in recording what each call sent."""
+
+    def __init__(self, fail_cached=False):
+        self.fail_cached = fail_cached
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def generate_content(self, model, contents, config):
+        with self.lock:
+            self.calls.append((contents, dict(config or {})))
+        if self.fail_cached and "cached_content" in (config or {}):
+            raise RuntimeError("400 CachedContent not found (or permission denied)")
+        return CachedResponse.from_text(RESPONSE)
+
+    def generate_content_stream(self, model, contents, config):
+        # Lazy like the SDK: nothing is sent until the first chunk is pulled
+        yield self.generate_content(model, contents, config)
+
+
+class FakeCaches:
+    """client.caches stand-in."""
+
+    def __init__(self):
+        self.created = []
+        self.deleted = []
+
+    def create(self, model, config):
+        self.created.append((model, config))
+        return SimpleNamespace(name=f"cachedContents/{len(self.created)}")
+
+    def delete(self, name):
+        self.deleted.append(name)
+
+
+def make_client(fail_cached=False):
+    return SimpleNamespace(models=FakeModels(fail_cached), caches=FakeCaches())
+
+
+@pytest.fixture(autouse=True)
+def small_min_tokens(monkeypatch):
+    monkeypatch.setenv("GEMINI_CONTEXT_CACHE_MIN_TOKENS", "1000")
+
+
+class TestGeminiBackend:
+    """Server-side caching sends only the suffix plus the cache reference."""
+
+    def test_cached_call_sends_suffix(self):
+        client = make_client()
+        model = GeminiModelWrapper(client, "gemini-test", context_cache_backend=GeminiContextCacheBackend(client))
+
+        cached = model.create_cached_context(PREFIX, ttl_seconds=600, display_name="crafter")
+        model.generate_content(PREFIX + "Write the introduction.", cached_context=cached)
+
+        assert client.caches.created == [
+            ("gemini-test", {"contents": PREFIX, "ttl": "600s", "display_name": "crafter"})
+        ]
+        contents, config = client.models.calls[0]
+        assert contents == "Write the introduction."
+        assert config["cached_content"] == "cachedContents/1"
+        assert config["temperature"] == 0.7
+
+    def test_prompt_without_prefix_is_sent_in_full(self):
+        client = make_client()
+        model = GeminiModelWrapper(client, "gemini-test", context_cache_backend=GeminiContextCacheBackend(client))
+        cached = model.create_cached_context(PREFIX)
+
+        model.generate_content("Unrelated prompt", cached_context=cached)
+
+        assert client.models.calls == [("Unrelated prompt", {"temperature": 0.7})]
+
+    def test_rejected_cache_falls_back_to_full_prompt(self):
+        client = make_client(fail_cached=True)
+        model = GeminiModelWrapper(client, "gemini-test", context_cache_backend=GeminiContextCacheBackend(client))
+        cached = model.create_cached_context(PREFIX)
+
+        response = model.generate_content(PREFIX + "Suffix", cached_context=cached)
+        model.generate_content(PREFIX + "Suffix", cached_context=cached)
+
+        assert response.text == RESPONSE
+        assert [contents for contents, _ in client.models.calls] == ["Suffix", PREFIX + "Suffix", PREFIX + "Suffix"]
+        assert not cached.valid
+
+    def test_rejected_cache_falls_back_when_streaming(self):
+        client = make_client(fail_cached=True)
+        model = GeminiModelWrapper(client, "gemini-test", context_cache_backend=GeminiContextCacheBackend(client))
+        cached = model.create_cached_context(PREFIX)
+
+        chunks = list(model.generate_content_stream(PREFIX + "Suffix", cached_context=cached))
+        list(model.generate_content_stream(PREFIX + "Suffix", cached_context=cached))
+
+        assert [chunk.text for chunk in chunks] == [RESPONSE]
+        assert [contents for contents, _ in client.models.calls] == ["Suffix", PREFIX + "Suffix", PREFIX + "Suffix"]
+        assert not cached.valid
+
+    def test_delete_and_small_prefix(self):
+        client = make_client()
+        model = GeminiModelWrapper(client, "gemini-test", context_cache_backend=GeminiContextCacheBackend(client))
+        cached = model.create_cached_context(PREFIX)
+
+        model.delete_cached_context(cached)
+        model.delete_cached_context(cached)
+
+        assert client.caches.deleted == ["cachedContents/1"]
+        assert model.create_cached_context("Too short to cache") is None
+
+
+class TestLocalBackend:
+    """The local backend keeps the code path but sends the full prompt."""
+
+    def test_model_receives_uncached_prompt(self):
+        client = make_client()
+        backend = LocalContextCacheBackend()
+        model = GeminiModelWrapper(client, "gemini-test", context_cache_backend=backend)
+        cached = model.create_cached_context(PREFIX)
+
+        model.generate_content(PREFIX + "A", cached_context=cached)
+        list(model.generate_content_stream(PREFIX + "B", cached_context=cached))
+
+        assert [contents for contents, _ in client.models.calls] == [PREFIX + "A", PREFIX + "B"]
+        assert backend.requests == 2 and backend.cached_tokens == 2 * cached.prefix_tokens
+        assert client.caches.created == []
+
+    def test_deleted_cache_raises(self):
+        backend = LocalContextCacheBackend()
+        model = GeminiModelWrapper(make_client(), "gemini-test", context_cache_backend=backend)
+        cached = model.create_cached_context(PREFIX)
+        backend.delete(cached.name)
+
+        with pytest.raises(ContextCacheError):
+            backend.request(cached, PREFIX + "A", {})
+
+    @pytest.mark.parametrize("mode, expected", [
+        (None, GeminiContextCacheBackend), ("local", LocalContextCacheBackend), ("false", type(None)),
+    ])
+    def test_backend_from_env(self, monkeypatch, mode, expected):
+        if mode is None:
+            monkeypatch.delenv("GEMINI_CONTEXT_CACHE", raising=False)
+        else:
+            monkeypatch.setenv("GEMINI_CONTEXT_CACHE", mode)
+        assert isinstance(default_context_cache_backend(make_client()), expected)
+
+
+class TestRunAgentWithCachedContext:
+    """run_agent forwards the cached context; output is unchanged."""
+
+    def test_run_agent_uses_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GEMINI_TOKEN_BUCKET", "false")
+        monkeypatch.setenv("LLM_CACHE_MODE", "off")
+        reset_config()
+        reset_gemini_limiter()
+        prompt = tmp_path / "agent.md"
+        prompt.write_text(PREFIX, encoding="utf-8")
+        client = make_client()
+        model = GeminiModelWrapper(client, "gemini-test", context_cache_backend=GeminiContextCacheBackend(client))
+        from utils.agent_runner import build_full_prompt
+        cached = model.create_cached_context(build_full_prompt(PREFIX, "Shared context\n"))
+
+        try:
+            output = run_agent(model, "Agent", str(prompt), "Shared context\nSection request",
+                               verbose=False, cached_context=cached)
+        finally:
+            reset_gemini_limiter()
+            reset_config()
+
+        assert output == RESPONSE
+        assert client.models.calls[0][0] == "Section request"
+
+
+@pytest.fixture
+def compose_setup(tmp_path, monkeypatch):
+    monkeypatch.setenv("API_TIER", "custom")
+    monkeypatch.setenv("GEMINI_TOKEN_BUCKET", "true")
+    monkeypatch.setenv("LLM_CACHE_MODE", "off")
+    reset_config()
+    reset_gemini_limiter()
+
+    citations = [
+        Citation(f"cite_{i:03d}", [f"Author{i}"], 2020, f"Electric vehicle study {i}", "journal",
+                 abstract="Adoption, charging and policy. " * 10)
+        for i in range(1, 31)
+    ]
+    ctx = DraftContext(topic="Electric vehicle adoption", verbose=False, skip_validation=True)
+    drafts = tmp_path / "drafts"
+    drafts.mkdir()
+    ctx.folders = {'root': tmp_path, 'drafts': drafts}
+    ctx.word_targets = {section: "1,500" for section in compose.CONTEXT_BUDGETS}
+    ctx.citation_database = CitationDatabase(citations=citations)
+    ctx.citation_summary = _build_citation_summary(ctx.citation_database)
+    ctx.formatter_output = "# Outline\n" + "Chapter plan. " * 200
+    yield ctx
+    reset_gemini_limiter()
+    reset_config()
+
+
+class TestComposeSharedPrefix:
+    """All Crafter calls of a draft reuse one cached prefix."""
+
+    def test_one_cache_for_all_crafters(self, compose_setup):
+        ctx = compose_setup
+        client = make_client()
+        ctx.model = GeminiModelWrapper(client, "gemini-test", context_cache_backend=GeminiContextCacheBackend(client))
+
+        compose.run_compose_phase(ctx)
+
+        assert len(client.caches.created) == 1
+        assert client.caches.deleted == ["cachedContents/1"]
+        assert ctx.crafter_context is None
+        prefix = client.caches.created[0][1]["contents"]
+        assert "CITATION DATABASE - 30 CITATIONS AVAILABLE" in prefix
+        assert len(client.models.calls) == 7
+        for contents, config in client.models.calls:
+            assert config["cached_content"] == "cachedContents/1"
+            assert len(contents) < len(prefix) / 4
+            assert "Most relevant citations for this section" in contents
+
+    def test_uncached_prompts_share_the_preamble(self, compose_setup, monkeypatch):
+        monkeypatch.setenv("GEMINI_CONTEXT_CACHE", "false")
+        ctx = compose_setup
+        client = make_client()
+        ctx.model = GeminiModelWrapper(client, "gemini-test")
+
+        compose.run_compose_phase(ctx)
+
+        preamble = compose._crafter_preamble(ctx, with_citations=False)
+        assert client.caches.created == []
+        assert len(client.models.calls) == 7
+        for contents, config in client.models.calls:
+            assert "cached_content" not in config
+            assert f"User Request:\n{preamble}Write" in contents
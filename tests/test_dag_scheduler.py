@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for the dependency-graph scheduler and the compose section graph
+ABOUTME: Validates ordering, overlap, throttling, failure handling and graph validity
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from concurrency.dag_scheduler import DagScheduler
+from phases.compose import SECTION_DEPENDENCIES
+
+
+class TestTopologicalOrder:
+    """Graph validation and single-worker ordering."""
+
+    def test_insertion_order_when_no_dependencies(self):
+        scheduler = DagScheduler()
+        for name in ["a", "b", "c"]:
+            scheduler.add(name, lambda: None)
+        assert scheduler.topological_order() == ["a", "b", "c"]
+
+    def test_dependencies_respected(self):
+        scheduler = DagScheduler()
+        scheduler.add("b", lambda: None, depends_on=["a"])
+        scheduler.add("a", lambda: None)
+        assert scheduler.topological_order() == ["a", "b"]
+
+    def test_unknown_dependency_raises(self):
+        scheduler = DagScheduler()
+        scheduler.add("a", lambda: None, depends_on=["missing"])
+        with pytest.raises(ValueError, match="unknown task"):
+            scheduler.topological_order()
+
+    def test_cycle_raises(self):
+        scheduler = DagScheduler()
+        scheduler.add("a", lambda: None, depends_on=["b"])
+        scheduler.add("b", lambda: None, depends_on=["a"])
+        with pytest.raises(ValueError, match="cycle"):
+            scheduler.run()
+
+    def test_duplicate_name_raises(self):
+        scheduler = DagScheduler()
+        scheduler.add("a", lambda: None)
+        with pytest.raises(ValueError):
+            scheduler.add("a", lambda: None)
+
+
+class TestExecution:
+    """Sequential and parallel execution semantics."""
+
+    def test_sequential_runs_in_order(self):
+        calls = []
+        scheduler = DagScheduler(max_workers=1)
+        for name in ["a", "b", "c"]:
+            scheduler.add(name, lambda name=name: calls.append(name))
+        durations = scheduler.run()
+        assert calls == ["a", "b", "c"]
+        assert set(durations) == {"a", "b", "c"}
+
+    def test_independent_tasks_overlap(self):
+        barrier = threading.Barrier(3, timeout=2)
+        scheduler = DagScheduler(max_workers=3)
+        for name in ["a", "b", "c"]:
+            # Would time out (BrokenBarrierError) unless all three run at once
+            scheduler.add(name, barrier.wait)
+        scheduler.run()
+
+    def test_dependent_task_sees_upstream_result(self):
+        state = {}
+
+        def upstream():
+            time.sleep(0.05)
+            state["upstream"] = "done"
+
+        def downstream():
+            state["downstream"] = state.get("upstream")
+
+        scheduler = DagScheduler(max_workers=4)
+        scheduler.add("upstream", upstream)
+        scheduler.add("downstream", downstream, depends_on=["upstream"])
+        scheduler.run()
+        assert state["downstream"] == "done"
+
+    def test_max_workers_bounds_concurrency(self):
+        lock = threading.Lock()
+        active = {"now": 0, "peak": 0}
+
+        def task():
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.02)
+            with lock:
+                active["now"] -= 1
+
+        scheduler = DagScheduler(max_workers=2)
+        for i in range(6):
+            scheduler.add(f"t{i}", task)
+        scheduler.run()
+        assert active["peak"] <= 2
+
+    def test_submit_delay_spaces_throttled_starts(self):
+        starts = []
+        scheduler = DagScheduler(max_workers=3, submit_delay=0.05)
+        for name in ["a", "b", "c"]:
+            scheduler.add(name, lambda: starts.append(time.monotonic()))
+        scheduler.run()
+        starts.sort()
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert all(gap >= 0.04 for gap in gaps)
+
+    def test_unthrottled_task_skips_delay(self):
+        scheduler = DagScheduler(max_workers=1, submit_delay=1.0)
+        scheduler.add("a", lambda: None)
+        scheduler.add("merge", lambda: None, depends_on=["a"], throttled=False)
+        start = time.monotonic()
+        scheduler.run()
+        assert time.monotonic() - start < 0.5
+
+    def test_failure_stops_dependents_and_reraises(self):
+        calls = []
+
+        def boom():
+            raise RuntimeError("section failed")
+
+        scheduler = DagScheduler(max_workers=2)
+        scheduler.add("a", boom)
+        scheduler.add("b", lambda: calls.append("b"), depends_on=["a"])
+        with pytest.raises(RuntimeError, match="section failed"):
+            scheduler.run()
+        assert calls == []
+
+
+class TestComposeGraph:
+    """The compose section graph must be a valid DAG."""
+
+    def test_compose_graph_is_acyclic(self):
+        scheduler = DagScheduler()
+        for section, deps in SECTION_DEPENDENCIES.items():
+            scheduler.add(section, lambda: None, depends_on=deps)
+        order = scheduler.topological_order()
+        assert order == list(SECTION_DEPENDENCIES)
+
+    def test_independent_sections_only_need_outline(self):
+        roots = [s for s, deps in SECTION_DEPENDENCIES.items() if not deps]
+        assert set(roots) == {"introduction", "literature_review", "methodology"}
+
+    def test_discussion_waits_for_results_and_lit_review(self):
+        assert set(SECTION_DEPENDENCIES["discussion"]) >= {"results", "literature_review"}
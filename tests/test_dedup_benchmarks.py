@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Performance benchmarks for near-duplicate citation detection.
+
+find_duplicate_groups only runs SequenceMatcher on candidate pairs from
+title blocking once a bibliography is larger than EXHAUSTIVE_TITLE_LIMIT,
+so merged bibliographies across many drafts stay interactive.
+
+Performance Targets:
+- 1k citations: < 1s
+- 10k citations: < 10s
+- Candidate pairs at 10k citations: < 1% of all pairs
+"""
+
+import itertools
+import random
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from utils.deduplicate_citations import (
+    EXHAUSTIVE_TITLE_LIMIT,
+    find_duplicate_groups,
+    normalize_text,
+    title_candidate_pairs,
+)
+
+SYLLABLES = [
+    "ka", "ri", "to", "men", "sa", "lo", "vi", "qu", "an", "tion", "ing", "ex", "pro", "de", "com",
+    "net", "data", "bio", "gen", "ol", "ar", "um", "phy", "lex", "tor", "mi", "ne", "sy", "cal", "ve",
+]
+STOP_WORDS = ["the", "of", "a", "and", "for", "in", "on", "with", "to", "from", "an", "by"]
+
+
+def _synthetic_citations(count: int, duplicate_rate: float = 0.15, seed: int = 7) -> List[Dict]:
+    """
+    Build citations with Zipf-distributed title words and near-duplicate variants.
+
+    Variants mimic what different APIs return for the same work: case
+    changes, a swapped word, a dropped last word, an added subtitle, or
+    inflected words.
+    """
+    rng = random.Random(seed)
+    vocab = set()
+    while len(vocab) < 20000:
+        vocab.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    vocab = sorted(vocab)
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocab))))
+
+    def word() -> str:
+        return rng.choices(vocab, cum_weights=cum_weights)[0]
+
+    def title() -> str:
+        words = [rng.choice(STOP_WORDS) if rng.random() < 0.25 else word() for _ in range(rng.randint(5, 14))]
+        return " ".join(words).capitalize()
+
+    def variant(original: str) -> str:
+        words = original.split()
+        roll = rng.random()
+        if roll < 0.2:
+            return original.upper()
+        if roll < 0.4:
+            words[rng.randrange(len(words))] = word()
+            return " ".join(words)
+        if roll < 0.55:
+            return " ".join(words[:-1])
+        if roll < 0.7:
+            return f"{original}: a {word()} {word()}"
+        for _ in range(rng.randint(1, 3)):
+            i = rng.randrange(len(words))
+            words[i] += rng.choice(["s", "ed", "ic", "al"])
+        return " ".join(words)
+
+    titles: List[str] = []
+    for _ in range(count):
+        titles.append(variant(rng.choice(titles)) if titles and rng.random() < duplicate_rate else title())
+
+    return [{"id": f"cite_{i:05d}", "title": t} for i, t in enumerate(titles)]
+
+
+def _group_ids(groups: Dict[str, List[List[Dict]]]) -> Dict[str, List[List[str]]]:
+    return {key: [[c["id"] for c in group] for group in value] for key, value in groups.items()}
+
+
+class TestBlockingAccuracy:
+    """Blocking finds the same groups as comparing every pair."""
+
+    def test_small_inputs_compare_every_pair(self):
+        citations = _synthetic_citations(EXHAUSTIVE_TITLE_LIMIT // 2, duplicate_rate=0.3)
+        assert _group_ids(find_duplicate_groups(citations)) == \
+            _group_ids(find_duplicate_groups(citations, exhaustive=True))
+
+    def test_blocking_matches_exhaustive_title_matches(self):
+        citations = _synthetic_citations(150, duplicate_rate=0.3, seed=11)
+        exhaustive = _group_ids(find_duplicate_groups(citations, exhaustive=True))
+        blocked = _group_ids(find_duplicate_groups(citations, exhaustive=False))
+
+        assert blocked["title_match"] == exhaustive["title_match"]
+        # Blocking may only drop weak 0.7-0.9 pairs that share few words
+        assert set(map(tuple, blocked["potential"])) <= set(map(tuple, exhaustive["potential"]))
+        assert len(blocked["potential"]) >= 0.9 * len(exhaustive["potential"])
+
+    def test_identical_common_word_titles_are_paired(self):
+        titles = ["The study of the data"] * 2 + [f"The study of the data {i}" for i in range(300)]
+        normalized = [normalize_text(t) for t in titles]
+        assert (0, 1) in title_candidate_pairs(normalized)
+
+    def test_url_groups_skip_doi_duplicates(self):
+        citations = [
+            {"id": "cite_001", "title": "A", "doi": "10.1/x", "url": "https://a.org/p"},
+            {"id": "cite_002", "title": "B", "doi": "10.1/X", "url": "https://a.org/p/"},
+            {"id": "cite_003", "title": "C", "url": "https://b.org/q"},
+            {"id": "cite_004", "title": "D", "url": "http://www.b.org/q"},
+        ]
+        groups = _group_ids(find_duplicate_groups(citations))
+        assert groups["exact_doi"] == [["cite_001", "cite_002"]]
+        assert groups["exact_url"] == [["cite_003", "cite_004"]]
+
+
+class TestDedupBenchmarks:
+    """Benchmark duplicate detection at bibliography-merge scale."""
+
+    def test_dedup_1k(self):
+        """Benchmark: 1k citations (< 1s)."""
+        citations = _synthetic_citations(1_000)
+        start = time.perf_counter()
+        groups = find_duplicate_groups(citations)
+        elapsed = time.perf_counter() - start
+
+        assert groups["title_match"]
+        assert elapsed < 1.0, f"1k dedup too slow: {elapsed:.2f}s (target: <1s)"
+        print(f"\n1k citations: {elapsed * 1000:.0f}ms")
+
+    def test_dedup_10k(self):
+        """Benchmark: 10k citations (< 10s)."""
+        citations = _synthetic_citations(10_000)
+        start = time.perf_counter()
+        groups = find_duplicate_groups(citations)
+        elapsed = time.perf_counter() - start
+
+        assert len(groups["title_match"]) > 1_000
+        assert elapsed < 10.0, f"10k dedup too slow: {elapsed:.2f}s (target: <10s)"
+        print(f"\n10k citations: {elapsed:.2f}s")
+
+    def test_candidate_pairs_scale_subquadratically(self):
+        """Candidate pairs at 10k citations are < 1% of all pairs."""
+        normalized = [normalize_text(c["title"]) for c in _synthetic_citations(10_000)]
+        candidates = title_candidate_pairs(normalized)
+        all_pairs = len(normalized) * (len(normalized) - 1) // 2
+
+        assert len(candidates) < 0.01 * all_pairs, f"{len(candidates):,} candidates of {all_pairs:,} pairs"
+        print(f"\n10k citations: {len(candidates):,} candidate pairs ({len(candidates) / all_pairs:.4%})")
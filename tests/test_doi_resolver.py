@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for batched DOI metadata resolution (OpenAlex OR-filter, Crossref fallback)
+ABOUTME: Uses fake _make_request - no network access
+"""
+
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from utils.api_citations.base import normalize_doi
+from utils.api_citations.crossref import CrossrefClient
+from utils.api_citations.doi_resolver import BatchDOIResolver, merge_metadata
+from utils.api_citations.openalex import OpenAlexClient
+from utils.citation_database import Citation
+
+
+def _openalex_work(doi: str) -> dict:
+    return {
+        "id": f"https://openalex.org/W{abs(hash(doi)) % 10**6}",
+        "doi": f"https://doi.org/{doi}",
+        "title": f"Work {doi}",
+        "authorships": [{"author": {"display_name": "Jane Smith"}}, {"author": {"display_name": "Li Wong"}}],
+        "publication_year": 2020,
+        "primary_location": {"source": {"display_name": "Journal of Tests", "host_organization_name": "Test Press"}},
+        "type": "article",
+        "cited_by_count": 7,
+        "biblio": {"volume": "12", "issue": "3", "first_page": "45", "last_page": "67"},
+    }
+
+
+def _crossref_item(doi: str) -> dict:
+    return {
+        "DOI": doi,
+        "title": [f"Work {doi}"],
+        "author": [{"family": "Brown", "given": "Ann"}],
+        "published": {"date-parts": [[2019]]},
+        "container-title": ["Crossref Journal"],
+        "publisher": "Crossref Press",
+        "volume": "4",
+        "page": "1-9",
+        "type": "journal-article",
+    }
+
+
+class FakeOpenAlex(OpenAlexClient):
+    """Answers bulk filter requests for a fixed set of known DOIs."""
+
+    def __init__(self, known):
+        super().__init__()
+        self.known = set(known)
+        self.requests = []
+
+    def _make_request(self, method, endpoint, params=None, **kwargs):
+        self.requests.append(params)
+        dois = params["filter"][len("doi:"):].split("|")
+        return {"results": [_openalex_work(d) for d in dois if d in self.known]}
+
+
+class FakeCrossref(CrossrefClient):
+    """Answers bulk filter requests for a fixed set of known DOIs."""
+
+    def __init__(self, known):
+        super().__init__()
+        self.known = set(known)
+        self.requests = []
+
+    def _make_request(self, method, endpoint, params=None, **kwargs):
+        self.requests.append(params)
+        dois = [part[len("doi:"):] for part in params["filter"].split(",")]
+        return {"message": {"items": [_crossref_item(d) for d in dois if d in self.known]}}
+
+
+class TestNormalizeDoi:
+    """DOIs are compared case-insensitively without resolver prefixes."""
+
+    @pytest.mark.parametrize("raw", [
+        "10.1000/ABC", "https://doi.org/10.1000/abc", "doi:10.1000/abc", " http://dx.doi.org/10.1000/Abc ",
+    ])
+    def test_variants_collapse(self, raw):
+        assert normalize_doi(raw) == "10.1000/abc"
+
+    def test_non_doi_is_empty(self):
+        assert normalize_doi("https://example.com/paper") == ""
+        assert normalize_doi(None) == ""
+
+
+class TestBulkClients:
+    """Client bulk lookups chunk at 50 DOIs per request."""
+
+    def test_openalex_chunks_by_fifty(self):
+        dois = [f"10.1000/{i}" for i in range(120)]
+        client = FakeOpenAlex(dois)
+        found = client.get_papers_by_dois(dois)
+
+        assert len(found) == 120
+        assert [len(p["filter"].split("|")) for p in client.requests] == [50, 50, 20]
+        assert found["10.1000/7"]["pages"] == "45-67"
+        assert found["10.1000/7"]["volume"] == "12"
+
+    def test_crossref_uses_or_filter(self):
+        client = FakeCrossref(["10.1000/a", "10.1000/b"])
+        found = client.get_papers_by_dois(["10.1000/A", "https://doi.org/10.1000/b", "10.1000/a"])
+
+        assert set(found) == {"10.1000/a", "10.1000/b"}
+        assert client.requests[0]["filter"] == "doi:10.1000/a,doi:10.1000/b"
+
+
+class TestBatchDOIResolver:
+    """Bulk resolution, fallback and memoization."""
+
+    def test_crossref_only_sees_openalex_misses(self):
+        openalex = FakeOpenAlex(["10.1000/a"])
+        crossref = FakeCrossref(["10.1000/b"])
+        resolver = BatchDOIResolver(openalex=openalex, crossref=crossref)
+
+        resolved = resolver.resolve(["10.1000/a", "10.1000/b", "10.1000/missing"])
+
+        assert resolved["10.1000/a"]["journal"] == "Journal of Tests"
+        assert resolved["10.1000/b"]["journal"] == "Crossref Journal"
+        assert "10.1000/missing" not in resolved
+        assert crossref.requests[0]["filter"] == "doi:10.1000/b,doi:10.1000/missing"
+
+    def test_memo_avoids_repeat_requests(self):
+        openalex = FakeOpenAlex(["10.1000/a"])
+        crossref = FakeCrossref([])
+        resolver = BatchDOIResolver(openalex=openalex, crossref=crossref)
+
+        resolver.resolve(["10.1000/a", "10.1000/missing"])
+        resolver.resolve(["https://doi.org/10.1000/A", "10.1000/missing"])
+
+        assert len(openalex.requests) == 1
+        assert len(crossref.requests) == 1
+        assert resolver.cached("10.1000/a")["title"] == "Work 10.1000/a"
+        assert resolver.cached("10.1000/missing") is None
+
+    def test_failed_requests_are_not_memoized(self):
+        openalex = FakeOpenAlex(["10.1000/a"])
+        crossref = FakeCrossref([])
+        resolver = BatchDOIResolver(openalex=openalex, crossref=crossref)
+        real_request = openalex._make_request
+        openalex._make_request = lambda *args, **kwargs: None  # every retry exhausted
+
+        assert resolver.resolve(["10.1000/a", "10.1000/missing"]) == {}
+
+        openalex._make_request = real_request
+        resolved = resolver.resolve(["10.1000/a", "10.1000/missing"])
+
+        assert "10.1000/a" in resolved
+        assert len(openalex.requests) == 1
+        assert len(crossref.requests) == 2
+        assert resolver.get_stats()["memoized"] == 2
+
+    def test_enrich_citations_fills_gaps_only(self):
+        resolver = BatchDOIResolver(openalex=FakeOpenAlex(["10.1000/a", "10.1000/b"]), crossref=FakeCrossref([]))
+        web = Citation(
+            citation_id="cite_001", authors=["Smith et al."], year=2020, title="Web copy",
+            source_type="website", doi="10.1000/a",
+        )
+        curated = Citation(
+            citation_id="cite_002", authors=["Keep"], year=2018, title="Curated",
+            source_type="journal", journal="Original Journal", doi="10.1000/b",
+        )
+        no_doi = Citation(citation_id="cite_003", authors=[], year=2021, title="No DOI", source_type="website")
+
+        assert resolver.enrich_citations([web, curated, no_doi]) == 2
+
+        assert web.authors == ["Smith", "Wong"]
+        assert web.journal == "Journal of Tests"
+        assert web.pages == "45-67"
+        assert curated.authors == ["Keep"]
+        assert curated.year == 2018
+        assert curated.journal == "Original Journal"
+        assert curated.volume == "12"
+        assert no_doi.authors == []
+
+    def test_complete_citations_skip_network(self):
+        openalex = FakeOpenAlex(["10.1000/a"])
+        resolver = BatchDOIResolver(openalex=openalex, crossref=FakeCrossref([]))
+        complete = {
+            "authors": ["Smith"], "year": 2020, "journal": "J", "volume": "1", "pages": "2-3", "doi": "10.1000/a",
+        }
+        assert resolver.enrich_citations([complete]) == 0
+        assert openalex.requests == []
+
+    def test_merge_into_metadata_dict(self):
+        metadata = {"title": "T", "authors": "Smith et al.", "year": None}
+        assert merge_metadata(metadata, {"authors": ["Smith", "Wong"], "year": 2020, "journal": "J"})
+        assert metadata == {"title": "T", "authors": ["Smith", "Wong"], "year": 2020, "journal": "J"}
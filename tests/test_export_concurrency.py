@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for concurrent PDF/DOCX export and the cached, precompiled LaTeX preamble
+ABOUTME: Uses fake pandoc/xelatex processes; validates overlap, preamble caching and format reuse
+"""
+
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from phases import compile as compile_phase
+from phases.context import DraftContext
+from utils import export_professional
+from utils.pdf_engines import latex_format, pandoc_engine
+from utils.pdf_engines.base import PDFGenerationOptions
+from utils.pdf_engines.latex_format import ENDOFDUMP_MARKER, LatexFormatCache
+from utils.pdf_engines.pandoc_engine import PandocLatexEngine
+
+
+@pytest.fixture
+def exports_ctx(tmp_path):
+    ctx = DraftContext(topic="Topic", verbose=False)
+    ctx.folders = {'root': tmp_path, 'exports': tmp_path}
+    md = tmp_path / "draft.md"
+    md.write_text("# Draft\n\nText.\n", encoding="utf-8")
+    return ctx, md
+
+
+class FakeTeX:
+    """subprocess.run stand-in for xelatex --version, format dumps and warm compiles."""
+
+    def __init__(self, fail_compile=False):
+        self.fail_compile = fail_compile
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, cmd, cwd=None, env=None, **kwargs):
+        with self.lock:
+            self.calls.append(list(cmd))
+        cwd = Path(cwd) if cwd else Path.cwd()
+        if "--version" in cmd:
+            return subprocess.CompletedProcess(cmd, 0, "XeTeX 3.141592653-2.6-0.999995 (TeX Live 2024)\n", "")
+        if "-ini" in cmd:
+            jobname = next(arg.split("=", 1)[1] for arg in cmd if arg.startswith("-jobname="))
+            time.sleep(0.05)
+            (cwd / f"{jobname}.fmt").write_bytes(b"format")
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+        if self.fail_compile:
+            return subprocess.CompletedProcess(cmd, 1, "! Emergency stop", "")
+        tex = cwd / cmd[-1]
+        assert "\\endofdump" in tex.read_text(encoding="utf-8")
+        assert "TEXFORMATS" in env
+        tex.with_suffix(".pdf").write_bytes(b"%PDF")
+        tex.with_suffix(".log").write_text("Output written", encoding="utf-8")
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    def runs(self, flag):
+        return [c for c in self.calls if flag in c]
+
+
+class TestConcurrentExport:
+    """PDF and DOCX export overlap in the compile phase."""
+
+    def test_exports_run_side_by_side(self, exports_ctx, monkeypatch):
+        ctx, md = exports_ctx
+
+        def slow_export(path_key):
+            def export(md_file, engine=None, **kwargs):
+                time.sleep(0.3)
+                Path(kwargs[path_key]).write_bytes(b"out")
+                return True
+            return export
+
+        monkeypatch.setattr(export_professional, "export_pdf", slow_export("output_pdf"))
+        monkeypatch.setattr(export_professional, "export_docx", slow_export("output_docx"))
+
+        start = time.perf_counter()
+        pdf_path, docx_path = compile_phase._export_pdf_and_docx(ctx, md, "draft")
+        elapsed = time.perf_counter() - start
+
+        assert pdf_path.exists() and docx_path.exists()
+        assert elapsed < 0.55
+
+    def test_pdf_failure_is_reported_first(self, exports_ctx, monkeypatch):
+        ctx, md = exports_ctx
+        monkeypatch.setattr(export_professional, "export_pdf", lambda **kwargs: False)
+        monkeypatch.setattr(export_professional, "export_docx", lambda **kwargs: False)
+
+        with pytest.raises(RuntimeError, match="PDF export failed"):
+            compile_phase._export_pdf_and_docx(ctx, md, "draft")
+
+
+class TestPreambleCache:
+    """Generated preambles are reused per options hash."""
+
+    def test_same_options_reuse_preamble(self, monkeypatch):
+        monkeypatch.setattr(PandocLatexEngine, "_preamble_cache", {})
+        builds = []
+        original = PandocLatexEngine._build_latex_preamble
+        monkeypatch.setattr(PandocLatexEngine, "_build_latex_preamble",
+                            lambda self, o, md="": builds.append(o) or original(self, o, md))
+
+        first = PandocLatexEngine()._create_latex_preamble(PDFGenerationOptions(title="A", date="2026"))
+        second = PandocLatexEngine()._create_latex_preamble(PDFGenerationOptions(title="A", date="2026"))
+        other = PandocLatexEngine()._create_latex_preamble(PDFGenerationOptions(title="B", date="2026"))
+
+        assert first is second
+        assert other != first
+        assert len(builds) == 2
+
+    def test_marker_splits_shared_packages_from_title_page(self):
+        preamble = PandocLatexEngine()._create_latex_preamble(PDFGenerationOptions(title="A Title", date="2026"))
+
+        before, after = preamble.split(ENDOFDUMP_MARKER)
+        assert "\\usepackage{fontspec}" in before and "A Title" not in before
+        assert "A Title" in after
+
+
+class TestLatexFormatCache:
+    """Dumped formats are built once per preamble prefix and XeLaTeX version."""
+
+    def test_format_built_once_and_reused(self, tmp_path, monkeypatch):
+        fake = FakeTeX()
+        monkeypatch.setattr(latex_format.subprocess, "run", fake)
+        cache = LatexFormatCache(tmp_path / "fmt", "/usr/bin/xelatex")
+
+        names = set()
+        threads = [threading.Thread(target=lambda: names.add(cache.ensure_format("\\documentclass{article}\n")))
+                   for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(names) == 1
+        assert len(fake.runs("-ini")) == 1
+        assert cache.format_path(names.pop()).exists()
+        assert cache.ensure_format("\\documentclass{report}\n") not in names
+        assert len(fake.runs("-ini")) == 2
+        assert sorted(p.suffix for p in (tmp_path / "fmt").iterdir()) == [".fmt", ".fmt"]
+
+    def test_compile_runs_twice_for_toc(self, tmp_path, monkeypatch):
+        fake = FakeTeX()
+        monkeypatch.setattr(latex_format.subprocess, "run", fake)
+        cache = LatexFormatCache(tmp_path / "fmt", "/usr/bin/xelatex")
+        tex = tmp_path / "draft.tex"
+        tex.write_text("\\documentclass{article}\n\\endofdump\n\\begin{document}x\\end{document}\n")
+
+        assert cache.compile(tex, "opendraft-abc", toc=True)
+        assert len(fake.runs("-fmt=opendraft-abc")) == 2
+        assert tex.with_suffix(".pdf").exists()
+
+
+class TestWarmPandocRun:
+    """PandocLatexEngine compiles against the dumped preamble and falls back when it cannot."""
+
+    def _patch(self, tmp_path, monkeypatch, fake, write_marker=True):
+        def fake_run(cmd, **kwargs):
+            if cmd[0] != "pandoc":
+                return fake(cmd, **kwargs)
+            output = Path(cmd[cmd.index("-o") + 1])
+            marker = ENDOFDUMP_MARKER if write_marker else ""
+            output.write_text(f"\\documentclass{{article}}\n{marker}\n\\begin{{document}}x\\end{{document}}\n")
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        # pandoc_engine and latex_format share the subprocess module
+        monkeypatch.setattr(pandoc_engine.subprocess, "run", fake_run)
+        monkeypatch.setattr(PandocLatexEngine, "_find_xelatex", lambda self: "/usr/bin/xelatex")
+        monkeypatch.setattr(LatexFormatCache, "is_available", lambda self: True)
+        monkeypatch.setenv("LATEX_FORMAT_DIR", str(tmp_path / "fmt"))
+        latex_format.reset_latex_format_cache()
+
+    def test_warm_compile_produces_pdf(self, tmp_path, monkeypatch):
+        fake = FakeTeX()
+        self._patch(tmp_path, monkeypatch, fake)
+        md, preamble = tmp_path / "in.md", tmp_path / "pre.tex"
+        md.write_text("x")
+        preamble.write_text("x")
+
+        engine = PandocLatexEngine()
+        options = PDFGenerationOptions(enable_toc=False)
+        first = engine._run_pandoc_warm(md, tmp_path / "out.pdf", preamble, options)
+        second = engine._run_pandoc_warm(md, tmp_path / "out2.pdf", preamble, options)
+
+        assert first.success and second.success
+        assert (tmp_path / "out.pdf").exists()
+        assert not (tmp_path / "out.tex").exists()
+        assert len(fake.runs("-ini")) == 1
+        latex_format.reset_latex_format_cache()
+
+    @pytest.mark.parametrize("write_marker, fail_compile", [(False, False), (True, True)])
+    def test_falls_back_to_cold_run(self, tmp_path, monkeypatch, write_marker, fail_compile):
+        self._patch(tmp_path, monkeypatch, FakeTeX(fail_compile=fail_compile), write_marker=write_marker)
+        md, preamble = tmp_path / "in.md", tmp_path / "pre.tex"
+        md.write_text("x")
+        preamble.write_text("x")
+
+        result = PandocLatexEngine()._run_pandoc_warm(md, tmp_path / "out.pdf", preamble, PDFGenerationOptions())
+
+        assert result is None
+        latex_format.reset_latex_format_cache()
+
+    def test_disabled_by_env(self, monkeypatch):
+        monkeypatch.setenv("LATEX_FORMAT_CACHE", "false")
+        assert latex_format.get_latex_format_cache("/usr/bin/xelatex") is None
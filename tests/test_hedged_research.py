@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for completion policies in CitationResearcher's parallel API fan-out
+ABOUTME: Validates early return on fast DOI hits, latency budgets and caching of straggler results
+"""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from utils.api_citations.completion_policy import (
+    MODE_ALL,
+    MODE_BUDGET,
+    MODE_FIRST,
+    CompletionPolicy,
+)
+from utils.api_citations.orchestrator import CitationResearcher
+
+
+class FakeClient:
+    """Academic API stand-in: waits, then returns metadata (sync and async)."""
+
+    def __init__(self, delay: float, doi: str = None, url: str = None):
+        self.delay = delay
+        self.doi = doi
+        self.url = url
+        self.finished = threading.Event()
+
+    def _metadata(self, query):
+        return {
+            "title": f"Paper about {query}",
+            "authors": ["Smith"],
+            "year": 2020,
+            "doi": self.doi,
+            "url": self.url,
+            "journal": "Journal of Tests",
+            "source_type": "journal",
+        }
+
+    def search_paper(self, query):
+        time.sleep(self.delay)
+        self.finished.set()
+        return self._metadata(query)
+
+    async def search_paper_async(self, query):
+        await asyncio.sleep(self.delay)
+        self.finished.set()
+        return self._metadata(query)
+
+    async def aclose(self):
+        pass
+
+
+def make_researcher(tmp_path, monkeypatch, policy, fast, slow):
+    monkeypatch.setenv("CITATION_CACHE_DB", str(tmp_path / "cache.db"))
+    r = CitationResearcher(
+        enable_semantic_scholar=False,
+        enable_gemini_grounded=False,
+        enable_llm_fallback=False,
+        enable_smart_routing=False,
+        verbose=False,
+        completion_policy=policy,
+    )
+    r.crossref = fast
+    r.openalex = slow
+    return r
+
+
+def wait_for_cache(researcher, topic, count, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        _, cached = researcher.cache.get(topic)
+        if cached and len(cached) >= count:
+            return cached
+        time.sleep(0.02)
+    return researcher.cache.get(topic)[1]
+
+
+class TestCompletionPolicy:
+    """Stop conditions per mode."""
+
+    def test_first_counts_doi_results(self):
+        policy = CompletionPolicy(mode=MODE_FIRST, first_n=2)
+        assert not policy.is_complete(0.1, [({"doi": "10.1/a"}, "Crossref"), ({"url": "http://x"}, "Serper")])
+        assert policy.is_complete(0.1, [({"doi": "10.1/a"}, "Crossref"), ({"doi": "10.1/b"}, "OpenAlex")])
+
+    def test_budget_needs_a_usable_result(self):
+        policy = CompletionPolicy(mode=MODE_BUDGET, latency_budget=1.0, timeout=30)
+        assert not policy.is_complete(0.5, [({"doi": "10.1/a"}, "Crossref")])
+        assert not policy.is_complete(1.5, [(None, "crossref")])
+        assert policy.is_complete(1.5, [({"url": "http://x"}, "Serper")])
+        assert policy.next_wait(0.25) == 0.75
+        assert policy.next_wait(2.0) == 28.0
+
+    def test_all_never_completes_early(self):
+        policy = CompletionPolicy(mode=MODE_ALL, timeout=30)
+        assert not policy.is_complete(29, [({"doi": "10.1/a"}, "Crossref")])
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("CITATION_COMPLETION_POLICY", "first")
+        monkeypatch.setenv("CITATION_FIRST_N", "2")
+        assert CompletionPolicy.from_env(timeout=10) == CompletionPolicy(MODE_FIRST, 2, 8.0, 10)
+        monkeypatch.setenv("CITATION_COMPLETION_POLICY", "bogus")
+        assert CompletionPolicy.from_env(timeout=10).mode == MODE_BUDGET
+
+
+class TestSyncHedging:
+    """research_citation returns on the fast hit and caches the straggler later."""
+
+    def test_first_policy_returns_before_slow_api(self, tmp_path, monkeypatch):
+        fast = FakeClient(0.05, doi="10.1000/fast")
+        slow = FakeClient(0.6, doi="10.1000/slow")
+        r = make_researcher(tmp_path, monkeypatch, CompletionPolicy(mode=MODE_FIRST), fast, slow)
+
+        start = time.monotonic()
+        citations = r.research_citation("hedged topic")
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.4
+        assert [c.doi for c in citations] == ["10.1000/fast"]
+
+        cached = wait_for_cache(r, "hedged topic", 2)
+        assert [metadata["doi"] for metadata, _ in cached] == ["10.1000/fast", "10.1000/slow"]
+        assert len(r.research_citation("hedged topic")) == 2
+
+    def test_all_policy_waits_for_every_api(self, tmp_path, monkeypatch):
+        fast = FakeClient(0.01, doi="10.1000/fast")
+        slow = FakeClient(0.2, doi="10.1000/slow")
+        r = make_researcher(tmp_path, monkeypatch, CompletionPolicy(mode=MODE_ALL), fast, slow)
+
+        citations = r.research_citation("patient topic")
+
+        assert [c.doi for c in citations] == ["10.1000/fast", "10.1000/slow"]
+
+    def test_budget_keeps_waiting_without_results(self, tmp_path, monkeypatch):
+        empty = FakeClient(0.01)
+        slow = FakeClient(0.3, doi="10.1000/slow")
+        policy = CompletionPolicy(mode=MODE_BUDGET, latency_budget=0.05, timeout=5)
+        r = make_researcher(tmp_path, monkeypatch, policy, empty, slow)
+
+        citations = r.research_citation("sparse topic")
+
+        assert [c.doi for c in citations] == ["10.1000/slow"]
+
+
+class TestAsyncHedging:
+    """research_citation_async applies the same policy on the event loop."""
+
+    def test_straggler_result_is_cached(self, tmp_path, monkeypatch):
+        fast = FakeClient(0.05, doi="10.1000/fast")
+        slow = FakeClient(0.3, doi="10.1000/slow")
+        policy = CompletionPolicy(mode=MODE_BUDGET, latency_budget=0.1, timeout=5)
+        r = make_researcher(tmp_path, monkeypatch, policy, fast, slow)
+
+        async def run():
+            start = time.monotonic()
+            citations = await r.research_citation_async("async topic")
+            elapsed = time.monotonic() - start
+            await asyncio.sleep(0.5)
+            return citations, elapsed
+
+        citations, elapsed = asyncio.run(run())
+
+        assert elapsed < 0.25
+        assert [c.doi for c in citations] == ["10.1000/fast"]
+        _, cached = r.cache.get("async topic")
+        assert [metadata["doi"] for metadata, _ in cached] == ["10.1000/fast", "10.1000/slow"]
+
+    def test_batch_caches_stragglers_before_returning(self, tmp_path, monkeypatch):
+        fast = FakeClient(0.01, doi="10.1000/fast")
+        slow = FakeClient(0.3, doi="10.1000/slow")
+        r = make_researcher(tmp_path, monkeypatch, CompletionPolicy(mode=MODE_FIRST, timeout=5), fast, slow)
+
+        results = r.research_citations_batch(["batch topic"], on_result=lambda *_: True)
+
+        assert [c.doi for c in results[0][2]] == ["10.1000/fast"]
+        _, cached = r.cache.get("batch topic")
+        assert [metadata["doi"] for metadata, _ in cached] == ["10.1000/fast", "10.1000/slow"]
+
+    def test_batch_waits_briefly_for_slow_stragglers(self, tmp_path, monkeypatch):
+        fast = FakeClient(0.01, doi="10.1000/fast")
+        slow = FakeClient(5, doi="10.1000/slow")
+        r = make_researcher(tmp_path, monkeypatch, CompletionPolicy(mode=MODE_FIRST, timeout=30), fast, slow)
+        r.STRAGGLER_DRAIN_SECONDS = 0.2
+
+        start = time.monotonic()
+        results = r.research_citations_batch(["impatient topic"])
+        elapsed = time.monotonic() - start
+
+        assert [c.doi for c in results[0][2]] == ["10.1000/fast"]
+        assert elapsed < 1.5
+        assert not r._straggler_tasks
+
+    def test_aclose_cancels_stragglers(self, tmp_path, monkeypatch):
+        fast = FakeClient(0.01, doi="10.1000/fast")
+        slow = FakeClient(5, doi="10.1000/slow")
+        r = make_researcher(tmp_path, monkeypatch, CompletionPolicy(mode=MODE_FIRST), fast, slow)
+
+        async def run():
+            citations = await r.research_citation_async("closing topic")
+            await r.aclose()
+            return citations
+
+        assert len(asyncio.run(run())) == 1
+        assert not r._straggler_tasks
+        assert not slow.finished.is_set()
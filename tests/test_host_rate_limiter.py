@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for the process-wide per-host API rate limiters
+ABOUTME: Validates slot spacing across threads and clients, Retry-After pauses and adaptive rates
+"""
+
+import email.utils
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from concurrency.host_rate_limiter import (
+    MAX_RETRY_AFTER_SECONDS,
+    SUCCESS_STREAK,
+    HostRateLimiter,
+    get_host_limiter,
+    parse_retry_after,
+    reset_host_limiters,
+)
+from utils.api_citations import base
+from utils.api_citations.crossref import CrossrefClient
+
+
+@pytest.fixture(autouse=True)
+def _reset_limiters():
+    reset_host_limiters()
+    yield
+    reset_host_limiters()
+
+
+class TestHostRateLimiter:
+    """Slots are spaced 1/rate apart, also under concurrency."""
+
+    def test_concurrent_threads_are_spaced(self):
+        limiter = HostRateLimiter("example.org", floor=5, ceiling=20)
+        starts = []
+        lock = threading.Lock()
+
+        def worker():
+            limiter.acquire()
+            with lock:
+                starts.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        starts.sort()
+        # Six slots at 20/s span at least five intervals; no two start together
+        assert starts[-1] - starts[0] >= 0.2
+        assert min(b - a for a, b in zip(starts, starts[1:])) >= 0.03
+
+    def test_429_halves_rate_and_honours_retry_after(self):
+        limiter = HostRateLimiter("example.org", floor=5, ceiling=40)
+        limiter.acquire()
+
+        pause = limiter.record_rate_limited(retry_after=0.3)
+        waited = limiter.acquire()
+
+        assert pause == 0.3
+        assert limiter.rate == 20
+        assert 0.25 <= waited < 0.6
+
+    def test_long_retry_after_is_capped(self):
+        limiter = HostRateLimiter("example.org", floor=5, ceiling=40)
+
+        pause = limiter.record_rate_limited(retry_after=86400)
+
+        assert pause == MAX_RETRY_AFTER_SECONDS
+
+    def test_rate_never_drops_below_floor(self):
+        limiter = HostRateLimiter("example.org", floor=5, ceiling=40)
+        for _ in range(5):
+            limiter.record_rate_limited(retry_after=0)
+        assert limiter.rate == 5
+
+    def test_success_streak_recovers_rate(self):
+        limiter = HostRateLimiter("example.org", floor=10, ceiling=20)
+        limiter.record_rate_limited(retry_after=0)
+        assert limiter.rate == 10
+
+        for _ in range(SUCCESS_STREAK):
+            limiter.record_success()
+
+        assert limiter.rate == 11
+        stats = limiter.get_stats()
+        assert stats["rate_limited"] == 1 and stats["ceiling"] == 20
+
+
+class TestRetryAfter:
+    """Retry-After is read as seconds or as an HTTP date."""
+
+    def test_seconds(self):
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(" 0.5 ") == 0.5
+
+    def test_http_date(self):
+        when = email.utils.formatdate(time.time() + 10, usegmt=True)
+        assert 8 <= parse_retry_after(when) <= 10
+
+    def test_missing_or_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestRegistry:
+    """One limiter per host, shared by every client instance."""
+
+    def test_clients_share_host_limiter(self):
+        first = CrossrefClient(rate_limit_per_second=1000)
+        second = CrossrefClient(rate_limit_per_second=1000)
+
+        assert first.host_limiter is second.host_limiter
+        assert first.host == "api.crossref.org"
+        # Capped by the table ceiling, not the client's 1000/s
+        assert first.host_limiter.ceiling == 20
+
+    def test_slower_client_lowers_ceiling(self):
+        get_host_limiter("api.openalex.org", rate=50)
+        limiter = get_host_limiter("api.openalex.org", rate=5)
+        assert limiter.ceiling == 5 and limiter.rate == 5
+
+    def test_unknown_host_uses_client_rate(self):
+        limiter = get_host_limiter("api.example.org", rate=8)
+        assert (limiter.floor, limiter.ceiling) == (2, 8)
+
+    def test_env_override(self, monkeypatch):
+        monkeypatch.setenv("API_HOST_RATE_LIMITS", "api.crossref.org=1:4, bad-entry=x")
+        limiter = get_host_limiter("api.crossref.org", rate=10)
+        assert (limiter.floor, limiter.ceiling) == (1, 4)
+
+
+class TestClientIntegration:
+    """BaseAPIClient feeds responses back into its host limiter."""
+
+    def test_sync_429_pauses_host_and_retries(self, monkeypatch):
+        client = CrossrefClient(rate_limit_per_second=1000)
+        monkeypatch.setattr(client, "_signal_rate_limited", lambda: None)
+        limited = Mock(status_code=429, headers={"Retry-After": "0.2"})
+        ok = Mock(status_code=200, headers={})
+        ok.json.return_value = {"message": {"items": []}}
+        calls = []
+        monkeypatch.setattr(client.session, "request", lambda **kwargs: calls.append(time.monotonic()) or
+                            (limited if len(calls) == 1 else ok))
+
+        start = time.monotonic()
+        result = client._make_request(**client._search_request("q"))
+
+        assert result == {"message": {"items": []}}
+        assert calls[1] - start >= 0.2
+        assert client.host_limiter.get_stats()["rate_limited"] == 1
+
+    def test_sync_429_behind_proxies_retries_without_pausing_host(self, monkeypatch):
+        client = CrossrefClient(rate_limit_per_second=1000)
+        monkeypatch.setattr(client, "_signal_rate_limited", lambda: None)
+        monkeypatch.setattr(base, "PROXY_LIST", ["proxy1.example:8080", "proxy2.example:8080"])
+        monkeypatch.setattr(base, "traced_sleep", lambda *args, **kwargs: None)
+        limited = Mock(status_code=429, headers={"Retry-After": "60"})
+        ok = Mock(status_code=200, headers={})
+        ok.json.return_value = {"message": {"items": []}}
+        calls = []
+        monkeypatch.setattr(client.session, "request", lambda **kwargs: calls.append(kwargs["proxies"]) or
+                            (limited if len(calls) == 1 else ok))
+
+        result = client._make_request(**client._search_request("q"))
+
+        assert result == {"message": {"items": []}}
+        assert len(calls) == 2 and all(calls)
+        assert client.host_limiter.get_stats()["rate_limited"] == 0
+        assert client.host_limiter.rate == client.host_limiter.ceiling
+
+    def test_throttled_get_uses_target_host(self):
+        client = CrossrefClient(rate_limit_per_second=1000)
+        session = Mock()
+        session.get.return_value = Mock(status_code=429, ok=False, headers={"Retry-After": "1"})
+
+        client._throttled_get(session, "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi", timeout=10)
+
+        ncbi = get_host_limiter("eutils.ncbi.nlm.nih.gov")
+        assert ncbi.get_stats()["rate_limited"] == 1
+        assert client.host_limiter.get_stats()["rate_limited"] == 0
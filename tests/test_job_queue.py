@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for the durable SQLite draft job queue
+ABOUTME: Validates leasing, heartbeats, retry backoff, dead-lettering, crash takeover with checkpoint resume and worker processes
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from batch_runner import BatchJob, JobResult
+from concurrency.concurrency_config import reset_config
+from concurrency.rate_limiter import reset_gemini_limiter
+from job_queue import DEAD, DONE, LEASED, QUEUED, JobQueue, QueueWorker, run_workers
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def marker_runner(job: BatchJob) -> JobResult:
+    """Runs in worker processes: records which jobs ran."""
+    job.output_dir.mkdir(parents=True, exist_ok=True)
+    with open(job.output_dir / "runs.txt", "a", encoding="utf-8") as f:
+        f.write("ran\n")
+    return JobResult(index=job.index, topic=job.topic, output_dir=str(job.output_dir), status="completed", seconds=0.0)
+
+
+def make_job(tmp_path, name="draft"):
+    return BatchJob(index=0, topic=f"Topic {name}", output_dir=tmp_path / name, options={"academic_level": "master"})
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def queue(tmp_path, clock):
+    queue = JobQueue(tmp_path / "queue.db", lease_seconds=60, max_attempts=3, backoff_base=10, clock=clock)
+    yield queue
+    queue.close()
+
+
+class TestLeasing:
+    """Lease, heartbeat and completion."""
+
+    def test_each_job_is_leased_once(self, queue, tmp_path):
+        first = queue.enqueue(make_job(tmp_path, "a"))
+        second = queue.enqueue(make_job(tmp_path, "b"))
+
+        a = queue.lease("worker-a")
+        b = queue.lease("worker-b")
+
+        assert {a.id, b.id} == {first, second}
+        assert queue.lease("worker-c") is None
+        assert a.to_batch_job().options == {"academic_level": "master"}
+        assert a.to_batch_job().output_dir == (tmp_path / "a").resolve()
+
+    def test_heartbeat_keeps_the_lease(self, queue, clock, tmp_path):
+        queue.enqueue(make_job(tmp_path))
+        leased = queue.lease("worker-a")
+
+        for _ in range(5):
+            clock.advance(45)
+            assert queue.heartbeat(leased)
+            assert queue.lease("worker-b") is None
+
+        assert queue.complete(leased)
+        assert queue.counts()[DONE] == 1
+
+    def test_expired_lease_is_taken_over(self, queue, clock, tmp_path):
+        queue.enqueue(make_job(tmp_path))
+        crashed = queue.lease("worker-a")
+        clock.advance(61)
+
+        takeover = queue.lease("worker-b")
+
+        assert takeover.id == crashed.id
+        assert takeover.attempts == 2
+        # The dead worker's late writes are rejected
+        assert not queue.heartbeat(crashed)
+        assert not queue.complete(crashed)
+        assert queue.complete(takeover)
+
+
+class TestRetries:
+    """Backoff and dead letters."""
+
+    def test_failure_backs_off_then_dead_letters(self, queue, clock, tmp_path):
+        job_id = queue.enqueue(make_job(tmp_path), max_attempts=2)
+
+        leased = queue.lease("w")
+        assert queue.fail(leased, "RuntimeError: quota") == QUEUED
+        assert queue.lease("w") is None  # Backing off for 10s
+        clock.advance(10)
+
+        leased = queue.lease("w")
+        assert leased.attempts == 2
+        assert queue.fail(leased, "RuntimeError: quota again") == DEAD
+
+        (dead,) = queue.jobs(DEAD)
+        assert dead["id"] == job_id
+        assert dead["last_error"] == "RuntimeError: quota again"
+
+        assert queue.requeue(job_id)
+        assert queue.lease("w").attempts == 1
+
+    def test_backoff_doubles_and_is_capped(self, queue):
+        queue.backoff_max = 50
+        assert [queue.backoff(n) for n in (1, 2, 3, 4)] == [10, 20, 40, 50]
+
+    def test_worker_dying_on_last_attempt_dead_letters(self, queue, clock, tmp_path):
+        queue.enqueue(make_job(tmp_path), max_attempts=1)
+        queue.lease("worker-a")
+        clock.advance(61)
+
+        assert queue.lease("worker-b") is None
+        assert queue.counts()[DEAD] == 1
+
+
+class TestQueueWorker:
+    """Workers run jobs and resume from checkpoints after a crash."""
+
+    def test_takeover_resumes_from_checkpoint(self, queue, clock, tmp_path):
+        queue.enqueue(make_job(tmp_path))
+
+        # Worker A gets through research, saves a checkpoint, then dies
+        crashed = queue.lease("worker-a")
+        output_dir = crashed.to_batch_job().output_dir
+        output_dir.mkdir(parents=True)
+        (output_dir / "checkpoint.json").write_text('{"completed_phase": "research"}', encoding="utf-8")
+        clock.advance(61)
+
+        resumed = []
+
+        def runner(job):
+            resumed.append((job.output_dir / "checkpoint.json").exists())
+            return JobResult(job.index, job.topic, str(job.output_dir), "completed", 1.0)
+
+        worker = QueueWorker(queue, runner=runner, worker_id="worker-b", heartbeat_interval=0.01)
+        assert worker.run_one() == DONE
+        assert resumed == [True]
+
+    def test_runner_exceptions_are_retried(self, queue, tmp_path):
+        queue.enqueue(make_job(tmp_path))
+
+        def runner(job):
+            raise ConnectionError("network down")
+
+        worker = QueueWorker(queue, runner=runner, heartbeat_interval=0.01)
+        assert worker.run_one() == QUEUED
+        (job,) = queue.jobs(QUEUED)
+        assert job["last_error"] == "ConnectionError: network down"
+
+    def test_heartbeats_while_running(self, tmp_path, clock):
+        queue = JobQueue(tmp_path / "queue.db", lease_seconds=60, clock=clock)
+        queue.enqueue(make_job(tmp_path))
+        beats = []
+        original = queue.heartbeat
+
+        def heartbeat(leased):
+            beats.append(leased.id)
+            return original(leased)
+
+        queue.heartbeat = heartbeat
+
+        def runner(job):
+            time.sleep(0.2)
+            return JobResult(job.index, job.topic, str(job.output_dir), "completed", 0.2)
+
+        QueueWorker(queue, runner=runner, heartbeat_interval=0.02).run_one()
+        assert len(beats) >= 3
+        assert queue.counts()[LEASED] == 0
+
+    def test_lost_lease_cancels_the_run(self, queue, clock, tmp_path):
+        queue.enqueue(make_job(tmp_path))
+        original = queue.heartbeat
+
+        def heartbeat(leased):
+            # The lease expired while this worker stalled; worker B took the job over
+            clock.advance(61)
+            assert queue.lease("worker-b") is not None
+            return original(leased)
+
+        queue.heartbeat = heartbeat
+        cancelled = threading.Event()
+
+        def runner(job):
+            if job.cancel_event.wait(2):
+                cancelled.set()
+                raise RuntimeError("DraftCancelled: stopped")
+            return JobResult(job.index, job.topic, str(job.output_dir), "completed", 2.0)
+
+        assert QueueWorker(queue, runner=runner, heartbeat_interval=0.01).run_one() == LEASED
+        assert cancelled.is_set()
+
+
+    def test_heartbeat_db_errors_are_retried(self, queue, clock, tmp_path):
+        queue.enqueue(make_job(tmp_path))
+        original = queue.heartbeat
+        beats = []
+
+        def heartbeat(leased):
+            beats.append(leased.id)
+            if len(beats) <= 2:
+                raise sqlite3.OperationalError("database is locked")
+            return original(leased)
+
+        queue.heartbeat = heartbeat
+
+        def runner(job):
+            time.sleep(0.2)
+            assert not job.cancel_event.is_set()
+            return JobResult(job.index, job.topic, str(job.output_dir), "completed", 0.2)
+
+        assert QueueWorker(queue, runner=runner, heartbeat_interval=0.02).run_one() == DONE
+        assert len(beats) >= 3
+
+    def test_unconfirmed_lease_cancels_the_run_once_expired(self, queue, clock, tmp_path):
+        queue.enqueue(make_job(tmp_path))
+
+        def heartbeat(leased):
+            clock.advance(61)
+            raise sqlite3.OperationalError("database is locked")
+
+        queue.heartbeat = heartbeat
+        cancelled = threading.Event()
+
+        def runner(job):
+            if job.cancel_event.wait(2):
+                cancelled.set()
+                raise RuntimeError("DraftCancelled: stopped")
+            return JobResult(job.index, job.topic, str(job.output_dir), "completed", 2.0)
+
+        # The lease expired but nobody took it over, so the failed attempt is still recorded
+        assert QueueWorker(queue, runner=runner, heartbeat_interval=0.01).run_one() == QUEUED
+        assert cancelled.is_set()
+
+
+class TestWorkerProcesses:
+    """A fleet of worker processes drains the queue."""
+
+    def test_workers_drain_queue_without_duplicates(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("API_TIER", "custom")
+        reset_config()
+        reset_gemini_limiter()
+        db_path = tmp_path / "queue.db"
+        queue = JobQueue(db_path)
+        for i in range(6):
+            queue.enqueue(make_job(tmp_path, f"job{i}"))
+
+        try:
+            run_workers(db_path, workers=3, runner=marker_runner, exit_when_idle=True, poll_interval=0.05)
+        finally:
+            reset_gemini_limiter()
+            reset_config()
+
+        assert queue.counts()[DONE] == 6
+        for i in range(6):
+            assert (tmp_path / f"job{i}" / "runs.txt").read_text(encoding="utf-8") == "ran\n"
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for the content-addressed LLM response cache and its run_agent integration
+ABOUTME: Validates keying, LRU eviction, record/replay modes and cache hits skipping the model
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from concurrency.concurrency_config import reset_config
+from concurrency.rate_limiter import reset_gemini_limiter
+from utils.llm_cache import (
+    CachedResponse,
+    LLMCacheMiss,
+    LLMResponseCache,
+    get_llm_cache,
+    reset_llm_cache,
+)
+
+OUTPUT_TEXT = "A sufficiently long agent response that clears the empty-output guard in run_agent."
+
+
+class FakeModel:
+    """Counts calls and returns a genai-shaped response."""
+
+    model_name = "fake-model"
+    default_temperature = 0.7
+
+    def __init__(self, text: str = OUTPUT_TEXT):
+        self.text = text
+        self.calls = 0
+
+    def generate_content(self, prompt, generation_config=None, safety_settings=None):
+        self.calls += 1
+        return CachedResponse.from_text(self.text)
+
+
+@pytest.fixture
+def cache_env(tmp_path, monkeypatch):
+    """Point the singleton cache at a temp dir and disable the token bucket."""
+    monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path / "llm_cache"))
+    monkeypatch.setenv("GEMINI_TOKEN_BUCKET", "false")
+    reset_config()
+    reset_gemini_limiter()
+    reset_llm_cache()
+    yield tmp_path
+    reset_llm_cache()
+    reset_gemini_limiter()
+    reset_config()
+
+
+@pytest.fixture
+def prompt_file(tmp_path):
+    path = tmp_path / "agent.md"
+    path.write_text("You are a test agent.", encoding="utf-8")
+    return str(path)
+
+
+class TestKeying:
+    """Cache keys are content addresses of model settings and prompt halves."""
+
+    def test_key_is_stable(self):
+        a = LLMResponseCache.make_key("m", 0.7, "prompt", "input")
+        b = LLMResponseCache.make_key("m", 0.7, "prompt", "input")
+        assert a == b
+
+    @pytest.mark.parametrize("change", [
+        ("m2", 0.7, "prompt", "input"),
+        ("m", 0.2, "prompt", "input"),
+        ("m", 0.7, "prompt2", "input"),
+        ("m", 0.7, "prompt", "input2"),
+    ])
+    def test_any_component_changes_key(self, change):
+        assert LLMResponseCache.make_key(*change) != LLMResponseCache.make_key("m", 0.7, "prompt", "input")
+
+
+class TestCacheStore:
+    """Store, lookup and eviction."""
+
+    def test_round_trip(self, tmp_path):
+        cache = LLMResponseCache(tmp_path, mode="on")
+        key = cache.make_key("m", 0.7, "p", "i")
+        assert cache.lookup(key) is None
+        cache.store(key, "hello")
+        response = cache.lookup(key)
+        assert response.text == "hello"
+        assert response.candidates[0].content.parts[0].text == "hello"
+        assert cache.get_stats()["hits"] == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        key = LLMResponseCache.make_key("m", 0.7, "p", "i")
+        LLMResponseCache(tmp_path, mode="on").store(key, "persisted")
+        assert LLMResponseCache(tmp_path, mode="on").lookup(key).text == "persisted"
+
+    def test_lru_eviction_keeps_recent_entries(self, tmp_path):
+        cache = LLMResponseCache(tmp_path, mode="on", max_bytes=2_000)
+        keys = [cache.make_key("m", 0.7, "p", str(i)) for i in range(5)]
+        for i, key in enumerate(keys):
+            cache.store(key, "x" * 500)
+            # Backdate in insertion order so LRU order is unambiguous
+            stamp = time.time() - 100 + i
+            os.utime(cache._path(key), (stamp, stamp))
+        assert cache.get_stats()["evictions"] > 0
+        assert cache.lookup(keys[-1]) is not None
+        assert cache.lookup(keys[0]) is None
+
+    def test_record_mode_never_serves(self, tmp_path):
+        cache = LLMResponseCache(tmp_path, mode="record")
+        key = cache.make_key("m", 0.7, "p", "i")
+        cache.store(key, "recorded")
+        assert cache.lookup(key) is None
+        assert LLMResponseCache(tmp_path, mode="replay").lookup(key).text == "recorded"
+
+    def test_replay_miss_raises(self, tmp_path):
+        cache = LLMResponseCache(tmp_path, mode="replay")
+        with pytest.raises(LLMCacheMiss):
+            cache.lookup(cache.make_key("m", 0.7, "p", "i"))
+
+    def test_unknown_mode_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            LLMResponseCache(tmp_path, mode="sometimes")
+
+    def test_off_by_default(self, cache_env, monkeypatch):
+        monkeypatch.delenv("LLM_CACHE_MODE", raising=False)
+        assert get_llm_cache() is None
+
+
+class TestRunAgentIntegration:
+    """run_agent serves hits without calling the model."""
+
+    def test_second_call_is_served_from_cache(self, cache_env, prompt_file, monkeypatch):
+        from utils.agent_runner import run_agent
+
+        monkeypatch.setenv("LLM_CACHE_MODE", "on")
+        model = FakeModel()
+        first = run_agent(model, "Test", prompt_file, "topic", verbose=False)
+        second = run_agent(model, "Test", prompt_file, "topic", verbose=False)
+        assert first == second
+        assert model.calls == 1
+
+    def test_record_then_replay_offline(self, cache_env, prompt_file, monkeypatch):
+        from utils.agent_runner import run_agent
+
+        monkeypatch.setenv("LLM_CACHE_MODE", "record")
+        recorded = run_agent(FakeModel(), "Test", prompt_file, "topic", verbose=False)
+
+        reset_llm_cache()
+        monkeypatch.setenv("LLM_CACHE_MODE", "replay")
+        offline = FakeModel(text="should never be called")
+        assert run_agent(offline, "Test", prompt_file, "topic", verbose=False) == recorded
+        assert offline.calls == 0
+
+        with pytest.raises(LLMCacheMiss):
+            run_agent(offline, "Test", prompt_file, "other topic", verbose=False)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for streamed LLM generation in run_agent
+ABOUTME: Validates incremental saves, partial progress callbacks and early repetition aborts
+"""
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from concurrency.concurrency_config import reset_config
+from concurrency.rate_limiter import reset_gemini_limiter
+from utils.agent_runner import run_agent
+from utils.llm_stream import RepetitionGuard, StreamAborted, consume_stream
+
+PARAGRAPH = (
+    "Streaming lets the pipeline persist each chapter while the model is still writing it, "
+    "so a timeout leaves useful partial content on disk. "
+)
+
+
+@dataclass
+class FakePart:
+    text: str
+
+
+@dataclass
+class FakeContent:
+    parts: List[FakePart]
+
+
+@dataclass
+class FakeCandidate:
+    content: FakeContent
+    finish_reason: Optional[int] = None
+
+
+@dataclass
+class FakeUsage:
+    prompt_token_count: int = 120
+    candidates_token_count: int = 80
+
+
+@dataclass
+class FakeChunk:
+    """Shaped like a google.genai streamed chunk."""
+
+    text: str
+    candidates: List[FakeCandidate] = field(default_factory=list)
+    usage_metadata: Optional[FakeUsage] = None
+
+
+def make_chunks(pieces: List[str]) -> List[FakeChunk]:
+    chunks = [FakeChunk(text=p, candidates=[FakeCandidate(FakeContent([FakePart(p)]))]) for p in pieces]
+    chunks[-1].candidates[0].finish_reason = 1
+    chunks[-1].usage_metadata = FakeUsage()
+    return chunks
+
+
+class StreamingModel:
+    """Streams a scripted sequence of chunk lists, one per call."""
+
+    model_name = "fake-stream-model"
+    default_temperature = 0.7
+
+    def __init__(self, *scripts: List[str]):
+        self.scripts = list(scripts)
+        self.stream_calls = 0
+        self.chunks_served = 0
+        self.generate_calls = 0
+
+    def generate_content(self, prompt, generation_config=None, safety_settings=None):
+        self.generate_calls += 1
+        raise AssertionError("streaming model should not be called without streaming")
+
+    def generate_content_stream(self, prompt, generation_config=None, safety_settings=None):
+        script = self.scripts[min(self.stream_calls, len(self.scripts) - 1)]
+        self.stream_calls += 1
+        for chunk in make_chunks(script):
+            self.chunks_served += 1
+            yield chunk
+
+
+@pytest.fixture
+def agent_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("GEMINI_TOKEN_BUCKET", "false")
+    monkeypatch.setenv("LLM_CACHE_MODE", "off")
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    reset_config()
+    reset_gemini_limiter()
+    prompt = tmp_path / "agent.md"
+    prompt.write_text("You are a test agent.", encoding="utf-8")
+    yield tmp_path, str(prompt)
+    reset_gemini_limiter()
+    reset_config()
+
+
+class TestConsumeStream:
+    """Draining a stream into a response."""
+
+    def test_assembles_text_and_metadata(self, tmp_path):
+        save_to = tmp_path / "drafts" / "chapter.md"
+        response = consume_stream(make_chunks([PARAGRAPH, PARAGRAPH]), save_to=save_to)
+
+        assert response.text == PARAGRAPH * 2
+        assert response.candidates[0].content.parts[0].text == PARAGRAPH * 2
+        assert response.candidates[0].finish_reason == 1
+        assert response.usage_metadata.candidates_token_count == 80
+        assert save_to.read_text(encoding="utf-8") == PARAGRAPH * 2
+
+    def test_file_grows_while_streaming(self, tmp_path):
+        save_to = tmp_path / "chapter.md"
+        sizes = []
+
+        def chunks():
+            for chunk in make_chunks([PARAGRAPH] * 3):
+                yield chunk
+                sizes.append(save_to.stat().st_size)
+
+        consume_stream(chunks(), save_to=save_to)
+        assert sizes == sorted(sizes) and sizes[0] > 0 and sizes[0] < sizes[-1]
+
+    def test_partial_callback_is_throttled(self):
+        seen = []
+        consume_stream(make_chunks([PARAGRAPH] * 20), on_partial=seen.append, progress_interval=3600)
+        # Only the final report fits in an hour-long interval
+        assert seen == [PARAGRAPH * 20]
+
+    def test_callback_errors_do_not_break_generation(self):
+        def broken(text):
+            raise RuntimeError("tracker offline")
+
+        response = consume_stream(make_chunks([PARAGRAPH]), on_partial=broken, progress_interval=0)
+        assert response.text == PARAGRAPH
+
+    def test_repetition_loop_aborts_early(self, tmp_path):
+        save_to = tmp_path / "chapter.md"
+        served = []
+
+        def chunks():
+            yield from make_chunks([PARAGRAPH])
+            for i in range(10_000):
+                served.append(i)
+                yield FakeChunk(text="loop " * 5)
+
+        with pytest.raises(StreamAborted) as exc_info:
+            consume_stream(chunks(), save_to=save_to)
+
+        assert len(served) < 100
+        assert "repetition" in str(exc_info.value).lower()
+        assert exc_info.value.partial_text.startswith(PARAGRAPH)
+        assert save_to.read_text(encoding="utf-8") == exc_info.value.partial_text
+
+
+class TestRepetitionGuard:
+    """Tail-window repetition checks."""
+
+    def test_tables_do_not_trip_the_guard(self):
+        guard = RepetitionGuard(check_every_chars=1)
+        row = "| Metric | Value | Source | Year | Notes |\n| --- | --- | --- | --- | --- |\n"
+        for _ in range(20):
+            assert guard.feed(row) is None
+        assert guard.finish() is None
+
+    def test_pattern_loop_detected(self):
+        guard = RepetitionGuard(check_every_chars=1)
+        errors = [guard.feed("G. M. ") for _ in range(40)]
+        assert any(errors)
+
+    def test_check_cost_is_bounded_by_window(self):
+        guard = RepetitionGuard()
+        for _ in range(2_000):
+            guard.feed(PARAGRAPH)
+        assert len(guard._tail) <= guard.window_words * 20
+
+
+class TestRunAgentStreaming:
+    """run_agent consumes streamed chunks when streaming is enabled."""
+
+    def test_stream_saves_and_reports(self, agent_env):
+        tmp_path, prompt = agent_env
+        model = StreamingModel([PARAGRAPH, PARAGRAPH, PARAGRAPH])
+        seen = []
+        save_to = tmp_path / "drafts" / "01_introduction.md"
+
+        output = run_agent(
+            model, "Crafter", prompt, "Write", save_to=save_to, verbose=False,
+            stream=True, on_partial=seen.append,
+        )
+
+        assert model.stream_calls == 1
+        assert output.strip() == (PARAGRAPH * 3).strip()
+        assert save_to.read_text(encoding="utf-8") == output
+        assert seen and seen[-1] == PARAGRAPH * 3
+
+    def test_env_enables_streaming(self, agent_env, monkeypatch):
+        _, prompt = agent_env
+        monkeypatch.setenv("LLM_STREAMING", "true")
+        model = StreamingModel([PARAGRAPH, PARAGRAPH])
+
+        run_agent(model, "Crafter", prompt, "Write", verbose=False)
+        assert model.stream_calls == 1
+
+    def test_degenerate_stream_is_regenerated(self, agent_env):
+        _, prompt = agent_env
+        loop = [PARAGRAPH] + ["word " * 20] * 500
+        model = StreamingModel(loop, [PARAGRAPH, PARAGRAPH])
+
+        output = run_agent(model, "Crafter", prompt, "Write", verbose=False, stream=True)
+
+        assert model.stream_calls == 2
+        # The aborted attempt stopped well before its 501 chunks were consumed
+        assert model.chunks_served < 100
+        assert output.strip() == (PARAGRAPH * 2).strip()
+
+    def test_repeated_degeneration_fails(self, agent_env):
+        _, prompt = agent_env
+        model = StreamingModel([PARAGRAPH] + ["word " * 20] * 500)
+
+        with pytest.raises(Exception, match="aborted"):
+            run_agent(model, "Crafter", prompt, "Write", verbose=False, stream=True, max_retries=2)
+        assert model.stream_calls == 2
+
+    def test_models_without_streaming_fall_back(self, agent_env):
+        _, prompt = agent_env
+        from utils.llm_cache import CachedResponse
+
+        class PlainModel:
+            model_name = "plain"
+            default_temperature = 0.7
+            calls = 0
+
+            def generate_content(self, prompt, generation_config=None, safety_settings=None):
+                PlainModel.calls += 1
+                return CachedResponse.from_text(PARAGRAPH)
+
+        output = run_agent(PlainModel(), "Crafter", prompt, "Write", verbose=False, stream=True)
+        assert PlainModel.calls == 1
+        assert output.strip() == PARAGRAPH.strip()
+
+    def test_timeout_keeps_streamed_partial_output(self, agent_env):
+        tmp_path, prompt = agent_env
+        save_to = tmp_path / "drafts" / "02_body.md"
+
+        class TimingOutModel(StreamingModel):
+            def generate_content_stream(self, prompt, generation_config=None, safety_settings=None):
+                yield from make_chunks([PARAGRAPH, PARAGRAPH])[:1]
+                raise TimeoutError("Deadline exceeded: request timed out")
+
+        output = run_agent(
+            TimingOutModel([PARAGRAPH]), "Crafter", prompt, "Write", save_to=save_to,
+            verbose=False, stream=True, max_retries=1,
+        )
+        assert output == PARAGRAPH
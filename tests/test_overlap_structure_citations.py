@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for running the structure and citations phases side by side
+ABOUTME: Validates the overlap, checkpoint order on success and failure, and citation unit resume
+"""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+import draft_generator
+from phases.citations import run_citation_management
+from phases.context import DraftContext
+from utils.checkpoint import MANIFESTS_DIRNAME, load_units
+from utils.citation_database import Citation, CitationDatabase, save_citation_database
+
+
+def make_context(tmp_path: Path) -> DraftContext:
+    research = tmp_path / "research"
+    research.mkdir(parents=True, exist_ok=True)
+    ctx = DraftContext(topic="Topic", verbose=False)
+    ctx.folders = {'root': tmp_path, 'research': research}
+    ctx.completed_units = load_units(tmp_path)
+    return ctx
+
+
+def make_database() -> CitationDatabase:
+    citation = Citation(
+        citation_id="cite_001",
+        authors=["Smith"],
+        year=2020,
+        title="A Paper",
+        source_type="journal",
+        doi="10.1000/a",
+    )
+    return CitationDatabase(citations=[citation])
+
+
+def fake_structure(delay=0.0, error=None):
+    def run(ctx):
+        time.sleep(delay)
+        if error:
+            raise error
+        ctx.architect_output = "# Outline\n## Chapter 1"
+    return run
+
+
+def fake_citations(delay=0.0, error=None):
+    def run(ctx):
+        time.sleep(delay)
+        if error:
+            raise error
+        ctx.citation_database = make_database()
+        ctx.citation_summary = "cite_001: Smith (2020)"
+    return run
+
+
+def completed_phase(tmp_path: Path) -> str:
+    return json.loads((tmp_path / "checkpoint.json").read_text())["completed_phase"]
+
+
+class TestRunStructureAndCitations:
+    """Both phases run at once; checkpoints stay in pipeline order."""
+
+    def test_phases_overlap(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(draft_generator, "run_structure_phase", fake_structure(delay=0.3))
+        monkeypatch.setattr(draft_generator, "run_citation_management", fake_citations(delay=0.3))
+        ctx = make_context(tmp_path)
+
+        start = time.monotonic()
+        draft_generator.run_structure_and_citations(ctx, tmp_path)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.5, f"phases took {elapsed:.2f}s (sequential would be 0.6s)"
+        assert completed_phase(tmp_path) == "citations"
+        manifests = sorted(p.name for p in (tmp_path / MANIFESTS_DIRNAME).iterdir())
+        assert manifests == ["02_structure.json", "03_citations.json"]
+
+    def test_citations_failure_keeps_structure_checkpoint(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(draft_generator, "run_structure_phase", fake_structure(delay=0.1))
+        monkeypatch.setattr(draft_generator, "run_citation_management", fake_citations(error=ValueError("bad")))
+
+        with pytest.raises(ValueError, match="bad"):
+            draft_generator.run_structure_and_citations(make_context(tmp_path), tmp_path)
+
+        assert completed_phase(tmp_path) == "structure"
+
+    def test_structure_failure_waits_for_citations(self, tmp_path, monkeypatch):
+        finished = []
+        citations = fake_citations(delay=0.2)
+        monkeypatch.setattr(draft_generator, "run_structure_phase", fake_structure(error=ValueError("outline")))
+        monkeypatch.setattr(draft_generator, "run_citation_management", lambda ctx: finished.append(citations(ctx)))
+
+        with pytest.raises(ValueError, match="outline"):
+            draft_generator.run_structure_and_citations(make_context(tmp_path), tmp_path)
+
+        assert finished
+        assert not (tmp_path / "checkpoint.json").exists()
+
+
+class TestCitationUnitResume:
+    """A finished citation database is restored instead of rebuilt."""
+
+    def test_restores_saved_database(self, tmp_path):
+        ctx = make_context(tmp_path)
+        save_citation_database(make_database(), ctx.folders['research'] / "bibliography.json")
+        ctx.unit_checkpoint("citations").save("database", {"citation_summary": "saved summary"})
+
+        resumed = make_context(tmp_path)
+        resumed.scout_result = None  # would fail if citation management ran again
+        run_citation_management(resumed)
+
+        assert resumed.citation_summary == "saved summary"
+        assert [c.id for c in resumed.citation_database.citations] == ["cite_001"]
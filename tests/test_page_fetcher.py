@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared concurrent page fetch used by the citation scrapers.
+
+PageFetcher downloads each URL once, limits concurrency per domain, spaces
+request starts to one domain, and the title and metadata scrapers both
+extract from the same fetched pages.
+"""
+
+import threading
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import requests
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from utils.page_fetcher import FetchedPage, PageFetcher
+from utils.scrape_citation_metadata import MetadataScraper
+from utils.scrape_citation_titles import TitleScraper
+
+ARTICLE_HTML = b"""
+<html><head>
+<title>Measuring Citation Drift in Grounded Search</title>
+<meta property="article:published_time" content="2021-04-02T10:00:00Z">
+<meta name="author" content="Jane Doe">
+</head><body><p>Body</p></body></html>
+"""
+
+
+class FakeResponse:
+    def __init__(self, content: bytes, status_code: int = 200):
+        self.content = content
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} error", response=self)
+
+
+class FakeSession:
+    """Records calls and in-flight requests per domain."""
+
+    def __init__(self, delay: float = 0.0, pages=None, failures=None):
+        self.delay = delay
+        self.pages = pages or {}
+        self.failures = failures or {}
+        self.calls = Counter()
+        self.starts = defaultdict(list)
+        self.in_flight = Counter()
+        self.max_in_flight = Counter()
+        self.max_total = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, timeout=None, allow_redirects=True):
+        domain = url.split("/")[2]
+        with self._lock:
+            self.calls[url] += 1
+            self.starts[domain].append(time.monotonic())
+            self.in_flight[domain] += 1
+            self.max_in_flight[domain] = max(self.max_in_flight[domain], self.in_flight[domain])
+            self.max_total = max(self.max_total, sum(self.in_flight.values()))
+        try:
+            time.sleep(self.delay)
+            failure = self.failures.get(url)
+            if isinstance(failure, list):
+                # One failure per call, then the page
+                failure = failure.pop(0) if failure else None
+            if failure is not None:
+                if isinstance(failure, Exception):
+                    raise failure
+                return FakeResponse(b"", status_code=failure)
+            return FakeResponse(self.pages.get(url, ARTICLE_HTML))
+        finally:
+            with self._lock:
+                self.in_flight[domain] -= 1
+
+
+class TestPageFetcher:
+    """Concurrency, politeness, and error capture."""
+
+    def test_each_url_fetched_once(self):
+        session = FakeSession()
+        fetcher = PageFetcher(max_workers=4, per_domain=2, domain_delay=0, session=session)
+        urls = ["https://a.org/1", "https://a.org/2", "https://a.org/1", None, "", "https://b.org/1"]
+
+        pages = fetcher.fetch_all(urls)
+
+        assert list(pages) == ["https://a.org/1", "https://a.org/2", "https://b.org/1"]
+        assert all(count == 1 for count in session.calls.values())
+        assert all(page.ok for page in pages.values())
+
+    def test_per_domain_limit(self):
+        session = FakeSession(delay=0.05)
+        fetcher = PageFetcher(max_workers=8, per_domain=2, domain_delay=0, session=session)
+
+        fetcher.fetch_all([f"https://a.org/{i}" for i in range(8)])
+
+        assert session.max_in_flight["a.org"] <= 2
+
+    def test_domain_delay_spaces_request_starts(self):
+        session = FakeSession()
+        fetcher = PageFetcher(max_workers=4, per_domain=4, domain_delay=0.05, session=session)
+
+        fetcher.fetch_all([f"https://a.org/{i}" for i in range(4)])
+
+        starts = sorted(session.starts["a.org"])
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        assert min(gaps) >= 0.04
+
+    def test_domains_fetched_in_parallel(self):
+        session = FakeSession(delay=0.1)
+        fetcher = PageFetcher(max_workers=8, per_domain=1, domain_delay=0, session=session)
+        urls = [f"https://site{i}.org/page" for i in range(8)]
+
+        start = time.perf_counter()
+        fetcher.fetch_all(urls)
+        elapsed = time.perf_counter() - start
+
+        assert session.max_total > 1
+        assert elapsed < 0.5, f"8 domains took {elapsed:.2f}s (serial would be 0.8s)"
+
+    def test_failures_are_captured(self):
+        session = FakeSession(failures={
+            "https://a.org/missing": 404,
+            "https://b.org/slow": requests.exceptions.Timeout(),
+        })
+        fetcher = PageFetcher(max_workers=2, per_domain=1, domain_delay=0, session=session, retry_base_delay=0)
+
+        pages = fetcher.fetch_all(["https://a.org/missing", "https://b.org/slow", "https://c.org/ok"])
+
+        assert pages["https://a.org/missing"].status_code == 404
+        assert not pages["https://a.org/missing"].ok
+        assert pages["https://b.org/slow"].error == "timeout"
+        assert pages["https://b.org/slow"].soup is None
+        assert pages["https://c.org/ok"].ok
+
+    def test_transient_failures_are_retried(self):
+        session = FakeSession(failures={
+            "https://a.org/flaky": [requests.exceptions.Timeout(), 503],
+            "https://b.org/reset": [requests.exceptions.ConnectionError("reset")],
+            "https://c.org/missing": 404,
+            "https://d.org/down": 502,
+        })
+        fetcher = PageFetcher(max_workers=4, per_domain=1, domain_delay=0, session=session,
+                              max_attempts=3, retry_base_delay=0)
+
+        pages = fetcher.fetch_all(["https://a.org/flaky", "https://b.org/reset",
+                                   "https://c.org/missing", "https://d.org/down"])
+
+        assert pages["https://a.org/flaky"].ok and session.calls["https://a.org/flaky"] == 3
+        assert pages["https://b.org/reset"].ok and session.calls["https://b.org/reset"] == 2
+        assert session.calls["https://c.org/missing"] == 1
+        assert pages["https://d.org/down"].status_code == 502 and session.calls["https://d.org/down"] == 3
+
+    def test_soup_parsed_once(self):
+        page = FetchedPage(url="https://a.org/1", content=ARTICLE_HTML)
+        assert page.soup is page.soup
+
+
+class TestSharedScraping:
+    """Title and metadata scrapers extract from the same fetched pages."""
+
+    @staticmethod
+    def _citations():
+        return [
+            {
+                "id": "cite_001",
+                "api_source": "Gemini Grounded",
+                "title": "example.com",
+                "authors": ["example.com"],
+                "year": 2020,
+                "url": "https://example.com/article",
+            },
+            {
+                "id": "cite_002",
+                "api_source": "Crossref",
+                "title": "A Real Paper Title",
+                "authors": ["Smith, J."],
+                "year": 2019,
+                "url": "https://doi.org/10.1/x",
+            },
+        ]
+
+    def test_one_fetch_serves_both_scrapers(self):
+        citations = self._citations()
+        session = FakeSession()
+        title_scraper = TitleScraper(verbose=False)
+        metadata_scraper = MetadataScraper(verbose=False)
+
+        to_scrape = title_scraper.select_citations(citations) + metadata_scraper.select_citations(citations)
+        pages = PageFetcher(domain_delay=0, session=session).fetch_all(c["url"] for c in to_scrape)
+
+        title_scraper.scrape_citations(citations, pages=pages)
+        metadata_scraper.scrape_citations(citations, pages=pages)
+
+        assert session.calls == Counter({"https://example.com/article": 1})
+        assert citations[0]["title"] == "Measuring Citation Drift in Grounded Search"
+        assert citations[0]["year"] == 2021
+        assert citations[0]["authors"] == ["Jane Doe"]
+        assert citations[1]["title"] == "A Real Paper Title"
+
+    def test_missing_pages_are_fetched_by_the_scraper(self):
+        citations = self._citations()
+        scraper = TitleScraper(verbose=False, rate_limit_delay=0)
+        scraper.session = FakeSession()
+
+        success, failed = scraper.scrape_citations(citations)
+
+        assert (success, failed) == (1, 0)
+        assert scraper.session.calls == Counter({"https://example.com/article": 1})
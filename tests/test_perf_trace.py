@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for the Chrome trace-event performance trace
+ABOUTME: Validates span recording, async spans, sleeps, category summaries and run_agent/API instrumentation
+"""
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from concurrency.concurrency_config import reset_config
+from concurrency.rate_limiter import reset_gemini_limiter
+from utils.perf_trace import (
+    CAT_AGENT,
+    CAT_API,
+    CAT_LLM,
+    CAT_PHASE,
+    CAT_SLEEP,
+    TRACE_FILENAME,
+    PerfTracer,
+    reset_tracer,
+    span,
+    traced_async_sleep,
+    traced_sleep,
+)
+
+
+@pytest.fixture
+def tracer(monkeypatch):
+    monkeypatch.delenv("PERF_TRACE", raising=False)
+    tracer = reset_tracer()
+    yield tracer
+    reset_tracer()
+
+
+def spans(tracer, ph="X"):
+    return [e for e in tracer.to_dict()["traceEvents"] if e["ph"] == ph]
+
+
+class TestPerfTracer:
+    """Span recording and file output."""
+
+    def test_span_records_complete_event(self, tracer):
+        with span("research", CAT_PHASE, attempt=1) as args:
+            time.sleep(0.01)
+            args["citations"] = 42
+
+        (event,) = spans(tracer)
+        assert event["name"] == "research"
+        assert event["cat"] == CAT_PHASE
+        assert event["dur"] >= 10_000
+        assert event["args"] == {"attempt": 1, "citations": 42}
+
+    def test_span_records_errors(self, tracer):
+        with pytest.raises(ValueError):
+            with span("compose", CAT_PHASE):
+                raise ValueError("boom")
+        assert spans(tracer)[0]["args"]["error"] == "ValueError: boom"
+
+    def test_threads_get_their_own_track(self, tracer):
+        # Keep all threads alive together so their idents are distinct
+        barrier = threading.Barrier(3)
+
+        def work():
+            with span("worker", CAT_API):
+                barrier.wait()
+
+        threads = [threading.Thread(target=work, name=f"worker-{i}") for i in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        trace = tracer.to_dict()["traceEvents"]
+        assert len({e["tid"] for e in trace if e["ph"] == "X"}) == 3
+        names = {e["args"]["name"] for e in trace if e["ph"] == "M"}
+        assert {"worker-0", "worker-1", "worker-2"} <= names
+
+    def test_async_spans_use_begin_end_pairs(self, tracer):
+        async def main():
+            await asyncio.gather(*(traced_async_sleep(0.01, "api_backoff") for _ in range(3)))
+
+        asyncio.run(main())
+
+        begins, ends = spans(tracer, "b"), spans(tracer, "e")
+        assert len(begins) == len(ends) == 3
+        assert len({e["id"] for e in begins}) == 3
+        assert tracer.summary()[CAT_SLEEP] >= 0.03
+
+    def test_traced_sleep_and_summary(self, tracer):
+        traced_sleep(0.02, "agent_backoff", agent="Crafter")
+        traced_sleep(0, "skipped")
+        tracer.add_span_seconds("gemini_rate_limit", CAT_SLEEP, 1.5)
+
+        assert [e["name"] for e in spans(tracer)] == ["agent_backoff", "gemini_rate_limit"]
+        assert tracer.summary()[CAT_SLEEP] == pytest.approx(1.52, abs=0.01)
+
+    def test_write_produces_chrome_trace_json(self, tracer, tmp_path):
+        with span("structure", CAT_PHASE):
+            pass
+        tracer.counter("memory", rss_mb=123.4)
+
+        path = tracer.write(tmp_path)
+
+        assert path == tmp_path / TRACE_FILENAME
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["displayTimeUnit"] == "ms"
+        assert {e["ph"] for e in data["traceEvents"]} == {"M", "X", "C"}
+        assert data["otherData"]["summary_seconds"][CAT_PHASE] >= 0
+
+    def test_disabled_tracer_records_nothing(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("PERF_TRACE", "false")
+        tracer = reset_tracer()
+        try:
+            with span("research", CAT_PHASE):
+                pass
+            assert tracer.to_dict()["traceEvents"] == []
+            assert tracer.write(tmp_path) is None
+        finally:
+            monkeypatch.delenv("PERF_TRACE")
+            reset_tracer()
+
+    def test_event_cap(self):
+        tracer = PerfTracer(max_events=2)
+        for _ in range(5):
+            with tracer.span("x", CAT_API):
+                pass
+        assert len(spans(tracer)) == 2
+        assert tracer.dropped == 3
+
+
+class TestInstrumentation:
+    """run_agent and the API client base emit spans."""
+
+    def test_run_agent_emits_agent_and_llm_spans(self, tracer, tmp_path, monkeypatch):
+        from utils.agent_runner import run_agent
+        from utils.llm_cache import CachedResponse
+
+        monkeypatch.setenv("GEMINI_TOKEN_BUCKET", "false")
+        monkeypatch.setenv("LLM_CACHE_MODE", "off")
+        reset_config()
+        reset_gemini_limiter()
+
+        class Model:
+            model_name = "fake"
+            default_temperature = 0.7
+
+            def generate_content(self, prompt, generation_config=None, safety_settings=None):
+                return CachedResponse.from_text("A sufficiently long agent response for the empty-output guard.")
+
+        prompt = tmp_path / "agent.md"
+        prompt.write_text("You are a test agent.", encoding="utf-8")
+        try:
+            run_agent(Model(), "Architect", str(prompt), "Outline", verbose=False, token_stage="architect")
+        finally:
+            reset_gemini_limiter()
+            reset_config()
+
+        by_cat = {e["cat"]: e for e in spans(tracer)}
+        assert by_cat[CAT_AGENT]["name"] == "Architect"
+        assert by_cat[CAT_AGENT]["args"]["stage"] == "architect"
+        assert by_cat[CAT_AGENT]["args"]["chars"] > 0
+        assert by_cat[CAT_LLM]["name"] == "Architect LLM call"
+        assert by_cat[CAT_LLM]["ts"] >= by_cat[CAT_AGENT]["ts"]
+
+    def test_api_requests_and_backoff_are_traced(self, tracer, monkeypatch):
+        from utils.api_citations.base import BaseAPIClient
+
+        class Response:
+            def __init__(self, status_code):
+                self.status_code = status_code
+                self.text = ""
+
+            def json(self):
+                return {"ok": True}
+
+        class Client(BaseAPIClient):
+            def search_paper(self, query):
+                return None
+
+        statuses = iter([503, 200])
+        client = Client("https://api.example.org", rate_limit_per_second=1000)
+        monkeypatch.setattr(client.session, "request", lambda **kwargs: Response(next(statuses)))
+        monkeypatch.setattr(BaseAPIClient, "_retry_wait", staticmethod(lambda attempt: 0.01))
+
+        assert client._make_request("GET", "works") == {"ok": True}
+
+        names = [(e["cat"], e["name"], e["args"].get("status")) for e in spans(tracer)]
+        assert (CAT_API, "Client GET", 503) in names
+        assert (CAT_SLEEP, "api_backoff", None) in names
+        assert (CAT_API, "Client GET", 200) in names
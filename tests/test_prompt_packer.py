@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for the token-budget prompt packer and its use in Crafter and QA prompts
+ABOUTME: Validates budgets, priorities, floors, whole-item citation lists and relevance ranking
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from phases import compose, validate
+from phases.citations import _build_citation_summary
+from phases.context import DraftContext
+from utils import agent_runner
+from utils.citation_database import Citation, CitationDatabase
+from utils.prompt_packer import (
+    KEEP_ENDS,
+    KEEP_TAIL,
+    TRUNCATION_MARK,
+    PromptPacker,
+    PromptSection,
+)
+from utils.text_relevance import rank_by_relevance
+from utils.token_counter import estimate_tokens
+
+
+def words(count, prefix="word"):
+    return " ".join(f"{prefix}{i}" for i in range(count))
+
+
+class TestPromptPacker:
+    """Sections are trimmed to the budget, lowest priority first."""
+
+    def test_fits_budget_and_keeps_small_sections_whole(self):
+        packed = PromptPacker(300).pack([
+            PromptSection("outline", "Short outline.", priority=3),
+            PromptSection("notes", words(500), priority=1),
+        ])
+
+        assert packed["outline"] == "Short outline."
+        assert packed.total_tokens <= 300
+        assert packed["notes"].startswith("word0 word1")
+
+    def test_low_priority_gives_way_first(self):
+        packed = PromptPacker(400).pack([
+            PromptSection("high", words(200, "h"), priority=2),
+            PromptSection("low", words(200, "l"), priority=1),
+        ])
+
+        assert packed.tokens["high"] == estimate_tokens(words(200, "h"))
+        assert packed.tokens["low"] < packed.tokens["high"]
+
+    def test_equal_priorities_shrink_in_proportion(self):
+        packed = PromptPacker(300).pack([
+            PromptSection("a", words(300, "a"), priority=1),
+            PromptSection("b", words(300, "b"), priority=1),
+        ])
+
+        assert abs(packed.tokens["a"] - packed.tokens["b"]) <= 10
+
+    def test_floor_and_cap(self):
+        packed = PromptPacker(100).pack([
+            PromptSection("capped", words(400, "c"), priority=3, max_tokens=50),
+            PromptSection("floored", words(400, "f"), priority=1, min_tokens=200),
+        ])
+
+        assert packed.tokens["capped"] <= 50
+        assert 180 <= packed.tokens["floored"] <= 200
+
+    def test_keep_tail_and_ends(self):
+        text = words(400)
+        packer = PromptPacker(50)
+
+        tail = packer.pack([PromptSection("t", text, keep=KEEP_TAIL)])["t"]
+        ends = packer.pack([PromptSection("e", text, keep=KEEP_ENDS)])["e"]
+
+        assert text.endswith(tail) and tail.split()[0] in text.split()
+        assert ends.startswith("word0 ") and ends.endswith("word399")
+        assert TRUNCATION_MARK in ends
+
+    def test_list_items_are_never_cut(self):
+        items = [f"{i}. {words(20)}\n" for i in range(10)]
+        packed = PromptPacker(100).pack([PromptSection("list", items=items)])
+
+        kept = packed.items_kept["list"]
+        assert 0 < kept < 10
+        assert packed["list"] == "".join(items[:kept])
+
+
+class TestRankByRelevance:
+    """Items matching distinctive query terms come first; ties keep input order."""
+
+    def test_ranks_distinctive_matches_first(self):
+        items = [
+            "Deep learning for climate adaptation",
+            "Survey methodology and sampling for climate studies",
+            "Carbon pricing and climate policy",
+        ]
+
+        ranked = rank_by_relevance(items, "climate policy sampling methodology design", lambda s: s)
+
+        assert ranked[0] == items[1]
+        assert ranked[-1] == items[0]
+
+    def test_no_overlap_keeps_order(self):
+        items = ["alpha", "beta", "gamma"]
+        assert rank_by_relevance(items, "unrelated", lambda s: s) == items
+
+
+def make_database(count):
+    citations = []
+    for i in range(1, count + 1):
+        focus = "survey sampling methodology instrument" if i % 5 == 0 else "market adoption trends"
+        citations.append(Citation(
+            f"cite_{i:03d}", [f"Author{i}", "Coauthor"], 2000 + i % 25,
+            f"Study {i} on {focus}", "journal",
+            journal="Journal", doi=f"10.1000/{i}", abstract=f"This paper examines {focus}. " + words(60),
+        ))
+    return CitationDatabase(citations=citations)
+
+
+@pytest.fixture
+def compose_ctx(tmp_path):
+    ctx = DraftContext(topic="Electric vehicle adoption", verbose=False, skip_validation=True)
+    ctx.folders = {'root': tmp_path, 'drafts': tmp_path}
+    ctx.word_targets = {section: "1,500" for section in compose.CONTEXT_BUDGETS}
+    ctx.citation_database = make_database(60)
+    ctx.citation_summary = _build_citation_summary(ctx.citation_database)
+    ctx.formatter_output = "# Outline\n" + words(1000, "outline")
+    ctx.signal_output = "Gaps: " + words(800, "gap")
+    ctx.lit_review_output = "## 2.1 Literature Review\n" + words(2000, "lit")
+    return ctx
+
+
+class TestCraftersUsePacker:
+    """Crafter prompts carry a budgeted context with the most relevant citations."""
+
+    def test_methodology_prompt_fits_budget(self, compose_ctx, monkeypatch):
+        prompts = {}
+        monkeypatch.setattr(agent_runner, "run_agent",
+                            lambda name, user_input, **kwargs: prompts.setdefault(name, user_input))
+
+        compose._write_methodology(compose_ctx)
+
+        prompt = prompts["Crafter - Methodology"]
+        full = estimate_tokens(compose_ctx.citation_summary)
+        assert estimate_tokens(prompt) < full
+        # Section budget, plus the shared outline preamble and the instructions
+        assert estimate_tokens(prompt) < compose.CONTEXT_BUDGETS["methodology"] + compose.OUTLINE_TOKENS + 1000
+        # The twelve methodology-focused citations rank ahead of the rest
+        listed = re.findall(r"^\d+\. \*\*\[cite_(\d{3})\]", prompt, re.MULTILINE)
+        assert 12 <= len(listed) < 60
+        assert all(int(number) % 5 == 0 for number in listed[:12])
+        assert "gap0" in prompt and "lit1999" not in prompt
+
+    def test_methodology_prompt_ignores_parallel_lit_review(self, compose_ctx, monkeypatch):
+        prompts = []
+        monkeypatch.setattr(agent_runner, "run_agent",
+                            lambda name, user_input, **kwargs: prompts.append(user_input))
+
+        compose._write_methodology(compose_ctx)
+        compose_ctx.lit_review_output = None
+        compose._write_methodology(compose_ctx)
+
+        assert prompts[0] == prompts[1]
+
+    def test_falls_back_to_citation_summary_without_database(self, compose_ctx, monkeypatch):
+        prompts = {}
+        monkeypatch.setattr(agent_runner, "run_agent",
+                            lambda name, user_input, **kwargs: prompts.setdefault(name, user_input))
+        compose_ctx.citation_database = None
+
+        compose._write_introduction(compose_ctx)
+
+        prompt = prompts["Crafter - Introduction"]
+        assert "CITATION DATABASE - 60 CITATIONS AVAILABLE" in prompt
+        assert estimate_tokens(prompt) < estimate_tokens(compose_ctx.citation_summary)
+
+
+class TestQAContent:
+    """QA content is packed to QA_CONTEXT_BUDGET and keeps both ends of each section."""
+
+    def test_sections_packed_with_ends(self, tmp_path):
+        ctx = DraftContext(topic="Topic", verbose=False)
+        ctx.folders = {'root': tmp_path, 'drafts': tmp_path}
+        ctx.intro_output = "Intro " + words(50)
+        ctx.conclusion_output = "Conclusion " + words(50)
+        for name in ["02_1_literature_review.md", "02_2_methodology.md",
+                     "02_3_analysis_results.md", "02_4_discussion.md"]:
+            (tmp_path / name).write_text(f"START {name} " + words(3000) + f" END {name}", encoding="utf-8")
+
+        content = validate._build_qa_content(ctx)
+
+        assert estimate_tokens(content) <= validate.QA_CONTEXT_BUDGET + 100
+        assert ctx.intro_output in content and ctx.conclusion_output in content
+        assert content.count(TRUNCATION_MARK) == 4
+        assert "END 02_4_discussion.md" in content and "START 02_1_literature_review.md" in content
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for the shared Gemini token-bucket limiter
+ABOUTME: Validates burst capacity, RPM/TPM waits, usage correction, 429 penalties and config toggles
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from concurrency.concurrency_config import reset_config
+from concurrency.rate_limiter import (
+    TokenBucketLimiter,
+    get_gemini_limiter,
+    reset_gemini_limiter,
+)
+from utils.token_counter import estimate_tokens
+
+
+@pytest.fixture(autouse=True)
+def _reset_singletons():
+    reset_config()
+    reset_gemini_limiter()
+    yield
+    reset_config()
+    reset_gemini_limiter()
+
+
+class TestTokenBucket:
+    """Core bucket behaviour."""
+
+    def test_burst_up_to_rpm_does_not_wait(self):
+        limiter = TokenBucketLimiter(rpm_limit=5, tpm_limit=100_000)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire(tokens=10)
+        assert time.monotonic() - start < 0.1
+
+    def test_rpm_exhausted_waits_for_refill(self):
+        # 600 RPM refills one request every 0.1s
+        limiter = TokenBucketLimiter(rpm_limit=600, tpm_limit=10_000_000)
+        for _ in range(600):
+            limiter.acquire()
+        waited = limiter.acquire()
+        assert 0.05 <= waited < 0.5
+
+    def test_tpm_exhausted_waits_for_refill(self):
+        # 60,000 TPM refills 100 tokens every 0.1s
+        limiter = TokenBucketLimiter(rpm_limit=10_000, tpm_limit=60_000)
+        limiter.acquire(tokens=60_000)
+        waited = limiter.acquire(tokens=100)
+        assert 0.05 <= waited < 0.5
+
+    def test_oversized_request_is_clamped(self):
+        limiter = TokenBucketLimiter(rpm_limit=10, tpm_limit=1_000)
+        assert limiter.acquire(tokens=5_000, timeout=0.1) < 0.05
+
+    def test_timeout_raises(self):
+        limiter = TokenBucketLimiter(rpm_limit=1, tpm_limit=1_000)
+        limiter.acquire()
+        with pytest.raises(TimeoutError):
+            limiter.acquire(timeout=0.05)
+
+    def test_invalid_limits_rejected(self):
+        with pytest.raises(ValueError):
+            TokenBucketLimiter(rpm_limit=0, tpm_limit=100)
+
+    def test_concurrent_callers_share_budget(self):
+        limiter = TokenBucketLimiter(rpm_limit=3, tpm_limit=100_000)
+        acquired = []
+
+        def worker():
+            try:
+                limiter.acquire(timeout=0.2)
+                acquired.append(1)
+            except TimeoutError:
+                pass
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # 3 burst slots; at 3 RPM no refill happens within 0.2s
+        assert len(acquired) == 3
+
+
+class TestUsageCorrection:
+    """record_usage() and penalize()."""
+
+    def test_underestimate_charges_difference(self):
+        limiter = TokenBucketLimiter(rpm_limit=100, tpm_limit=60_000)
+        limiter.acquire(tokens=1_000)
+        limiter.record_usage(actual_tokens=60_000, estimated_tokens=1_000)
+        waited = limiter.acquire(tokens=100)
+        assert waited >= 0.05
+
+    def test_overestimate_refunds(self):
+        limiter = TokenBucketLimiter(rpm_limit=100, tpm_limit=1_000)
+        limiter.acquire(tokens=1_000)
+        limiter.record_usage(actual_tokens=100, estimated_tokens=1_000)
+        assert limiter.acquire(tokens=800, timeout=0.05) < 0.05
+
+    def test_penalize_blocks_callers(self):
+        limiter = TokenBucketLimiter(rpm_limit=6_000, tpm_limit=10_000_000)
+        limiter.penalize(cooldown_seconds=0.1)
+        waited = limiter.acquire()
+        assert waited >= 0.09
+
+    def test_stats_reflect_usage(self):
+        limiter = TokenBucketLimiter(rpm_limit=10, tpm_limit=1_000)
+        limiter.acquire(tokens=200)
+        stats = limiter.get_stats()
+        assert stats["total_requests"] == 1
+        assert stats["available_tokens"] <= 801
+
+
+class TestSingleton:
+    """Config-driven singleton."""
+
+    def test_seeded_from_config(self, monkeypatch):
+        monkeypatch.setenv("API_TIER", "paid")
+        monkeypatch.setenv("GEMINI_TOKEN_BUCKET", "true")
+        limiter = get_gemini_limiter()
+        assert limiter is not None
+        assert limiter.rpm_limit == 2000
+        assert get_gemini_limiter() is limiter
+
+    def test_env_overrides_limits(self, monkeypatch):
+        monkeypatch.setenv("API_TIER", "free")
+        monkeypatch.setenv("RPM_LIMIT", "42")
+        monkeypatch.setenv("TPM_LIMIT", "12345")
+        limiter = get_gemini_limiter()
+        assert (limiter.rpm_limit, limiter.tpm_limit) == (42, 12345)
+
+    def test_disabled_returns_none(self, monkeypatch):
+        monkeypatch.setenv("API_TIER", "free")
+        monkeypatch.setenv("GEMINI_TOKEN_BUCKET", "false")
+        assert get_gemini_limiter() is None
+
+    def test_estimate_tokens_is_offline_approximation(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd" * 100) == 100
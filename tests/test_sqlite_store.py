@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for the per-thread SQLite connection helper shared by the persistent stores
+ABOUTME: Validates WAL setup, one connection per thread, lazy directory creation and on_connect failures
+"""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from utils.sqlite_store import SQLiteConnections
+
+
+class TestSQLiteConnections:
+    """Connections are opened lazily, per thread, in WAL mode."""
+
+    def test_one_wal_connection_per_thread(self, tmp_path):
+        connections = SQLiteConnections(tmp_path / "nested" / "store.db", pragmas=["foreign_keys=ON"])
+        assert not (tmp_path / "nested").exists()
+
+        conn = connections.get()
+        assert connections.get() is conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(connections.get()))
+        thread.start()
+        thread.join()
+        assert other[0] is not conn
+
+        connections.close()
+        assert connections.get() is not conn
+
+    def test_failed_on_connect_closes_the_connection(self, tmp_path):
+        calls = []
+
+        def on_connect(conn):
+            calls.append(conn)
+            if len(calls) == 1:
+                raise RuntimeError("schema failed")
+
+        connections = SQLiteConnections(tmp_path / "store.db", on_connect=on_connect)
+        with pytest.raises(RuntimeError):
+            connections.get()
+
+        assert connections.get() is calls[1]
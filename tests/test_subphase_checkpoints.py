@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests for sub-phase (unit) checkpoints
+ABOUTME: Validates atomic unit files and that compose, validate and scout resume at the first unfinished unit
+"""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from concurrency.concurrency_config import reset_config
+from phases import compose, validate
+from phases.context import DraftContext
+from utils.checkpoint import (
+    UNITS_DIRNAME,
+    DraftCancelled,
+    UnitCheckpoint,
+    has_checkpoint,
+    load_units,
+    save_checkpoint,
+)
+from utils.citation_database import Citation
+
+
+@pytest.fixture
+def fast_config(monkeypatch):
+    """Paid-tier config with the token bucket on, so no rate-limit sleeps."""
+    monkeypatch.setenv("API_TIER", "custom")
+    monkeypatch.setenv("GEMINI_TOKEN_BUCKET", "true")
+    monkeypatch.setenv("DOI_BATCH_ENRICH", "false")
+    reset_config()
+    yield monkeypatch
+    reset_config()
+
+
+def make_context(tmp_path: Path) -> DraftContext:
+    drafts = tmp_path / "drafts"
+    drafts.mkdir(parents=True, exist_ok=True)
+    ctx = DraftContext(topic="Topic", verbose=False)
+    ctx.folders = {'root': tmp_path, 'research': tmp_path / "research", 'drafts': drafts}
+    return ctx
+
+
+def resume_context(tmp_path: Path) -> DraftContext:
+    """A fresh context for a resumed run, as generate_draft builds it."""
+    ctx = make_context(tmp_path)
+    ctx.completed_units = load_units(tmp_path)
+    return ctx
+
+
+class TestUnitCheckpoint:
+    """Unit files on disk."""
+
+    def test_round_trip_and_clear_on_phase_checkpoint(self, tmp_path):
+        units = UnitCheckpoint(tmp_path, "compose")
+        units.save("introduction", {"intro_output": "Intro"})
+        units.save("query:a/b c?", {"citations": []})
+
+        assert "introduction" in units and len(units) == 2
+        assert load_units(tmp_path) == {
+            "compose": {"introduction": {"intro_output": "Intro"}, "query:a/b c?": {"citations": []}}
+        }
+        assert has_checkpoint(tmp_path)
+
+        save_checkpoint(make_context(tmp_path), "compose", tmp_path)
+
+        assert load_units(tmp_path) == {}
+        assert (tmp_path / "checkpoint.json").exists()
+
+    def test_concurrent_saves_leave_no_partial_files(self, tmp_path):
+        units = UnitCheckpoint(tmp_path, "research")
+
+        def save(i):
+            units.save(f"query:{i}", {"citations": [{"id": str(i)}] * 50})
+
+        threads = [threading.Thread(target=save, args=(i,)) for i in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        files = list((tmp_path / UNITS_DIRNAME / "research").iterdir())
+        assert len(files) == 20
+        assert all(f.suffix == ".json" for f in files)
+        assert len(load_units(tmp_path)["research"]) == 20
+
+    def test_unreadable_units_are_skipped(self, tmp_path):
+        UnitCheckpoint(tmp_path, "validate").save("thread", {})
+        (tmp_path / UNITS_DIRNAME / "validate" / "broken.json").write_text("{trunc", encoding="utf-8")
+
+        assert load_units(tmp_path) == {"validate": {"thread": {}}}
+
+    def test_cancelled_run_writes_nothing(self, tmp_path):
+        ctx = make_context(tmp_path)
+        ctx.cancel_event = threading.Event()
+        units = ctx.unit_checkpoint("compose")
+        units.save("introduction", {"intro_output": "Intro"})
+
+        ctx.cancel_event.set()
+        with pytest.raises(DraftCancelled):
+            units.save("literature_review", {"lit_review_output": "Review"})
+        with pytest.raises(DraftCancelled):
+            save_checkpoint(ctx, "compose", tmp_path)
+
+        assert load_units(tmp_path) == {"compose": {"introduction": {"intro_output": "Intro"}}}
+        assert not (tmp_path / "checkpoint.json").exists()
+
+
+class TestComposeResume:
+    """A crash inside compose resumes at the next chapter."""
+
+    def _patch_writers(self, monkeypatch, calls, fail_on=None):
+        def make_writer(section):
+            attr = compose.SECTION_OUTPUTS[section]
+
+            def writer(ctx):
+                calls.append(section)
+                if section == fail_on:
+                    raise RuntimeError(f"crash in {section}")
+                setattr(ctx, attr, f"{section} text")
+            return writer
+
+        names = {
+            "introduction": "_write_introduction",
+            "literature_review": "_write_literature_review",
+            "methodology": "_write_methodology",
+            "results": "_write_results",
+            "discussion": "_write_discussion",
+            "body": "_merge_body_sections",
+            "conclusion": "_write_conclusion",
+            "appendices": "_write_appendices",
+        }
+        for section, name in names.items():
+            monkeypatch.setattr(compose, name, make_writer(section))
+
+    def test_resume_skips_written_sections(self, tmp_path, fast_config):
+        fast_config.setenv("CRAFTER_MAX_WORKERS", "1")
+        reset_config()
+        first_calls = []
+        self._patch_writers(fast_config, first_calls, fail_on="conclusion")
+
+        with pytest.raises(Exception, match="crash in conclusion"):
+            compose.run_compose_phase(make_context(tmp_path))
+
+        resumed_calls = []
+        self._patch_writers(fast_config, resumed_calls)
+        ctx = resume_context(tmp_path)
+        compose.run_compose_phase(ctx)
+
+        assert resumed_calls == ["conclusion", "appendices"]
+        assert ctx.intro_output == "introduction text"
+        assert ctx.body_output == "body text"
+        assert ctx.appendix_output == "appendices text"
+
+
+class TestValidateResume:
+    """Finished QA agents are not re-run."""
+
+    def test_only_failed_agents_rerun(self, tmp_path, fast_config):
+        calls = []
+        outcomes = {"thread": True, "narrator": False, "factcheck": True}
+
+        for step in outcomes:
+            def run(ctx, content, step=step):
+                calls.append(step)
+                return outcomes[step]
+            fast_config.setattr(validate, f"_run_{step}", run)
+        fast_config.setattr(validate, "_build_qa_content", lambda ctx: "draft")
+
+        validate.run_validate_phase(make_context(tmp_path))
+        assert calls == ["thread", "narrator", "factcheck"]
+
+        calls.clear()
+        validate.run_validate_phase(resume_context(tmp_path))
+        assert calls == ["narrator"]
+
+
+class FakeResearcher:
+    """Stands in for CitationResearcher: one citation per query, some queries crash the run."""
+
+    instances = []
+
+    def __init__(self, crash_on=None, **kwargs):
+        self.crash_on = crash_on
+        self.queried = []
+        FakeResearcher.instances.append(self)
+
+    def research_citation(self, topic):
+        if topic == self.crash_on:
+            raise KeyboardInterrupt  # Not caught by the per-topic error handling
+        self.queried.append(topic)
+        return [Citation(f"cite_{len(self.queried)}", ["Author, A."], 2024, f"Paper on {topic}",
+                         "journal", api_source="Crossref")]
+
+
+class TestScoutResume:
+    """Answered scout queries are restored instead of searched again."""
+
+    @pytest.mark.parametrize("workers", ["1", "2"])
+    def test_resume_queries_only_pending_topics(self, tmp_path, fast_config, workers):
+        from utils import agent_runner
+
+        fast_config.setenv("SCOUT_PARALLEL_WORKERS", workers)
+        fast_config.setenv("SCOUT_ASYNC", "false")
+        fast_config.setenv("SCOUT_BATCH_SIZE", "1")
+        reset_config()
+        topics = [f"query {i}" for i in range(5)]
+        units = UnitCheckpoint(tmp_path, "research")
+
+        fast_config.setattr(agent_runner, "CitationResearcher",
+                            lambda **kwargs: FakeResearcher(crash_on="query 3", **kwargs))
+        with pytest.raises(KeyboardInterrupt):
+            agent_runner.research_citations_via_api(
+                model=None, research_topics=topics, output_path=tmp_path / "scout_raw.md",
+                target_minimum=1, verbose=False, unit_checkpoint=units,
+            )
+        assert len(load_units(tmp_path)["research"]) == 3
+
+        fast_config.setattr(agent_runner, "CitationResearcher", lambda **kwargs: FakeResearcher(**kwargs))
+        result = agent_runner.research_citations_via_api(
+            model=None, research_topics=topics, output_path=tmp_path / "scout_raw.md",
+            target_minimum=1, verbose=False,
+            unit_checkpoint=UnitCheckpoint(tmp_path, "research", load_units(tmp_path)["research"]),
+        )
+
+        assert FakeResearcher.instances[-1].queried == ["query 3", "query 4"]
+        assert result["count"] == 5
+        assert result["sources"]["Crossref"] == 5
+        assert sorted(c.title for c in result["citations"]) == [f"Paper on query {i}" for i in range(5)]
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+ABOUTME: Tests and benchmark for the compiled rewrite rules behind compile-phase cleanup
+ABOUTME: Checks apply_full_cleanup and clean_ai_language against the original sequential re.sub passes
+"""
+
+import random
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "engine"))
+
+from utils import text_cleanup
+from utils.rewrite_rules import RewriteDocument, RewriteRule, anchor_literal, required_literal
+from utils.text_cleanup import apply_full_cleanup
+from utils.text_utils import AI_WORD_REPLACEMENTS, clean_ai_language
+
+
+# =============================================================================
+# Reference implementations: the original one-re.sub-per-pattern passes
+# =============================================================================
+
+def legacy_full_cleanup(text):
+    stats = dict.fromkeys(
+        ["fillers", "intensifiers", "verbose", "meta", "synonyms", "thesis", "vocab_diversified", "claims_calibrated"], 0
+    )
+    for pattern in text_cleanup.FILLER_STARTS:
+        before = text
+        text = re.sub(r"(?m)(^|\.\s+)" + pattern, lambda m: m.group(1), text)
+        if text != before:
+            stats["fillers"] += 1
+    text, stats["intensifiers"] = text_cleanup.INTENSIFIERS.subn(r"", text)
+    for key, rules, flags in [
+        ("synonyms", text_cleanup.SYNONYM_CHAINS, re.IGNORECASE),
+        ("meta", [(p, "") for p in text_cleanup.META_PATTERNS], 0),
+        ("verbose", text_cleanup.VERBOSE_PHRASES, re.IGNORECASE),
+        ("thesis", text_cleanup.THESIS_RESTATEMENTS, re.IGNORECASE),
+    ]:
+        for pattern, replacement in rules:
+            before = text
+            text = re.sub(pattern, replacement, text, flags=flags)
+            if text != before:
+                stats[key] += 1
+    for pattern, synonyms in text_cleanup.VOCAB_DIVERSITY:
+        matches = list(re.finditer(pattern, text, flags=re.IGNORECASE))
+        if len(matches) > 3:
+            for i, match in enumerate(reversed(matches[2:])):
+                synonym = synonyms[(len(matches) - 3 - i) % len(synonyms)]
+                if match.group().istitle():
+                    synonym = synonym.title()
+                elif match.group().isupper():
+                    synonym = synonym.upper()
+                text = text[:match.start()] + synonym + text[match.end():]
+                stats["vocab_diversified"] += 1
+    for pattern, replacement in text_cleanup.CLAIM_CALIBRATION:
+        before = text
+        count = len(re.findall(pattern, text, flags=re.IGNORECASE))
+        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+        if text != before:
+            stats["claims_calibrated"] += count
+    refs_splits = re.split(r"\n##\s+References\s*\n", text)
+    if len(refs_splits) > 2:
+        text = refs_splits[0]
+        for part in refs_splits[1:-1]:
+            text += "\n" + part
+        text += "\n## References\n" + refs_splits[-1]
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = re.sub(r"  +", " ", text)
+    return {"text": text, "stats": stats}
+
+
+def legacy_clean_ai_language(text):
+    text = text.replace('—', '--').replace('–', '-').replace('―', '--')
+    for pattern, replacement in AI_WORD_REPLACEMENTS:
+        text = re.sub(pattern, replacement, text)
+    text = re.sub(r'  +', ' ', text)
+    text = re.sub(r' +([.,;:!?])', r'\1', text)
+    return re.sub(r'\. +([a-z])', lambda m: '. ' + m.group(1).upper(), text)
+
+
+# =============================================================================
+# Draft generator
+# =============================================================================
+
+_WORDS = (
+    "analysis framework empirical evidence model data results method approach research literature "
+    "theory study findings sample variable effect students digital policy adoption outcomes "
+    "the of and in to a is that for on with as by this are be which from an was it their these"
+).split()
+
+# Phrases every rule list reacts to, in assorted cases
+_TRIGGERS = [
+    "in order to", "In Order To", "due to the fact that", "prior to", "with respect to", "is able to",
+    "very", "Highly", "extremely", "mechanism", "Mechanism", "MECHANISM", "significant", "significant effect",
+    "demonstrates", "utilized", "facilitates", "comprehensive", "robust", "Robust", "paradigm", "paradigm shift",
+    "vulnerability", "is indisputable", "undeniable", "proves that", "obviously", "clearly shows", "is always",
+    "is always been", "without a doubt", "the only solution", "important, essential, and paramount",
+    "crucial, vital, and critical", "delves", "Delve", "realm", "landscape", "Ecosystem", "game-changer",
+    "cutting edge", "state-of-the-art", "seamlessly", "Seamless", "holistic", "pivotal", "Crucial", "myriad",
+    "indeed", "Indeed", "interestingly", "noteworthy", "It bears mentioning", "argubly", "—", "–",
+    "ſignificant", "thıs", "İn order to",
+]
+
+_SENTENCE_OPENERS = [
+    "", "", "", "Furthermore, ", "Moreover, ", "Furthermore, Moreover, ", "It is worth noting that ",
+    "Additionally, In addition, ", "This section discusses the data. ", "In this section, we review it. ",
+    "As this paper argues, ", "We argue that ", "This study demonstrates that ", "It is worth noting that ",
+]
+
+
+def make_draft(words: int, seed: int, trigger_rate: float = 0.3) -> str:
+    """Markdown draft with headings, paragraphs and rule triggers at a given rate per sentence."""
+    rng = random.Random(seed)
+    sentences = []
+    while words > 0:
+        body = [rng.choice(_WORDS) for _ in range(rng.randint(10, 25))]
+        if rng.random() < trigger_rate:
+            body.insert(rng.randrange(len(body)), rng.choice(_TRIGGERS))
+        words -= len(body)
+        sentences.append(rng.choice(_SENTENCE_OPENERS) + " ".join(body) + rng.choice([".", ".", " .", ".  "]))
+    paragraphs = []
+    for i in range(0, len(sentences), 5):
+        if i % 60 == 0:
+            paragraphs.append(f"## Section {i // 60 + 1}")
+        paragraphs.append(" ".join(sentences[i:i + 5]))
+    draft = "\n\n\n".join(paragraphs)
+    return draft + "\n## References\nA\n## References\nB\n"
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+class TestRequiredLiteral:
+    """Prefilter literals read from parsed patterns."""
+
+    @pytest.mark.parametrize("pattern, flags, expected", [
+        (r"\bin order to\b", re.IGNORECASE, "in order to"),
+        (r"\bDelves?\b", 0, "Delve"),
+        (r"(?m)(^|\.\s+)Furthermore,\s*", 0, "Furthermore,"),
+        (r"(?<=\.\s)As\s+this\s+(?:paper|study)\s+argues?,?\s*", re.IGNORECASE, "argue"),
+        (r"\b(very|extremely|highly)\s+(?=[a-z])", re.IGNORECASE, None),
+    ])
+    def test_literals(self, pattern, flags, expected):
+        assert required_literal(re.compile(pattern, flags)) == expected
+
+    @pytest.mark.parametrize("pattern, flags, expected", [
+        (r"\bDelves?\b", re.IGNORECASE, "delve"),
+        (r"(?<=\.\s)As\s+this", 0, "As"),
+        (r"(?m)(^|\.\s+)Furthermore,\s*", 0, None),
+    ])
+    def test_anchor_literals(self, pattern, flags, expected):
+        assert anchor_literal(re.compile(pattern, flags)) == expected
+
+    def test_anchored_matching_respects_word_boundaries(self):
+        rule = RewriteRule(r"\bdelves?\b", "explores", re.IGNORECASE)
+        doc = RewriteDocument("Delves redelves delve delvesx DELVE.")
+        assert doc.sub(rule) == 3
+        assert doc.text == "explores redelves explores delvesx explores."
+
+    def test_ignorecase_prefilter_sees_unicode_case_variants(self):
+        rule = RewriteRule(r"\bsignificant\b", "notable", re.IGNORECASE)
+        doc = RewriteDocument("A ſignificant result.")
+        assert doc.sub(rule) == 1
+        assert doc.text == "A notable result."
+
+    def test_absent_literal_skips_rule(self):
+        doc = RewriteDocument("Nothing to see here.")
+        assert doc.sub(RewriteRule(r"\bprior to\b", "before", re.IGNORECASE)) == 0
+        assert doc.rules_skipped == 1
+
+
+class TestIdenticalOutput:
+    """Compiled rules reproduce the sequential passes exactly."""
+
+    @pytest.mark.parametrize("seed", range(12))
+    def test_full_cleanup_matches_reference(self, seed):
+        draft = make_draft(3000, seed, trigger_rate=0.1 + seed / 20)
+
+        expected = legacy_full_cleanup(draft)
+        result = apply_full_cleanup(draft)
+
+        assert result["text"] == expected["text"]
+        assert result["stats"] == expected["stats"]
+
+    @pytest.mark.parametrize("seed", range(12))
+    def test_clean_ai_language_matches_reference(self, seed):
+        draft = make_draft(3000, seed, trigger_rate=0.1 + seed / 20)
+        assert clean_ai_language(draft) == legacy_clean_ai_language(draft)
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "Furthermore, Moreover, the model fits.",
+        "The data. Furthermore, it is worth noting that results hold. Notably, Importantly, yes.",
+        "Mechanism mechanism MECHANISM mechanism Mechanism mechanism.",
+        "Robust robust robust. robust ROBUST",
+        "Significant difference. significant effect. significant significant significant significant.",
+        "The study proves that it is indisputable. Obviously it is always perfect. It is always been.",
+        "Intro\n## References\nA\n\n\n\n## References\nB\n## References  \nC",
+        "  double  spaces   and İn order to thıs .",
+    ])
+    def test_edge_cases_match_reference(self, text):
+        assert apply_full_cleanup(text)["text"] == legacy_full_cleanup(text)["text"]
+        assert apply_full_cleanup(text)["stats"] == legacy_full_cleanup(text)["stats"]
+        assert clean_ai_language(text) == legacy_clean_ai_language(text)
+
+    def test_per_rule_stats(self):
+        result = apply_full_cleanup("In order to win, in order to learn. Prior to that, nothing.")
+
+        assert result["rules"][r"\bin order to\b"] == 2
+        assert result["rules"][r"\bprior to\b"] == 1
+        assert result["stats"]["verbose"] == 2
+
+
+class TestCleanupBenchmark:
+    """80k-word PhD draft through the compile-phase cleanup."""
+
+    def test_phd_draft_cleanup_speedup(self):
+        """Benchmark: compiled rules at least 2x faster than the sequential passes, same output."""
+        draft = make_draft(80_000, seed=2024, trigger_rate=0.05)
+
+        def best_of(func, runs=3):
+            times = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                output = func(draft)
+                times.append(time.perf_counter() - start)
+            return min(times), output
+
+        legacy_seconds, legacy_output = best_of(lambda t: legacy_clean_ai_language(legacy_full_cleanup(t)["text"]))
+        seconds, output = best_of(lambda t: clean_ai_language(apply_full_cleanup(t)["text"]))
+
+        print(f"\nPhD draft cleanup ({len(draft.split())} words): "
+              f"sequential {legacy_seconds * 1000:.0f}ms, compiled {seconds * 1000:.0f}ms "
+              f"({legacy_seconds / seconds:.1f}x)")
+        assert output == legacy_output
+        assert seconds * 2 < legacy_seconds